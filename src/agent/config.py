@@ -5,7 +5,7 @@ REQ: REQ-A-ItemGen
 
 Design Patterns:
 - Dependency Inversion Principle (DIP): Use abstract base for LLM providers
-- Strategy Pattern: Different LLM providers (GoogleGenerativeAI, LiteLLM)
+- Strategy Pattern: Different LLM providers (GoogleGenerativeAI, LiteLLM, Fake)
 - Factory Pattern: LLMFactory selects provider based on environment
 - Single Responsibility: Each provider handles its own configuration
 """
@@ -13,6 +13,7 @@ Design Patterns:
 from abc import ABC, abstractmethod
 from os import getenv
 
+from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 
@@ -119,12 +120,39 @@ class LiteLLMProvider(LLMProvider):
         )
 
 
+class FakeLLMProvider(LLMProvider):
+    """
+    Deterministic scripted LLM provider for load and latency testing.
+
+    Requires no network or credentials (see src/agent/llm_fake.py).
+    """
+
+    def create(self) -> BaseChatModel:
+        """
+        Create scripted fake LLM instance.
+
+        Returns:
+            ScriptedChatModel: Configured from LLM_FAKE_* environment variables.
+
+        Environment Variables:
+            LLM_FAKE_LATENCY_MS: Median latency in milliseconds (default: 0).
+            LLM_FAKE_LATENCY_SIGMA: Lognormal latency sigma (default: 0.5).
+            LLM_FAKE_ERROR_RATE: Fraction of failing calls (default: 0).
+            LLM_FAKE_THROTTLE_RATE: Fraction of 429 calls (default: 0).
+            LLM_FAKE_SEED: RNG seed (default: 42).
+
+        """
+        from src.agent.llm_fake import create_fake_llm
+
+        return create_fake_llm()
+
+
 class LLMFactory:
     """
     Factory for creating LLM providers based on configuration.
 
     Adheres to Factory Pattern and Single Responsibility Principle (SRP).
-    Selects appropriate provider based on USE_LITE_LLM environment variable.
+    Selects appropriate provider based on USE_FAKE_LLM / USE_LITE_LLM environment variables.
     """
 
     @staticmethod
@@ -133,13 +161,18 @@ class LLMFactory:
         Get appropriate LLM provider based on environment configuration.
 
         Returns:
-            LLMProvider: Either GoogleGenerativeAIProvider or LiteLLMProvider.
+            LLMProvider: FakeLLMProvider, GoogleGenerativeAIProvider or LiteLLMProvider.
 
         Environment Variables:
+            USE_FAKE_LLM: "True" (case-insensitive) to use the scripted fake LLM
+                         (takes precedence over USE_LITE_LLM).
             USE_LITE_LLM: "True" (case-insensitive) to use LiteLLM,
                          otherwise uses Google Generative AI.
 
         """
+        if getenv("USE_FAKE_LLM", "False").lower() == "true":
+            return FakeLLMProvider()
+
         use_lite_llm = getenv("USE_LITE_LLM", "False").lower() == "true"
 
         if use_lite_llm:
@@ -147,28 +180,69 @@ class LLMFactory:
 
         return GoogleGenerativeAIProvider()
 
+    @staticmethod
+    def get_alternate_provider() -> LLMProvider | None:
+        """
+        Get the provider not selected by get_provider(), if it is configured.
+
+        Used as hedge target for duplicate requests (see src/agent/llm_hedging.py).
+
+        Returns:
+            LLMProvider or None if the alternate provider has no credentials.
+
+        """
+        if getenv("USE_FAKE_LLM", "False").lower() == "true":
+            return FakeLLMProvider()
+
+        use_lite_llm = getenv("USE_LITE_LLM", "False").lower() == "true"
+
+        if use_lite_llm:
+            return GoogleGenerativeAIProvider() if getenv("GEMINI_API_KEY") else None
+
+        return LiteLLMProvider() if getenv("LITELLM_BASE_URL") else None
+
+
+def _apply_limiter(llm: BaseChatModel) -> BaseChatModel:
+    """Wrap llm with the process-wide limiter if LLM_LIMITER_ENABLED is set."""
+    if getenv("LLM_LIMITER_ENABLED", "False").lower() == "true":
+        from src.agent.llm_limiter import ThrottledChatModel, get_llm_limiter
 
-def create_llm() -> ChatGoogleGenerativeAI | ChatOpenAI:
+        return ThrottledChatModel(inner=llm, limiter=get_llm_limiter())
+    return llm
+
+
+def create_llm() -> BaseChatModel:
     """
     Create LLM instance based on environment configuration.
 
     This is the main public API for LLM creation. It delegates to
     LLMFactory to select the appropriate provider and creates the
-    LLM instance with optimized default settings.
+    LLM instance with optimized default settings. Optional middleware
+    (process-wide limiter, hedging, response cache) wraps the instance when enabled.
 
     Returns:
-        Union[ChatGoogleGenerativeAI, ChatOpenAI]: Configured LLM instance.
+        BaseChatModel: Configured LLM instance (ChatGoogleGenerativeAI,
+            ChatOpenAI, or a wrapper around one of them).
 
     Raises:
         ValueError: If required environment variables are not set.
 
     Environment Variables:
+        USE_FAKE_LLM: Set to "True" to use the deterministic scripted LLM
+                     (load testing without network, see src/agent/llm_fake.py).
         USE_LITE_LLM: Set to "True" to use LiteLLM (ChatOpenAI).
                      Otherwise uses Google Generative AI.
         GEMINI_API_KEY: Required if USE_LITE_LLM is not "True".
         LITELLM_BASE_URL: Required if USE_LITE_LLM is "True".
         LITELLM_API_KEY: Optional, defaults to "sk-dummy-key".
         LITELLM_MODEL: Optional, defaults to "gpt-4".
+        LLM_LIMITER_ENABLED: Set to "True" to run every call through the shared
+                            AIMD limiter (see src/agent/llm_limiter.py).
+        LLM_HEDGING_ENABLED: Set to "True" to hedge slow idempotent calls
+                            (see src/agent/llm_hedging.py).
+        LLM_HEDGE_ALTERNATE: Set to "True" to send hedges to the other provider.
+        LLM_CACHE_ENABLED: Set to "True" to serve repeated prompts from the
+                          SQLite response cache (see src/agent/llm_cache.py).
 
     Example:
         >>> # Use Google Generative AI (default)
@@ -181,7 +255,28 @@ def create_llm() -> ChatGoogleGenerativeAI | ChatOpenAI:
 
     """
     provider = LLMFactory.get_provider()
-    return provider.create()
+    llm: BaseChatModel = provider.create()
+
+    # Middleware order (outer → inner): cache → hedging → limiter → provider
+    # Cache hits never consume limiter slots; hedged duplicates do.
+    llm = _apply_limiter(llm)
+
+    if getenv("LLM_HEDGING_ENABLED", "False").lower() == "true":
+        from src.agent.llm_hedging import HedgedChatModel, get_hedging_policy
+
+        alternate = None
+        alternate_provider = LLMFactory.get_alternate_provider()
+        if alternate_provider and getenv("LLM_HEDGE_ALTERNATE", "False").lower() == "true":
+            alternate = _apply_limiter(alternate_provider.create())
+
+        llm = HedgedChatModel(inner=llm, policy=get_hedging_policy(), alternate=alternate)
+
+    if getenv("LLM_CACHE_ENABLED", "False").lower() == "true":
+        from src.agent.llm_cache import CachedChatModel, get_llm_cache
+
+        llm = CachedChatModel(inner=llm, response_cache=get_llm_cache())
+
+    return llm
 
 
 # Agent 설정
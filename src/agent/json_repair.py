@@ -0,0 +1,221 @@
+r"""
+Tolerant JSON parsing for LLM output - one shared repair engine.
+
+REQ: REQ-A-OutputConverter
+
+개요:
+    LLM 응답 JSON 파싱의 단일 진입점입니다. (llm_agent.parse_json_robust,
+    AgentOutputConverter, ExplainService, ValidationResponseParser,
+    FinalAnswerStreamParser가 모두 사용)
+
+    1. Fast path: 유효한 JSON이면 orjson으로 바로 파싱 (orjson 미설치 시 json)
+    2. Repair: 정규식 토크나이저로 한 번만 스캔하며 결함을 모두 수정
+    3. 수정된 텍스트를 한 번 더 파싱 (실패 시 json.JSONDecodeError)
+
+    적용 가능한 repair (RepairResult.repairs에 적용 순서대로 기록):
+    - escaped_json: \"key\": \"value\" 형태로 전체가 escape된 JSON → 일반 JSON
+    - python_literals: True/False/None → true/false/null (문자열 밖)
+    - trailing_commas: `,` 직후 `}` / `]` → 쉼표 제거
+    - invalid_escapes: 문자열 안의 \x (JSON에 없는 escape) → \\x, \' → '
+    - control_chars: 문자열 안의 raw 개행/탭 등 → \n / \t / \u00XX
+
+사용 예:
+    result = parse_json_tolerant(text)
+    result.value    # 파싱된 객체
+    result.repairs  # ("python_literals", "trailing_commas") 등
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - declared dependency; stdlib fallback for stripped installs
+    orjson = None
+
+# One token per match; strings are matched whole (including raw control chars)
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<ws>\s+)
+    |(?P<escaped_ws>\\[ntr])
+    |(?P<comma>,)
+    |(?P<close>[}\]])
+    |(?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<other>[^\s",}\]A-Za-z_\\]+|\\|")
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_ESCAPED_JSON_RE = re.compile(r'^\s*[\[{](?:[\s\[{]|\\[ntr])*\\"')
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+# Escapes are matched as pairs so the second backslash of a valid \\ is never re-escaped;
+# only the (') and (.) groups are invalid
+_ESCAPE_RE = re.compile(r"""\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}|(')|(.))""", re.DOTALL)
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+
+
+@dataclass(frozen=True)
+class RepairResult:
+    """
+    Result of parse_json_tolerant().
+
+    Attributes:
+        value: Parsed JSON value
+        repairs: Repairs applied, in order (empty if the fast path succeeded)
+
+    """
+
+    value: Any
+    repairs: tuple[str, ...] = ()
+
+
+def loads(text: str | bytes) -> Any:  # noqa: ANN401
+    """
+    Parse strict JSON with the fastest available backend.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error subclasses it)
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, big ints, lone surrogates) - let json decide
+            pass
+    return json.loads(text)
+
+
+def strip_code_fences(text: str) -> str:
+    """
+    Return the contents of the first markdown code block (```json ... ```), or text stripped.
+
+    Args:
+        text: LLM response text
+
+    Returns:
+        JSON candidate text
+
+    """
+    if "```" not in text:
+        return text.strip()
+    match = _CODE_FENCE_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    # Unclosed fence (truncated response): take everything after it
+    return text.split("```", 1)[1].removeprefix("json").strip()
+
+
+def _repair_string(token: str, repairs: list[str]) -> str:
+    """Fix invalid escapes and raw control characters inside one string token."""
+    if "\\" in token:
+        fixed = _ESCAPE_RE.sub(_fix_escape, token)
+        if fixed != token:
+            _add(repairs, "invalid_escapes")
+            token = fixed
+    if _CONTROL_CHAR_RE.search(token):
+        _add(repairs, "control_chars")
+        token = _CONTROL_CHAR_RE.sub(lambda m: _CONTROL_ESCAPES.get(m.group(), f"\\u{ord(m.group()):04x}"), token)
+    return token
+
+
+def _fix_escape(match: re.Match[str]) -> str:
+    r"""Keep valid escape; \' → ', other invalid \x → \\x."""
+    if match.group(1):
+        return "'"
+    if match.group(2) is not None:
+        return "\\\\" + match.group(2)
+    return match.group()
+
+
+def _add(repairs: list[str], name: str) -> None:
+    """Record repair once, preserving first-applied order."""
+    if name not in repairs:
+        repairs.append(name)
+
+
+def repair_json(text: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Repair common LLM JSON defects in a single tokenizing pass.
+
+    Args:
+        text: JSON-like text
+
+    Returns:
+        (repaired text, repairs applied)
+
+    """
+    repairs: list[str] = []
+
+    if _ESCAPED_JSON_RE.match(text):
+        repairs.append("escaped_json")
+        text = text.replace('\\"', '"')
+
+    out: list[str] = []
+    pending_comma: str | None = None  # comma held until the next significant token
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        token = match.group()
+
+        if kind == "ws" or kind == "escaped_ws":
+            out.append(" " if kind == "escaped_ws" else token)
+            continue
+
+        if pending_comma is not None:
+            if kind == "close":
+                _add(repairs, "trailing_commas")
+            else:
+                out.append(pending_comma)
+            pending_comma = None
+
+        if kind == "comma":
+            pending_comma = token
+        elif kind == "string":
+            out.append(_repair_string(token, repairs))
+        elif kind == "word" and token in _PYTHON_LITERALS:
+            _add(repairs, "python_literals")
+            out.append(_PYTHON_LITERALS[token])
+        else:
+            out.append(token)
+
+    if pending_comma is not None:
+        out.append(pending_comma)
+    return "".join(out), tuple(repairs)
+
+
+def parse_json_tolerant(text: str) -> RepairResult:
+    """
+    Parse LLM JSON output: fast path first, single-pass repair on failure.
+
+    Args:
+        text: JSON text (code fences / prose must already be stripped)
+
+    Returns:
+        RepairResult with parsed value and applied repairs
+
+    Raises:
+        ValueError: If text is empty or not a string
+        json.JSONDecodeError: If text is invalid even after repair
+
+    """
+    if not text or not isinstance(text, str):
+        raise ValueError("json text must be a non-empty string")
+
+    try:
+        return RepairResult(value=loads(text))
+    except json.JSONDecodeError:
+        pass
+
+    repaired, repairs = repair_json(text)
+    return RepairResult(value=loads(repaired), repairs=repairs)
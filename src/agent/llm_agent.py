@@ -20,19 +20,22 @@ REQ: REQ-A-ItemGen
 
 import json
 import logging
-import re
+import time
 import uuid
 from datetime import UTC, datetime
+from os import getenv
 
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field
 
 from src.agent.config import AGENT_CONFIG, create_llm
 from src.agent.fastmcp_server import TOOLS
+from src.agent.json_repair import parse_json_tolerant
 from src.agent.output_converter import AgentOutputConverter
 from src.agent.prompts.react_prompt import get_react_prompt
 from src.agent.round_id_generator import RoundIDGenerator
+from src.agent.streaming_json import FinalAnswerStreamParser
 
 logger = logging.getLogger(__name__)
 
@@ -47,75 +50,36 @@ _round_id_gen = RoundIDGenerator()
 
 def parse_json_robust(json_str: str, max_attempts: int = 5) -> dict | list:
     """
-    Robust JSON parsing with multiple cleanup strategies.
+    Robust JSON parsing for LLM output.
 
-    This function attempts to parse JSON using various cleanup strategies when
-    the initial parse fails. This handles edge cases like unescaped newlines,
-    trailing commas, Python True/False, etc.
+    Delegates to the shared repair engine (src/agent/json_repair.py): valid JSON
+    is parsed directly (orjson fast path); otherwise unescaped newlines, trailing
+    commas, Python True/False/None etc. are repaired in a single pass.
 
     Args:
         json_str: Raw JSON string from LLM response
-        max_attempts: Maximum number of cleanup strategies to try (default 5)
+        max_attempts: Kept for backward compatibility (unused)
 
     Returns:
         Parsed JSON object or list
 
     Raises:
-        json.JSONDecodeError: If all cleanup strategies fail
+        ValueError: If json_str is empty or not a string
+        json.JSONDecodeError: If the JSON is invalid even after repair
 
     """
     if not json_str or not isinstance(json_str, str):
         raise ValueError("json_str must be a non-empty string")
 
-    # Strategy list: (name, cleanup_function)
-    cleanup_strategies = [
-        # Strategy 1: No cleanup - try as-is
-        ("no_cleanup", lambda s: s),
-        # Strategy 2: Fix Python literals (True/False/None)
-        (
-            "fix_python_literals",
-            lambda s: re.sub(r"\b(True|False)\b", lambda m: m.group(1).lower(), re.sub(r"\bNone\b", "null", s)),
-        ),
-        # Strategy 3: Remove trailing commas
-        ("fix_trailing_commas", lambda s: re.sub(r",(\s*[}\]])", r"\1", s)),
-        # Strategy 4: Fix escaped quotes and backslashes
-        ("fix_escapes", lambda s: re.sub(r"\\(?!\\|/|[btnfr])", "\\\\", s)),
-        # Strategy 5: Remove control characters
-        ("remove_control_chars", lambda s: s.encode("utf-8", "ignore").decode("utf-8")),
-    ]
-
-    last_error = None
-    for attempt_num, (strategy_name, cleanup_fn) in enumerate(cleanup_strategies, 1):
-        try:
-            cleaned_json = cleanup_fn(json_str)
-            result = json.loads(cleaned_json)
-
-            if attempt_num > 1:
-                logger.info(
-                    f"✅ JSON parsing succeeded with strategy '{strategy_name}' "
-                    f"(attempt {attempt_num}/{len(cleanup_strategies)})"
-                )
+    try:
+        result = parse_json_tolerant(json_str)
+    except json.JSONDecodeError as e:
+        logger.error(f"❌ JSON parsing failed after repair: {e} at char {e.pos}")
+        raise
 
-            return result
-
-        except json.JSONDecodeError as e:
-            last_error = e
-            logger.debug(
-                f"   Attempt {attempt_num}/{len(cleanup_strategies)} "
-                f"(strategy: {strategy_name}) failed at char {e.pos}: {e.msg}"
-            )
-            continue
-
-        except Exception as e:
-            logger.debug(f"   Attempt {attempt_num} ({strategy_name}) error: {e}")
-            continue
-
-    # All strategies failed
-    logger.error(
-        f"❌ JSON parsing failed after {len(cleanup_strategies)} cleanup strategies. "
-        f"Last error: {last_error} at char {last_error.pos if last_error else 'unknown'}"
-    )
-    raise last_error or ValueError("JSON parsing failed with unknown error")
+    if result.repairs:
+        logger.info(f"✅ JSON parsing succeeded after repairs: {', '.join(result.repairs)}")
+    return result.value
 
 
 def normalize_answer_schema(answer_schema_raw: str | dict | None) -> str:
@@ -145,6 +109,7 @@ class GenerateQuestionsRequest(BaseModel):
 
     session_id: str = Field(..., description="테스트 세션 ID (Backend Service가 생성)")
     survey_id: str = Field(..., description="설문 ID")
+    user_id: str | None = Field(default=None, description="사용자 ID (Tool 1 조회용, 사전 로드된 컨텍스트와 매칭)")
     round_idx: int = Field(..., ge=1, description="라운드 번호 (1-based)")
     prev_answers: list[dict] | None = Field(default=None, description="이전 라운드 답변 (적응형 테스트용)")
     question_count: int = Field(default=5, ge=1, le=20, description="생성할 문항 개수 (기본값: 5, 테스트: 2)")
@@ -589,11 +554,13 @@ class ItemGenAgent:
                 if request.question_types
                 else "multiple_choice, true_false, short_answer"
             )
+            # User ID는 Tool 1 사전 로드 컨텍스트 매칭용 (없으면 생략: survey_id를 user_id로 표시하지 않음)
+            user_id_line = f"User ID: {request.user_id}\n" if request.user_id else ""
             agent_input = f"""
 Generate high-quality exam questions for the following survey.
 Session ID: {request.session_id}
 Survey ID: {request.survey_id}
-Round: {request.round_idx}
+{user_id_line}Round: {request.round_idx}
 Domain: {request.domain}
 Previous Answers: {json.dumps(request.prev_answers) if request.prev_answers else "None (First round)"}
 Question Count: {request.question_count}
@@ -627,7 +594,13 @@ Important:
             #    - 가능한 경우: 같은 질문의 validate/save 단계를 병렬화
             # 2. Tool 비동기화: 모든 Tool을 async 함수로 변경 (현재는 동기)
             # 3. 캐싱: 자주 호출되는 Tool (get_difficulty_keywords)에 캐싱 적용
-            result = await self.executor.ainvoke({"messages": [HumanMessage(content=agent_input)]})
+            # AGENT_STREAMING_ENABLED=True: Final Answer 토큰을 스트리밍으로 받아
+            # question 객체가 닫히는 즉시 item으로 변환 (생성 완료 전 추출 시작)
+            streamed_items: list[GeneratedItem] | None = None
+            if getenv("AGENT_STREAMING_ENABLED", "False").lower() == "true":
+                result, streamed_items = await self._ainvoke_streaming(agent_input)
+            else:
+                result = await self.executor.ainvoke({"messages": [HumanMessage(content=agent_input)]})
 
             # ReAct 응답 완성도 검증 (디버깅 목적)
             for message in result.get("messages", []):
@@ -643,7 +616,7 @@ Important:
             logger.info("✅ 에이전트 실행 완료")
 
             # 결과 파싱
-            response = self._parse_agent_output_generate(result, round_id)
+            response = self._parse_agent_output_generate(result, round_id, streamed_items=streamed_items)
             logger.info(f"✅ 문항 생성 성공: {len(response.items)}개 생성")
 
             return response
@@ -659,6 +632,62 @@ Important:
                 error_message=str(e),
             )
 
+    async def _ainvoke_streaming(self, agent_input: str) -> tuple[dict, list[GeneratedItem] | None]:
+        """
+        Run the agent with token streaming and extract items while the Final Answer streams.
+
+        Each AI turn gets a fresh FinalAnswerStreamParser (and item list); completed
+        question objects are converted to GeneratedItem as soon as their closing
+        brace arrives. Only items of the last turn are returned.
+
+        Args:
+            agent_input: Agent prompt
+
+        Returns:
+            (final graph state, streamed items or None if the Final Answer did not
+            stream completely - caller then falls back to full-message parsing)
+
+        """
+        result: dict = {}
+        items: list[GeneratedItem] = []
+        parser: FinalAnswerStreamParser | None = None
+        message_id: str | None = None
+        started = time.perf_counter()
+
+        async for mode, payload in self.executor.astream(
+            {"messages": [HumanMessage(content=agent_input)]}, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                result = payload
+                continue
+
+            chunk, _metadata = payload
+            if not isinstance(chunk, AIMessageChunk) or not isinstance(chunk.content, str):
+                continue
+            if parser is None or chunk.id != message_id:
+                # New AI turn: items parsed from an earlier turn's partial Final Answer are discarded
+                parser, message_id = FinalAnswerStreamParser(), chunk.id
+                items = []
+
+            for question in parser.feed(chunk.content):
+                for item_dict in AgentOutputConverter.extract_items_from_questions(question):
+                    item_dict["saved_at"] = datetime.now(UTC).isoformat()
+                    try:
+                        items.append(GeneratedItem(**item_dict))
+                    except Exception as e:
+                        logger.warning(f"⚠️  Streamed item skipped: {e}")
+                        continue
+                    if len(items) == 1:
+                        logger.info(f"⚡ First item extracted after {(time.perf_counter() - started) * 1000:.0f}ms")
+
+        if parser is None or not parser.finished or parser.errors:
+            logger.info("Final Answer did not stream completely; falling back to full-message parsing")
+            return result, None
+
+        if parser.repairs:
+            logger.info(f"Final Answer repairs applied: {sorted(parser.repairs)}")
+        return result, items
+
     async def score_and_explain(self, request: ScoreAnswerRequest) -> ScoreAnswerResponse:
         """
         Mode 2: Auto-grade answers (Tool 6).
@@ -885,13 +914,20 @@ Tool 6 will return: is_correct (boolean), score (0-100), explanation, keyword_ma
                 ),
             )
 
-    def _parse_agent_output_generate(self, result: dict, round_id: str) -> GenerateQuestionsResponse:
+    def _parse_agent_output_generate(
+        self,
+        result: dict,
+        round_id: str,
+        streamed_items: list[GeneratedItem] | None = None,
+    ) -> GenerateQuestionsResponse:
         """
         Parse agent output for question generation (REQ-A-LangChain).
 
         Args:
             result: Agent output (supports both AgentExecutor and LangGraph formats)
             round_id: 라운드 ID
+            streamed_items: Items already extracted while the Final Answer streamed
+                (skips Final Answer re-parsing)
 
         Returns:
             GenerateQuestionsResponse
@@ -985,13 +1021,13 @@ Tool 6 will return: is_correct (boolean), score (0-100), explanation, keyword_ma
 
             # 0. ReAct 텍스트 형식: Final Answer JSON 파싱 시도 (AgentOutputConverter 사용)
             logger.info("\n🔍 Attempting to parse Final Answer JSON from AIMessage...")
-            items: list[GeneratedItem] = []
+            items: list[GeneratedItem] = list(streamed_items or [])
             failed_count = 0
             error_messages: list[str] = []
-            agent_steps = 0  # Initialize agent_steps early
+            agent_steps = len(result.get("messages", [])) if items else 0  # Initialize agent_steps early
 
-            # AIMessage에서 Final Answer JSON 추출
-            for message in result.get("messages", []):
+            # AIMessage에서 Final Answer JSON 추출 (스트리밍으로 이미 추출된 경우 스킵)
+            for message in [] if items else result.get("messages", []):
                 if isinstance(message, AIMessage):
                     content = getattr(message, "content", "")
 
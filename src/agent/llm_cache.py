@@ -0,0 +1,369 @@
+"""
+LLM Response Cache - Exact-match cache with SQLite persistence.
+
+REQ: REQ-A-ItemGen
+
+Validation (Tool 4), short-answer scoring (Tool 6) and explanation generation
+send identical prompts repeatedly. CachedChatModel wraps the LLM from
+create_llm() and serves repeated prompts from a local SQLite file.
+
+Cache key: sha256 of (provider, model, params, messages, stop, call kwargs).
+Calls with bound tools (ReAct agent) bypass the cache.
+
+Eviction:
+    - TTL: entries older than ttl_seconds are ignored and purged
+    - LRU: when max_entries is exceeded, least recently accessed entries are deleted
+
+Environment Variables:
+    LLM_CACHE_ENABLED: "True" to wrap create_llm() output (default: False)
+    LLM_CACHE_PATH: SQLite file path (default: .cache/llm_responses.sqlite3)
+    LLM_CACHE_TTL_SECONDS: Entry lifetime (default: 604800 = 7 days)
+    LLM_CACHE_MAX_ENTRIES: Maximum entries before LRU eviction (default: 10000)
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from os import getenv
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import (
+    AIMessageChunk,
+    BaseMessage,
+    BaseMessageChunk,
+    message_chunk_to_message,
+    message_to_dict,
+    messages_from_dict,
+)
+from pydantic import ConfigDict
+
+from src.agent.llm_middleware import DelegatingChatModel, describe_llm
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/llm_responses.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class LLMResponseCache:
+    """
+    Thread-safe SQLite-backed exact-match response cache.
+
+    Stores serialized AIMessage plus the latency of the original call, so hits
+    can report how much LLM time they saved.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize cache and create the table if needed.
+
+        Args:
+            path: SQLite file path (":memory:" for non-persistent cache)
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of entries kept (LRU eviction)
+
+        """
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_latency_ms = 0.0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                message TEXT NOT NULL,
+                latency_ms REAL NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        params: dict[str, Any],
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        call_kwargs: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Build cache key from request identity.
+
+        Args:
+            provider: LLM provider type (e.g., "chat-google-generative-ai")
+            model: Model name
+            params: Model parameters (temperature, max tokens, ...)
+            messages: Prompt messages
+            stop: Stop sequences
+            call_kwargs: Extra per-call kwargs
+
+        Returns:
+            Hex sha256 digest
+
+        """
+        payload = {
+            "provider": provider,
+            "model": model,
+            "params": params,
+            "messages": [(m.type, m.content) for m in messages],
+            "stop": stop,
+            "kwargs": call_kwargs or {},
+        }
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> BaseMessage | None:
+        """
+        Get cached message if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached message or None
+
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT message, latency_ms, created_at FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            self.saved_latency_ms += row[1]
+
+        return messages_from_dict([json.loads(row[0])])[0]
+
+    def put(self, key: str, message: BaseMessage, latency_ms: float) -> None:
+        """
+        Store message and evict least recently used entries beyond max_entries.
+
+        Args:
+            key: Cache key
+            message: LLM response message
+            latency_ms: Latency of the original LLM call
+
+        """
+        now = time.time()
+        serialized = json.dumps(message_to_dict(message), ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, message, latency_ms, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, serialized, latency_ms, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of deleted entries
+
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all entries and reset statistics."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+            self.saved_latency_ms = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics (size, hits, misses, hit_rate, saved_latency_ms)."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                "size": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "saved_latency_ms": round(self.saved_latency_ms, 1),
+            }
+
+
+class CachedChatModel(DelegatingChatModel):
+    """
+    Chat model wrapper that serves repeated prompts from LLMResponseCache.
+
+    Example:
+        >>> llm = CachedChatModel(inner=create_llm(), response_cache=get_llm_cache())
+        >>> llm.invoke(prompt)  # first call hits the provider
+        >>> llm.invoke(prompt)  # second call is a SQLite lookup
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    response_cache: LLMResponseCache
+
+    def _cache_key(self, messages: list[BaseMessage], stop: list[str] | None, kwargs: dict[str, Any]) -> str | None:
+        """Return cache key, or None if the call must not be cached (tools bound)."""
+        if "tools" in kwargs or "functions" in kwargs:
+            return None
+        provider, model, params = describe_llm(self.inner)
+        return LLMResponseCache.make_key(provider, model, params, messages, stop, kwargs)
+
+    def _call(self, messages: list[BaseMessage], stop: list[str] | None, **kwargs: Any) -> BaseMessage:  # noqa: ANN401
+        """Serve from cache or invoke inner model and store the response."""
+        key = self._cache_key(messages, stop, kwargs)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
+        message = super()._call(messages, stop, **kwargs)
+        if key is not None:
+            self.response_cache.put(key, message, (time.perf_counter() - start) * 1000)
+        return message
+
+    async def _acall(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> BaseMessage:
+        """Async variant of _call."""
+        key = self._cache_key(messages, stop, kwargs)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
+        message = await super()._acall(messages, stop, **kwargs)
+        if key is not None:
+            self.response_cache.put(key, message, (time.perf_counter() - start) * 1000)
+        return message
+
+    @staticmethod
+    def _as_chunk(message: BaseMessage) -> BaseMessageChunk:
+        """Replay cached message as a single stream chunk."""
+        return AIMessageChunk(
+            content=message.content,
+            additional_kwargs=message.additional_kwargs,
+            response_metadata=message.response_metadata,
+            id=message.id,
+        )
+
+    def _call_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[BaseMessageChunk]:
+        """Replay cache hit as one chunk, or stream inner model and store the completed response."""
+        key = self._cache_key(messages, stop, kwargs)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                yield self._as_chunk(cached)
+                return
+
+        start = time.perf_counter()
+        full: BaseMessageChunk | None = None
+        for chunk in super()._call_stream(messages, stop, **kwargs):
+            full = chunk if full is None else full + chunk
+            yield chunk
+        if key is not None and full is not None:
+            self.response_cache.put(key, message_chunk_to_message(full), (time.perf_counter() - start) * 1000)
+
+    async def _acall_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[BaseMessageChunk]:
+        """Async variant of _call_stream."""
+        key = self._cache_key(messages, stop, kwargs)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                yield self._as_chunk(cached)
+                return
+
+        start = time.perf_counter()
+        full: BaseMessageChunk | None = None
+        async for chunk in super()._acall_stream(messages, stop, **kwargs):
+            full = chunk if full is None else full + chunk
+            yield chunk
+        if key is not None and full is not None:
+            self.response_cache.put(key, message_chunk_to_message(full), (time.perf_counter() - start) * 1000)
+
+
+# Process-wide cache instance (lazy singleton, built on first use)
+_llm_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _build_llm_cache() -> LLMResponseCache:
+    """Open cache configured from environment (once per process)."""
+    cache = LLMResponseCache(
+        path=getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+        ttl_seconds=float(getenv("LLM_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+        max_entries=int(getenv("LLM_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+    )
+    logger.info(f"LLM response cache enabled: path={cache.path}")
+    return cache
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Get process-wide LLM response cache configured from environment.
+
+    Returns:
+        LLMResponseCache singleton
+
+    """
+    with _llm_cache_lock:
+        return _build_llm_cache()
@@ -0,0 +1,425 @@
+"""
+Fake LLM - Deterministic scripted chat model for load and latency testing.
+
+REQ: REQ-A-ItemGen
+
+Lets the backend and the ReAct agent run end-to-end without a Gemini key or
+LiteLLM proxy. Responses are derived from the prompt (same prompt → same
+response) and mimic every LLM call site in the repo:
+
+    - ReAct agent (tools bound): Tool 1 + Tool 3 calls → Tool 4 call per
+      question → "Final Answer: [...]" JSON
+    - Tool 4 validation: single score ("0.91") or batch JSON array
+    - Tool 6 short answer scoring: {"score": .., "reasoning": ..}
+    - Tool 6 explanation: text + "Reference Link N: {...}" lines
+    - ExplainService: {"explanation": .., "reference_links": [...]} JSON
+      (batch prompt: JSON array with one such object per "[문항 N]")
+
+Latency follows a lognormal distribution around a median; errors and 429s
+are injected at configurable rates (seeded RNG → reproducible runs).
+When streamed (e.g. LangGraph stream_mode="messages"), text responses are
+emitted in small chunks with the latency spread across them.
+
+Environment Variables:
+    USE_FAKE_LLM: "True" to select this provider in create_llm() (default: False)
+    LLM_FAKE_LATENCY_MS: Median latency in milliseconds (default: 0)
+    LLM_FAKE_LATENCY_SIGMA: Lognormal sigma; 0 = constant latency (default: 0.5)
+    LLM_FAKE_ERROR_RATE: Fraction of calls raising FakeLLMError (default: 0)
+    LLM_FAKE_THROTTLE_RATE: Fraction of calls raising FakeRateLimitError (429) (default: 0)
+    LLM_FAKE_SEED: RNG seed for latency/error injection (default: 42)
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from os import getenv
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict, PrivateAttr
+
+FAKE_MODEL_NAME = "fake-scripted"
+
+
+class FakeLLMError(Exception):
+    """Injected generic provider failure."""
+
+
+class FakeRateLimitError(Exception):
+    """Injected provider 429 (recognized by llm_limiter.is_throttle_error)."""
+
+    status_code = 429
+
+
+def _digest(text: str) -> int:
+    """Return stable integer hash of text."""
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:12], 16)
+
+
+def _stable_score(text: str, low: float, high: float) -> float:
+    """Map text to a deterministic value in [low, high] (2 decimals)."""
+    return round(low + (_digest(text) % 1000) / 999 * (high - low), 2)
+
+
+def _field(pattern: str, text: str, default: str) -> str:
+    """Extract first regex group from text or return default."""
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else default
+
+
+def scripted_questions(agent_input: str) -> list[dict[str, Any]]:
+    """
+    Build deterministic questions for a Mode 1 agent input.
+
+    Reads "Question Count", "Question Types", "Domain", "Survey ID" and
+    "Round" lines from the agent input (see ItemGenAgent.generate_questions).
+
+    Args:
+        agent_input: Agent HumanMessage content
+
+    Returns:
+        List of questions in the Final Answer format of the ReAct prompt
+
+    """
+    count = int(_field(r"Question Count:\s*(\d+)", agent_input, "5"))
+    types = [t.strip() for t in _field(r"Question Types:\s*(.+)", agent_input, "multiple_choice").split(",")]
+    types = [t for t in types if t in ("multiple_choice", "true_false", "short_answer")] or ["multiple_choice"]
+    domain = _field(r"Domain:\s*(.+)", agent_input, "AI")
+    survey_id = _field(r"Survey ID:\s*(.+)", agent_input, "survey")
+    round_idx = _field(r"Round:\s*(\d+)", agent_input, "1")
+
+    # Content depends on survey/round only; ids are unique per agent input (session)
+    input_digest = _digest(agent_input)
+    questions = []
+    for i in range(count):
+        seed = f"{survey_id}:{round_idx}:{i}"
+        item_type = types[i % len(types)]
+        difficulty = 3 + _digest(seed) % 5
+        question: dict[str, Any] = {
+            "question_id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{input_digest}:{i}")),
+            "type": item_type,
+            "difficulty": difficulty,
+            "category": domain,
+            "validation_score": _stable_score(seed, 0.85, 0.98),
+        }
+        if item_type == "multiple_choice":
+            choices = [f"{domain} 개념 {i + 1}-{c} 설명" for c in "ABCD"]
+            question["stem"] = f"[{domain}] {round_idx}라운드 {i + 1}번: 다음 중 올바른 설명은 무엇입니까?"
+            question["choices"] = choices
+            question["answer_schema"] = {
+                "type": "exact_match",
+                "correct_answer": choices[_digest(seed) % len(choices)],
+                "keywords": None,
+            }
+        elif item_type == "true_false":
+            question["stem"] = f"[{domain}] {round_idx}라운드 {i + 1}번: 다음 설명은 참입니까?"
+            question["choices"] = ["True", "False"]
+            question["answer_schema"] = {
+                "type": "exact_match",
+                "correct_answer": "True" if _digest(seed) % 2 == 0 else "False",
+                "keywords": None,
+            }
+        else:
+            question["stem"] = f"[{domain}] {round_idx}라운드 {i + 1}번: 핵심 개념을 간단히 설명하세요."
+            question["choices"] = None
+            question["answer_schema"] = {
+                "type": "keyword_match",
+                "correct_answer": None,
+                "keywords": [f"{domain} 원리", "적용 사례", "한계"],
+            }
+        questions.append(question)
+    return questions
+
+
+def _tool_call(name: str, args: dict[str, Any], seed: str) -> dict[str, Any]:
+    """Build a tool call dict with a deterministic id."""
+    return {"name": name, "args": args, "id": f"call_{_digest(f'{seed}:{name}:{json.dumps(args)}'):x}"}
+
+
+def _react_step(messages: list[BaseMessage], tool_names: set[str]) -> AIMessage:
+    """
+    Script one ReAct agent step from the conversation so far.
+
+    Step 1: Tool 1 (+ Tool 3) → Step 2: Tool 4 per question → Step 3: Final Answer.
+    """
+    agent_input = next((str(m.content) for m in messages if isinstance(m, HumanMessage)), "")
+    called = {m.name for m in messages if isinstance(m, ToolMessage)}
+    questions = scripted_questions(agent_input)
+
+    if "get_user_profile" in tool_names and "get_user_profile" not in called:
+        user_id = _field(r"User ID:\s*(.+)", agent_input, "unknown")
+        calls = [_tool_call("get_user_profile", {"user_id": user_id}, agent_input)]
+        if "get_difficulty_keywords" in tool_names and questions:
+            calls.append(
+                _tool_call(
+                    "get_difficulty_keywords",
+                    {"difficulty": questions[0]["difficulty"], "category": "technical"},
+                    agent_input,
+                )
+            )
+        return AIMessage(content="Thought: 사용자 프로필과 난이도 키워드를 조회합니다.", tool_calls=calls)
+
+    if "validate_question_quality" in tool_names and "validate_question_quality" not in called and questions:
+        calls = [
+            _tool_call(
+                "validate_question_quality",
+                {
+                    "stem": q["stem"],
+                    "question_type": q["type"],
+                    "choices": q["choices"],
+                    "correct_answer": q["answer_schema"]["correct_answer"] or ", ".join(q["answer_schema"]["keywords"]),
+                },
+                agent_input,
+            )
+            for q in questions
+        ]
+        return AIMessage(content="Thought: 생성한 문항을 검증합니다.", tool_calls=calls)
+
+    final_answer = json.dumps(questions, ensure_ascii=False, indent=2)
+    return AIMessage(content=f"Thought: 모든 문항이 검증되었습니다.\nFinal Answer: {final_answer}")
+
+
+def _scripted_explanation(category: str) -> dict[str, Any]:
+    """Script one ExplainService explanation (four sections, three reference links)."""
+    sections = [
+        "[틀린 이유]\n선택한 보기는 문제의 조건 중 일부만 고려했기 때문에 정답이 될 수 없습니다. " * 2,
+        "[정답의 원리]\n정답은 문제에서 요구하는 핵심 개념을 정확히 설명하며 실제 사례에도 그대로 적용됩니다. " * 2,
+        "[개념 구분]\n유사 개념은 적용 범위와 전제 조건이 다르므로 정의와 사용 맥락을 함께 비교해야 합니다. " * 2,
+        "[복습 팁]\n다음에는 보기의 전제 조건을 먼저 확인하고 핵심 용어의 정의를 다시 떠올려 보세요. " * 2,
+    ]
+    return {
+        "explanation": "\n\n".join(s.strip() for s in sections),
+        "reference_links": [
+            {"title": "개념 설명 자료", "url": f"https://example.com/concept-{category.lower()}"},
+            {"title": "심화 학습 가이드", "url": f"https://example.com/guide-{category.lower()}"},
+            {"title": "관련 문제 풀이집", "url": f"https://example.com/problems-{category.lower()}"},
+        ],
+    }
+
+
+def _scripted_text(prompt: str) -> str:
+    """Script a plain-prompt response based on which call site built the prompt."""
+    if "Evaluate the quality of each of the following" in prompt:
+        count = len(re.findall(r"^\[Question \d+\]", prompt, re.MULTILINE))
+        return json.dumps(
+            [{"index": i, "score": _stable_score(f"{prompt}:{i}", 0.8, 0.98)} for i in range(1, count + 1)]
+        )
+
+    if "Evaluate the quality of this question" in prompt:
+        return str(_stable_score(prompt, 0.8, 0.98))
+
+    if "Evaluate the following short answer response" in prompt:
+        score = int(_stable_score(prompt, 40, 95))
+        return json.dumps({"score": score, "reasoning": "핵심 개념을 일부 포함하고 있습니다."}, ensure_ascii=False)
+
+    if "Generate a learning explanation" in prompt:
+        body = " ".join(["This answer touches the key concepts and can be improved with concrete examples."] * 8)
+        links = "\n".join(
+            f'Reference Link {i}: {{"title": "Reference {i}", "url": "https://example.com/ref-{i}"}}'
+            for i in range(1, 4)
+        )
+        return f"{body}\n{links}"
+
+    if "개 문제 각각에 대해" in prompt:
+        blocks = re.split(r"^\[문항 \d+\]$", prompt, flags=re.MULTILINE)[1:]
+        return json.dumps(
+            [
+                {"index": i, **_scripted_explanation(_field(r"문제 주제:\s*(.+)", block, "general"))}
+                for i, block in enumerate(blocks, start=1)
+            ],
+            ensure_ascii=False,
+        )
+
+    if "맞춤형 해설" in prompt:
+        return json.dumps(_scripted_explanation(_field(r"문제 주제:\s*(.+)", prompt, "general")), ensure_ascii=False)
+
+    return "OK"
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Deterministic chat model with injected latency, errors and 429s.
+
+    Attributes:
+        latency_ms: Median latency in milliseconds
+        latency_sigma: Lognormal sigma (0 = constant latency)
+        error_rate: Fraction of calls raising FakeLLMError
+        throttle_rate: Fraction of calls raising FakeRateLimitError
+        seed: RNG seed for latency/error injection
+        stream_chunk_chars: Characters per chunk when streaming
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: str = FAKE_MODEL_NAME
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    seed: int = 42
+    stream_chunk_chars: int = 24
+
+    _rng: random.Random = PrivateAttr()
+    _rng_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+        """Initialize seeded RNG."""
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        """Return LLM type."""
+        return "fake-scripted"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        """Return identifying params."""
+        return {"model": self.model}
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Runnable[LanguageModelInput, BaseMessage]:
+        """Bind tools in OpenAI format (tool names drive the ReAct script)."""
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _draw(self) -> tuple[float, Exception | None]:
+        """Draw latency (seconds) and injected error for one call."""
+        with self._rng_lock:
+            latency = self.latency_ms / 1000
+            if latency > 0 and self.latency_sigma > 0:
+                latency = self._rng.lognormvariate(0.0, self.latency_sigma) * latency
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return latency, FakeRateLimitError("429 Too Many Requests (injected)")
+        if roll < self.throttle_rate + self.error_rate:
+            return latency, FakeLLMError("Fake LLM failure (injected)")
+        return latency, None
+
+    def _respond(self, messages: list[BaseMessage], kwargs: dict[str, Any]) -> ChatResult:
+        """Build scripted response for messages."""
+        tools = kwargs.get("tools")
+        if tools:
+            tool_names = {t.get("function", {}).get("name", t.get("name")) for t in tools}
+            message = _react_step(messages, tool_names)
+        else:
+            message = AIMessage(content=_scripted_text(str(messages[-1].content) if messages else ""))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        """Sleep for sampled latency, then raise injected error or respond."""
+        latency, error = self._draw()
+        if latency > 0:
+            time.sleep(latency)
+        if error:
+            raise error
+        return self._respond(messages, kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        """Async variant of _generate (does not block the event loop)."""
+        latency, error = self._draw()
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if error:
+            raise error
+        return self._respond(messages, kwargs)
+
+    def _chunks(self, message: BaseMessage) -> list[ChatGenerationChunk]:
+        """Split scripted response into stream chunks (tool calls arrive in the last chunk)."""
+        content = str(message.content)
+        size = max(1, self.stream_chunk_chars)
+        chunks = [
+            ChatGenerationChunk(message=AIMessageChunk(content=content[i : i + size]))
+            for i in range(0, len(content), size)
+        ]
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls or not chunks:
+            tool_call_chunks = [
+                {"name": tc["name"], "args": json.dumps(tc["args"], ensure_ascii=False), "id": tc["id"], "index": i}
+                for i, tc in enumerate(tool_calls or [])
+            ]
+            chunks.append(ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=tool_call_chunks)))
+        return chunks
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[ChatGenerationChunk]:
+        """Stream scripted response in chunks, spreading sampled latency across them."""
+        latency, error = self._draw()
+        if error:
+            raise error
+        chunks = self._chunks(self._respond(messages, kwargs).generations[0].message)
+        for chunk in chunks:
+            if latency > 0:
+                time.sleep(latency / len(chunks))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Async variant of _stream."""
+        latency, error = self._draw()
+        if error:
+            raise error
+        chunks = self._chunks(self._respond(messages, kwargs).generations[0].message)
+        for chunk in chunks:
+            if latency > 0:
+                await asyncio.sleep(latency / len(chunks))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+
+def create_fake_llm() -> ScriptedChatModel:
+    """
+    Create ScriptedChatModel configured from environment.
+
+    Returns:
+        ScriptedChatModel instance
+
+    """
+    return ScriptedChatModel(
+        latency_ms=float(getenv("LLM_FAKE_LATENCY_MS", "0")),
+        latency_sigma=float(getenv("LLM_FAKE_LATENCY_SIGMA", "0.5")),
+        error_rate=float(getenv("LLM_FAKE_ERROR_RATE", "0")),
+        throttle_rate=float(getenv("LLM_FAKE_THROTTLE_RATE", "0")),
+        seed=int(getenv("LLM_FAKE_SEED", "42")),
+    )
@@ -0,0 +1,333 @@
+"""
+LLM Hedging - Hedged requests to cut tail latency of idempotent LLM calls.
+
+REQ: REQ-A-ItemGen
+
+Providers are configured with timeout=30 and have a long latency tail; one
+slow validation/explanation call stalls the whole request. HedgedChatModel
+sends a duplicate request when the primary has not answered within the
+observed p90 latency and returns whichever response arrives first.
+
+Policy:
+    - Only idempotent calls are hedged (plain prompts; tool-calling agent
+      requests pass through untouched)
+    - Hedge delay = configured percentile of recent primary latencies;
+      no hedging until min_samples latencies have been observed
+    - Budget: hedges are capped at max_hedge_ratio of recent requests; hedges still
+      in flight count against the budget, so a burst of slow calls cannot all hedge
+    - Duplicate goes to the alternate provider when one is configured
+
+Sync callers: primary and hedge run on a shared thread pool (the loser
+finishes in the background). Async callers: the loser task is cancelled.
+
+Environment Variables:
+    LLM_HEDGING_ENABLED: "True" to wrap create_llm() output (default: False)
+    LLM_HEDGE_PERCENTILE: Latency percentile used as hedge delay (default: 0.9)
+    LLM_HEDGE_MAX_RATIO: Maximum fraction of hedged requests (default: 0.1)
+    LLM_HEDGE_MIN_SAMPLES: Latencies observed before hedging (default: 20)
+    LLM_HEDGE_ALTERNATE: "True" to send hedges to the alternate provider (default: False)
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from os import getenv
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from pydantic import ConfigDict
+
+from src.agent.llm_middleware import DelegatingChatModel
+
+logger = logging.getLogger(__name__)
+
+HEDGE_MAX_WORKERS = 32
+
+_hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge")
+
+
+def nearest_rank_percentile(values: list[float], q: float) -> float:
+    """Return q-quantile (0..1) of values using nearest-rank."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class HedgingPolicy:
+    """
+    Thread-safe hedge delay estimation, budget and metrics.
+
+    Latencies are kept in a sliding window of the most recent requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        max_hedge_ratio: float = 0.1,
+        min_samples: int = 20,
+        window: int = 500,
+    ) -> None:
+        """
+        Initialize policy.
+
+        Args:
+            percentile: Latency percentile used as hedge delay (0..1)
+            max_hedge_ratio: Maximum fraction of requests that may be hedged
+            min_samples: Number of observed latencies required before hedging
+            window: Sliding window size for latencies and budget
+
+        """
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._primary_latencies: deque[float] = deque(maxlen=window)
+        self._effective_latencies: deque[float] = deque(maxlen=window)
+        self._hedged_flags: deque[bool] = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.hedges_in_flight = 0
+
+    def hedge_delay(self) -> float | None:
+        """
+        Get current hedge delay in seconds.
+
+        Returns:
+            Delay, or None if not enough samples have been observed yet
+
+        """
+        with self._lock:
+            if len(self._primary_latencies) < self.min_samples:
+                return None
+            return nearest_rank_percentile(list(self._primary_latencies), self.percentile)
+
+    def try_start_hedge(self) -> bool:
+        """
+        Reserve hedge budget; return False if the budget is exhausted.
+
+        A successful reservation counts as in flight until record_request(hedged=True)
+        or abort_hedge() is called.
+        """
+        with self._lock:
+            hedged = sum(self._hedged_flags) + self.hedges_in_flight + 1
+            recent = len(self._hedged_flags) + self.hedges_in_flight + 1
+            if hedged > self.max_hedge_ratio * recent:
+                return False
+            self.hedges += 1
+            self.hedges_in_flight += 1
+            return True
+
+    def abort_hedge(self) -> None:
+        """Release a reservation whose request failed or was cancelled (nothing recorded)."""
+        with self._lock:
+            self.hedges_in_flight = max(0, self.hedges_in_flight - 1)
+
+    def record_primary(self, latency: float) -> None:
+        """Record primary latency (used for hedge delay estimation)."""
+        with self._lock:
+            self._primary_latencies.append(latency)
+
+    def record_request(self, latency: float, hedged: bool, hedge_won: bool = False) -> None:
+        """Record latency observed by the caller (hedged=True completes a reservation)."""
+        with self._lock:
+            if hedged:
+                self.hedges_in_flight = max(0, self.hedges_in_flight - 1)
+            self.requests += 1
+            self._effective_latencies.append(latency)
+            self._hedged_flags.append(hedged)
+            if hedge_won:
+                self.hedge_wins += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return hedge rate and latency percentiles (primary vs effective)."""
+        with self._lock:
+            primary = list(self._primary_latencies)
+            effective = list(self._effective_latencies)
+            p99_primary = nearest_rank_percentile(primary, 0.99) * 1000
+            p99_effective = nearest_rank_percentile(effective, 0.99) * 1000
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedges_in_flight": self.hedges_in_flight,
+                "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+                "p90_primary_ms": round(nearest_rank_percentile(primary, 0.9) * 1000, 1),
+                "p99_primary_ms": round(p99_primary, 1),
+                "p99_effective_ms": round(p99_effective, 1),
+                "p99_improvement_ms": round(p99_primary - p99_effective, 1) if primary and effective else 0.0,
+            }
+
+
+class HedgedChatModel(DelegatingChatModel):
+    """
+    Chat model wrapper that hedges slow idempotent calls.
+
+    Streamed calls are passed through unhedged: tokens are already flowing to the
+    caller, so a duplicate stream could not be merged into the first one.
+
+    Attributes:
+        policy: Shared HedgingPolicy
+        alternate: Optional alternate provider used for the duplicate request
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    policy: HedgingPolicy
+    alternate: BaseChatModel | None = None
+
+    @staticmethod
+    def _is_idempotent(kwargs: dict[str, Any]) -> bool:
+        """Plain prompt calls are idempotent; tool-calling agent steps are not hedged."""
+        return "tools" not in kwargs and "functions" not in kwargs
+
+    def _timed_invoke(
+        self,
+        llm: BaseChatModel,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        kwargs: dict[str, Any],
+        is_primary: bool,
+    ) -> BaseMessage:
+        """Invoke llm and record primary latency (runs on hedge executor)."""
+        start = time.monotonic()
+        result = llm.invoke(messages, stop=stop, **kwargs)
+        if is_primary:
+            self.policy.record_primary(time.monotonic() - start)
+        return result
+
+    def _call(self, messages: list[BaseMessage], stop: list[str] | None, **kwargs: Any) -> BaseMessage:  # noqa: ANN401
+        """Invoke primary; fire a duplicate if it is slower than the hedge delay."""
+        delay = self.policy.hedge_delay()
+        if not self._is_idempotent(kwargs) or delay is None:
+            start = time.monotonic()
+            result = super()._call(messages, stop, **kwargs)
+            if self._is_idempotent(kwargs):
+                latency = time.monotonic() - start
+                self.policy.record_primary(latency)
+                self.policy.record_request(latency, hedged=False)
+            return result
+
+        start = time.monotonic()
+        primary = _hedge_executor.submit(self._timed_invoke, self.inner, messages, stop, kwargs, True)
+        try:
+            result = primary.result(timeout=delay)
+            self.policy.record_request(time.monotonic() - start, hedged=False)
+            return result
+        except FutureTimeoutError:
+            pass
+
+        if not self.policy.try_start_hedge():
+            result = primary.result()
+            self.policy.record_request(time.monotonic() - start, hedged=False)
+            return result
+
+        target = self.alternate or self.inner
+        logger.debug(f"Hedging LLM call after {delay * 1000:.0f}ms")
+        hedge = _hedge_executor.submit(self._timed_invoke, target, messages, stop, kwargs, False)
+
+        pending: set[Future] = {primary, hedge}
+        recorded = False
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        self.policy.record_request(time.monotonic() - start, hedged=True, hedge_won=future is hedge)
+                        recorded = True
+                        return future.result()
+        finally:
+            if not recorded:  # both failed or caller interrupted
+                self.policy.abort_hedge()
+
+        # Both failed: surface the primary error
+        raise primary.exception()  # type: ignore[misc]
+
+    async def _acall(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> BaseMessage:
+        """Async variant of _call (the losing task is cancelled)."""
+        delay = self.policy.hedge_delay()
+        start = time.monotonic()
+        if not self._is_idempotent(kwargs) or delay is None:
+            result = await super()._acall(messages, stop, **kwargs)
+            if self._is_idempotent(kwargs):
+                latency = time.monotonic() - start
+                self.policy.record_primary(latency)
+                self.policy.record_request(latency, hedged=False)
+            return result
+
+        primary = asyncio.ensure_future(self.inner.ainvoke(messages, stop=stop, **kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.policy.try_start_hedge():
+            result = await primary
+            latency = time.monotonic() - start
+            self.policy.record_primary(latency)
+            self.policy.record_request(latency, hedged=False)
+            return result
+
+        target = self.alternate or self.inner
+        logger.debug(f"Hedging LLM call after {delay * 1000:.0f}ms")
+        hedge = asyncio.ensure_future(target.ainvoke(messages, stop=stop, **kwargs))
+
+        pending: set[asyncio.Future] = {primary, hedge}
+        recorded = False
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        latency = time.monotonic() - start
+                        # Like _call: only a primary that finished is a latency sample
+                        if task is primary:
+                            self.policy.record_primary(latency)
+                        self.policy.record_request(latency, hedged=True, hedge_won=task is hedge)
+                        recorded = True
+                        return task.result()
+        finally:
+            if not recorded:  # both failed or caller cancelled
+                self.policy.abort_hedge()
+            for task in pending:
+                task.cancel()
+
+        raise primary.exception()  # type: ignore[misc]
+
+
+# Process-wide policy instance (lazy singleton, built on first use)
+_hedging_policy_lock = threading.Lock()
+
+
+@functools.cache
+def _build_hedging_policy() -> HedgingPolicy:
+    """Build policy from environment (once per process)."""
+    policy = HedgingPolicy(
+        percentile=float(getenv("LLM_HEDGE_PERCENTILE", "0.9")),
+        max_hedge_ratio=float(getenv("LLM_HEDGE_MAX_RATIO", "0.1")),
+        min_samples=int(getenv("LLM_HEDGE_MIN_SAMPLES", "20")),
+    )
+    logger.info(f"LLM hedging enabled: percentile={policy.percentile}")
+    return policy
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """
+    Get process-wide hedging policy configured from environment.
+
+    Returns:
+        HedgingPolicy singleton
+
+    """
+    with _hedging_policy_lock:
+        return _build_hedging_policy()
@@ -0,0 +1,341 @@
+"""
+LLM Limiter - Process-wide concurrency limiter with adaptive (AIMD) throttling.
+
+REQ: REQ-A-ItemGen
+
+LLM calls come from the ReAct agent (async), the explanation thread pool,
+Mode2Pipeline (asyncio.to_thread) and CLI batch scoring. All of them obtain
+their client from create_llm(), so ThrottledChatModel enforces one shared limit:
+
+    - Token bucket: at most rate_per_second call starts (burst up to `burst`)
+    - Concurrency cap: at most `limit` calls in flight
+    - AIMD: limit += increase / limit on success (≈ +1 per window),
+            limit *= decrease_factor on 429 / timeout (at most once per cooldown)
+
+Both blocking (threads) and asyncio callers are supported: sync acquire waits on
+a threading.Condition, async acquire polls without blocking the event loop.
+
+Environment Variables:
+    LLM_LIMITER_ENABLED: "True" to wrap create_llm() output (default: False)
+    LLM_MAX_CONCURRENCY: Upper bound for concurrent calls (default: 8)
+    LLM_MIN_CONCURRENCY: Lower bound after backoff (default: 1)
+    LLM_RATE_PER_SECOND: Token bucket refill rate (default: 5)
+    LLM_BURST: Token bucket capacity (default: 10)
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from os import getenv
+from typing import Any
+
+from langchain_core.messages import BaseMessage, BaseMessageChunk
+from pydantic import ConfigDict
+
+from src.agent.llm_middleware import DelegatingChatModel
+
+logger = logging.getLogger(__name__)
+
+ASYNC_POLL_INTERVAL = 0.01  # seconds between async acquire attempts
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """
+    Check if error means the provider is overloaded (429 / timeout).
+
+    Args:
+        error: Exception raised by the LLM client
+
+    Returns:
+        True if limiter should back off
+
+    """
+    if isinstance(error, TimeoutError | asyncio.TimeoutError):
+        return True
+
+    for attr in ("status_code", "code", "http_status"):
+        if getattr(error, attr, None) == 429:
+            return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+
+    name = type(error).__name__.lower()
+    if any(marker in name for marker in ("ratelimit", "resourceexhausted", "timeout")):
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "resource exhausted" in message
+
+
+class AdaptiveLLMLimiter:
+    """
+    Thread- and asyncio-aware token bucket + AIMD concurrency limiter.
+
+    Example:
+        >>> limiter = AdaptiveLLMLimiter(max_concurrency=4)
+        >>> with limiter.slot():
+        ...     llm.invoke(prompt)
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        initial_concurrency: float | None = None,
+        rate_per_second: float | None = 5.0,
+        burst: int = 10,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+    ) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            max_concurrency: Upper bound for concurrent calls
+            min_concurrency: Lower bound after multiplicative decrease
+            initial_concurrency: Starting limit (default: max_concurrency)
+            rate_per_second: Token bucket refill rate (call starts per second); None disables the bucket
+            burst: Token bucket capacity
+            increase: Additive increase per full window of successes
+            decrease_factor: Multiplicative decrease on throttle (0 < f < 1)
+            cooldown_seconds: Minimum time between two decreases
+
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = float(initial_concurrency or max_concurrency)
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self._started_at = time.monotonic()
+        self.in_flight = 0
+
+        # Metrics
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.peak_in_flight = 0
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        """Refill token bucket (caller holds lock)."""
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate_per_second)
+        self._last_refill = now
+
+    def _try_acquire(self) -> float:
+        """
+        Try to take a slot (caller holds lock).
+
+        Returns:
+            0.0 if acquired, otherwise suggested wait in seconds
+
+        """
+        if self.in_flight >= int(self.limit):
+            return ASYNC_POLL_INTERVAL
+        if self.rate_per_second is not None:
+            self._refill(time.monotonic())
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.rate_per_second
+            self._tokens -= 1.0
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return 0.0
+
+    def _record_wait(self, waited: float) -> None:
+        """Record queue wait metrics (caller holds lock)."""
+        self.acquired += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def acquire(self) -> float:
+        """
+        Block until a slot is available (thread callers).
+
+        Returns:
+            Seconds spent waiting in queue
+
+        """
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0.0:
+                    waited = time.monotonic() - start
+                    self._record_wait(waited)
+                    return waited
+                self._cond.wait(timeout=wait)
+
+    async def aacquire(self) -> float:
+        """
+        Wait until a slot is available without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting in queue
+
+        """
+        start = time.monotonic()
+        while True:
+            with self._cond:
+                wait = self._try_acquire()
+                if wait == 0.0:
+                    waited = time.monotonic() - start
+                    self._record_wait(waited)
+                    return waited
+            await asyncio.sleep(min(wait, 0.1))
+
+    def release(self, duration: float = 0.0, throttled: bool = False) -> None:
+        """
+        Release slot and adapt limit (AIMD).
+
+        Args:
+            duration: Call duration in seconds (for effective concurrency)
+            throttled: True if call failed with 429 / timeout
+
+        """
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.busy_seconds += duration
+            now = time.monotonic()
+            if throttled:
+                self.throttled += 1
+                if now - self._last_decrease >= self.cooldown_seconds:
+                    self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.warning(f"LLM throttled: concurrency limit decreased to {self.limit:.2f}")
+            else:
+                self.limit = min(float(self.max_concurrency), self.limit + self.increase / max(self.limit, 1.0))
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of a sync call."""
+        self.acquire()
+        start = time.monotonic()
+        throttled = False
+        try:
+            yield
+        except BaseException as e:
+            throttled = is_throttle_error(e)
+            raise
+        finally:
+            self.release(time.monotonic() - start, throttled=throttled)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of an async call."""
+        await self.aacquire()
+        start = time.monotonic()
+        throttled = False
+        try:
+            yield
+        except BaseException as e:
+            throttled = is_throttle_error(e)
+            raise
+        finally:
+            self.release(time.monotonic() - start, throttled=throttled)
+
+    def stats(self) -> dict[str, Any]:
+        """Return limiter metrics (queue wait, effective concurrency, limit)."""
+        with self._cond:
+            elapsed = max(time.monotonic() - self._started_at, 1e-9)
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "avg_wait_ms": round(self.total_wait_seconds / self.acquired * 1000, 2) if self.acquired else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+                "effective_concurrency": round(self.busy_seconds / elapsed, 3),
+            }
+
+
+class ThrottledChatModel(DelegatingChatModel):
+    """Chat model wrapper that runs every call inside an AdaptiveLLMLimiter slot."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    limiter: AdaptiveLLMLimiter
+
+    def _call(self, messages: list[BaseMessage], stop: list[str] | None, **kwargs: Any) -> BaseMessage:  # noqa: ANN401
+        """Invoke inner model inside a limiter slot."""
+        with self.limiter.slot():
+            return super()._call(messages, stop, **kwargs)
+
+    async def _acall(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> BaseMessage:
+        """Invoke inner model inside a limiter slot (async)."""
+        async with self.limiter.aslot():
+            return await super()._acall(messages, stop, **kwargs)
+
+    def _call_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[BaseMessageChunk]:
+        """Stream inner model, holding one limiter slot until the stream ends."""
+        with self.limiter.slot():
+            yield from super()._call_stream(messages, stop, **kwargs)
+
+    async def _acall_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[BaseMessageChunk]:
+        """Stream inner model, holding one limiter slot until the stream ends (async)."""
+        async with self.limiter.aslot():
+            async for chunk in super()._acall_stream(messages, stop, **kwargs):
+                yield chunk
+
+
+# Process-wide limiter instance (lazy singleton, built on first use)
+_llm_limiter_lock = threading.Lock()
+
+
+@functools.cache
+def _build_llm_limiter() -> AdaptiveLLMLimiter:
+    """Build limiter from environment (once per process)."""
+    limiter = AdaptiveLLMLimiter(
+        max_concurrency=int(getenv("LLM_MAX_CONCURRENCY", "8")),
+        min_concurrency=int(getenv("LLM_MIN_CONCURRENCY", "1")),
+        rate_per_second=float(getenv("LLM_RATE_PER_SECOND", "5")),
+        burst=int(getenv("LLM_BURST", "10")),
+    )
+    logger.info(f"LLM limiter enabled: max_concurrency={limiter.max_concurrency}")
+    return limiter
+
+
+def get_llm_limiter() -> AdaptiveLLMLimiter:
+    """
+    Get process-wide LLM limiter configured from environment.
+
+    Returns:
+        AdaptiveLLMLimiter singleton
+
+    """
+    with _llm_limiter_lock:
+        return _build_llm_limiter()
@@ -0,0 +1,165 @@
+"""
+LLM Middleware - Delegating chat model base for wrapping LLM clients.
+
+REQ: REQ-A-ItemGen
+
+Design Patterns:
+- Decorator Pattern: Wrappers add behavior (cache, throttling, ...) around the
+  LLM instance returned by LLMProvider.create() without changing callers
+- Open/Closed Principle: New cross-cutting concerns subclass DelegatingChatModel
+
+Callers keep using the LangChain chat model API (invoke/ainvoke/bind_tools), so
+both direct tool calls (llm.invoke(prompt)) and the LangGraph ReAct agent go
+through the wrapper chain.
+"""
+
+import json
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, BaseMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+
+
+def describe_llm(llm: BaseChatModel) -> tuple[str, str, dict[str, Any]]:
+    """
+    Describe LLM instance as (provider, model, params).
+
+    Unwraps DelegatingChatModel chains so wrappers report the underlying client.
+
+    Args:
+        llm: Chat model instance
+
+    Returns:
+        (provider, model, params) tuple; params is JSON-safe
+
+    """
+    while isinstance(llm, DelegatingChatModel):
+        llm = llm.inner
+
+    provider = getattr(llm, "_llm_type", type(llm).__name__)
+    model = getattr(llm, "model", None) or getattr(llm, "model_name", None) or "unknown"
+    try:
+        params = dict(llm._identifying_params)
+    except Exception:
+        params = {}
+    # Normalize to JSON-safe values (SecretStr, enums, ...)
+    params = json.loads(json.dumps(params, sort_keys=True, default=str))
+    return str(provider), str(model), params
+
+
+class DelegatingChatModel(BaseChatModel):
+    """
+    Chat model that forwards every call to an inner chat model.
+
+    Subclasses override _call / _acall to add behavior around the inner call, and
+    _call_stream / _acall_stream for streamed calls (stream/astream, and LangGraph
+    runs with a streaming callback). Wrappers that do not override the stream
+    hooks pass the inner model's chunks through unchanged. bind_tools() binds the inner model's tool kwargs onto the wrapper, so tool
+    calling agents still route through the wrapper chain.
+    """
+
+    inner: BaseChatModel
+
+    @property
+    def _llm_type(self) -> str:
+        """Return inner LLM type (wrappers are transparent)."""
+        return self.inner._llm_type
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        """Return inner identifying params."""
+        return self.inner._identifying_params
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        """Bind tools using the inner model's tool format, keeping the wrapper in the chain."""
+        if tool_choice is not None:
+            kwargs["tool_choice"] = tool_choice
+        bound = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**getattr(bound, "kwargs", {}))
+
+    def _call(self, messages: list[BaseMessage], stop: list[str] | None, **kwargs: Any) -> BaseMessage:  # noqa: ANN401
+        """Invoke inner model (override to add behavior)."""
+        return self.inner.invoke(messages, stop=stop, **kwargs)
+
+    async def _acall(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> BaseMessage:
+        """Invoke inner model asynchronously (override to add behavior)."""
+        return await self.inner.ainvoke(messages, stop=stop, **kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        """Generate via _call."""
+        message = self._call(messages, stop, **kwargs)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        """Generate via _acall."""
+        message = await self._acall(messages, stop, **kwargs)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _call_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[BaseMessageChunk]:
+        """Stream inner model (override to add behavior)."""
+        yield from self.inner.stream(messages, stop=stop, **kwargs)
+
+    async def _acall_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[BaseMessageChunk]:
+        """Stream inner model asynchronously (override to add behavior)."""
+        async for chunk in self.inner.astream(messages, stop=stop, **kwargs):
+            yield chunk
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[ChatGenerationChunk]:
+        """Stream via _call_stream (token callbacks are emitted by BaseChatModel)."""
+        for chunk in self._call_stream(messages, stop, **kwargs):
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Stream via _acall_stream (token callbacks are emitted by BaseChatModel)."""
+        async for chunk in self._acall_stream(messages, stop, **kwargs):
+            yield ChatGenerationChunk(message=chunk)
@@ -22,9 +22,10 @@ REQ: REQ-A-OutputConverter
 
 import json
 import logging
-import re
 import uuid
 
+from src.agent.json_repair import parse_json_tolerant, strip_code_fences
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,18 +72,17 @@ class AgentOutputConverter:
         처리 단계:
         1. "Final Answer:" 패턴 탐색
         2. 마크다운 코드블록 제거 (```json ... ```)
-        3. Escaped 문자 처리
-        4. Robust JSON 파싱 (5가지 cleanup strategy)
+        3. Tolerant JSON 파싱 (src/agent/json_repair.py: fast path → single-pass repair)
 
         Args:
             content: AI Message의 content (ReAct 텍스트 형식)
-            max_attempts: 최대 cleanup 시도 횟수
+            max_attempts: 하위 호환용 (single-pass repair로 대체되어 사용하지 않음)
 
         Returns:
             파싱된 JSON 객체 또는 배열
 
         Raises:
-            json.JSONDecodeError: 모든 cleanup 시도 실패 시
+            json.JSONDecodeError: repair 후에도 파싱 실패 시
             ValueError: content가 None이거나 Final Answer 패턴 없을 시
 
         """
@@ -94,100 +94,42 @@ class AgentOutputConverter:
             raise ValueError('Content must contain "Final Answer:" pattern')
 
         json_start = content.find("Final Answer:") + len("Final Answer:")
-        json_str = content[json_start:].strip()
 
         # Step 2: 마크다운 코드블록 제거
-        json_str = AgentOutputConverter._remove_markdown_code_blocks(json_str)
-
-        # Step 3: Escaped 문자 처리
-        json_str = AgentOutputConverter._unescape_json_string(json_str)
+        json_str = strip_code_fences(content[json_start:])
 
-        # Step 4: Robust JSON 파싱
+        # Step 3: Tolerant JSON 파싱
         try:
-            parsed = AgentOutputConverter._parse_json_robust(json_str, max_attempts)
+            parsed = AgentOutputConverter._parse_json_robust(json_str)
             logger.info("✅ Successfully parsed Final Answer JSON")
             return parsed
         except json.JSONDecodeError:
-            logger.error(f"❌ Failed to parse Final Answer JSON after {max_attempts} attempts")
+            logger.error("❌ Failed to parse Final Answer JSON after repair")
             raise
 
-    @staticmethod
-    def _remove_markdown_code_blocks(json_str: str) -> str:
-        """마크다운 코드블록 (```json ... ```) 제거."""
-        if "```json" in json_str:
-            return json_str.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_str:
-            return json_str.split("```")[1].split("```")[0].strip()
-        return json_str
-
-    @staticmethod
-    def _unescape_json_string(json_str: str) -> str:
-        r"""
-        JSON 문자열의 escaped 문자 처리.
-
-        처리 대상:
-        - \\' → ' (single quote)
-        - \\" → " (double quote)
-        - \\bNone\\b → null (Python None)
-        """
-        # Remove backslash before single quotes
-        json_str = json_str.replace("\\'", "'")
-        # Replace escaped double quotes
-        json_str = json_str.replace('\\"', '"')
-        # Convert Python None to JSON null
-        json_str = re.sub(r"\bNone\b", "null", json_str)
-        return json_str
-
     @staticmethod
     def _parse_json_robust(json_str: str, max_attempts: int = 5) -> dict | list:
         """
-        5가지 cleanup strategy를 순차적으로 적용하는 robust JSON 파싱.
+        Tolerant JSON 파싱 (src/agent/json_repair.parse_json_tolerant 위임).
 
-        Strategy 1: 현상태로 파싱
-        Strategy 2: Python literals (True/False) 변환
-        Strategy 3: Trailing commas 제거
-        Strategy 4: Escape 문자 처리
-        Strategy 5: Control characters 제거
+        유효한 JSON은 fast path(orjson)로 바로 파싱하고, 실패 시 한 번의 스캔으로
+        Python literals / trailing commas / escape / control characters를 수정합니다.
 
         Args:
             json_str: Raw JSON 문자열
-            max_attempts: 최대 시도 횟수
+            max_attempts: 하위 호환용 (사용하지 않음)
 
         Returns:
             파싱된 JSON 객체 또는 배열
 
         Raises:
-            json.JSONDecodeError: 모든 전략 실패 시
+            json.JSONDecodeError: repair 후에도 파싱 실패 시
 
         """
-        cleanup_strategies = [
-            ("no_cleanup", lambda s: s),
-            ("fix_python_literals", lambda s: re.sub(r"\b(True|False)\b", lambda m: m.group(1).lower(), s)),
-            ("fix_trailing_commas", lambda s: re.sub(r",(\s*[}\]])", r"\1", s)),
-            ("fix_escapes", lambda s: re.sub(r"\\(?!\\|/|[btnfr])", "\\\\", s)),
-            ("remove_control_chars", lambda s: s.encode("utf-8", "ignore").decode("utf-8")),
-        ]
-
-        last_error = None
-        for attempt_num, (strategy_name, cleanup_fn) in enumerate(cleanup_strategies, 1):
-            try:
-                cleaned_json = cleanup_fn(json_str)
-                result = json.loads(cleaned_json)
-
-                if attempt_num > 1:
-                    logger.debug(
-                        f"✅ JSON parsing succeeded with strategy '{strategy_name}' "
-                        f"(attempt {attempt_num}/{len(cleanup_strategies)})"
-                    )
-                return result
-
-            except json.JSONDecodeError as e:
-                last_error = e
-                logger.debug(f"⚠️  Strategy '{strategy_name}' failed: {str(e)[:100]}")
-                if attempt_num >= max_attempts:
-                    break
-
-        raise last_error
+        result = parse_json_tolerant(json_str)
+        if result.repairs:
+            logger.debug(f"✅ JSON parsed after repairs: {', '.join(result.repairs)}")
+        return result.value
 
     # ==========================================================================
     # 2. 데이터 변환: 질문 데이터 → GeneratedItem
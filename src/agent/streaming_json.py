@@ -0,0 +1,324 @@
+r"""
+Incremental Final Answer JSON parser for streamed LLM output.
+
+REQ: REQ-A-OutputConverter
+
+개요:
+    AgentOutputConverter.parse_final_answer_json()은 메시지가 완성된 뒤에야
+    전체를 파싱합니다.
+    FinalAnswerStreamParser는 토큰이 도착하는 대로 소비하며,
+    배열의 각 question 객체가 닫히는 즉시 파싱해 반환합니다.
+    (생성이 끝나기 전에 item 변환을 시작할 수 있음)
+
+    각 element는 src/agent/json_repair.parse_json_tolerant로 파싱하므로
+    비스트리밍 경로와 같은 repair(Python literals, trailing commas, escape,
+    control characters)가 적용됩니다. 스캐너는 element 경계만 추적합니다.
+
+    StringFieldStreamParser는 JSON 객체의 문자열 필드 하나(예: explanation)를
+    도착하는 대로 decode해 반환합니다. (해설 텍스트를 생성 중에 스트리밍)
+    값의 최종본은 완성된 응답을 파싱해 얻습니다 (repair가 적용될 수 있음).
+
+사용 예:
+    parser = FinalAnswerStreamParser()
+    async for chunk in stream:
+        for question in parser.feed(chunk):
+            ...  # 완성된 question dict
+    parser.close()
+
+    field = StringFieldStreamParser("explanation")
+    async for chunk in stream:
+        text = field.feed(chunk)  # 이번 chunk로 decode된 텍스트 ("" 가능)
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+from src.agent.json_repair import parse_json_tolerant
+
+logger = logging.getLogger(__name__)
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+# Characters that can change scanner state (everything else is copied as-is)
+_STRUCTURAL_RE = re.compile(r'[\[\]{},"\\]')
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+# Whitespace around elements (escaped JSON uses literal \n between tokens)
+_EDGE_WS_RE = re.compile(r"^(?:\s|\\[ntr])+|(?:\s|\\[ntr])+$")
+# Single-character JSON string escapes
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "/": "/", '"': '"', "\\": "\\"}
+
+
+class FinalAnswerStreamParser:
+    """
+    Consume streamed ReAct text and yield completed Final Answer JSON values.
+
+    - Text before "Final Answer:" and markdown fences are skipped.
+    - Top-level array: each element is returned as soon as it closes.
+    - Top-level object: the object is returned once it closes.
+    - Text after the top-level value closes is ignored.
+
+    Attributes:
+        values: All completed values so far
+        repairs: Names of repairs applied (see module docstring)
+        errors: Elements that could not be parsed even after repair
+        finished: True once the top-level value has closed
+
+    """
+
+    def __init__(self, marker: str = FINAL_ANSWER_MARKER) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            marker: Text that precedes the JSON value
+
+        """
+        self.marker = marker
+        self.values: list[Any] = []
+        self.repairs: set[str] = set()
+        self.errors: list[str] = []
+        self.finished = False
+
+        self._tail = ""  # marker 탐색용 (chunk 경계에 걸친 marker 처리)
+        self._started = False  # marker 발견 후 True
+        self._top: str | None = None  # "[" or "{"
+        self._depth = 0
+        self._in_string = False
+        self._escape = False  # 직전 문자가 backslash (chunk 경계 포함)
+        self._escaped_json = False  # \"...\" 형태로 전체가 escape된 JSON
+        self._element: list[str] = []  # 현재 element의 raw text 조각
+        self._element_done = False  # 컨테이너 element가 닫혀 이미 파싱됨
+
+    def feed(self, chunk: str) -> list[Any]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of LLM output
+
+        Returns:
+            Values completed by this chunk (possibly empty)
+
+        """
+        if self.finished or not chunk:
+            return []
+
+        if not self._started:
+            text = self._tail + chunk
+            index = text.find(self.marker)
+            if index < 0:
+                self._tail = text[-(len(self.marker) - 1) :]
+                return []
+            self._started = True
+            chunk = text[index + len(self.marker) :]
+
+        completed_before = len(self.values)
+        self._scan(chunk)
+        return self.values[completed_before:]
+
+    def close(self) -> list | dict:
+        """
+        Signal end of stream.
+
+        Returns:
+            Parsed Final Answer (same shape as AgentOutputConverter.parse_final_answer_json):
+            list of elements for a top-level array, the object for a top-level object
+
+        Raises:
+            ValueError: If no marker was found or the top-level value never closed
+
+        """
+        if not self._started:
+            raise ValueError(f'Content must contain "{self.marker}" pattern')
+        if not self.finished:
+            raise ValueError(f"Final Answer JSON is incomplete ({len(self.values)} values completed)")
+        if self._top == "{" and self.values:
+            return self.values[0]
+        return self.values
+
+    # ------------------------------------------------------------------
+    # Scanner (tracks element boundaries only; repairs happen in json_repair)
+    # ------------------------------------------------------------------
+
+    def _scan(self, chunk: str) -> None:
+        """Scan chunk, jumping between structural characters."""
+        pos, size = 0, len(chunk)
+        if self._top is None:
+            starts = [i for i in (chunk.find("["), chunk.find("{")) if i >= 0]
+            if not starts:
+                return  # prose / ```json fence before the value
+            pos = min(starts)
+            self._top, self._depth = chunk[pos], 1
+            pos += 1
+            if self._top == "{":
+                self._element.append("{")
+
+        segment_start = pos
+        while pos < size:
+            if self._escape:
+                self._escape = False
+                char = chunk[pos]
+                pos += 1
+                if char == '"' and (self._escaped_json or not self._in_string):
+                    # Escaped JSON: \" opens/closes strings
+                    self._escaped_json = True
+                    self._in_string = not self._in_string
+                continue
+
+            pattern = _STRING_SPECIAL_RE if self._in_string else _STRUCTURAL_RE
+            match = pattern.search(chunk, pos)
+            if match is None:
+                break
+            char, pos = match.group(), match.end()
+
+            if char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = not self._in_string
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    end = pos if self._top == "{" else pos - 1
+                    self._element.append(chunk[segment_start:end])
+                    self._complete_element()
+                    self.finished = True
+                    return
+                if self._depth == 1 and self._top == "[":
+                    self._element.append(chunk[segment_start:pos])
+                    self._complete_element()
+                    self._element_done = True
+                    segment_start = pos
+            elif char == "," and self._depth == 1 and self._top == "[":
+                self._element.append(chunk[segment_start : pos - 1])
+                self._complete_element()
+                self._element_done = False
+                segment_start = pos
+
+        self._element.append(chunk[segment_start:])
+
+    def _complete_element(self) -> None:
+        """Parse the buffered element with the shared repair engine and append it to values."""
+        text = _EDGE_WS_RE.sub("", "".join(self._element))
+        self._element = []
+        if self._element_done or not text:
+            return
+        try:
+            result = parse_json_tolerant(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"⚠️  Streamed Final Answer element could not be parsed: {e}")
+            self.errors.append(text[:200])
+            return
+        self.repairs.update(result.repairs)
+        self.values.append(result.value)
+
+
+class StringFieldStreamParser:
+    r"""
+    Consume streamed JSON text and yield the decoded value of one string field.
+
+    - Text before the field (prose, fences, other fields) is skipped.
+    - Escapes split across chunks (\", \uXXXX, surrogate pairs) are buffered.
+    - Raw control characters inside the string are passed through (tolerant).
+    - Text after the closing quote is ignored.
+
+    Attributes:
+        field: Field name
+        started: True once the field's opening quote was seen
+        finished: True once the field's closing quote was seen
+
+    """
+
+    def __init__(self, field: str) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            field: Name of the string field to stream
+
+        """
+        self.field = field
+        self.started = False
+        self.finished = False
+        self._key_re = re.compile(rf'"{re.escape(field)}"\s*:\s*"')
+        self._buffer = ""  # field 시작 전: 누적 text / 시작 후: 아직 decode하지 않은 나머지
+
+    def feed(self, chunk: str) -> str:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of LLM output
+
+        Returns:
+            Field text decoded from this chunk (possibly empty)
+
+        """
+        if self.finished or not chunk:
+            return ""
+        self._buffer += chunk
+        if not self.started:
+            match = self._key_re.search(self._buffer)
+            if match is None:
+                return ""
+            self.started = True
+            self._buffer = self._buffer[match.end() :]
+        return self._decode()
+
+    def _decode(self) -> str:
+        """Decode buffered string content up to the closing quote or an incomplete escape."""
+        buffer, pos, parts = self._buffer, 0, []
+        while pos < len(buffer):
+            match = _STRING_SPECIAL_RE.search(buffer, pos)
+            if match is None:
+                parts.append(buffer[pos:])
+                pos = len(buffer)
+                break
+            parts.append(buffer[pos : match.start()])
+            pos = match.start()
+            if match.group() == '"':
+                self.finished = True
+                pos = len(buffer)
+                break
+
+            decoded, consumed = self._decode_escape(buffer, pos)
+            if consumed == 0:
+                break  # escape continues in the next chunk
+            parts.append(decoded)
+            pos += consumed
+
+        self._buffer = buffer[pos:]
+        return "".join(parts)
+
+    @staticmethod
+    def _decode_escape(buffer: str, pos: int) -> tuple[str, int]:
+        """Decode the backslash escape at buffer[pos]; returns (text, chars consumed), 0 if incomplete."""
+        if pos + 1 >= len(buffer):
+            return "", 0
+        char = buffer[pos + 1]
+        if char != "u":
+            return _SIMPLE_ESCAPES.get(char, char), 2
+
+        if pos + 6 > len(buffer):
+            return "", 0
+        try:
+            code = int(buffer[pos + 2 : pos + 6], 16)
+        except ValueError:
+            return buffer[pos : pos + 6], 6
+        if 0xD800 <= code < 0xDC00:
+            if pos + 12 > len(buffer):
+                return "", 0
+            if buffer[pos + 6 : pos + 8] == "\\u":
+                try:
+                    low = int(buffer[pos + 8 : pos + 12], 16)
+                except ValueError:
+                    low = 0
+                if 0xDC00 <= low < 0xE000:
+                    return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+            return "\ufffd", 6
+        if 0xDC00 <= code < 0xE000:
+            return "\ufffd", 6
+        return chr(code), 6
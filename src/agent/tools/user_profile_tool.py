@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from src.backend.database import get_db
 from src.backend.models.user_profile import UserProfileSurvey
+from src.backend.services.user_context_cache import UserContext, lookup_user_context
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +119,32 @@ def _build_profile_response(user_id: str, profile: UserProfileSurvey | None) ->
     }
 
 
+def _build_profile_response_from_context(user_id: str, context: UserContext) -> dict[str, Any]:
+    """
+    Build response dict from preloaded user context (no DB access).
+
+    Args:
+        user_id: User ID (for response)
+        context: UserContext preloaded by backend service
+
+    Returns:
+        dict with profile information
+
+    """
+    prior_score = context.prior_round.get("score") if context.prior_round else None
+    return {
+        "user_id": user_id,
+        "self_level": context.self_level or DEFAULT_PROFILE["self_level"],
+        "years_experience": (
+            context.years_experience if context.years_experience is not None else DEFAULT_PROFILE["years_experience"]
+        ),
+        "job_role": context.job_role or DEFAULT_PROFILE["job_role"],
+        "duty": context.duty or DEFAULT_PROFILE["duty"],
+        "interests": context.interests or DEFAULT_PROFILE["interests"],
+        "previous_score": prior_score if prior_score is not None else DEFAULT_PROFILE["previous_score"],
+    }
+
+
 def _get_user_profile_impl(user_id: str) -> dict[str, Any]:
     """
     Implement get_user_profile (without @tool decorator).
@@ -138,6 +165,13 @@ def _get_user_profile_impl(user_id: str) -> dict[str, Any]:
     """
     logger.info(f"Tool 1: Retrieving profile for user {user_id}")
 
+    # Preloaded context (bound to this agent run or shared cache) → memory lookup
+    if isinstance(user_id, str):
+        context = lookup_user_context(user_id)
+        if context is not None:
+            logger.info(f"Tool 1: Served profile for user {user_id} from preloaded context")
+            return _build_profile_response_from_context(user_id, context)
+
     # Validate input
     try:
         _validate_user_id(user_id)
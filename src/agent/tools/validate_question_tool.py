@@ -3,14 +3,26 @@ Validate Question Quality Tool - Validate AI-generated question quality.
 
 REQ: REQ-A-Mode1-Tool4
 Tool 4 for Mode 1 pipeline: Validate generated question quality using LLM + rule-based checks.
+
+Tiered validation (rule-first):
+    1. Rule checks run first. final_score = min(llm, rule), so a rule_score below
+       MIN_VALID_SCORE already guarantees reject/discard → LLM call is skipped.
+    2. Questions already scored by the LLM (e.g. an unchanged template re-emitted
+       verbatim) reuse the memoized LLM score.
+    3. Only remaining (ambiguous) questions are escalated to the LLM.
 """
 
+import hashlib
+import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from langchain_core.tools import tool
 
 from src.agent.config import create_llm
+from src.agent.tools.validation_response_parser import ValidationResponseParser
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +43,18 @@ REVISE_UPPER_THRESHOLD = 0.85
 # Default score for LLM failure
 DEFAULT_LLM_SCORE = 0.5
 
+# Batch validation: max questions scored in one LLM prompt
+BATCH_VALIDATION_MAX_ITEMS = 10
+
+# Memoized LLM scores by question fingerprint (LRU)
+LLM_SCORE_MEMO_MAX_ENTRIES = 1024
+_llm_score_memo: OrderedDict[str, float] = OrderedDict()
+_memo_lock = threading.Lock()
+
+# Tiered validation counters (see get_validation_stats)
+_validation_stats: dict[str, int] = {"validated": 0, "rule_decided": 0, "memo_hits": 0, "llm_validated": 0}
+_stats_lock = threading.Lock()
+
 
 def _validate_question_inputs(
     stem: str | list[str],
@@ -142,6 +166,89 @@ def _check_rule_based_quality(
     return score, issues
 
 
+def _question_fingerprint(
+    stem: str,
+    question_type: str,
+    choices: list[str] | None,
+    correct_answer: str,
+) -> str:
+    """Build content hash identifying a question for LLM score memoization."""
+    payload = json.dumps([stem.strip(), question_type, choices, correct_answer.strip()], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_memoized_llm_score(fingerprint: str) -> float | None:
+    """Return memoized LLM score for a question fingerprint, if any."""
+    with _memo_lock:
+        score = _llm_score_memo.get(fingerprint)
+        if score is not None:
+            _llm_score_memo.move_to_end(fingerprint)
+        return score
+
+
+def _memoize_llm_score(fingerprint: str, score: float) -> None:
+    """Store LLM score for a question fingerprint (LRU eviction)."""
+    with _memo_lock:
+        _llm_score_memo[fingerprint] = score
+        _llm_score_memo.move_to_end(fingerprint)
+        while len(_llm_score_memo) > LLM_SCORE_MEMO_MAX_ENTRIES:
+            _llm_score_memo.popitem(last=False)
+
+
+def _is_decided_by_rules(rule_score: float) -> bool:
+    """
+    Check whether rule checks alone determine the outcome.
+
+    final_score = min(llm_score, rule_score), so any rule_score below
+    MIN_VALID_SCORE yields reject/should_discard regardless of the LLM score.
+    Higher rule scores can still end as pass, revise or reject and need the LLM.
+
+    Args:
+        rule_score: Rule-based score (0.0-1.0)
+
+    Returns:
+        True if LLM validation can be skipped
+
+    """
+    return rule_score < MIN_VALID_SCORE
+
+
+def _record_validation(outcome: str) -> None:
+    """Increment tiered validation counters ("rule_decided" | "memo_hits" | "llm_validated")."""
+    with _stats_lock:
+        _validation_stats["validated"] += 1
+        _validation_stats[outcome] += 1
+
+
+def get_validation_stats() -> dict[str, Any]:
+    """
+    Get tiered validation counters.
+
+    Returns:
+        dict with:
+            - validated: Total questions validated
+            - rule_decided: Questions decided by rule checks alone
+            - memo_hits: Questions that reused a memoized LLM score
+            - llm_validated: Questions escalated to the LLM
+            - short_circuit_rate: Fraction of questions that skipped the LLM
+
+    """
+    with _stats_lock:
+        stats: dict[str, Any] = dict(_validation_stats)
+    skipped = stats["rule_decided"] + stats["memo_hits"]
+    stats["short_circuit_rate"] = skipped / stats["validated"] if stats["validated"] else 0.0
+    return stats
+
+
+def reset_validation_state() -> None:
+    """Clear memoized LLM scores and validation counters (used by tests)."""
+    with _memo_lock:
+        _llm_score_memo.clear()
+    with _stats_lock:
+        for key in _validation_stats:
+            _validation_stats[key] = 0
+
+
 def _call_llm_validation(
     stem: str,
     question_type: str,
@@ -199,6 +306,7 @@ Do not include any explanation, just the score."""
             score = float(score_text)
             score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
             logger.info(f"LLM validation score: {score}")
+            _memoize_llm_score(_question_fingerprint(stem, question_type, choices, correct_answer), score)
             return score
         except ValueError:
             logger.warning(f"Could not parse LLM response as float: {score_text}")
@@ -209,6 +317,74 @@ Do not include any explanation, just the score."""
         return DEFAULT_LLM_SCORE
 
 
+def _call_llm_batch_validation(
+    questions: list[tuple[str, str, list[str] | None, str]],
+) -> list[float | None]:
+    """
+    Score multiple questions with a single LLM call.
+
+    REQ: REQ-A-Mode1-Tool4-Batch
+
+    All questions are sent in one structured prompt and the LLM answers with a
+    JSON array of per-item scores, parsed by ValidationResponseParser.
+    Items that cannot be parsed are returned as None so the caller can fall
+    back to per-item validation for just those questions.
+
+    Args:
+        questions: List of (stem, question_type, choices, correct_answer)
+
+    Returns:
+        List of LLM quality scores (0.0-1.0) or None per question
+
+    """
+    if not questions:
+        return []
+
+    blocks = []
+    for i, (stem, question_type, choices, correct_answer) in enumerate(questions, start=1):
+        choices_str = " | ".join(str(c) for c in choices) if choices else "N/A"
+        blocks.append(
+            f"[Question {i}]\n"
+            f"Question Stem: {stem}\n"
+            f"Question Type: {question_type}\n"
+            f"Choices: {choices_str}\n"
+            f"Correct Answer: {correct_answer}"
+        )
+    questions_str = "\n\n".join(blocks)
+
+    prompt = f"""Evaluate the quality of each of the following {len(questions)} questions on a scale of 0.0 to 1.0.
+
+{questions_str}
+
+Consider these criteria for each question independently:
+1. Clarity: Is the question clear and unambiguous?
+2. Appropriateness: Is the difficulty level appropriate?
+3. Correctness: Is the correct answer objective and verifiable?
+4. Bias: Are there any biases or inappropriate language?
+5. Format: Is the format valid and properly structured?
+
+Respond with ONLY a JSON array containing one object per question, like:
+[{{"index": 1, "score": 0.85}}, {{"index": 2, "score": 0.70}}]
+
+Do not include any explanation, just the JSON array."""
+
+    try:
+        llm = create_llm()
+        response = llm.invoke(prompt)
+        scores = ValidationResponseParser.parse_batch_scores(str(response.content), len(questions))
+    except Exception as e:
+        logger.error(f"Batch LLM validation failed: {e}")
+        return [None] * len(questions)
+
+    for question, score in zip(questions, scores, strict=True):
+        if score is not None:
+            _memoize_llm_score(_question_fingerprint(*question), score)
+
+    parsed = sum(1 for score in scores if score is not None)
+    logger.info(f"Batch LLM validation: {parsed}/{len(questions)} scores parsed in one call")
+    return scores
+
+
 def _get_recommendation(final_score: float) -> str:
     """
     Determine recommendation based on final score.
@@ -266,6 +442,7 @@ def _build_feedback(
     rule_score: float,
     issues: list[str],
     recommendation: str,
+    llm_skipped: bool = False,
 ) -> str:
     """
     Build human-readable feedback.
@@ -275,6 +452,7 @@ def _build_feedback(
         rule_score: Rule-based score
         issues: List of issues found
         recommendation: Recommendation (pass/revise/reject)
+        llm_skipped: True if the outcome was decided by rule checks alone
 
     Returns:
         Feedback string
@@ -292,7 +470,10 @@ def _build_feedback(
     if issues:
         feedback_parts.append("\n발견된 문제점:\n" + "\n".join(f"- {issue}" for issue in issues))
 
-    feedback_parts.append(f"\n점수: LLM {score:.2f} / 규칙 {rule_score:.2f}")
+    if llm_skipped:
+        feedback_parts.append(f"\n점수: 규칙 {rule_score:.2f} (규칙 검사로 폐기 확정, LLM 검증 생략)")
+    else:
+        feedback_parts.append(f"\n점수: LLM {score:.2f} / 규칙 {rule_score:.2f}")
 
     return "".join(feedback_parts)
 
@@ -351,8 +532,8 @@ def _validate_question_quality_impl(
         # Handle choices - could be list of lists or single list or None
         if choices is None:
             all_choices = [None] * len(stems)
-        elif isinstance(choices, list) and choices and isinstance(choices[0], list):
-            # Already list of lists for batch
+        elif isinstance(choices, list) and any(isinstance(c, list) for c in choices):
+            # Already list of lists for batch (None entries for non-choice types)
             all_choices = choices
         elif isinstance(choices, list) and choices and isinstance(choices[0], str):
             # Single list - apply to all
@@ -360,9 +541,23 @@ def _validate_question_quality_impl(
         else:
             all_choices = [None] * len(stems)
 
+        items = list(zip(stems, types, all_choices, answers, strict=True))
+
+        # Only ambiguous items (not decided by rules, no memoized score) go to the LLM:
+        # one call per chunk instead of one per question;
+        # items whose score could not be parsed fall back to per-item calls
+        llm_scores: list[float | None] = [None] * len(items)
+        pending = [i for i, item in enumerate(items) if _needs_llm_validation(*item)]
+        if len(pending) > 1:
+            for offset in range(0, len(pending), BATCH_VALIDATION_MAX_ITEMS):
+                chunk = pending[offset : offset + BATCH_VALIDATION_MAX_ITEMS]
+                chunk_scores = _call_llm_batch_validation([items[i] for i in chunk])
+                for i, score in zip(chunk, chunk_scores, strict=True):
+                    llm_scores[i] = score
+
         results = []
-        for s, qt, c, ans in zip(stems, types, all_choices, answers, strict=True):
-            result = _validate_single_question(s, qt, c, ans)
+        for (s, qt, c, ans), llm_score in zip(items, llm_scores, strict=True):
+            result = _validate_single_question(s, qt, c, ans, llm_score=llm_score)
             results.append(result)
 
         logger.info(f"Batch validation completed: {len(results)} questions")
@@ -374,11 +569,38 @@ def _validate_question_quality_impl(
         return result
 
 
+def _needs_llm_validation(
+    stem: str,
+    question_type: str,
+    choices: list[str] | None,
+    correct_answer: str,
+) -> bool:
+    """
+    Check whether a question must be escalated to the LLM.
+
+    Args:
+        stem: Question stem
+        question_type: Question type
+        choices: Answer choices
+        correct_answer: Correct answer
+
+    Returns:
+        False if rule checks decide the outcome or an LLM score is memoized
+
+    """
+    rule_score, _ = _check_rule_based_quality(stem, question_type, choices, correct_answer)
+    if _is_decided_by_rules(rule_score):
+        return False
+    fingerprint = _question_fingerprint(stem, question_type, choices, correct_answer)
+    return _get_memoized_llm_score(fingerprint) is None
+
+
 def _validate_single_question(
     stem: str,
     question_type: str,
     choices: list[str] | None,
     correct_answer: str,
+    llm_score: float | None = None,
 ) -> dict[str, Any]:
     """
     Validate a single question.
@@ -388,6 +610,8 @@ def _validate_single_question(
         question_type: Question type
         choices: Answer choices
         correct_answer: Correct answer
+        llm_score: Pre-computed LLM score from batch validation
+            (None: call LLM for this question)
 
     Returns:
         Validation result dict with:
@@ -399,13 +623,29 @@ def _validate_single_question(
             - issues: list[str] (detected problems)
             - recommendation: "pass"|"revise"|"reject"
             - should_discard: bool (True if should regenerate, False if should keep)
+            - llm_skipped: bool (True if decided by rule checks alone, LLM not called)
 
     """
     # Rule-based validation
     rule_score, issues = _check_rule_based_quality(stem, question_type, choices, correct_answer)
 
-    # LLM semantic validation
-    llm_score = _call_llm_validation(stem, question_type, choices, correct_answer)
+    # Tiered LLM semantic validation:
+    # rule-decided → skip, memoized → reuse, batch-scored → use, else → call LLM
+    llm_skipped = _is_decided_by_rules(rule_score)
+    if llm_skipped:
+        # Outcome is reject regardless of LLM; report rule score as the semantic score
+        llm_score = rule_score
+        _record_validation("rule_decided")
+    elif llm_score is not None:
+        _record_validation("llm_validated")
+    else:
+        memoized = _get_memoized_llm_score(_question_fingerprint(stem, question_type, choices, correct_answer))
+        if memoized is not None:
+            llm_score = memoized
+            _record_validation("memo_hits")
+        else:
+            llm_score = _call_llm_validation(stem, question_type, choices, correct_answer)
+            _record_validation("llm_validated")
 
     # Final score is minimum of LLM and rule scores
     final_score = min(llm_score, rule_score)
@@ -420,7 +660,7 @@ def _validate_single_question(
     should_discard = _should_discard_question(final_score, recommendation)
 
     # Build feedback
-    feedback = _build_feedback(llm_score, rule_score, issues, recommendation)
+    feedback = _build_feedback(llm_score, rule_score, issues, recommendation, llm_skipped=llm_skipped)
 
     logger.debug(
         f"Question validation: final_score={final_score:.2f}, "
@@ -437,6 +677,7 @@ def _validate_single_question(
         "issues": issues,
         "recommendation": recommendation,
         "should_discard": should_discard,
+        "llm_skipped": llm_skipped,
     }
 
 
@@ -475,6 +716,7 @@ def validate_question_quality(
             - issues: list[str] (detected problems)
             - recommendation: "pass" (>=0.85) | "revise" (0.70-0.85) | "reject" (<0.70)
             - should_discard: bool (True if should regenerate, False if should keep)
+            - llm_skipped: bool (True if decided by rule checks alone, LLM not called)
 
     Raises:
         ValueError: If inputs are invalid
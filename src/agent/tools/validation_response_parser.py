@@ -7,11 +7,16 @@ Handles:
 1. Parsing validation responses (single & batch)
 2. Detecting and handling contradictory responses
 3. Fallback parsing when responses are malformed
+4. Parsing per-item scores from batched LLM validation output
 """
 
+import json
 import logging
+import re
 from typing import Any
 
+from src.agent.json_repair import parse_json_tolerant
+
 logger = logging.getLogger(__name__)
 
 # Score thresholds (must match validate_question_tool.py)
@@ -217,6 +222,71 @@ class ValidationResponseParser:
             "should_discard": True,
         }
 
+    @staticmethod
+    def parse_batch_scores(content: str, expected_count: int) -> list[float | None]:
+        """
+        Parse per-item scores from a batched LLM validation response.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Accepted formats (optionally wrapped in ```json fences):
+            [{"index": 1, "score": 0.85}, {"index": 2, "score": 0.6}]
+            [0.85, 0.6]
+
+        Items that are missing, duplicated, out of range or not numeric are
+        returned as None so the caller can re-validate only those items.
+
+        Args:
+            content: Raw LLM response text
+            expected_count: Number of questions in the batch
+
+        Returns:
+            List of length expected_count with clamped scores (0.0-1.0) or None
+
+        """
+        scores: list[float | None] = [None] * expected_count
+
+        match = re.search(r"\[.*\]", content, re.DOTALL)
+        if not match:
+            logger.warning("Batch validation response contains no JSON array")
+            return scores
+
+        try:
+            items = parse_json_tolerant(match.group(0)).value
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not parse batch validation response: {e}")
+            return scores
+
+        if not isinstance(items, list):
+            return scores
+
+        seen: set[int] = set()
+        for position, item in enumerate(items):
+            if isinstance(item, dict):
+                index = item.get("index")
+                raw_score = item.get("score")
+                slot = index - 1 if isinstance(index, int) and not isinstance(index, bool) else None
+            else:
+                raw_score = item
+                slot = position
+
+            if slot is None or not 0 <= slot < expected_count:
+                logger.debug(f"Ignoring batch validation item {position}: {item!r}")
+                continue
+            if slot in seen:
+                # Conflicting scores for one question: trust neither, re-validate it
+                logger.debug(f"Duplicate batch validation index {slot + 1}: {item!r}")
+                scores[slot] = None
+                continue
+            seen.add(slot)
+
+            try:
+                scores[slot] = max(0.0, min(1.0, float(raw_score)))
+            except (TypeError, ValueError):
+                logger.debug(f"Non-numeric score in batch validation item {position}: {item!r}")
+
+        return scores
+
     @staticmethod
     def validate_response_structure(response: dict[str, Any]) -> bool:
         """
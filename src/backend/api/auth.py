@@ -8,12 +8,14 @@ import logging
 
 import jwt as pyjwt
 from fastapi import APIRouter, Cookie, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from src.backend.config import settings
 from src.backend.database import get_db
-from src.backend.services.auth_service import AuthService
+from src.backend.services.auth_service import AuthService, OIDCAuthService
 
 logger = logging.getLogger(__name__)
 
@@ -63,10 +65,15 @@ class OIDCCallbackRequest(BaseModel):
     Request model for OIDC callback endpoint.
 
     REQ: REQ-B-A1-1
-    TODO: Define form-urlencoded parameters (code, state)
+
+    Attributes:
+        code: Authorization code from Azure AD
+        code_verifier: PKCE code verifier generated by the frontend
+
     """
 
-    pass
+    code: str = Field(..., description="Authorization code from Azure AD")
+    code_verifier: str = Field(..., description="PKCE code verifier")
 
 
 class StatusResponse(BaseModel):
@@ -140,38 +147,82 @@ def login(
 
 @router.post(
     "/oidc/callback",
+    response_model=LoginResponse,
     summary="OIDC Callback",
-    description="Handle OIDC callback from IDP (form POST)",
+    description="Exchange authorization code with Azure AD and issue JWT cookie",
 )
-def oidc_callback(
+async def oidc_callback(
+    request: OIDCCallbackRequest,
     db: Session = Depends(get_db),  # noqa: B008
-):
+) -> JSONResponse:
     """
-    Handle OIDC callback from IDP.
+    Handle OIDC callback from frontend (authorization code + PKCE verifier).
 
     REQ: REQ-B-A1-1, REQ-B-A1-2, REQ-B-A1-3, REQ-B-A1-4, REQ-B-A1-5, REQ-B-A1-6, REQ-B-A1-7
 
-    TODO: Implement IDP callback handling
-    1. Receive form-urlencoded (code, state) from IDP
-    2. Validate state
-    3. Exchange code for IDP tokens (with client_secret)
-    4. Validate ID Token
-    5. Extract user claims and save to DB
-    6. Generate JWT and set HttpOnly cookie
-    7. Return 302 redirect to /home
+    Async route: the IdP round-trip runs on the shared pooled AsyncClient, so login
+    storms do not hold threadpool workers while Azure AD responds. ID token
+    validation and the user upsert run in the threadpool: validation is served
+    from the in-memory JWKS cache, but a cold cache or unknown kid makes it
+    fetch JWKS synchronously, which must not block the event loop.
 
     Args:
+        request: Authorization code and code_verifier
         db: Database session
 
     Returns:
-        RedirectResponse with HttpOnly cookie
+        JSONResponse with JWT token and is_new_user flag, JWT set as HttpOnly cookie
+        Status code 201 for new users, 200 for existing users
 
     Raises:
-        HTTPException: If OIDC callback fails
+        HTTPException: 401 if code exchange or ID token validation fails, 500 otherwise
 
     """
-    # TODO: Implement OIDC callback logic
-    raise HTTPException(status_code=501, detail="OIDC callback not implemented")
+    oidc_service = OIDCAuthService()
+    try:
+        tokens = await oidc_service.aexchange_code_for_tokens(request.code, request.code_verifier)
+        claims = await run_in_threadpool(oidc_service.validate_id_token, tokens["id_token"])
+    except (ValueError, KeyError, pyjwt.InvalidTokenError) as e:
+        logger.warning(f"OIDC authentication failed: {str(e)}")
+        raise HTTPException(status_code=401, detail="OIDC authentication failed") from e
+
+    user_data = {
+        "knox_id": claims.get("sub", ""),
+        "name": claims.get("name", ""),
+        "dept": claims.get("dept", ""),
+        "business_unit": claims.get("business_unit", ""),
+        "email": claims.get("email", ""),
+    }
+    if not user_data["knox_id"]:
+        raise HTTPException(status_code=401, detail="OIDC authentication failed: missing sub claim")
+
+    try:
+        jwt_token, is_new_user, user_id = await run_in_threadpool(
+            AuthService(db).authenticate_or_create_user, user_data
+        )
+    except Exception as e:
+        logger.exception("OIDC user registration error")
+        raise HTTPException(status_code=500, detail="Authentication failed") from e
+
+    response = JSONResponse(
+        status_code=201 if is_new_user else 200,
+        content={
+            "access_token": jwt_token,
+            "token_type": "bearer",
+            "user_id": user_id,
+            "is_new_user": is_new_user,
+        },
+    )
+    response.set_cookie(
+        key="auth_token",
+        value=jwt_token,
+        max_age=settings.JWT_EXPIRATION_HOURS * 3600,
+        path="/",
+        secure=True,
+        httponly=True,
+        samesite="lax",
+    )
+    return response
 
 
 @router.get(
@@ -0,0 +1,90 @@
+"""
+Bulk export API endpoints.
+
+REQ: REQ-B-B5-1, REQ-B-B5-3
+
+Environment Variables:
+    EXPORT_ALLOWED_KNOX_IDS: Comma-separated knox_ids allowed to export all users' data
+        (default: empty → every user can export only their own data)
+"""
+
+import logging
+from datetime import datetime
+from os import getenv
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.backend.database import get_db
+from src.backend.services.export_service import EXPORT_MEDIA_TYPES, ExportService
+from src.backend.services.principal_cache import Principal
+from src.backend.utils.auth import get_current_principal
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["export"])
+
+
+def export_allowed_knox_ids() -> set[str]:
+    """Return knox_ids allowed to export all users' data (EXPORT_ALLOWED_KNOX_IDS)."""
+    return {knox_id.strip() for knox_id in getenv("EXPORT_ALLOWED_KNOX_IDS", "").split(",") if knox_id.strip()}
+
+
+@router.get(
+    "/{dataset}",
+    status_code=200,
+    summary="Export Dataset",
+    description="Stream attempts (with rounds), answers or results as NDJSON or CSV (requires JWT)",
+    response_class=StreamingResponse,
+)
+def export_dataset(
+    dataset: Literal["attempts", "answers", "results"],
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),  # noqa: B008
+    user_id: int | None = Query(None, description="Only this user's rows (all users if omitted)"),  # noqa: B008
+    since: datetime | None = Query(None, description="Only rows finished/created at or after this time"),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Stream one export dataset in constant memory.
+
+    REQ: REQ-B-B5-1, REQ-B-B5-3
+
+    Rows are read through a server-side cursor and sent as they are fetched, so
+    large exports neither buffer in memory nor hit response timeouts.
+    Users listed in EXPORT_ALLOWED_KNOX_IDS may export any (or all) users;
+    everyone else exports only their own rows.
+
+    Args:
+        dataset: "attempts", "answers" or "results"
+        export_format: "ndjson" (default) or "csv"
+        user_id: Only this user's rows (all users if omitted)
+        since: Only rows finished/created at or after this time
+        user: Current authenticated user (from JWT)
+        db: Database session (closed after the response is sent)
+
+    Returns:
+        Streaming NDJSON/CSV response
+
+    Raises:
+        HTTPException: 403 if exporting other users' data is not allowed, 400 if parameters are invalid
+
+    """
+    if user.knox_id not in export_allowed_knox_ids():
+        if user_id is not None and user_id != user.id:
+            raise HTTPException(status_code=403, detail="Not allowed to export other users' data")
+        user_id = user.id
+
+    try:
+        chunks = ExportService(db).stream(dataset, export_format, user_id=user_id, since=since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    logger.info(f"Export started: dataset={dataset}, format={export_format}, user_id={user_id}, by={user.knox_id}")
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{export_format}"'},
+    )
@@ -18,9 +18,10 @@ from sqlalchemy.orm import Session
 
 from src.backend.database import get_db
 from src.backend.models.user import User
+from src.backend.services.principal_cache import Principal
 from src.backend.services.profile_service import ProfileService
 from src.backend.services.ranking_service import RankingService
-from src.backend.utils.auth import get_current_user
+from src.backend.utils.auth import get_current_principal, get_current_user
 
 logger = logging.getLogger(__name__)
 
@@ -216,7 +217,7 @@ def check_nickname_availability(
 )
 def register_nickname(
     request: NicknameRegisterRequest,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -295,7 +296,7 @@ def get_nickname(
 )
 def edit_nickname(
     request: NicknameEditRequest,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -343,7 +344,7 @@ def edit_nickname(
 )
 def update_survey(
     request: SurveyUpdateRequest,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -405,7 +406,7 @@ def update_survey(
     description="Retrieve current user's most recent self-assessment info (requires JWT)",
 )
 def get_latest_survey(
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -476,7 +477,7 @@ def get_consent(
 )
 def update_consent(
     request: ConsentUpdateRequest,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -520,7 +521,7 @@ def update_consent(
     description="Get current user's grade and ranking (requires JWT)",
 )
 def get_ranking(
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -5,19 +5,24 @@ REQ: REQ-B-B2-Gen-1, REQ-B-B2-Gen-2, REQ-B-B2-Gen-3, REQ-B-B2-Adapt, REQ-B-B2-Pl
 """
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from src.backend.database import get_db
-from src.backend.models.user import User
 from src.backend.services.autosave_service import AutosaveService
 from src.backend.services.explain_service import ExplainService
+from src.backend.services.explanation_executor import explanation_executor
+from src.backend.services.explanation_pregen import wait_for_pregeneration
+from src.backend.services.principal_cache import Principal
 from src.backend.services.question_gen_service import QuestionGenerationService
 from src.backend.services.scoring_service import ScoringService
-from src.backend.utils.auth import get_current_user, get_current_user_id
+from src.backend.utils.auth import get_current_principal, get_current_user_id
+from src.backend.utils.responses import format_sse_event
 
 logger = logging.getLogger(__name__)
 
@@ -966,18 +971,21 @@ def check_time_status(
     summary="Get Session Explanations",
     description="Retrieve all answers and explanations for a test session (batch retrieval API)",
 )
-def get_session_explanations(
+async def get_session_explanations(
     session_id: str,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
-) -> dict[str, Any]:
+) -> SessionExplanationResponse:
     """
     Retrieve all answers and explanations for a test session.
 
     REQ: REQ-B-B3-Explain-2
 
-    Batch retrieves explanations for all questions in a session.
-    If explanation doesn't exist, generates it on-the-fly.
+    Batch retrieves explanations for all questions in a session (in question order).
+    If explanation doesn't exist, generates it on-the-fly: concurrently via the LLM's
+    async API under the process-wide explanation limit, with DB work offloaded to the
+    threadpool (see services/explanation_executor.py). With
+    EXPLANATION_BATCH_ENABLED, uncached questions share batched LLM prompts.
     Performance requirement: Complete within 10 seconds.
 
     Args:
@@ -999,98 +1007,87 @@ def get_session_explanations(
     from src.backend.models.question import Question
     from src.backend.models.test_session import TestSession
 
-    try:
-        # Validate and retrieve session
-        test_session = db.query(TestSession).filter_by(id=session_id).first()
+    user_id = user.id
 
+    def load_session() -> dict[str, Any]:
+        """Load session, ownership and answered items (question order) as plain data."""
+        test_session = db.query(TestSession).filter_by(id=session_id).first()
         if not test_session:
+            return {"found": False}
+        if test_session.user_id != user_id:
+            return {"found": True, "owned": False}
+
+        questions = db.query(Question).filter_by(session_id=session_id).order_by(Question.created_at).all()
+        answers_map = {
+            answer.question_id: answer for answer in db.query(AttemptAnswer).filter_by(session_id=session_id)
+        }
+        items = [
+            {
+                "question_id": question.id,
+                "user_answer": answers_map[question.id].user_answer,
+                "is_correct": answers_map[question.id].is_correct,
+                "score": answers_map[question.id].score or 0,
+                "attempt_answer_id": answers_map[question.id].id,
+            }
+            for question in questions
+            if question.id in answers_map
+        ]
+        return {
+            "found": True,
+            "owned": True,
+            "session_id": test_session.id,
+            "status": test_session.status,
+            "round": test_session.round,
+            "answered_count": len(answers_map),
+            "total_questions": len(questions),
+            "items": items,
+        }
+
+    try:
+        loaded = await explanation_executor.run_db(load_session)
+
+        if not loaded["found"]:
             raise HTTPException(status_code=404, detail=f"Test session {session_id} not found") from ValueError(
                 "Session not found"
             )
 
         # Verify user owns this session
-        if test_session.user_id != user.id:
+        if not loaded["owned"]:
             raise HTTPException(
                 status_code=401, detail="Unauthorized: You can only access your own sessions"
             ) from ValueError("Unauthorized access")
 
-        # Get all questions in this session
-        questions = db.query(Question).filter_by(session_id=session_id).all()
-
-        # Get all answers in this session
-        answers_map = {}  # question_id -> answer
-        answers_list = db.query(AttemptAnswer).filter_by(session_id=session_id).all()
-        for answer in answers_list:
-            answers_map[answer.question_id] = answer
+        # Explanations may still be pre-generating (round just scored): wait instead of duplicating LLM calls
+        await wait_for_pregeneration(session_id)
 
-        # Build explanations list with parallel processing for performance
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        explanations_list: list[dict[str, Any]] = []
-        explanation_items_to_process = []
-
-        # First pass: prepare items
-        for question in questions:
-            answer = answers_map.get(question.id)
-
-            if not answer:
-                # No answer for this question, skip
-                continue
-
-            # Prepare explanation item
-            explanation_item: dict[str, Any] = {
-                "question_id": question.id,
-                "user_answer": answer.user_answer,
-                "is_correct": answer.is_correct,
-                "score": answer.score or 0,
-                "explanation": None,
-            }
-            explanation_items_to_process.append((explanation_item, question.id, answer))
-
-        # Second pass: generate explanations in parallel
-        def generate_explanation_safe(params: tuple) -> dict[str, Any]:
-            """Generate explanation for a single item (thread-safe with independent session)."""
-            from src.backend.database import SessionLocal
-
-            item, question_id, answer = params
-            # Create independent session for this thread to avoid SQLAlchemy state conflicts
-            thread_db = SessionLocal()
-            try:
-                thread_explain_service = ExplainService(thread_db)
-                explanation = thread_explain_service.generate_explanation(
-                    question_id=question_id,
-                    user_answer=answer.user_answer,
-                    is_correct=answer.is_correct,
-                    attempt_answer_id=answer.id,
-                )
-                item["explanation"] = explanation
-            except Exception as e:
-                logger.warning(f"Failed to generate explanation for question {question_id}: {e}")
-                item["explanation"] = None
-            finally:
-                thread_db.close()
-            return item
-
-        # Use thread pool for parallel processing (up to 5 concurrent requests)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(generate_explanation_safe, item_params) for item_params in explanation_items_to_process
+        # Generate concurrently: LLM via ainvoke under the process-wide limit (batched prompts when
+        # EXPLANATION_BATCH_ENABLED), DB work on the shared pool through this request's session
+        explanations = await ExplainService(db).agenerate_session_explanations(
+            [
+                (item["question_id"], item["user_answer"], item["is_correct"], item["attempt_answer_id"])
+                for item in loaded["items"]
             ]
-            for future in as_completed(futures):
-                explanations_list.append(future.result())
-
-        # Count answered questions
-        answered_count = len(answers_list)
-        total_count = len(questions)
+        )
+        explanations_list = [
+            {
+                "question_id": item["question_id"],
+                "user_answer": item["user_answer"],
+                "is_correct": item["is_correct"],
+                "score": item["score"],
+                "explanation": explanation,
+            }
+            for item, explanation in zip(loaded["items"], explanations, strict=True)
+        ]
 
-        return {
-            "session_id": test_session.id,
-            "status": test_session.status,
-            "round": test_session.round,
-            "answered_count": answered_count,
-            "total_questions": total_count,
-            "explanations": explanations_list,
-        }
+        # Model instance: FastAPI response 검증이 재검증 없이 통과
+        return SessionExplanationResponse(
+            session_id=loaded["session_id"],
+            status=loaded["status"],
+            round=loaded["round"],
+            answered_count=loaded["answered_count"],
+            total_questions=loaded["total_questions"],
+            explanations=explanations_list,
+        )
 
     except HTTPException:
         raise
@@ -1157,6 +1154,76 @@ def generate_explanation(
         raise HTTPException(status_code=500, detail="Failed to generate explanation") from e
 
 
+@router.post(
+    "/explanations/stream",
+    status_code=200,
+    summary="Stream Question Explanation",
+    description="Stream explanation text as Server-Sent Events while it is generated",
+    response_class=StreamingResponse,
+)
+async def stream_explanation(
+    request: GenerateExplanationRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Stream explanation for a question answer (Server-Sent Events).
+
+    REQ: REQ-B-B3-Explain-1
+
+    Same request as POST /explanations. Events:
+        - delta: {"text": ...} explanation text as the LLM produces it
+        - done: ExplanationResponse payload (saved; explanation_text is authoritative)
+        - error: {"detail": ...} if the stream fails after it started
+
+    Cached explanations are streamed immediately (one delta, then done).
+
+    Args:
+        request: GenerateExplanationRequest with question, answer, correctness
+        db: Database session
+
+    Returns:
+        StreamingResponse (text/event-stream)
+
+    Raises:
+        HTTPException 400: If validation fails
+        HTTPException 404: If question not found
+        HTTPException 500: If explanation generation fails before streaming starts
+
+    """
+    events = ExplainService(db).astream_explanation(
+        question_id=request.question_id,
+        user_answer=request.user_answer,
+        is_correct=request.is_correct,
+        attempt_answer_id=request.attempt_answer_id,
+    )
+    # First event surfaces lookup errors as HTTP status codes (before headers are sent)
+    try:
+        first = await anext(events)
+    except ValueError as e:
+        error_msg = str(e)
+        if "not found" in error_msg.lower():
+            raise HTTPException(status_code=404, detail=error_msg) from e
+        raise HTTPException(status_code=400, detail=error_msg) from e
+    except Exception as e:
+        logger.exception("Error generating explanation")
+        raise HTTPException(status_code=500, detail="Failed to generate explanation") from e
+
+    async def body() -> AsyncIterator[bytes]:
+        yield format_sse_event(*first)
+        try:
+            async for event, data in events:
+                yield format_sse_event(event, data)
+        except Exception:
+            logger.exception("Error streaming explanation")
+            yield format_sse_event("error", {"detail": "Failed to generate explanation"})
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ============================================================================
 # New GET Endpoints for CLI REST API Migration
 # ============================================================================
@@ -1170,7 +1237,7 @@ def generate_explanation(
     description="Retrieve the latest test session for the authenticated user",
 )
 def get_latest_session(
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -1227,7 +1294,7 @@ def get_latest_session(
 )
 def get_question(
     question_id: str,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -1293,9 +1360,9 @@ def get_question(
 )
 def get_session_questions(
     session_id: str,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
-) -> dict[str, Any]:
+) -> SessionQuestionsResponse:
     """
     Get all questions in a test session.
 
@@ -1344,11 +1411,11 @@ def get_session_questions(
             for q in questions
         ]
 
-        return {
-            "session_id": session_id,
-            "total_count": len(questions_list),
-            "questions": questions_list,
-        }
+        return SessionQuestionsResponse(
+            session_id=session_id,
+            total_count=len(questions_list),
+            questions=questions_list,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -1365,7 +1432,7 @@ def get_session_questions(
 )
 def get_unscored_answers(
     session_id: str,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
@@ -1440,7 +1507,7 @@ def get_unscored_answers(
 )
 def get_question_detail(
     question_id: str,
-    user: User = Depends(get_current_user),  # noqa: B008
+    user: Principal = Depends(get_current_principal),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
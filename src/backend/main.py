@@ -14,13 +14,17 @@ from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.responses import FileResponse  # noqa: E402
 from fastapi.staticfiles import StaticFiles  # noqa: E402
 
-from src.backend.api import auth, profile, questions, survey  # noqa: E402
-from src.backend.database import init_db  # noqa: E402
+from src.backend.api import auth, export, profile, questions, survey  # noqa: E402
+from src.backend.database import SessionLocal, init_db  # noqa: E402
+from src.backend.services.nickname_index import nickname_index, nickname_index_enabled  # noqa: E402
+from src.backend.services.oidc_http_client import close_oidc_http_client  # noqa: E402
+from src.backend.utils.responses import FastJSONResponse  # noqa: E402
 
 app = FastAPI(
     title="SLEA-SSEM",
     description="AI-driven learning platform for employees",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 # Enable CORS for frontend
@@ -37,6 +41,15 @@ app.add_middleware(
 def startup_event() -> None:
     """Initialize database on startup."""
     init_db()
+    if nickname_index_enabled():
+        with SessionLocal() as db:
+            nickname_index.load(db)
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Close pooled IdP connections on shutdown."""
+    await close_oidc_http_client()
 
 
 # API endpoints - defined first for priority matching
@@ -51,6 +64,7 @@ app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(survey.router, prefix="/survey", tags=["survey"])
 app.include_router(profile.router, prefix="/profile", tags=["profile"])
 app.include_router(questions.router, prefix="/questions", tags=["questions"])
+app.include_router(export.router, prefix="/export", tags=["export"])
 
 
 # Static files setup - only if frontend is built
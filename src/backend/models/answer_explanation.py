@@ -20,7 +20,8 @@ class AnswerExplanation(Base):
     REQ: REQ-B-B3-Explain-1
 
     Design principle:
-    - One explanation per question (cached and reused across users)
+    - One explanation per question content (cached and reused across users/sessions
+      via content_hash, see services/explanation_cache.py)
     - Optional: Can be linked to specific attempt_answer_id for tracking user attempts
     - Stores explanation text and reference links
     - Used for providing learning feedback after scoring
@@ -30,6 +31,7 @@ class AnswerExplanation(Base):
         id: Primary key (UUID)
         question_id: Foreign key to questions
         attempt_answer_id: Optional FK to attempt_answers for audit trail
+        content_hash: Content key (stem + choices + correct answer + correctness), None for fallbacks
         explanation_text: Explanation content (≥500 chars)
         reference_links: List of reference links [{title, url}, ...] (≥3)
         is_correct: Whether explanation is for correct or incorrect answer
@@ -55,6 +57,7 @@ class AnswerExplanation(Base):
         nullable=True,
         index=True,
     )
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     explanation_text: Mapped[str] = mapped_column(String(5000), nullable=False)
     reference_links: Mapped[list[dict]] = mapped_column(JSON, nullable=False)
     is_correct: Mapped[bool] = mapped_column(default=True, nullable=False)
@@ -13,6 +13,8 @@ from sqlalchemy.orm import Session
 
 from src.backend.config import settings
 from src.backend.models.user import User
+from src.backend.services.jwks_cache import jwks_cache
+from src.backend.services.oidc_http_client import get_oidc_http_client
 
 
 class AuthService:
@@ -155,6 +157,7 @@ class OIDCAuthService:
 
     Methods:
         exchange_code_for_tokens: Exchange authorization code for Azure AD tokens
+        aexchange_code_for_tokens: Async token exchange on the shared pooled client
         validate_id_token: Validate and extract claims from ID Token
 
     """
@@ -192,15 +195,7 @@ class OIDCAuthService:
         if settings.OIDC_CLIENT_ID == "your-azure-app-id":
             return self._get_mock_tokens(code, code_verifier)
 
-        payload = {
-            "client_id": settings.OIDC_CLIENT_ID,
-            "client_secret": settings.OIDC_CLIENT_SECRET,
-            "code": code,
-            "code_verifier": code_verifier,
-            "redirect_uri": settings.OIDC_REDIRECT_URI,
-            "grant_type": "authorization_code",
-            "scope": "openid profile email",
-        }
+        payload = self._token_request_payload(code, code_verifier)
 
         try:
             response = httpx.post(settings.OIDC_TOKEN_ENDPOINT, data=payload, timeout=10.0)
@@ -211,6 +206,67 @@ class OIDCAuthService:
         except httpx.RequestError as e:
             raise ValueError(f"Token exchange request failed: {str(e)}") from e
 
+    async def aexchange_code_for_tokens(self, code: str, code_verifier: str) -> dict[str, Any]:
+        """
+        Exchange authorization code for Azure AD tokens (async).
+
+        REQ: REQ-B-A1-1, REQ-B-A1-2
+
+        Same contract as exchange_code_for_tokens, but the IdP round-trip runs on the
+        shared pooled AsyncClient (keep-alive, HTTP/2 if available) and does not hold
+        a threadpool worker while waiting.
+
+        Args:
+            code: Authorization code from Azure AD
+            code_verifier: PKCE code verifier (from frontend)
+
+        Returns:
+            Dictionary containing access_token, id_token, token_type, expires_in
+
+        Raises:
+            ValueError: If token exchange fails
+
+        """
+        if not settings.OIDC_TOKEN_ENDPOINT:
+            raise ValueError("OIDC_TOKEN_ENDPOINT not configured")
+
+        # Development/Test Mode: Return mock tokens if using test credentials
+        if settings.OIDC_CLIENT_ID == "your-azure-app-id":
+            return self._get_mock_tokens(code, code_verifier)
+
+        payload = self._token_request_payload(code, code_verifier)
+
+        try:
+            response = await get_oidc_http_client().post(settings.OIDC_TOKEN_ENDPOINT, data=payload)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise ValueError(f"Token exchange failed: {e.response.text}") from e
+        except httpx.RequestError as e:
+            raise ValueError(f"Token exchange request failed: {str(e)}") from e
+
+    def _token_request_payload(self, code: str, code_verifier: str) -> dict[str, str]:
+        """
+        Build form payload for the Azure AD token endpoint.
+
+        Args:
+            code: Authorization code from Azure AD
+            code_verifier: PKCE code verifier
+
+        Returns:
+            Form fields for the authorization_code grant
+
+        """
+        return {
+            "client_id": settings.OIDC_CLIENT_ID,
+            "client_secret": settings.OIDC_CLIENT_SECRET,
+            "code": code,
+            "code_verifier": code_verifier,
+            "redirect_uri": settings.OIDC_REDIRECT_URI,
+            "grant_type": "authorization_code",
+            "scope": "openid profile email",
+        }
+
     def validate_id_token(self, id_token: str) -> dict[str, Any]:
         """
         Validate and extract claims from ID Token.
@@ -242,19 +298,21 @@ class OIDCAuthService:
 
         """
         try:
-            # Skip JWKS fetch in test/development mode
-            if settings.OIDC_CLIENT_ID != "your-azure-app-id":
-                # Production: Get JWKS from Azure AD endpoint for signature verification
-                # TODO: Use JWKS for signature verification in production
-                _ = self._get_jwks()
-
-            # Decode and validate token
-            # Note: In production, we would verify the signature using JWKS
-            # For now, we verify the token structure and expiration
-            payload = jwt.decode(
-                id_token,
-                options={"verify_signature": False},  # Will be verified with JWKS in production
-            )
+            if settings.OIDC_CLIENT_ID == "your-azure-app-id":
+                # Mock mode (_get_mock_tokens): unsigned tokens, verify structure and expiration only
+                payload = jwt.decode(
+                    id_token,
+                    options={"verify_signature": False},
+                )
+            else:
+                # Production: signing key from the in-memory JWKS cache (no network on cache hit)
+                signing_key = self._get_signing_key(id_token)
+                payload = jwt.decode(
+                    id_token,
+                    key=signing_key.key,
+                    algorithms=[signing_key.algorithm_name],
+                    options={"verify_aud": False, "verify_iss": False},  # Checked below
+                )
 
             # Validate issuer
             expected_issuer = f"https://login.microsoftonline.com/{settings.OIDC_TENANT_ID}/v2.0"
@@ -328,25 +386,42 @@ class OIDCAuthService:
             "expires_in": 3600,
         }
 
+    def _get_signing_key(self, id_token: str) -> jwt.PyJWK:
+        """
+        Resolve the signing key for an ID token from the JWKS cache.
+
+        REQ: REQ-B-A1-3
+
+        Args:
+            id_token: ID Token (JWT) from Azure AD
+
+        Returns:
+            Signing key for the token's kid
+
+        Raises:
+            jwt.InvalidTokenError: If the header is malformed, has no kid, or the kid is unknown
+            ValueError: If JWKS cannot be loaded
+
+        """
+        kid = jwt.get_unverified_header(id_token).get("kid")
+        if not kid:
+            raise jwt.InvalidTokenError("ID token header has no kid")
+        return jwks_cache.get_signing_key(kid)
+
     def _get_jwks(self) -> dict[str, Any]:
         """
-        Fetch JWKS (JSON Web Key Set) from Azure AD endpoint.
+        Get JWKS (JSON Web Key Set) of Azure AD.
 
         REQ: REQ-B-A1-3
 
+        Served from the process-wide jwks_cache; the endpoint (or OIDC_JWKS_FILE)
+        is read on first use and refreshed in the background afterwards.
+
         Returns:
             JWKS dictionary containing keys for signature verification
 
         Raises:
-            httpx.HTTPError: If JWKS fetch fails
+            ValueError: If JWKS cannot be loaded
 
         """
-        if not settings.OIDC_JWKS_ENDPOINT:
-            raise ValueError("OIDC_JWKS_ENDPOINT not configured")
-
-        try:
-            response = httpx.get(settings.OIDC_JWKS_ENDPOINT, timeout=10.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            raise ValueError(f"Failed to fetch JWKS: {str(e)}") from e
+        return jwks_cache.get_jwks()
@@ -4,22 +4,47 @@ Explanation generation service for generating question explanations with referen
 REQ: REQ-B-B3-Explain, REQ-B-B3-Explain-2
 
 Uses Gemini LLM to generate dynamic explanations based on problem context.
+
+Environment Variables:
+    EXPLANATION_BATCH_ENABLED: "True" to explain a session's uncached questions in
+        batched LLM calls (default: False)
+    EXPLANATION_BATCH_MAX_ITEMS: Max questions per batched LLM call (default: 5)
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import replace
 from datetime import UTC, datetime
-from typing import Any
+from os import getenv
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
 from src.agent.config import create_llm
+from src.agent.json_repair import parse_json_tolerant, strip_code_fences
+from src.agent.streaming_json import StringFieldStreamParser
 from src.backend.models.answer_explanation import AnswerExplanation
 from src.backend.models.question import Question
+from src.backend.services.explanation_cache import CachedExplanation, explanation_cache, explanation_content_key
+from src.backend.services.explanation_executor import explanation_executor
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Batched session explanations: max questions explained in one LLM prompt
+DEFAULT_BATCH_MAX_ITEMS = 5
+
+
+def get_explanation_batch_size() -> int:
+    """Return max questions per batched explanation call (1 = batching disabled)."""
+    if getenv("EXPLANATION_BATCH_ENABLED", "False").lower() != "true":
+        return 1
+    return max(1, int(getenv("EXPLANATION_BATCH_MAX_ITEMS", str(DEFAULT_BATCH_MAX_ITEMS))))
+
 
 class ExplainService:
     """
@@ -33,7 +58,8 @@ class ExplainService:
 
     Design:
         - Generates 200+ character explanations with 3+ reference links
-        - Caches explanations by question_id (reused across users)
+        - Caches explanations by question content (reused across users and sessions):
+          in-process LRU (explanation_cache) → answer_explanations.content_hash → LLM
         - Separates prompts for correct vs incorrect answers
         - Supports timeout handling with graceful degradation
 
@@ -48,6 +74,7 @@ class ExplainService:
 
         """
         self.session = session
+        self._db_lock: asyncio.Lock | None = None  # agenerate_explanation: one DB step at a time
 
     def generate_explanation(
         self,
@@ -85,28 +112,11 @@ class ExplainService:
             ValueError: If question not found or validation fails
 
         """
-        # Validate inputs
-        if not question_id:
-            raise ValueError("question_id cannot be empty")
-
-        if isinstance(user_answer, str) and not user_answer.strip():
-            raise ValueError("user_answer cannot be empty")
-
-        # Validate question exists
-        question = self.session.query(Question).filter_by(id=question_id).first()
-        if not question:
-            raise ValueError(f"Question not found: {question_id}")
-
-        # Check for cached explanation (by question_id + is_correct)
-        cached = self.session.query(AnswerExplanation).filter_by(question_id=question_id, is_correct=is_correct).first()
-
-        if cached:
-            return self._format_explanation_response(
-                explanation=cached,
-                question=question,
-                user_answer=user_answer,
-                attempt_answer_id=attempt_answer_id,
-            )
+        question, content_key, cached_response = self._lookup_explanation(
+            question_id, user_answer, is_correct, attempt_answer_id
+        )
+        if cached_response is not None:
+            return cached_response
 
         # Generate new explanation (with fallback tracking)
         try:
@@ -122,29 +132,236 @@ class ExplainService:
                 error_message=str(e),
             )
 
-        # Validate explanation meets requirements
-        self._validate_explanation(llm_response)
+        return self._save_explanation(
+            question, content_key, user_answer, is_correct, attempt_answer_id, llm_response, is_fallback, error_message
+        )
 
-        # Save to database
-        explanation = AnswerExplanation(
-            id=str(uuid4()),
-            question_id=question_id,
-            attempt_answer_id=attempt_answer_id,
-            explanation_text=llm_response["explanation"],
-            reference_links=llm_response["reference_links"],
-            is_correct=is_correct,
-            is_fallback=is_fallback,
-            error_message=error_message,
+    async def agenerate_explanation(
+        self,
+        question_id: str,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Async version of generate_explanation for concurrent callers.
+
+        REQ: REQ-B-B3-Explain-2
+
+        The LLM is called with ainvoke under the process-wide explanation limit.
+        DB work runs on the shared explanation DB pool, one step at a time per
+        service (the Session is not thread-safe), so concurrent calls on one
+        service share a single DB connection.
+
+        Args:
+            question_id: Question ID to explain
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Returns:
+            Same dictionary as generate_explanation
+
+        Raises:
+            ValueError: If question not found or validation fails
+
+        """
+        question, content_key, cached_response = await self._run_db(
+            self._lookup_explanation, question_id, user_answer, is_correct, attempt_answer_id
         )
-        self.session.add(explanation)
-        self.session.commit()
-        self.session.refresh(explanation)
+        if cached_response is not None:
+            return cached_response
 
-        return self._format_explanation_response(
-            explanation=explanation,
-            question=question,
-            user_answer=user_answer,
+        prompt = await self._run_db(self._build_explanation_prompt, question, user_answer, is_correct)
+        try:
+            llm_response = await self._agenerate_with_gemini(prompt)
+            is_fallback, error_message = False, None
+        except Exception as e:
+            logger.error(f"✗ Gemini API failed - Type: {type(e).__name__}, Message: {e}")
+            logger.info("Using Mock LLM as fallback for explanation generation")
+            llm_response = await self._run_db(self._generate_mock_explanation, question, user_answer, is_correct)
+            is_fallback, error_message = True, str(e)
+
+        return await self._run_db(
+            self._save_explanation,
+            question,
+            content_key,
+            user_answer,
+            is_correct,
+            attempt_answer_id,
+            llm_response,
+            is_fallback,
+            error_message,
+        )
+
+    async def agenerate_session_explanations(
+        self,
+        items: list[tuple[str, str | dict, bool, str | None]],
+        batch_size: int | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Generate explanations for several answers (e.g. a whole session) concurrently.
+
+        REQ: REQ-B-B3-Explain-2
+
+        With batch_size > 1, uncached questions are explained with one LLM call per
+        chunk of batch_size questions instead of one call each, so the shared
+        instructions are sent once per chunk. Items the batch response does not
+        cover (missing, invalid, call failed) fall back to agenerate_explanation
+        individually.
+
+        Args:
+            items: List of (question_id, user_answer, is_correct, attempt_answer_id)
+            batch_size: Max questions per LLM call (default: get_explanation_batch_size())
+
+        Returns:
+            generate_explanation dictionaries in item order (None where generation failed)
+
+        """
+        if batch_size is None:
+            batch_size = get_explanation_batch_size()
+        results: list[dict[str, Any] | None] = [None] * len(items)
+
+        if batch_size > 1:
+            pending: list[tuple[int, Question, str]] = []
+            for i, (question_id, user_answer, is_correct, attempt_answer_id) in enumerate(items):
+                try:
+                    question, content_key, cached_response = await self._run_db(
+                        self._lookup_explanation, question_id, user_answer, is_correct, attempt_answer_id
+                    )
+                except ValueError:
+                    continue  # per-item path below reports the error
+                if cached_response is not None:
+                    results[i] = cached_response
+                else:
+                    pending.append((i, question, content_key))
+
+            if len(pending) > 1:
+                chunks = [pending[offset : offset + batch_size] for offset in range(0, len(pending), batch_size)]
+                chunk_responses = await asyncio.gather(
+                    *(
+                        self._agenerate_batch_with_gemini(
+                            [(question, items[i][1], items[i][2]) for i, question, _ in chunk]
+                        )
+                        for chunk in chunks
+                    )
+                )
+                for chunk, responses in zip(chunks, chunk_responses, strict=True):
+                    for (i, question, content_key), llm_response in zip(chunk, responses, strict=True):
+                        if llm_response is None:
+                            continue
+                        _, user_answer, is_correct, attempt_answer_id = items[i]
+                        results[i] = await self._run_db(
+                            self._save_explanation,
+                            question,
+                            content_key,
+                            user_answer,
+                            is_correct,
+                            attempt_answer_id,
+                            llm_response,
+                            False,
+                            None,
+                        )
+
+        async def explain_one(item: tuple[str, str | dict, bool, str | None]) -> dict[str, Any] | None:
+            question_id, user_answer, is_correct, attempt_answer_id = item
+            try:
+                return await self.agenerate_explanation(
+                    question_id=question_id,
+                    user_answer=user_answer,
+                    is_correct=is_correct,
+                    attempt_answer_id=attempt_answer_id,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to generate explanation for question {question_id}: {e}")
+                return None
+
+        remaining = [i for i, result in enumerate(results) if result is None]
+        remaining_results = await asyncio.gather(*(explain_one(items[i]) for i in remaining))
+        for i, result in zip(remaining, remaining_results, strict=True):
+            results[i] = result
+        return results
+
+    async def astream_explanation(
+        self,
+        question_id: str,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Stream an explanation while the LLM generates it.
+
+        REQ: REQ-B-B3-Explain-1
+
+        Yields (event, data) pairs:
+            - ("delta", {"text": ...}): next piece of explanation text
+            - ("done", dict): saved explanation (same dictionary as generate_explanation).
+              Its explanation_text is authoritative: it may differ from the deltas
+              when the LLM output needed JSON repair or generation fell back.
+
+        Cached explanations are sent as one delta followed by done, without an LLM call.
+        The lookup runs before the first event, so a missing question raises on the
+        first iteration (before anything is sent).
+
+        Args:
+            question_id: Question ID to explain
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Yields:
+            (event name, event data)
+
+        Raises:
+            ValueError: If question not found or validation fails
+
+        """
+        question, content_key, cached_response = await self._run_db(
+            self._lookup_explanation, question_id, user_answer, is_correct, attempt_answer_id
+        )
+        if cached_response is not None:
+            yield "delta", {"text": cached_response["explanation_text"]}
+            yield "done", cached_response
+            return
+
+        prompt = await self._run_db(self._build_explanation_prompt, question, user_answer, is_correct)
+        streamed = False
+        try:
+            llm = create_llm()
+            field = StringFieldStreamParser("explanation")
+            parts: list[str] = []
+            async with explanation_executor.allm_slot():
+                async for chunk in llm.astream(prompt):
+                    if not isinstance(chunk.content, str):
+                        continue
+                    parts.append(chunk.content)
+                    text = field.feed(chunk.content)
+                    if text:
+                        streamed = True
+                        yield "delta", {"text": text}
+            llm_response = self._parse_llm_output("".join(parts))
+            is_fallback, error_message = False, None
+        except Exception as e:
+            logger.error(f"✗ Gemini API failed - Type: {type(e).__name__}, Message: {e}")
+            logger.info("Using Mock LLM as fallback for explanation generation")
+            llm_response = await self._run_db(self._generate_mock_explanation, question, user_answer, is_correct)
+            is_fallback, error_message = True, str(e)
+
+        explanation = await self._run_db(
+            self._save_explanation,
+            question,
+            content_key,
+            user_answer,
+            is_correct,
+            attempt_answer_id,
+            llm_response,
+            is_fallback,
+            error_message,
         )
+        if not streamed:
+            yield "delta", {"text": explanation["explanation_text"]}
+        yield "done", explanation
 
     def get_explanation(
         self,
@@ -194,6 +411,183 @@ class ExplainService:
     # Private Methods
     # =========================================================================
 
+    def _lookup_explanation(
+        self,
+        question_id: str,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None,
+    ) -> tuple[Question, str, dict[str, Any] | None]:
+        """
+        Validate inputs, load question and look up cached explanation.
+
+        Args:
+            question_id: Question ID to explain
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Returns:
+            (question, content key, formatted cached explanation or None)
+
+        Raises:
+            ValueError: If inputs are invalid or question not found
+
+        """
+        # Validate inputs
+        if not question_id:
+            raise ValueError("question_id cannot be empty")
+
+        if isinstance(user_answer, str) and not user_answer.strip():
+            raise ValueError("user_answer cannot be empty")
+
+        # Validate question exists
+        question = self.session.query(Question).filter_by(id=question_id).first()
+        if not question:
+            raise ValueError(f"Question not found: {question_id}")
+
+        # Check for cached explanation: in-process LRU → DB (by content hash)
+        content_key = self._content_key(question, user_answer, is_correct)
+        cached = explanation_cache.get(content_key) or self._load_cached_explanation(
+            question_id, is_correct, content_key
+        )
+        if not cached:
+            return question, content_key, None
+
+        if cached.question_id != question_id:
+            # Shared from an identical question (other session/user): don't leak its attempt
+            cached = replace(cached, question_id=question_id, attempt_answer_id=None)
+        response = self._format_explanation_response(
+            explanation=cached,
+            question=question,
+            user_answer=user_answer,
+            attempt_answer_id=attempt_answer_id,
+        )
+        return question, content_key, response
+
+    def _save_explanation(
+        self,
+        question: Question,
+        content_key: str,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None,
+        llm_response: dict[str, Any],
+        is_fallback: bool,
+        error_message: str | None,
+    ) -> dict[str, Any]:
+        """
+        Validate generated explanation, persist it and populate the LRU.
+
+        Returns:
+            Formatted explanation response
+
+        Raises:
+            ValueError: If explanation does not meet requirements
+
+        """
+        # Validate explanation meets requirements
+        self._validate_explanation(llm_response)
+
+        # Save to database
+        explanation = AnswerExplanation(
+            id=str(uuid4()),
+            question_id=question.id,
+            attempt_answer_id=attempt_answer_id,
+            content_hash=None if is_fallback else content_key,
+            explanation_text=llm_response["explanation"],
+            reference_links=llm_response["reference_links"],
+            is_correct=is_correct,
+            is_fallback=is_fallback,
+            error_message=error_message,
+        )
+        self.session.add(explanation)
+        self.session.commit()
+        self.session.refresh(explanation)
+        if not is_fallback:
+            explanation_cache.put(content_key, CachedExplanation.from_row(explanation))
+
+        return self._format_explanation_response(
+            explanation=explanation,
+            question=question,
+            user_answer=user_answer,
+        )
+
+    async def _run_db(self, func: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+        """Run blocking DB step on the threadpool (serialized per service: one connection per request)."""
+        if self._db_lock is None:
+            self._db_lock = asyncio.Lock()
+        async with self._db_lock:
+            return await explanation_executor.run_db(func, *args)
+
+    def _content_key(self, question: Question, user_answer: str | dict, is_correct: bool) -> str:
+        """
+        Build content-addressed cache key for question + correctness (+ wrong answer).
+
+        Args:
+            question: Question object
+            user_answer: User's submitted answer (part of the key only when incorrect)
+            is_correct: Whether answer is correct
+
+        Returns:
+            Content key (see explanation_content_key)
+
+        """
+        answer_schema = question.answer_schema or {}
+        correct_answer = self._extract_correct_answer_key(answer_schema, question.item_type or "unknown")
+        keywords = answer_schema.get("keywords")
+        if isinstance(keywords, list) and keywords:
+            correct_answer += " | " + ", ".join(str(keyword) for keyword in keywords)
+        return explanation_content_key(
+            stem=question.stem,
+            choices=question.choices,
+            correct_answer=correct_answer,
+            category=question.category,
+            is_correct=is_correct,
+            user_answer=user_answer,
+        )
+
+    def _load_cached_explanation(
+        self,
+        question_id: str,
+        is_correct: bool,
+        content_key: str,
+    ) -> CachedExplanation | None:
+        """
+        Load explanation from DB (tier 2) and populate the in-process LRU (tier 1).
+
+        Looks up by content hash first, then by (question_id, is_correct) among rows
+        without a hash: rows created before content_hash existed (backfilled here) and
+        per-question fallbacks. Hashed rows of the same question for another wrong
+        answer are not reused.
+
+        Args:
+            question_id: Question ID
+            is_correct: Whether answer is correct
+            content_key: Content key of the question
+
+        Returns:
+            CachedExplanation or None if not generated yet
+
+        """
+        row = self.session.query(AnswerExplanation).filter_by(content_hash=content_key).first()
+        if row is None:
+            row = (
+                self.session.query(AnswerExplanation)
+                .filter_by(question_id=question_id, is_correct=is_correct, content_hash=None)
+                .first()
+            )
+            if row is None:
+                return None
+            if row.content_hash is None and not row.is_fallback:
+                row.content_hash = content_key
+                self.session.commit()
+
+        cached = CachedExplanation.from_row(row)
+        if not cached.is_fallback:
+            explanation_cache.put(content_key, cached)
+        return cached
+
     def _generate_with_llm(
         self,
         question: Question,
@@ -261,10 +655,64 @@ class ExplainService:
         # Build prompt with question context
         prompt = self._build_explanation_prompt(question, user_answer, is_correct)
 
-        # Call Gemini LLM
-        response = llm.invoke(prompt)
-        response_text = response.content
+        # Call Gemini LLM (process-wide explanation concurrency limit)
+        with explanation_executor.llm_slot():
+            response = llm.invoke(prompt)
+
+        return self._parse_llm_output(response.content)
+
+    async def _agenerate_with_gemini(self, prompt: str) -> dict[str, Any]:
+        """
+        Generate explanation using the LLM's async API.
+
+        REQ: REQ-B-B3-Explain-2
+
+        Args:
+            prompt: Prompt from _build_explanation_prompt
+
+        Returns:
+            Dictionary with 'explanation' and 'reference_links'
+
+        """
+        llm = create_llm()
+        async with explanation_executor.allm_slot():
+            response = await llm.ainvoke(prompt)
+        return self._parse_llm_output(response.content)
+
+    async def _agenerate_batch_with_gemini(
+        self, batch: list[tuple[Question, str | dict, bool]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Generate explanations for several questions with one LLM call.
+
+        REQ: REQ-B-B3-Explain-2
+
+        Never raises: if the call or parsing fails, every item is None so the
+        caller can fall back to per-question generation.
+
+        Args:
+            batch: List of (question, user_answer, is_correct)
+
+        Returns:
+            List (batch order) of {'explanation', 'reference_links'} dicts or None
+
+        """
+        prompt = await self._run_db(self._build_batch_explanation_prompt, batch)
+        try:
+            llm = create_llm()
+            async with explanation_executor.allm_slot():
+                response = await llm.ainvoke(prompt)
+        except Exception as e:
+            logger.error(f"✗ Batch explanation LLM call failed - Type: {type(e).__name__}, Message: {e}")
+            return [None] * len(batch)
+
+        results = self._parse_batch_llm_response(str(response.content), len(batch))
+        parsed = sum(1 for result in results if result is not None)
+        logger.info(f"Batch explanation: {parsed}/{len(batch)} explanations parsed in one call")
+        return results
 
+    def _parse_llm_output(self, response_text: str) -> dict[str, Any]:
+        """Parse LLM output and log quality metrics."""
         # Log raw response for debugging
         logger.debug(f"Gemini raw response length: {len(response_text)} chars")
         logger.debug(f"Gemini response preview: {response_text[:200]}...")
@@ -297,6 +745,47 @@ class ExplainService:
         Returns:
             Formatted prompt string
 
+        """
+        correct_key = self._extract_correct_answer_key(question.answer_schema or {}, question.item_type or "unknown")
+
+        # Build detailed prompt with enhanced requirements
+        prompt = f"""다음 문제에 대해 사용자 답변을 평가하고 맞춤형 해설을 작성해주세요.
+
+{self._build_question_context(question, user_answer, is_correct)}
+
+다음 JSON 포맷으로 상세한 해설을 작성해주세요. 괄호는 포함하지 마세요:
+{{
+  "explanation": "[틀린 이유]\\n사용자가 선택한 이유와 오류를 구체적으로 분석해주세요. (200-300자)\\n예: \\"이 보기는...왜냐하면...따라서 틀렸습니다\\"\\n\\n[정답의 원리]\\n'{correct_key}'가 정답인 이유를 개념 설명 + 구체적 예시와 함께 상세히 설명해주세요. (250-350자)\\n예: \\"이것이 정답인 이유는...구체적으로는...이런 경우에 적용됩니다\\"\\n\\n[개념 구분]\\n혼동하기 쉬운 유사 개념들을 비교표나 구체적인 차이점으로 명확히 구분해주세요. (150-250자)\\n예: \\"A는 ...하고, B는 ...하는 점이 다릅니다\\"\\n\\n[복습 팁]\\n사용자가 이 유형의 문제를 다음에 올바르게 풀기 위한 구체적인 학습 전략을 제시해주세요. (100-200자)\\n예: \\"다음 번에는...확인하세요\\"",
+  "reference_links": [
+    {{"title": "개념 설명 자료", "url": "https://example.com/concept-{question.category.lower()}"}},
+    {{"title": "심화 학습 가이드", "url": "https://example.com/guide-{question.category.lower()}"}},
+    {{"title": "관련 문제 풀이집", "url": "https://example.com/problems-{question.category.lower()}"}}
+  ]
+}}
+
+매우 중요한 요구사항:
+✓ 각 섹션([틀린 이유], [정답의 원리], [개념 구분], [복습 팁])을 명확하게 구분하고, 전체 explanation은 최소 700자 이상이어야 합니다.
+✓ 문제의 구체적인 내용(stem, 선택지, 정답)을 활용하여 이 문제에만 적용되는 맞춤형 해설을 작성해주세요.
+✓ 추상적인 설명보다는 구체적인 예시, 사례, 비유를 포함해주세요.
+✓ 참고 링크는 정확히 3개, 모두 한글 제목을 포함해야 합니다.
+✓ JSON 유효성: explanation 필드의 문자열 내에 실제 줄바꿈을 사용할 경우, 반드시 JSON 문자열 규칙에 따라 이스케이프하거나 한 줄로 작성하세요.
+✓ 권장: 섹션 내용을 한 줄로 유지하거나, 꼭 필요한 경우에만 논리적 구분점에서 실제 줄바꿈을 사용하세요.
+"""
+
+        return prompt
+
+    def _build_question_context(self, question: Question, user_answer: str | dict, is_correct: bool) -> str:
+        """
+        Build question context block (stem, choices, user answer, correctness) for prompts.
+
+        Args:
+            question: Question object
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+
+        Returns:
+            Context block shared by single and batch explanation prompts
+
         """
         # Format user answer for display
         if isinstance(user_answer, dict):
@@ -316,10 +805,7 @@ class ExplainService:
         answer_schema = question.answer_schema or {}
         correct_key = self._extract_correct_answer_key(answer_schema, question.item_type or "unknown")
 
-        # Build detailed prompt with enhanced requirements
-        prompt = f"""다음 문제에 대해 사용자 답변을 평가하고 맞춤형 해설을 작성해주세요.
-
-문제 유형: {question.item_type}
+        context = f"""문제 유형: {question.item_type}
 문제 주제: {question.category}
 
 <문제>
@@ -330,37 +816,63 @@ class ExplainService:
 
         # Add choices if available
         if question.choices:
-            prompt += f"""선택지:
+            context += f"""선택지:
 {chr(10).join(f"- {choice}" for choice in question.choices)}
 
 """
 
         # Add answer info
-        prompt += f"""사용자 답변: {user_answer_str}
+        context += f"""사용자 답변: {user_answer_str}
 정답: {correct_key}
-정오답: {"정답" if is_correct else "오답"}
+정오답: {"정답" if is_correct else "오답"}"""
 
-다음 JSON 포맷으로 상세한 해설을 작성해주세요. 괄호는 포함하지 마세요:
-{{
-  "explanation": "[틀린 이유]\\n사용자가 선택한 이유와 오류를 구체적으로 분석해주세요. (200-300자)\\n예: \\"이 보기는...왜냐하면...따라서 틀렸습니다\\"\\n\\n[정답의 원리]\\n'{correct_key}'가 정답인 이유를 개념 설명 + 구체적 예시와 함께 상세히 설명해주세요. (250-350자)\\n예: \\"이것이 정답인 이유는...구체적으로는...이런 경우에 적용됩니다\\"\\n\\n[개념 구분]\\n혼동하기 쉬운 유사 개념들을 비교표나 구체적인 차이점으로 명확히 구분해주세요. (150-250자)\\n예: \\"A는 ...하고, B는 ...하는 점이 다릅니다\\"\\n\\n[복습 팁]\\n사용자가 이 유형의 문제를 다음에 올바르게 풀기 위한 구체적인 학습 전략을 제시해주세요. (100-200자)\\n예: \\"다음 번에는...확인하세요\\"",
-  "reference_links": [
-    {{"title": "개념 설명 자료", "url": "https://example.com/concept-{question.category.lower()}"}},
-    {{"title": "심화 학습 가이드", "url": "https://example.com/guide-{question.category.lower()}"}},
-    {{"title": "관련 문제 풀이집", "url": "https://example.com/problems-{question.category.lower()}"}}
-  ]
-}}
+        return context
+
+    def _build_batch_explanation_prompt(self, batch: list[tuple[Question, str | dict, bool]]) -> str:
+        """
+        Build one LLM prompt explaining several questions (instructions sent once).
+
+        REQ: REQ-B-B3-Explain-2
+
+        Args:
+            batch: List of (question, user_answer, is_correct)
+
+        Returns:
+            Formatted prompt string; questions are marked "[문항 N]" (1-based)
+
+        """
+        blocks = [
+            f"[문항 {i}]\n{self._build_question_context(question, user_answer, is_correct)}"
+            for i, (question, user_answer, is_correct) in enumerate(batch, start=1)
+        ]
+        questions_str = "\n\n".join(blocks)
+
+        return f"""다음 {len(batch)}개 문제 각각에 대해 사용자 답변을 평가하고 문항별 맞춤형 해설을 작성해주세요.
+
+{questions_str}
+
+문항마다 아래 형식의 객체를 하나씩 담은 JSON 배열로만 응답해주세요. 괄호는 포함하지 마세요:
+[
+  {{
+    "index": 1,
+    "explanation": "[틀린 이유]\\n사용자가 선택한 이유와 오류를 구체적으로 분석해주세요. (200-300자)\\n\\n[정답의 원리]\\n해당 문항의 정답이 정답인 이유를 개념 설명 + 구체적 예시와 함께 상세히 설명해주세요. (250-350자)\\n\\n[개념 구분]\\n혼동하기 쉬운 유사 개념들을 비교표나 구체적인 차이점으로 명확히 구분해주세요. (150-250자)\\n\\n[복습 팁]\\n사용자가 이 유형의 문제를 다음에 올바르게 풀기 위한 구체적인 학습 전략을 제시해주세요. (100-200자)",
+    "reference_links": [
+      {{"title": "개념 설명 자료", "url": "https://example.com/concept-<문제 주제>"}},
+      {{"title": "심화 학습 가이드", "url": "https://example.com/guide-<문제 주제>"}},
+      {{"title": "관련 문제 풀이집", "url": "https://example.com/problems-<문제 주제>"}}
+    ]
+  }}
+]
 
 매우 중요한 요구사항:
-✓ 각 섹션([틀린 이유], [정답의 원리], [개념 구분], [복습 팁])을 명확하게 구분하고, 전체 explanation은 최소 700자 이상이어야 합니다.
-✓ 문제의 구체적인 내용(stem, 선택지, 정답)을 활용하여 이 문제에만 적용되는 맞춤형 해설을 작성해주세요.
+✓ index는 [문항 N]의 N과 같아야 하며, {len(batch)}개 문항 모두에 대해 객체를 하나씩 작성하세요.
+✓ 각 섹션([틀린 이유], [정답의 원리], [개념 구분], [복습 팁])을 명확하게 구분하고, 문항별 explanation은 최소 700자 이상이어야 합니다.
+✓ 각 문항의 구체적인 내용(stem, 선택지, 정답)을 활용하여 그 문항에만 적용되는 맞춤형 해설을 작성하고, 다른 문항의 해설을 재사용하지 마세요.
 ✓ 추상적인 설명보다는 구체적인 예시, 사례, 비유를 포함해주세요.
-✓ 참고 링크는 정확히 3개, 모두 한글 제목을 포함해야 합니다.
+✓ 참고 링크는 문항마다 정확히 3개, 모두 한글 제목을 포함해야 합니다. <문제 주제>는 해당 문항의 주제(소문자)로 바꾸세요.
 ✓ JSON 유효성: explanation 필드의 문자열 내에 실제 줄바꿈을 사용할 경우, 반드시 JSON 문자열 규칙에 따라 이스케이프하거나 한 줄로 작성하세요.
-✓ 권장: 섹션 내용을 한 줄로 유지하거나, 꼭 필요한 경우에만 논리적 구분점에서 실제 줄바꿈을 사용하세요.
 """
 
-        return prompt
-
     def _parse_llm_response(self, response_text: str) -> dict[str, Any]:
         """
         Parse LLM response and extract structured explanation.
@@ -379,37 +891,22 @@ class ExplainService:
         """
         try:
             # Extract JSON from response (may be wrapped in markdown code blocks)
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_text = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_text = response_text.strip()
+            json_text = strip_code_fences(response_text)
 
             # Log raw JSON for debugging (truncated for security)
             json_preview = json_text[:500] + "..." if len(json_text) > 500 else json_text
             logger.debug(f"Raw JSON before parsing: {json_preview}")
 
-            # Parse JSON with control character handling
+            # Parse JSON; raw newlines in strings (common in long explanations) etc. are repaired
             try:
-                data = json.loads(json_text)
+                result = parse_json_tolerant(json_text)
             except json.JSONDecodeError as e:
-                # Attempt to escape unescaped control characters in the JSON string
-                # This handles cases where LLM returns actual newlines instead of \n
-                logger.debug(f"Initial JSON parse failed: {e}. Attempting recovery with escaped control characters...")
-
-                # Replace actual control characters with their escaped versions
-                # while preserving already-escaped sequences
-                escaped_json = self._escape_control_characters(json_text)
-                try:
-                    data = json.loads(escaped_json)
-                    logger.info("✓ JSON parsing succeeded after escaping control characters")
-                except json.JSONDecodeError as recovery_error:
-                    logger.error(
-                        f"Failed to parse LLM response after recovery: {type(recovery_error).__name__}: {recovery_error}"
-                    )
-                    logger.error(f"JSON text preview: {json_preview}")
-                    raise recovery_error
+                logger.error(f"Failed to parse LLM response after repair: {type(e).__name__}: {e}")
+                logger.error(f"JSON text preview: {json_preview}")
+                raise
+            if result.repairs:
+                logger.info(f"✓ JSON parsing succeeded after repairs: {', '.join(result.repairs)}")
+            data = result.value
 
             # Validate structure
             if "explanation" not in data or "reference_links" not in data:
@@ -440,54 +937,50 @@ class ExplainService:
             logger.error(f"Failed to parse LLM response: {type(e).__name__}: {e}")
             raise ValueError(f"Invalid LLM response format: {e}") from e
 
-    def _escape_control_characters(self, json_text: str) -> str:
-        r"""
-        Escape unescaped control characters in JSON text.
+    def _parse_batch_llm_response(self, response_text: str, count: int) -> list[dict[str, Any] | None]:
+        """
+        Parse batch LLM response into per-question explanations.
+
+        REQ: REQ-B-B3-Explain-2
 
-        Handles cases where LLM returns actual newlines/tabs in string values
-        instead of escaped sequences. Converts:
-        - Actual newlines → \n
-        - Actual tabs → \t
-        - Actual carriage returns → \r
+        Entries that are missing, duplicated or fail _validate_explanation are
+        returned as None so the caller can fall back for just those questions.
 
         Args:
-            json_text: JSON string potentially with unescaped control characters
+            response_text: LLM response text (JSON array of {index, explanation, reference_links})
+            count: Number of questions in the prompt
 
         Returns:
-            JSON string with control characters properly escaped
+            List (prompt order) of {'explanation', 'reference_links'} dicts or None
 
         """
-        import re
-
-        # Pattern to find string values in JSON (simple approach)
-        # This won't handle all edge cases but works for most LLM output
-        def escape_string_contents(match: re.Match) -> str:
-            quote_char = match.group(1)  # The quote character (" or ')
-            content = match.group(2)  # The string content
-
-            # Only process if not already escaped
-            # Replace actual control characters with their escape sequences
-            content = content.replace("\r\n", "\\n")  # Windows line endings
-            content = content.replace("\r", "\\r")  # Mac line endings
-            content = content.replace("\n", "\\n")  # Unix line endings
-            content = content.replace("\t", "\\t")  # Tabs
-
-            return f"{quote_char}{content}{quote_char}"
-
+        results: list[dict[str, Any] | None] = [None] * count
         try:
-            # Match JSON strings (simplified - handles most cases)
-            # Matches "..." or '...' patterns
-            escaped_text = re.sub(
-                r'"((?:[^"\\]|\\.)*)"',  # Double-quoted strings
-                lambda m: '"'
-                + m.group(1).replace("\r\n", "\\n").replace("\r", "\\r").replace("\n", "\\n").replace("\t", "\\t")
-                + '"',
-                json_text,
-            )
-            return escaped_text
-        except Exception as e:
-            logger.warning(f"Control character escaping failed: {e}. Returning original text.")
-            return json_text
+            data = parse_json_tolerant(strip_code_fences(response_text)).value
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse batch explanation response: {type(e).__name__}: {e}")
+            return results
+
+        if isinstance(data, dict):
+            data = data.get("explanations")
+        if not isinstance(data, list):
+            logger.error("Batch explanation response is not a JSON array")
+            return results
+
+        for entry in data:
+            if not isinstance(entry, dict) or not isinstance(entry.get("explanation"), str):
+                continue
+            index = entry.get("index")
+            if not isinstance(index, int) or not 1 <= index <= count or results[index - 1] is not None:
+                continue
+            try:
+                self._validate_explanation(entry)
+            except ValueError as e:
+                logger.warning(f"Batch explanation for question {index} rejected: {e}")
+                continue
+            results[index - 1] = {"explanation": entry["explanation"], "reference_links": entry["reference_links"]}
+
+        return results
 
     def _generate_mock_explanation(
         self,
@@ -825,7 +1318,7 @@ class ExplainService:
 
     def _format_explanation_response(
         self,
-        explanation: AnswerExplanation,
+        explanation: AnswerExplanation | CachedExplanation,
         question: Question | None = None,
         user_answer: str | dict | None = None,
         attempt_answer_id: str | None = None,
@@ -834,7 +1327,7 @@ class ExplainService:
         Format explanation as API response with sections and answer summary.
 
         Args:
-            explanation: AnswerExplanation ORM object
+            explanation: AnswerExplanation ORM object or cached snapshot
             question: Question object (for answer formatting)
             user_answer: User's answer (for comparison)
             attempt_answer_id: Optional override for attempt_answer_id
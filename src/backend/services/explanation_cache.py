@@ -0,0 +1,199 @@
+"""
+Content-addressed explanation cache (in-process LRU tier).
+
+REQ: REQ-B-B3-Explain-1, REQ-B-B3-Explain-2
+
+Design:
+    - Questions are generated per session, so identical questions (same template,
+      retakes, other users) have different question ids. Explanations are keyed by
+      explanation_content_key(): sha256 of normalized stem + choices + correct answer
+      + category + correctness (+ the user's answer when it is wrong: an incorrect
+      explanation addresses the chosen distractor, so it is only shared for the same answer).
+    - Tier 1: ExplanationCache - process-wide LRU of CachedExplanation snapshots (thread-safe)
+    - Tier 2: answer_explanations.content_hash (DB, shared across processes)
+    - ExplainService.generate_explanation checks tier 1, then tier 2, then calls the LLM.
+
+    Fallback (mock) explanations are never shared by content key.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.backend.models.answer_explanation import AnswerExplanation
+
+DEFAULT_MAX_ENTRIES = 2048
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: Any) -> str:  # noqa: ANN401
+    """NFKC-normalize and collapse whitespace."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", str(text))).strip()
+
+
+def _normalize_answer(answer: Any) -> Any:  # noqa: ANN401
+    """Normalize user answer (str or nested dict/list) for hashing."""
+    if isinstance(answer, dict):
+        return {str(key): _normalize_answer(value) for key, value in sorted(answer.items())}
+    if isinstance(answer, list):
+        return [_normalize_answer(value) for value in answer]
+    return _normalize(answer)
+
+
+def explanation_content_key(
+    stem: str,
+    choices: list[str] | None,
+    correct_answer: str,
+    category: str | None,
+    is_correct: bool,
+    user_answer: str | dict | None = None,
+) -> str:
+    """
+    Build content-addressed cache key for an explanation.
+
+    Whitespace and Unicode compatibility forms are normalized, so questions that
+    differ only in formatting share a key. Choice order is preserved (answers
+    refer to choices by position/key). Incorrect-answer explanations also key on
+    the normalized user answer; correct-answer explanations ignore it.
+
+    Args:
+        stem: Question stem
+        choices: Answer choices (None for short answer)
+        correct_answer: Correct answer as shown to the LLM
+        category: Question category (used in reference links)
+        is_correct: Whether the explanation is for a correct answer
+        user_answer: User's answer (only part of the key when is_correct is False)
+
+    Returns:
+        64-character hex digest
+
+    """
+    payload = [
+        _normalize(stem),
+        [_normalize(choice) for choice in choices or []],
+        _normalize(correct_answer),
+        _normalize(category or ""),
+        bool(is_correct),
+    ]
+    if not is_correct:
+        payload.append(_normalize_answer(user_answer or ""))
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedExplanation:
+    """Detached snapshot of an AnswerExplanation row (same attribute names)."""
+
+    id: str
+    question_id: str
+    attempt_answer_id: str | None
+    explanation_text: str
+    reference_links: list[dict]
+    is_correct: bool
+    is_fallback: bool
+    error_message: str | None
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row: AnswerExplanation) -> "CachedExplanation":
+        """
+        Snapshot ORM row so it can outlive the DB session.
+
+        Args:
+            row: AnswerExplanation ORM object
+
+        Returns:
+            CachedExplanation
+
+        """
+        return cls(
+            id=row.id,
+            question_id=row.question_id,
+            attempt_answer_id=row.attempt_answer_id,
+            explanation_text=row.explanation_text,
+            reference_links=list(row.reference_links or []),
+            is_correct=row.is_correct,
+            is_fallback=row.is_fallback,
+            error_message=row.error_message,
+            created_at=row.created_at,
+        )
+
+
+class ExplanationCache:
+    """
+    Thread-safe LRU cache of CachedExplanation keyed by content key.
+
+    Least recently used entries are evicted first once max_entries is reached.
+    Explanations are immutable once generated, so entries have no TTL.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached explanations
+
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedExplanation] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedExplanation | None:
+        """
+        Get cached explanation for content key.
+
+        Args:
+            key: Content key from explanation_content_key()
+
+        Returns:
+            CachedExplanation or None
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, explanation: CachedExplanation) -> None:
+        """Store explanation (replaces any existing entry for the key)."""
+        with self._lock:
+            self._entries[key] = explanation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached explanations and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics (size, hits, misses, hit_rate)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# Process-wide cache instance (singleton pattern)
+explanation_cache = ExplanationCache()
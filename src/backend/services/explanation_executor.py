@@ -0,0 +1,93 @@
+"""
+Shared execution resources for explanation generation.
+
+REQ: REQ-B-B3-Explain-2
+
+get_session_explanations used to create a ThreadPoolExecutor(max_workers=5) and a
+fresh SessionLocal() per thread on every request, so concurrent results pages
+multiplied threads and DB connections without bound. Instead:
+
+    - LLM calls: ExplainService.agenerate_explanation uses ainvoke under a
+      process-wide concurrency limit (llm_slot / allm_slot), an AdaptiveLLMLimiter
+      without token bucket, so it also backs off on 429 / timeout. Blocking callers
+      (POST /explanations, background pre-generation) share the same limit.
+    - Sync DB work: run_db runs on the request's threadpool (run_in_threadpool);
+      ExplainService serializes its DB steps, so one request holds one connection.
+      Context variables are propagated, like asyncio.to_thread.
+
+Environment Variables:
+    EXPLANATION_MAX_CONCURRENCY: Concurrent explanation LLM calls, process-wide (default: 16)
+"""
+
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from os import getenv
+from typing import Any, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.agent.llm_limiter import AdaptiveLLMLimiter
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+T = TypeVar("T")
+
+
+class ExplanationExecutor:
+    """
+    Process-wide LLM concurrency limit and DB offloading for explanations.
+
+    The limit is an AdaptiveLLMLimiter (no token bucket), so it holds across
+    threads and event loops and shrinks when the provider throttles.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        """
+        Initialize executor.
+
+        Args:
+            max_concurrency: Maximum concurrent explanation LLM calls
+
+        """
+        self.max_concurrency = max_concurrency
+        self.limiter = AdaptiveLLMLimiter(max_concurrency=max_concurrency, rate_per_second=None)
+
+    def llm_slot(self) -> AbstractContextManager[None]:
+        """Hold one LLM slot (blocking)."""
+        return self.limiter.slot()
+
+    def allm_slot(self) -> AbstractAsyncContextManager[None]:
+        """Hold one LLM slot (async, does not block the event loop)."""
+        return self.limiter.aslot()
+
+    async def run_db(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        """
+        Run blocking DB work on the threadpool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            func's return value
+
+        """
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Return executor statistics (limits, in-flight and peak LLM calls)."""
+        limiter_stats = self.limiter.stats()
+        return {
+            "max_concurrency": self.max_concurrency,
+            "limit": limiter_stats["limit"],
+            "in_flight": limiter_stats["in_flight"],
+            "peak_in_flight": limiter_stats["peak_in_flight"],
+            "throttled": limiter_stats["throttled"],
+        }
+
+
+# Process-wide executor instance (singleton pattern)
+explanation_executor = ExplanationExecutor(
+    max_concurrency=int(getenv("EXPLANATION_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+)
@@ -0,0 +1,218 @@
+"""
+Explanation pre-generation after a round is scored.
+
+REQ: REQ-B-B3-Explain-2
+
+GET /questions/explanations/session/{id} generates missing explanations on demand,
+so the first viewer of a results page waits on LLM calls. When a round is scored
+(ScoringService.save_round_result), explanations for every answered question are
+generated in the background on a bounded thread pool, each task with its own DB
+session. Results land in the explanation caches (explanation_cache.py), so the
+results page reads them instead of calling the LLM.
+
+The results endpoint awaits wait_for_pregeneration() first: if pre-generation for the
+session is still running, it waits (bounded) instead of duplicating LLM calls.
+
+Environment Variables:
+    EXPLANATION_PREGEN_ENABLED: "True" to pre-generate on round scoring (default: False)
+    EXPLANATION_PREGEN_MAX_WORKERS: Concurrent pre-generation tasks, process-wide (default: 4)
+    EXPLANATION_PREGEN_WAIT_SECONDS: Max wait for in-flight pre-generation on the results page (default: 5)
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from os import getenv
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.attempt_answer import AttemptAnswer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_WAIT_SECONDS = 5.0
+
+
+class ExplanationPregenerator:
+    """
+    Bounded background executor for per-session explanation generation.
+
+    A session is scheduled at most once while its tasks are in flight.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Initialize pre-generator.
+
+        Args:
+            max_workers: Maximum concurrent generation tasks (bounds LLM calls)
+
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="explain-pregen")
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, list[Future]] = {}
+        self.generated = 0
+        self.failed = 0
+
+    def schedule_session(self, session_id: str, db: Session) -> list[Future]:
+        """
+        Schedule explanation generation for all answers in a session.
+
+        Args:
+            session_id: TestSession ID
+            db: Caller's DB session (used only to list answers)
+
+        Returns:
+            Futures of scheduled tasks (existing futures if already in flight)
+
+        """
+        with self._lock:
+            if session_id in self._in_flight:
+                return list(self._in_flight[session_id])
+
+        answers = db.query(AttemptAnswer).filter_by(session_id=session_id).all()
+        params = [(answer.id, answer.question_id, answer.user_answer, answer.is_correct) for answer in answers]
+        if not params:
+            return []
+
+        with self._lock:
+            if session_id in self._in_flight:
+                return list(self._in_flight[session_id])
+            futures = [self._executor.submit(self._generate, *item) for item in params]
+            self._in_flight[session_id] = futures
+
+        for future in futures:
+            future.add_done_callback(lambda _future: self._on_done(session_id))
+        logger.info(f"Explanation pre-generation scheduled: session={session_id}, answers={len(futures)}")
+        return futures
+
+    def wait_for_session(self, session_id: str, timeout: float) -> bool:
+        """
+        Wait for in-flight pre-generation of a session.
+
+        Args:
+            session_id: TestSession ID
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if nothing is in flight (anymore), False on timeout
+
+        """
+        with self._lock:
+            futures = list(self._in_flight.get(session_id, []))
+        if not futures:
+            return True
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    async def await_session(self, session_id: str, timeout: float) -> bool:
+        """
+        Async version of wait_for_session (does not block the event loop).
+
+        Args:
+            session_id: TestSession ID
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if nothing is in flight (anymore), False on timeout
+
+        """
+        with self._lock:
+            futures = list(self._in_flight.get(session_id, []))
+        if not futures:
+            return True
+        _, not_done = await asyncio.wait([asyncio.wrap_future(future) for future in futures], timeout=timeout)
+        return not not_done
+
+    def stats(self) -> dict[str, Any]:
+        """Return pre-generation statistics (in-flight sessions, generated, failed)."""
+        with self._lock:
+            return {
+                "in_flight_sessions": len(self._in_flight),
+                "generated": self.generated,
+                "failed": self.failed,
+            }
+
+    def _generate(self, attempt_answer_id: str, question_id: str, user_answer: str | dict, is_correct: bool) -> None:
+        """Generate (or load cached) explanation for one answer with an independent DB session."""
+        from src.backend import database
+        from src.backend.services.explain_service import ExplainService
+
+        db = database.SessionLocal()
+        try:
+            ExplainService(db).generate_explanation(
+                question_id=question_id,
+                user_answer=user_answer,
+                is_correct=is_correct,
+                attempt_answer_id=attempt_answer_id,
+            )
+            with self._lock:
+                self.generated += 1
+        except Exception as e:
+            logger.warning(f"Explanation pre-generation failed for question {question_id}: {e}")
+            with self._lock:
+                self.failed += 1
+        finally:
+            db.close()
+
+    def _on_done(self, session_id: str) -> None:
+        """Drop session from in-flight map once all its tasks are done."""
+        with self._lock:
+            futures = self._in_flight.get(session_id)
+            if futures is not None and all(future.done() for future in futures):
+                del self._in_flight[session_id]
+
+
+# Process-wide pre-generator instance (singleton pattern; worker threads start on first use)
+explanation_pregenerator = ExplanationPregenerator(
+    max_workers=int(getenv("EXPLANATION_PREGEN_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+)
+
+
+def is_pregeneration_enabled() -> bool:
+    """Return True if EXPLANATION_PREGEN_ENABLED is set."""
+    return getenv("EXPLANATION_PREGEN_ENABLED", "False").lower() == "true"
+
+
+def schedule_explanation_pregeneration(session_id: str, db: Session) -> list[Future]:
+    """
+    Schedule explanation pre-generation for a scored session (no-op unless enabled).
+
+    Never raises: pre-generation is an optimization and must not fail scoring.
+
+    Args:
+        session_id: TestSession ID
+        db: Caller's DB session
+
+    Returns:
+        Scheduled futures (empty if disabled or nothing to do)
+
+    """
+    if not is_pregeneration_enabled():
+        return []
+    try:
+        return explanation_pregenerator.schedule_session(session_id, db)
+    except Exception as e:
+        logger.warning(f"Failed to schedule explanation pre-generation for session {session_id}: {e}")
+        return []
+
+
+async def wait_for_pregeneration(session_id: str) -> bool:
+    """
+    Wait (bounded by EXPLANATION_PREGEN_WAIT_SECONDS) for in-flight pre-generation of a session.
+
+    Args:
+        session_id: TestSession ID
+
+    Returns:
+        True if nothing is in flight (or pre-generation is disabled), False on timeout
+
+    """
+    if not is_pregeneration_enabled():
+        return True
+    timeout = float(getenv("EXPLANATION_PREGEN_WAIT_SECONDS", str(DEFAULT_WAIT_SECONDS)))
+    return await explanation_pregenerator.await_session(session_id, timeout=timeout)
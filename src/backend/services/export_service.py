@@ -0,0 +1,243 @@
+"""
+Streaming bulk export of attempts, answers and results.
+
+REQ: REQ-B-B5-1, REQ-B-B5-3
+
+Design:
+    - Each dataset is one column-only SELECT (no ORM entities, so nothing piles up in
+      the session identity map) executed with yield_per: PostgreSQL streams rows
+      through a server-side cursor, so memory stays flat for any export size
+    - Rows are encoded as NDJSON (one JSON object per line) or CSV and emitted in
+      chunks of EXPORT_BATCH_SIZE rows, for StreamingResponse / file output
+    - Datasets are flat (one row per attempt round / answer / result) so NDJSON and
+      CSV share the same columns
+
+Datasets:
+    attempts: Attempt LEFT JOIN AttemptRound (one row per round; round_* empty if none)
+    answers: AttemptAnswer JOIN TestSession (user_id, round)
+    results: TestResult JOIN TestSession (user_id)
+
+Environment Variables:
+    EXPORT_BATCH_SIZE: Rows fetched per server-side cursor batch and emitted per chunk (default: 1000)
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from os import getenv
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from src.backend.models import Attempt, AttemptAnswer, AttemptRound, TestResult, TestSession
+from src.backend.utils.responses import format_ndjson_line
+
+DEFAULT_BATCH_SIZE = 1000
+
+EXPORT_DATASETS = ("attempts", "answers", "results")
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class ExportService:
+    """
+    Service for streaming bulk exports of test history data.
+
+    REQ: REQ-B-B5-1, REQ-B-B5-3
+    """
+
+    def __init__(self, session: Session, batch_size: int | None = None) -> None:
+        """
+        Initialize ExportService.
+
+        Args:
+            session: SQLAlchemy database session (must stay open while streaming)
+            batch_size: Rows per batch (default: EXPORT_BATCH_SIZE)
+
+        """
+        self.session = session
+        self.batch_size = batch_size or int(getenv("EXPORT_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)))
+
+    def _build_query(self, dataset: str, user_id: int | None, since: datetime | None) -> Select:
+        """
+        Build column-only SELECT for dataset.
+
+        Args:
+            dataset: One of EXPORT_DATASETS
+            user_id: Only this user's rows (None for all users)
+            since: Only rows finished/created at or after this time
+
+        Returns:
+            SELECT statement ordered by primary key
+
+        Raises:
+            ValueError: If dataset is unknown
+
+        """
+        if dataset == "attempts":
+            stmt = (
+                select(
+                    Attempt.id.label("attempt_id"),
+                    Attempt.user_id,
+                    Attempt.survey_id,
+                    Attempt.test_type,
+                    Attempt.status,
+                    Attempt.started_at,
+                    Attempt.finished_at,
+                    Attempt.final_grade,
+                    Attempt.final_score,
+                    Attempt.percentile,
+                    Attempt.rank,
+                    Attempt.total_candidates,
+                    AttemptRound.round_idx,
+                    AttemptRound.score.label("round_score"),
+                    AttemptRound.time_spent_seconds.label("round_time_spent_seconds"),
+                )
+                .outerjoin(AttemptRound, AttemptRound.attempt_id == Attempt.id)
+                .order_by(Attempt.id, AttemptRound.round_idx)
+            )
+            user_column, time_column = Attempt.user_id, Attempt.finished_at
+        elif dataset == "answers":
+            stmt = (
+                select(
+                    AttemptAnswer.id.label("answer_id"),
+                    TestSession.user_id,
+                    AttemptAnswer.session_id,
+                    TestSession.round,
+                    AttemptAnswer.question_id,
+                    AttemptAnswer.user_answer,
+                    AttemptAnswer.is_correct,
+                    AttemptAnswer.score,
+                    AttemptAnswer.response_time_ms,
+                    AttemptAnswer.saved_at,
+                    AttemptAnswer.created_at,
+                )
+                .join(TestSession, TestSession.id == AttemptAnswer.session_id)
+                .order_by(AttemptAnswer.id)
+            )
+            user_column, time_column = TestSession.user_id, AttemptAnswer.created_at
+        elif dataset == "results":
+            stmt = (
+                select(
+                    TestResult.id.label("result_id"),
+                    TestSession.user_id,
+                    TestResult.session_id,
+                    TestResult.round,
+                    TestResult.score,
+                    TestResult.total_points,
+                    TestResult.correct_count,
+                    TestResult.total_count,
+                    TestResult.wrong_categories,
+                    TestResult.created_at,
+                )
+                .join(TestSession, TestSession.id == TestResult.session_id)
+                .order_by(TestResult.id)
+            )
+            user_column, time_column = TestSession.user_id, TestResult.created_at
+        else:
+            raise ValueError(f"Unknown export dataset: {dataset} (expected one of {', '.join(EXPORT_DATASETS)})")
+
+        if user_id is not None:
+            stmt = stmt.where(user_column == user_id)
+        if since is not None:
+            stmt = stmt.where(time_column >= since)
+        return stmt
+
+    def columns(self, dataset: str) -> list[str]:
+        """
+        Return column names of dataset (CSV header order).
+
+        Args:
+            dataset: One of EXPORT_DATASETS
+
+        Returns:
+            Column names
+
+        """
+        return [column.name for column in self._build_query(dataset, None, None).selected_columns]
+
+    def iter_batches(
+        self,
+        dataset: str,
+        user_id: int | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream dataset rows in batches from a server-side cursor.
+
+        Args:
+            dataset: One of EXPORT_DATASETS
+            user_id: Only this user's rows (None for all users)
+            since: Only rows finished/created at or after this time
+
+        Yields:
+            Lists of up to batch_size row dicts
+
+        Raises:
+            ValueError: If dataset is unknown
+
+        """
+        stmt = self._build_query(dataset, user_id, since)
+        result = self.session.execute(stmt.execution_options(yield_per=self.batch_size))
+        try:
+            for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+        finally:
+            result.close()
+
+    def stream(
+        self,
+        dataset: str,
+        export_format: str = "ndjson",
+        user_id: int | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream dataset encoded as NDJSON or CSV, one chunk per batch.
+
+        Args:
+            dataset: One of EXPORT_DATASETS
+            export_format: "ndjson" or "csv"
+            user_id: Only this user's rows (None for all users)
+            since: Only rows finished/created at or after this time
+
+        Yields:
+            UTF-8 encoded chunks (CSV: header first)
+
+        Raises:
+            ValueError: If dataset or format is unknown
+
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format} (expected one of {', '.join(EXPORT_FORMATS)})")
+        # 쿼리/포맷 오류는 스트리밍 시작 전에 드러나도록 검증 후 generator 반환
+        columns = self.columns(dataset)
+        batches = self.iter_batches(dataset, user_id, since)
+        if export_format == "ndjson":
+            return (b"".join(format_ndjson_line(row) for row in batch) for batch in batches)
+        return _iter_csv(columns, batches)
+
+
+def _csv_value(value: Any) -> Any:  # noqa: ANN401
+    """Flatten value for a CSV cell (JSON columns as JSON text, datetimes as ISO 8601)."""
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _iter_csv(columns: list[str], batches: Iterator[list[dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows([_csv_value(row[column]) for column in columns] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only (no rows)
+        yield buffer.getvalue().encode()
@@ -4,10 +4,12 @@ History service for managing test attempt history and retry functionality.
 REQ: REQ-B-B5-1, REQ-B-B5-2, REQ-B-B5-3, REQ-B-B5-4, REQ-B-B5-5
 """
 
+import base64
+import binascii
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, and_, func, or_
 from sqlalchemy.orm import Session
 
 from src.backend.models import (
@@ -37,6 +39,51 @@ class ImprovementResult:
     metrics_available: bool  # False if first attempt
 
 
+@dataclass
+class AttemptPage:
+    """One keyset page of a user's attempts."""
+
+    attempts: list[Attempt]
+    next_cursor: str | None  # None on the last page
+    total_count: int | None  # None unless requested (include_total=True)
+
+
+def encode_attempt_cursor(attempt: Attempt) -> str:
+    """
+    Encode opaque keyset cursor for the position after attempt.
+
+    Args:
+        attempt: Last attempt of the current page
+
+    Returns:
+        URL-safe cursor string
+
+    """
+    finished_at = attempt.finished_at.isoformat() if attempt.finished_at else ""
+    return base64.urlsafe_b64encode(f"{finished_at}|{attempt.id}".encode()).decode()
+
+
+def decode_attempt_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode keyset cursor into (finished_at, attempt_id).
+
+    Args:
+        cursor: Cursor returned as AttemptPage.next_cursor
+
+    Returns:
+        Tuple of (finished_at, attempt_id)
+
+    Raises:
+        ValueError: If cursor is malformed
+
+    """
+    try:
+        finished_at, attempt_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(finished_at), attempt_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 class HistoryService:
     """
     Service for managing test attempt history and retry functionality.
@@ -299,6 +346,13 @@ class HistoryService:
         )
         return latest_survey
 
+    def _completed_attempts_filter(self, user_id: int) -> ColumnElement[bool]:
+        """Filter for user's completed attempts (leading columns of idx_attempt_user_finished)."""
+        return and_(
+            Attempt.user_id == user_id,
+            Attempt.status == "completed",
+        )
+
     def list_user_attempts(
         self,
         user_id: int,
@@ -310,6 +364,10 @@ class HistoryService:
 
         REQ: REQ-B-B5-3
 
+        Performance: total count comes from a window count (COUNT(*) OVER ()) on the
+        page query, so a page is one round trip. Prefer list_user_attempts_page
+        (keyset) for deep pages; OFFSET still scans the skipped rows.
+
         Args:
             user_id: User ID
             limit: Number of records per page
@@ -319,32 +377,95 @@ class HistoryService:
             Tuple of (attempts list, total count)
 
         """
+        rows = (
+            self.session.query(Attempt, func.count().over().label("total_count"))
+            .filter(self._completed_attempts_filter(user_id))
+            .order_by(Attempt.finished_at.desc(), Attempt.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+        if rows:
+            return [attempt for attempt, _ in rows], rows[0].total_count
+
+        # 빈 페이지: offset이 전체 개수를 넘은 경우에만 개수를 따로 조회
         total_count: int = (
-            self.session.query(Attempt)
-            .filter(
-                and_(
-                    Attempt.user_id == user_id,
-                    Attempt.status == "completed",
-                )
-            )
-            .count()
+            self.session.query(Attempt).filter(self._completed_attempts_filter(user_id)).count() if offset else 0
         )
+        return [], total_count
 
-        attempts: list[Attempt] = (
-            self.session.query(Attempt)
-            .filter(
-                and_(
-                    Attempt.user_id == user_id,
-                    Attempt.status == "completed",
+    def list_user_attempts_page(
+        self,
+        user_id: int,
+        limit: int = 10,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> AttemptPage:
+        """
+        Get one keyset (cursor) page of user's completed attempts, newest first.
+
+        REQ: REQ-B-B5-3
+
+        Performance: seeks on idx_attempt_user_finished (user_id, finished_at) with
+        (finished_at, id) < cursor instead of OFFSET, so every page costs the same.
+        id breaks finished_at ties. One round trip per page, including the optional
+        total count (window count on the first page, scalar subquery after).
+
+        Args:
+            user_id: User ID
+            limit: Number of records per page
+            cursor: next_cursor of the previous page (None for the first page)
+            include_total: Also return the total number of completed attempts
+
+        Returns:
+            AttemptPage with attempts, next_cursor and optional total_count
+
+        Raises:
+            ValueError: If cursor is malformed
+
+        """
+        conditions = [self._completed_attempts_filter(user_id)]
+        total_column = None
+        if cursor is not None:
+            finished_at, attempt_id = decode_attempt_cursor(cursor)
+            conditions.append(
+                or_(
+                    Attempt.finished_at < finished_at,
+                    and_(Attempt.finished_at == finished_at, Attempt.id < attempt_id),
                 )
             )
-            .order_by(Attempt.finished_at.desc())
-            .limit(limit)
-            .offset(offset)
+            if include_total:
+                total_column = (
+                    self.session.query(func.count(Attempt.id))
+                    .filter(self._completed_attempts_filter(user_id))
+                    .scalar_subquery()
+                )
+        elif include_total:
+            total_column = func.count().over()
+
+        columns = [Attempt] if total_column is None else [Attempt, total_column.label("total_count")]
+        rows = (
+            self.session.query(*columns)
+            .filter(*conditions)
+            .order_by(Attempt.finished_at.desc(), Attempt.id.desc())
+            .limit(limit + 1)  # one extra row tells whether a next page exists
             .all()
         )
 
-        return attempts, total_count
+        attempts: list[Attempt] = [row if total_column is None else row[0] for row in rows[:limit]]
+        next_cursor = encode_attempt_cursor(attempts[-1]) if len(rows) > limit else None
+
+        total_count: int | None = None
+        if include_total:
+            if rows:
+                total_count = rows[0].total_count
+            elif cursor is None:
+                total_count = 0
+            else:
+                total_count = self.session.query(Attempt).filter(self._completed_attempts_filter(user_id)).count()
+
+        return AttemptPage(attempts=attempts, next_cursor=next_cursor, total_count=total_count)
 
     def get_attempt_details(self, attempt_id: str) -> dict:
         """
@@ -352,23 +473,30 @@ class HistoryService:
 
         REQ: REQ-B-B5-1
 
+        Performance: attempt and its rounds are loaded in one LEFT OUTER JOIN query.
+
         Args:
             attempt_id: Attempt ID
 
         Returns:
             Dictionary with attempt data, rounds, and answers
 
-        """
-        attempt: Attempt | None = self.session.query(Attempt).filter(Attempt.id == attempt_id).first()
-        if not attempt:
-            raise ValueError(f"Attempt with id {attempt_id} not found")
+        Raises:
+            ValueError: If attempt not found
 
-        rounds: list[AttemptRound] = (
-            self.session.query(AttemptRound)
-            .filter(AttemptRound.attempt_id == attempt_id)
+        """
+        rows: list[tuple[Attempt, AttemptRound | None]] = (
+            self.session.query(Attempt, AttemptRound)
+            .outerjoin(AttemptRound, AttemptRound.attempt_id == Attempt.id)
+            .filter(Attempt.id == attempt_id)
             .order_by(AttemptRound.round_idx)
             .all()
         )
+        if not rows:
+            raise ValueError(f"Attempt with id {attempt_id} not found")
+
+        attempt: Attempt = rows[0][0]
+        rounds: list[AttemptRound] = [r for _, r in rows if r is not None]
 
         return {
             "attempt_id": attempt.id,
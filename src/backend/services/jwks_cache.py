@@ -0,0 +1,251 @@
+"""
+JWKS (JSON Web Key Set) cache for Azure AD ID token validation.
+
+REQ: REQ-B-A1-3
+
+Design:
+    - JWKSCache: process-wide signing keys indexed by kid (thread-safe)
+    - First use loads the key set synchronously; afterwards validation is pure CPU
+    - Stale set (older than TTL) → keys keep being served while one background
+      thread refreshes them; refresh failures keep the last good key set
+    - Unknown kid (key rotation) → synchronous refetch, at most once per
+      OIDC_JWKS_MIN_REFETCH_SECONDS so forged kids cannot hammer the IdP
+    - OIDC_JWKS_FILE → keys are read from a local JWKS file instead of the
+      network (offline development and tests)
+
+Environment Variables:
+    OIDC_JWKS_CACHE_TTL_SECONDS: Age after which keys are refreshed in the background (default: 3600)
+    OIDC_JWKS_MIN_REFETCH_SECONDS: Minimum interval between unknown-kid refetches (default: 60)
+    OIDC_JWKS_FILE: Path of a local JWKS file used instead of OIDC_JWKS_ENDPOINT (default: unset)
+"""
+
+import json
+import logging
+import threading
+import time
+from os import getenv
+from pathlib import Path
+from typing import Any
+
+import httpx
+import jwt
+
+from src.backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MIN_REFETCH_SECONDS = 60
+FETCH_TIMEOUT_SECONDS = 10.0
+
+
+class JWKSCache:
+    """
+    Thread-safe cache of JWKS signing keys keyed by kid.
+
+    Keys are loaded from jwks_file when set, otherwise from settings.OIDC_JWKS_ENDPOINT
+    (read at fetch time so tests and config reloads take effect).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        min_refetch_seconds: float = DEFAULT_MIN_REFETCH_SECONDS,
+        jwks_file: str = "",
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Age after which keys are refreshed in the background
+            min_refetch_seconds: Minimum interval between fetches triggered by unknown kids
+            jwks_file: Local JWKS file path (empty → fetch from OIDC_JWKS_ENDPOINT)
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.min_refetch_seconds = min_refetch_seconds
+        self.jwks_file = jwks_file
+        self._jwks: dict[str, Any] | None = None
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.fetch_errors = 0
+
+    def _load(self) -> dict[str, Any]:
+        """
+        Read JWKS from the local file or the configured endpoint.
+
+        Returns:
+            JWKS dictionary
+
+        Raises:
+            ValueError: If the key set cannot be loaded
+
+        """
+        if self.jwks_file:
+            try:
+                return json.loads(Path(self.jwks_file).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                raise ValueError(f"Failed to read JWKS file {self.jwks_file}: {str(e)}") from e
+
+        if not settings.OIDC_JWKS_ENDPOINT:
+            raise ValueError("OIDC_JWKS_ENDPOINT not configured")
+
+        try:
+            response = httpx.get(settings.OIDC_JWKS_ENDPOINT, timeout=FETCH_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            raise ValueError(f"Failed to fetch JWKS: {str(e)}") from e
+
+    def refresh(self) -> dict[str, Any]:
+        """
+        Fetch the key set and replace cached keys.
+
+        Concurrent callers share one fetch: a caller that waited for another
+        thread's fetch returns its result instead of fetching again.
+
+        Returns:
+            JWKS dictionary
+
+        Raises:
+            ValueError: If the key set cannot be loaded
+
+        """
+        started = time.monotonic()
+        with self._fetch_lock:
+            with self._lock:
+                if self._jwks is not None and self._fetched_at >= started:
+                    return self._jwks
+            try:
+                jwks = self._load()
+            except ValueError:
+                with self._lock:
+                    self.fetch_errors += 1
+                raise
+
+            keys: dict[str, jwt.PyJWK] = {}
+            for data in jwks.get("keys", []):
+                kid = data.get("kid")
+                if not kid or data.get("use", "sig") != "sig":
+                    continue
+                try:
+                    keys[kid] = jwt.PyJWK(data)
+                except jwt.PyJWTError as e:
+                    # Unsupported key types are skipped, not fatal
+                    logger.debug(f"Skipping JWKS key kid={kid}: {e}")
+
+            with self._lock:
+                self._jwks = jwks
+                self._keys = keys
+                self._fetched_at = time.monotonic()
+                self.fetches += 1
+            logger.info(f"JWKS loaded: {len(keys)} signing keys")
+            return jwks
+
+    def _background_refresh(self) -> None:
+        """Refresh keys; on failure keep serving the last good key set."""
+        try:
+            self.refresh()
+        except ValueError as e:
+            logger.warning(f"Background JWKS refresh failed, keeping cached keys: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_loaded(self) -> None:
+        """Load keys on first use; schedule a background refresh when stale."""
+        with self._lock:
+            loaded = self._jwks is not None
+            stale = loaded and time.monotonic() - self._fetched_at >= self.ttl_seconds
+            start_refresh = stale and not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+
+        if not loaded:
+            self.refresh()
+        elif start_refresh:
+            threading.Thread(target=self._background_refresh, name="jwks-refresh", daemon=True).start()
+
+    def get_jwks(self) -> dict[str, Any]:
+        """
+        Return the cached JWKS dictionary (loaded on first use).
+
+        Raises:
+            ValueError: If the key set cannot be loaded
+
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return self._jwks or {"keys": []}
+
+    def get_signing_key(self, kid: str) -> jwt.PyJWK:
+        """
+        Return signing key for kid, refetching once if the kid is unknown.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            Signing key
+
+        Raises:
+            jwt.InvalidTokenError: If no key with this kid exists (after a permitted refetch)
+            ValueError: If the key set cannot be loaded
+
+        """
+        self._ensure_loaded()
+        with self._lock:
+            key = self._keys.get(kid)
+            if key is not None:
+                self.hits += 1
+                return key
+            self.misses += 1
+            may_refetch = time.monotonic() - self._fetched_at >= self.min_refetch_seconds
+
+        # Unknown kid: IdP probably rotated keys → refetch (rate limited)
+        if may_refetch:
+            logger.info(f"Unknown JWKS kid={kid}, refetching key set")
+            self.refresh()
+            with self._lock:
+                key = self._keys.get(kid)
+            if key is not None:
+                return key
+
+        raise jwt.InvalidTokenError(f"Unknown signing key: kid={kid}")
+
+    def clear(self) -> None:
+        """Drop cached keys and reset statistics."""
+        with self._lock:
+            self._jwks = None
+            self._keys = {}
+            self._fetched_at = 0.0
+            self.hits = 0
+            self.misses = 0
+            self.fetches = 0
+            self.fetch_errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics (size, hits, misses, fetches, fetch_errors, age_seconds)."""
+        with self._lock:
+            return {
+                "size": len(self._keys),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fetches": self.fetches,
+                "fetch_errors": self.fetch_errors,
+                "age_seconds": time.monotonic() - self._fetched_at if self._jwks is not None else None,
+            }
+
+
+# Process-wide cache instance (singleton pattern)
+jwks_cache = JWKSCache(
+    ttl_seconds=float(getenv("OIDC_JWKS_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+    min_refetch_seconds=float(getenv("OIDC_JWKS_MIN_REFETCH_SECONDS", str(DEFAULT_MIN_REFETCH_SECONDS))),
+    jwks_file=getenv("OIDC_JWKS_FILE", ""),
+)
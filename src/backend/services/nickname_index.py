@@ -0,0 +1,223 @@
+"""
+In-process nickname availability index.
+
+REQ: REQ-B-A2-1, REQ-B-A2-3
+
+Design:
+    - BloomFilter: fast "definitely not taken" answers; no false negatives
+    - Set of taken nicknames: exact membership for Bloom positives and for the
+      base_N suggestion candidates (ProfileService.generate_nickname_alternatives)
+    - NicknameIndex: loaded from users.nickname in one query (startup or first
+      use), reloaded after NICKNAME_INDEX_REFRESH_SECONDS so writes made by other
+      processes are picked up
+
+Consistency:
+    ProfileService.register_nickname / edit_nickname call add()/discard() after the
+    change is committed. The index only answers availability checks; writes still
+    rely on the users.nickname UNIQUE constraint (IntegrityError → "already taken"),
+    so a stale index can never produce a duplicate nickname.
+
+Environment Variables:
+    NICKNAME_INDEX_ENABLED: Answer nickname checks from the in-process index (default: false)
+    NICKNAME_INDEX_REFRESH_SECONDS: Reload interval in seconds (default: 300)
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterable
+from os import getenv
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.user import User
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SECONDS = 300
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> None:
+        """
+        Initialize empty filter sized for capacity items.
+
+        Args:
+            capacity: Expected number of items
+            false_positive_rate: Target false positive rate at capacity
+
+        """
+        self.capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-self.capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        """Add item to the filter."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Return False if item was definitely never added."""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class NicknameIndex:
+    """
+    Thread-safe in-memory set of taken nicknames with a Bloom filter front.
+
+    contains() returns None while the index is not loaded (callers fall back to the DB).
+    """
+
+    def __init__(self, refresh_seconds: float = DEFAULT_REFRESH_SECONDS) -> None:
+        """
+        Initialize empty (unloaded) index.
+
+        Args:
+            refresh_seconds: Reload from DB when the snapshot is older than this
+
+        """
+        self.refresh_seconds = refresh_seconds
+        self._names: set[str] = set()
+        self._bloom = BloomFilter(MIN_CAPACITY)
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+        self.bloom_negatives = 0
+        self.lookups = 0
+
+    def load(self, session: Session) -> None:
+        """
+        Replace the index with all nicknames currently in the users table.
+
+        Args:
+            session: Database session
+
+        """
+        names = {name for (name,) in session.query(User.nickname).filter(User.nickname.isnot(None))}
+        with self._lock:
+            self._rebuild(names)
+            self._loaded_at = time.monotonic()
+        logger.info(f"Nickname index loaded: {len(names)} nicknames")
+
+    def ensure_loaded(self, session: Session) -> None:
+        """Load on first use and reload when older than refresh_seconds."""
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self.refresh_seconds:
+            self.load(session)
+
+    def _rebuild(self, names: set[str]) -> None:
+        """Rebuild set and Bloom filter (caller holds lock)."""
+        self._names = names
+        self._bloom = BloomFilter(max(MIN_CAPACITY, len(names) * 2))
+        for name in names:
+            self._bloom.add(name)
+
+    def _contains_locked(self, nickname: str) -> bool:
+        if nickname not in self._bloom:
+            self.bloom_negatives += 1
+            return False
+        return nickname in self._names
+
+    def contains(self, nickname: str) -> bool | None:
+        """
+        Check whether nickname is taken.
+
+        Args:
+            nickname: Nickname to check
+
+        Returns:
+            True if taken, False if free, None if the index is not loaded
+
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return None
+            self.lookups += 1
+            return self._contains_locked(nickname)
+
+    def taken_among(self, candidates: Iterable[str]) -> set[str] | None:
+        """
+        Return candidates that are taken (None if the index is not loaded).
+
+        Args:
+            candidates: Nicknames to check
+
+        Returns:
+            Set of taken candidates, or None
+
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return None
+            return {candidate for candidate in candidates if self._contains_locked(candidate)}
+
+    def add(self, nickname: str) -> None:
+        """Record a committed nickname (no-op while unloaded)."""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            if nickname in self._names:
+                return
+            self._names.add(nickname)
+            if self._bloom.count >= self._bloom.capacity:
+                self._rebuild(self._names)
+            else:
+                self._bloom.add(nickname)
+
+    def discard(self, nickname: str | None) -> None:
+        """
+        Record a released nickname (no-op while unloaded).
+
+        The Bloom filter keeps the bit pattern until the next rebuild; that only
+        turns a fast negative into an exact set lookup.
+        """
+        if nickname is None:
+            return
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._names.discard(nickname)
+
+    def clear(self) -> None:
+        """Drop the snapshot and reset statistics (index becomes unloaded)."""
+        with self._lock:
+            self._rebuild(set())
+            self._loaded_at = None
+            self.bloom_negatives = 0
+            self.lookups = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return index statistics (loaded, size, lookups, bloom_negatives)."""
+        with self._lock:
+            return {
+                "loaded": self._loaded_at is not None,
+                "size": len(self._names),
+                "lookups": self.lookups,
+                "bloom_negatives": self.bloom_negatives,
+            }
+
+
+def nickname_index_enabled() -> bool:
+    """Return True if NICKNAME_INDEX_ENABLED is set."""
+    return getenv("NICKNAME_INDEX_ENABLED", "false").lower() == "true"
+
+
+# Process-wide index instance (singleton pattern)
+nickname_index = NicknameIndex(
+    refresh_seconds=float(getenv("NICKNAME_INDEX_REFRESH_SECONDS", str(DEFAULT_REFRESH_SECONDS))),
+)
@@ -0,0 +1,106 @@
+"""
+Shared async HTTP client for Azure AD (OIDC) requests.
+
+REQ: REQ-B-A1-2
+
+Design:
+    - One httpx.AsyncClient per event loop (normally one per process) instead of a
+      new connection per login: pooled keep-alive connections to the IdP, so TLS
+      handshakes are paid once, not on every token exchange during login storms
+    - HTTP/2 when the optional h2 package is installed (httpx[http2]); falls back
+      to HTTP/1.1 keep-alive otherwise
+    - close_oidc_http_client() is called on application shutdown
+
+Environment Variables:
+    OIDC_HTTP_MAX_CONNECTIONS: Maximum pooled connections to the IdP (default: 20)
+    OIDC_HTTP_KEEPALIVE_SECONDS: Idle keep-alive expiry in seconds (default: 30)
+    OIDC_HTTP_TIMEOUT_SECONDS: Request timeout in seconds (default: 10)
+    OIDC_HTTP2: Use HTTP/2 if available, "false" to disable (default: true)
+"""
+
+import asyncio
+import importlib.util
+import logging
+from os import getenv
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+
+def _http2_enabled() -> bool:
+    """Return True if HTTP/2 is requested and the h2 package is installed."""
+    if getenv("OIDC_HTTP2", "true").lower() != "true":
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create pooled AsyncClient configured from environment."""
+    max_connections = int(getenv("OIDC_HTTP_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS)))
+    http2 = _http2_enabled()
+    client = httpx.AsyncClient(
+        http2=http2,
+        timeout=float(getenv("OIDC_HTTP_TIMEOUT_SECONDS", str(DEFAULT_TIMEOUT_SECONDS))),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=float(getenv("OIDC_HTTP_KEEPALIVE_SECONDS", str(DEFAULT_KEEPALIVE_SECONDS))),
+        ),
+    )
+    logger.info(f"OIDC HTTP client: max_connections={max_connections}, http2={http2}")
+    return client
+
+
+class LoopBoundClient:
+    """Holds the shared AsyncClient and the event loop it was created on."""
+
+    def __init__(self) -> None:
+        """Initialize empty holder (client is created on first get())."""
+        self.client: httpx.AsyncClient | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Return client for the running loop, replacing one from another loop or a closed one."""
+        loop = asyncio.get_running_loop()
+        if self.client is None or self.client.is_closed or self.loop is not loop:
+            self.client = _create_client()
+            self.loop = loop
+        return self.client
+
+    async def aclose(self) -> None:
+        """Close client if it belongs to the running loop and forget it."""
+        client, loop = self.client, self.loop
+        self.client, self.loop = None, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+
+
+# Process-wide holder (singleton pattern)
+oidc_http_client = LoopBoundClient()
+
+
+def get_oidc_http_client() -> httpx.AsyncClient:
+    """
+    Get shared AsyncClient for the running event loop.
+
+    Pooled connections belong to the loop that opened them, so a client created on
+    another loop (e.g. a previous TestClient) is replaced rather than reused.
+
+    Returns:
+        Shared httpx.AsyncClient
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+
+    """
+    return oidc_http_client.get()
+
+
+async def close_oidc_http_client() -> None:
+    """Close the shared client (application shutdown)."""
+    await oidc_http_client.aclose()
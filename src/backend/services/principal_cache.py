@@ -0,0 +1,175 @@
+"""
+Authenticated principal cache for request authentication.
+
+REQ: REQ-B-A1-5
+
+Design:
+    - Principal: immutable snapshot of the authenticated user (id, knox_id, nickname, consent)
+    - PrincipalCache: process-wide TTL cache keyed by sha256 of the bearer token
+      (thread-safe, LRU-bounded). An entry never outlives the token's exp claim.
+    - get_current_principal (utils/auth.py): cache hit → no JWT decode, no user query
+
+Invalidation:
+    ProfileService.register_nickname, edit_nickname and update_user_consent call
+    principal_cache.invalidate_user(user_id) after the change is committed.
+
+Environment Variables:
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: Entry lifetime in seconds; 0 disables the cache (default: 60)
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import getenv
+from typing import Any
+
+from src.backend.models.user import User
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Snapshot of an authenticated user (detached from the DB session)."""
+
+    id: int
+    knox_id: str
+    nickname: str | None = None
+    privacy_consent: bool = False
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """
+        Build Principal from User ORM row.
+
+        Args:
+            user: Authenticated User
+
+        Returns:
+            Principal snapshot
+
+        """
+        return cls(
+            id=user.id,
+            knox_id=user.knox_id,
+            nickname=user.nickname,
+            privacy_consent=bool(user.privacy_consent),
+        )
+
+
+def _token_key(token: str) -> str:
+    """Hash token so raw credentials are not kept in memory as dict keys."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    """
+    Thread-safe TTL cache of Principal keyed by bearer token.
+
+    Least recently used entries are evicted first once max_entries is reached.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds (0 disables caching)
+            max_entries: Maximum number of cached tokens
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Principal | None:
+        """
+        Get cached principal for token if present and not expired.
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            Principal or None
+
+        """
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: Principal, token_exp: float | None = None) -> None:
+        """
+        Store principal for token (replaces any existing entry).
+
+        Args:
+            token: Bearer token
+            principal: Authenticated principal
+            token_exp: Token exp claim (Unix time); the entry expires no later than this
+
+        """
+        if self.ttl_seconds <= 0:
+            return
+        lifetime = self.ttl_seconds
+        if token_exp is not None:
+            lifetime = min(lifetime, token_exp - time.time())
+            if lifetime <= 0:
+                return
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + lifetime, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop all cached tokens of a user (call after nickname/consent changes)."""
+        with self._lock:
+            keys = [key for key, (_, principal) in self._entries.items() if principal.id == user_id]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            logger.debug(f"Principal cache invalidated: user_id={user_id}, tokens={len(keys)}")
+
+    def clear(self) -> None:
+        """Drop all cached principals and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics (size, hits, misses, hit_rate)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# Process-wide cache instance (singleton pattern)
+principal_cache = PrincipalCache(
+    ttl_seconds=float(getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+)
@@ -4,16 +4,26 @@ Profile service for nickname management and profile editing.
 REQ: REQ-B-A2-1, REQ-B-A2-2, REQ-B-A2-3, REQ-B-A2-5, REQ-B-A2-Edit-1, REQ-B-A2-Edit-2, REQ-B-A2-Edit-3
 """
 
+import random
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.backend.models.user import User
 from src.backend.models.user_profile import UserProfileSurvey
+from src.backend.services.nickname_index import NicknameIndex, nickname_index, nickname_index_enabled
+from src.backend.services.principal_cache import principal_cache
+from src.backend.services.user_context_cache import user_context_cache
 from src.backend.validators.nickname import NicknameValidator
 
+SUGGESTION_COUNT = 3
+NUMERIC_SUFFIX_LIMIT = 100  # base_1 ... base_100
+RANDOM_SUFFIX_COUNT = 20  # base_<1000-9999> fallback when all numeric suffixes are taken
+
 
 class ProfileService:
     """
@@ -66,7 +76,12 @@ class ProfileService:
         if not is_valid:
             raise ValueError(error_msg)
 
-        # Check if nickname exists in database
+        # In-process index (NICKNAME_INDEX_ENABLED): negative answers need no query
+        index = self._nickname_index()
+        if index is not None and not index.contains(nickname):
+            return {"available": True, "suggestions": []}
+
+        # Check if nickname exists in database (authoritative for index positives)
         existing_user = self.session.query(User).filter_by(nickname=nickname).first()
 
         if existing_user:
@@ -83,31 +98,66 @@ class ProfileService:
 
         REQ: REQ-B-A2-3
 
-        Generates alternatives in format: base_nickname_1, base_nickname_2, base_nickname_3
-        Returns only available alternatives.
+        Candidates are tried in order (see _nickname_candidates):
+            1. base_nickname_1 ... base_nickname_100 (base truncated to fit 30 chars)
+            2. base_nickname_<random 4 digits> if all numeric suffixes are taken
+
+        Taken candidates are looked up with one indexed IN query per strategy,
+        so a popular nickname costs one round-trip instead of one per candidate.
+        With NICKNAME_INDEX_ENABLED they are looked up in the in-process index (no query).
 
         Args:
             base_nickname: Base nickname to generate alternatives from
 
         Returns:
-            List of 3 available nickname alternatives
+            List of up to 3 available nickname alternatives
 
         """
+        index = self._nickname_index()
         suggestions: list[str] = []
-        counter = 1
-
-        while len(suggestions) < 3 and counter <= 100:  # Safeguard against infinite loop
-            candidate = f"{base_nickname}_{counter}"
+        for suffixes in (
+            range(1, NUMERIC_SUFFIX_LIMIT + 1),
+            random.sample(range(1000, 10000), RANDOM_SUFFIX_COUNT),
+        ):
+            candidates = [
+                candidate
+                for candidate in self._nickname_candidates(base_nickname, suffixes)
+                if candidate not in suggestions
+            ]
+            if not candidates:
+                continue
+            taken = index.taken_among(candidates) if index is not None else None
+            if taken is None:
+                taken = {
+                    nickname
+                    for (nickname,) in self.session.query(User.nickname).filter(User.nickname.in_(candidates)).all()
+                }
+            suggestions.extend(candidate for candidate in candidates if candidate not in taken)
+            if len(suggestions) >= SUGGESTION_COUNT:
+                break
+
+        return suggestions[:SUGGESTION_COUNT]
+
+    @staticmethod
+    def _nickname_candidates(base_nickname: str, suffixes: Iterable[int]) -> list[str]:
+        """
+        Build valid "<base>_<n>" candidates, truncating base to the max length.
 
-            # Check if candidate is available
-            if len(candidate) <= 30:  # Max length constraint
-                existing = self.session.query(User).filter_by(nickname=candidate).first()
-                if not existing:
-                    suggestions.append(candidate)
+        Args:
+            base_nickname: Base nickname
+            suffixes: Numeric suffixes in preference order
 
-            counter += 1
+        Returns:
+            Unique candidates (excluding base_nickname itself) that pass NicknameValidator
 
-        return suggestions[:3]  # Return first 3 suggestions
+        """
+        candidates: list[str] = []
+        for suffix in suffixes:
+            tail = f"_{suffix}"
+            candidate = base_nickname[: NicknameValidator.MAX_LENGTH - len(tail)] + tail
+            if candidate != base_nickname and candidate not in candidates and NicknameValidator.validate(candidate)[0]:
+                candidates.append(candidate)
+        return candidates
 
     def register_nickname(self, user_id: int, nickname: str) -> dict[str, Any]:
         """
@@ -135,19 +185,23 @@ class ProfileService:
         if not is_valid:
             raise ValueError(error_msg)
 
-        # Check if nickname is available
-        existing = self.session.query(User).filter_by(nickname=nickname).first()
-        if existing:
-            raise ValueError(f"Nickname '{nickname}' is already taken.")
+        # Check if nickname is available (skipped on index negative; UNIQUE constraint is authoritative)
+        index = self._nickname_index()
+        if index is None or index.contains(nickname):
+            existing = self.session.query(User).filter_by(nickname=nickname).first()
+            if existing:
+                raise ValueError(f"Nickname '{nickname}' is already taken.")
 
         # Get user and update nickname
         user = self.session.query(User).filter_by(id=user_id).first()
         if not user:
             raise Exception(f"User with id {user_id} not found.")
 
+        old_nickname = user.nickname
         user.nickname = nickname
         user.updated_at = datetime.now(UTC)
-        self.session.commit()
+        self._commit_nickname(nickname, old_nickname)
+        principal_cache.invalidate_user(user.id)
 
         return {
             "user_id": user.id,
@@ -182,6 +236,11 @@ class ProfileService:
         if not is_valid:
             raise ValueError(error_msg)
 
+        # In-process index (NICKNAME_INDEX_ENABLED): negative answers need no query
+        index = self._nickname_index()
+        if index is not None and not index.contains(nickname):
+            return {"available": True, "suggestions": []}
+
         # Check if nickname exists in database (excluding current user)
         existing_user = self.session.query(User).filter(User.nickname == nickname, User.id != user_id).first()
 
@@ -219,19 +278,23 @@ class ProfileService:
         if not is_valid:
             raise ValueError(error_msg)
 
-        # Check if nickname is taken by others (exclude self)
-        existing = self.session.query(User).filter(User.nickname == nickname, User.id != user_id).first()
-        if existing:
-            raise ValueError(f"Nickname '{nickname}' is already taken.")
+        # Check if nickname is taken by others (skipped on index negative; UNIQUE constraint is authoritative)
+        index = self._nickname_index()
+        if index is None or index.contains(nickname):
+            existing = self.session.query(User).filter(User.nickname == nickname, User.id != user_id).first()
+            if existing:
+                raise ValueError(f"Nickname '{nickname}' is already taken.")
 
         # Get user and update nickname
         user = self.session.query(User).filter_by(id=user_id).first()
         if not user:
             raise Exception(f"User with id {user_id} not found.")
 
+        old_nickname = user.nickname
         user.nickname = nickname
         user.updated_at = datetime.now(UTC)
-        self.session.commit()
+        self._commit_nickname(nickname, old_nickname)
+        principal_cache.invalidate_user(user.id)
 
         return {
             "user_id": user.id,
@@ -239,6 +302,41 @@ class ProfileService:
             "updated_at": user.updated_at.isoformat(),
         }
 
+    def _nickname_index(self) -> NicknameIndex | None:
+        """
+        Return the loaded in-process nickname index, or None if disabled.
+
+        Returns:
+            NicknameIndex (loaded/refreshed with this session) or None
+
+        """
+        if not nickname_index_enabled():
+            return None
+        nickname_index.ensure_loaded(self.session)
+        return nickname_index
+
+    def _commit_nickname(self, nickname: str, old_nickname: str | None) -> None:
+        """
+        Commit nickname change and record it in the nickname index.
+
+        Args:
+            nickname: New nickname
+            old_nickname: Previous nickname (released)
+
+        Raises:
+            ValueError: If the UNIQUE constraint rejects the nickname (taken concurrently)
+
+        """
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ValueError(f"Nickname '{nickname}' is already taken.") from e
+
+        if old_nickname != nickname:
+            nickname_index.discard(old_nickname)
+        nickname_index.add(nickname)
+
     def update_survey(self, user_id: int, survey_data: dict[str, Any]) -> dict[str, Any]:
         """
         Create new user profile survey record.
@@ -292,6 +390,9 @@ class ProfileService:
         self.session.add(survey)
         self.session.commit()
 
+        # Latest survey changed: drop cached generation context (Tool 1)
+        user_context_cache.invalidate(user_id)
+
         return {
             "survey_id": survey.id,
             "user_id": survey.user_id,
@@ -458,6 +559,7 @@ class ProfileService:
             user.consent_at = None
 
         self.session.commit()
+        principal_cache.invalidate_user(user.id)
 
         return {
             "success": True,
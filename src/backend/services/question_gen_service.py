@@ -22,6 +22,7 @@ from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
 from src.backend.models.user_profile import UserProfileSurvey
 from src.backend.services.adaptive_difficulty_service import AdaptiveDifficultyService
+from src.backend.services.user_context_cache import UserContext, bind_user_context, user_context_cache
 
 logger = logging.getLogger(__name__)
 
@@ -457,6 +458,9 @@ class QuestionGenerationService:
 
             logger.debug(f"✓ Survey found: interests={survey.interests}")
 
+            # Preload user context so Tool 1 does not re-query the survey
+            user_context = self._load_user_context(user_id, survey, round_num)
+
             # Step 2: Create TestSession
             session_id = str(uuid4())
             test_session = TestSession(
@@ -498,6 +502,7 @@ class QuestionGenerationService:
                     agent_request = GenerateQuestionsRequest(
                         session_id=session_id,
                         survey_id=survey_id,
+                        user_id=str(user_id),
                         round_idx=round_num,
                         prev_answers=prev_answers,
                         question_count=question_count,
@@ -506,7 +511,8 @@ class QuestionGenerationService:
                     )
                     logger.debug(f"✓ GenerateQuestionsRequest created: session_id={session_id}, count={question_count}")
 
-                    agent_response = await agent.generate_questions(agent_request)
+                    with bind_user_context(user_context):
+                        agent_response = await agent.generate_questions(agent_request)
                     logger.debug(
                         f"Agent response received: {len(agent_response.items)} items, tokens={agent_response.total_tokens}"
                     )
@@ -613,6 +619,63 @@ class QuestionGenerationService:
                 "attempt": max_retries,
             }
 
+    def _load_user_context(
+        self,
+        user_id: int,
+        survey: UserProfileSurvey | None,
+        round_num: int,
+        prior_result: TestResult | None = None,
+    ) -> UserContext:
+        """
+        Get user context from cache or build it from already-loaded rows.
+
+        REQ: REQ-A-Mode1-Tool1 (Tool 1 memory lookup)
+
+        Cached context is reused only when it was built from the same survey and
+        the same previous round (the same TestResult when prior_result is given);
+        otherwise it is rebuilt and stored.
+
+        Args:
+            user_id: User ID
+            survey: Survey used for this generation (None to look it up via cache)
+            round_num: Target round number
+            prior_result: Previous round TestResult if already loaded
+
+        Returns:
+            UserContext for binding into the agent run
+
+        """
+        expected_prior_round = round_num - 1 if round_num > 1 else None
+        cached = user_context_cache.get(user_id)
+        if (
+            cached is not None
+            and (survey is None or cached.survey_id == survey.id)
+            and (cached.prior_round or {}).get("round") == expected_prior_round
+            and (prior_result is None or cached.prior_result_id == prior_result.id)
+        ):
+            return cached
+
+        if survey is None:
+            survey = (
+                self.session.query(UserProfileSurvey)
+                .filter_by(user_id=user_id)
+                .order_by(UserProfileSurvey.submitted_at.desc())
+                .first()
+            )
+
+        if prior_result is None and expected_prior_round is not None:
+            prior_result = (
+                self.session.query(TestResult)
+                .join(TestSession, TestSession.id == TestResult.session_id)
+                .filter(TestSession.user_id == user_id, TestResult.round == expected_prior_round)
+                .order_by(TestResult.created_at.desc())
+                .first()
+            )
+
+        context = UserContext.from_survey(user_id, survey, prior_result)
+        user_context_cache.put(context)
+        return context
+
     def _get_previous_answers(self, user_id: int, round_num: int) -> list[dict[str, Any]] | None:
         """
         Retrieve previous round answers for adaptive difficulty.
@@ -758,12 +821,17 @@ class QuestionGenerationService:
         prev_answers = self._get_previous_answers(user_id, prev_round)
         logger.debug(f"Previous answers for adaptive context: {len(prev_answers) if prev_answers else 0}")
 
+        # Preload user context (survey + previous round) for Tool 1
+        survey = self.session.query(UserProfileSurvey).filter_by(id=prev_session.survey_id).first()
+        user_context = self._load_user_context(user_id, survey, round_num, prior_result=prev_result)
+
         # Call Real Agent with adaptive parameters
         # Note: adjusted_difficulty is a float (e.g., 3.5), we pass it as-is
         agent = await create_agent()
         agent_request = GenerateQuestionsRequest(
             session_id=new_session_id,
             survey_id=prev_session.survey_id,
+            user_id=str(user_id),
             round_idx=round_num,
             prev_answers=prev_answers,
             question_count=question_count,
@@ -772,7 +840,8 @@ class QuestionGenerationService:
         )
         logger.debug(f"✓ Created adaptive GenerateQuestionsRequest for {domain}, count={question_count}")
 
-        agent_response = await agent.generate_questions(agent_request)
+        with bind_user_context(user_context):
+            agent_response = await agent.generate_questions(agent_request)
         logger.debug(f"Agent response: {len(agent_response.items) if agent_response.items else 0} items")
 
         # Save generated items to DB
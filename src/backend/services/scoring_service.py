@@ -13,6 +13,8 @@ from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.question import Question
 from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
+from src.backend.services.explanation_pregen import schedule_explanation_pregeneration
+from src.backend.services.user_context_cache import user_context_cache
 
 
 class ScoringService:
@@ -509,6 +511,9 @@ class ScoringService:
         """
         Calculate and persist round result to database.
 
+        Also schedules background explanation pre-generation for the session
+        (EXPLANATION_PREGEN_ENABLED, see explanation_pregen.py).
+
         Args:
             session_id: TestSession ID
             round_num: Round number
@@ -531,4 +536,12 @@ class ScoringService:
 
         self.session.add(result)
         self.session.commit()
+
+        # Prior round changed: drop cached generation context (Tool 1)
+        test_session = self.session.query(TestSession).filter_by(id=session_id).first()
+        if test_session is not None:
+            user_context_cache.invalidate(test_session.user_id)
+
+        # Results page reads explanations right after scoring: generate them off the request path
+        schedule_explanation_pregeneration(session_id, self.session)
         return result
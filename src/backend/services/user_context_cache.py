@@ -0,0 +1,223 @@
+"""
+User context cache shared by Tool 1 and backend services.
+
+REQ: REQ-A-Mode1-Tool1, REQ-B-B2-Gen-1
+
+Design:
+    - UserContext: immutable snapshot of latest survey, self-level, interests and
+      prior round summary for one user
+    - UserContextCache: process-wide TTL cache keyed by user id (thread-safe)
+    - Run-scoped binding (ContextVar): QuestionGenerationService binds the context it
+      has already loaded before invoking the agent, so Tool 1 becomes a memory lookup
+
+Invalidation:
+    ProfileService.update_survey (and therefore SurveyService.submit_survey) calls
+    user_context_cache.invalidate(user_id) after a new survey is committed;
+    ScoringService.save_round_result does the same after a new round result.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.backend.models.test_result import TestResult
+from src.backend.models.user_profile import UserProfileSurvey
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300  # 5 minutes
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class UserContext:
+    """Snapshot of a user's generation context (latest survey + prior round)."""
+
+    user_id: str
+    survey_id: str | None = None
+    self_level: str | None = None
+    years_experience: int | None = None
+    job_role: str | None = None
+    duty: str | None = None
+    interests: list[str] = field(default_factory=list)
+    prior_round: dict[str, Any] | None = None
+    prior_result_id: str | None = None
+
+    @classmethod
+    def from_survey(
+        cls,
+        user_id: int | str,
+        survey: UserProfileSurvey | None,
+        prior_result: TestResult | None = None,
+    ) -> "UserContext":
+        """
+        Build UserContext from ORM rows.
+
+        Args:
+            user_id: User ID
+            survey: Latest UserProfileSurvey or None
+            prior_result: Latest TestResult of the previous round or None
+
+        Returns:
+            UserContext snapshot (detached from the DB session)
+
+        """
+        prior_round = None
+        prior_result_id = None
+        if prior_result is not None:
+            prior_result_id = prior_result.id
+            prior_round = {
+                "round": prior_result.round,
+                "score": prior_result.score,
+                "correct_count": prior_result.correct_count,
+                "total_count": prior_result.total_count,
+                "wrong_categories": dict(prior_result.wrong_categories or {}),
+            }
+
+        if survey is None:
+            return cls(user_id=str(user_id), prior_round=prior_round, prior_result_id=prior_result_id)
+
+        return cls(
+            user_id=str(user_id),
+            survey_id=survey.id,
+            self_level=survey.self_level,
+            years_experience=survey.years_experience,
+            job_role=survey.job_role,
+            duty=survey.duty,
+            interests=list(survey.interests or []),
+            prior_round=prior_round,
+            prior_result_id=prior_result_id,
+        )
+
+    def matches(self, key: str) -> bool:
+        """Return True if key identifies this context (user id or survey id)."""
+        return key in (self.user_id, self.survey_id)
+
+
+class UserContextCache:
+    """
+    Thread-safe TTL cache of UserContext keyed by user id.
+
+    Oldest entries are evicted first once max_entries is reached.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of cached users
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, UserContext]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int | str) -> UserContext | None:
+        """
+        Get cached context for user if present and not expired.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            UserContext or None
+
+        """
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, context = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return context
+
+    def put(self, context: UserContext) -> None:
+        """Store context (replaces any existing entry for the user)."""
+        with self._lock:
+            self._entries[context.user_id] = (time.monotonic(), context)
+            self._entries.move_to_end(context.user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int | str) -> None:
+        """Drop cached context for user (call after survey changes)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                logger.debug(f"User context invalidated: user_id={user_id}")
+
+    def clear(self) -> None:
+        """Drop all cached contexts and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics (size, hits, misses, hit_rate)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# Process-wide cache instance (singleton pattern)
+user_context_cache = UserContextCache()
+
+# Context preloaded for the current agent run (propagates into tool threads)
+_run_context: ContextVar[UserContext | None] = ContextVar("user_run_context", default=None)
+
+
+@contextmanager
+def bind_user_context(context: UserContext) -> Iterator[UserContext]:
+    """
+    Bind preloaded context to the current agent run.
+
+    Example:
+        >>> with bind_user_context(ctx):
+        ...     response = await agent.generate_questions(request)
+
+    """
+    token = _run_context.set(context)
+    try:
+        yield context
+    finally:
+        _run_context.reset(token)
+
+
+def lookup_user_context(key: str) -> UserContext | None:
+    """
+    Resolve context from the current run binding, then the shared cache.
+
+    Args:
+        key: User ID (or survey ID, which the agent sometimes passes instead)
+
+    Returns:
+        UserContext or None if not preloaded
+
+    """
+    bound = _run_context.get()
+    if bound is not None and bound.matches(key):
+        return bound
+    return user_context_cache.get(key)
@@ -7,19 +7,17 @@ from sqlalchemy.orm import Session
 from src.backend.database import get_db
 from src.backend.models.user import User
 from src.backend.services.auth_service import AuthService
+from src.backend.services.principal_cache import Principal, principal_cache
 
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
-    db: Session = Depends(get_db),  # noqa: B008
-) -> User:
+def _authenticate(token: str, db: Session) -> User:
     """
-    Extract and validate JWT token, return current User object.
+    Decode JWT, load its user and cache the principal for the token.
 
     Args:
-        credentials: HTTP Bearer token from Authorization header
+        token: Bearer token
         db: Database session
 
     Returns:
@@ -30,9 +28,7 @@ def get_current_user(
 
     """
     try:
-        token = credentials.credentials
-        auth_service = AuthService(db)
-        payload = auth_service.decode_jwt(token)
+        payload = AuthService(db).decode_jwt(token)
         knox_id = payload.get("knox_id")
         if not knox_id:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -41,25 +37,90 @@ def get_current_user(
         user = db.query(User).filter_by(knox_id=knox_id).first()
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
-
-        return user
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
+    principal_cache.put(token, Principal.from_user(user), token_exp=payload.get("exp"))
+    return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> User:
+    """
+    Extract and validate JWT token, return current User object.
+
+    Use for routes that read or modify User columns beyond Principal; routes that
+    only need the user id should depend on get_current_principal (no DB work).
+
+    Args:
+        credentials: HTTP Bearer token from Authorization header
+        db: Database session
+
+    Returns:
+        User object of authenticated user
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+
+    """
+    token = credentials.credentials
+    principal = principal_cache.get(token)
+    if principal is None:
+        return _authenticate(token, db)
+
+    # Cached token: skip JWT decode, load by primary key (identity map)
+    user = db.get(User, principal.id)
+    if not user:
+        principal_cache.invalidate_user(principal.id)
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> Principal:
+    """
+    Extract and validate JWT token, return cached principal of the current user.
+
+    REQ: REQ-B-A1-5
+
+    Tokens seen within AUTH_PRINCIPAL_CACHE_TTL_SECONDS are served from
+    principal_cache without decoding the JWT or querying the users table.
+
+    Args:
+        credentials: HTTP Bearer token from Authorization header
+        db: Database session (used only on cache miss)
+
+    Returns:
+        Principal of authenticated user
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+
+    """
+    token = credentials.credentials
+    principal = principal_cache.get(token)
+    if principal is None:
+        principal = Principal.from_user(_authenticate(token, db))
+    return principal
+
 
 def get_current_user_id(
-    user: User = Depends(get_current_user),  # noqa: B008
+    principal: Principal = Depends(get_current_principal),  # noqa: B008
 ) -> int:
     """
     Get current user's database ID.
 
     Args:
-        user: Current user from JWT token
+        principal: Current user from JWT token
 
     Returns:
         User's database ID (integer)
 
     """
-    return user.id
+    return principal.id
@@ -0,0 +1,106 @@
+"""
+Fast JSON response class for API payloads.
+
+REQ: REQ-B-B3-Explain-2
+
+개요:
+    FastAPI 기본 JSONResponse는 stdlib json.dumps로 직렬화합니다.
+    FastJSONResponse는 orjson(프로젝트 의존성)으로 직렬화하며 (import 실패 시 stdlib로 fallback),
+    main.py에서 app 전체의 default_response_class로 사용합니다.
+
+    Endpoint가 response_model 인스턴스를 반환하면 FastAPI의 response 검증은
+    재검증 없이 통과하고 (Pydantic revalidate_instances="never"),
+    dict 변환 후 orjson 직렬화만 수행됩니다.
+
+    format_sse_event()는 같은 직렬화로 Server-Sent Events 메시지를 만듭니다.
+    (StreamingResponse(media_type="text/event-stream")용)
+
+    format_ndjson_line()은 같은 직렬화로 NDJSON 한 줄을 만듭니다.
+    (StreamingResponse(media_type="application/x-ndjson")용, 대량 export)
+
+사용 예:
+    @router.get("/...", response_model=SessionQuestionsResponse)
+    def handler(...) -> SessionQuestionsResponse:
+        return SessionQuestionsResponse(...)
+
+    yield format_sse_event("delta", {"text": "..."})
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - declared dependency; stdlib fallback for stripped installs
+    orjson = None
+
+
+def _default(value: Any) -> Any:  # noqa: ANN401
+    """Serialize types orjson does not handle natively (Pydantic models returned without response_model)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Output matches JSONResponse (UTF-8, compact separators), except that NaN/Infinity
+    become null instead of raising.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: Response content (already jsonable when a response_model is set)
+
+        Returns:
+            UTF-8 encoded JSON
+
+        """
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _dumps(data: Any) -> bytes:  # noqa: ANN401
+    """Serialize data like FastJSONResponse (stdlib fallback when orjson is missing)."""
+    if orjson is None:
+        return json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")).encode()
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def format_sse_event(event: str, data: Any) -> bytes:  # noqa: ANN401
+    """
+    Format one Server-Sent Events message with a JSON data line.
+
+    Args:
+        event: Event name
+        data: Event payload (serialized like FastJSONResponse)
+
+    Returns:
+        UTF-8 encoded SSE message (event line, data line, blank line)
+
+    """
+    return b"event: " + event.encode() + b"\ndata: " + _dumps(data) + b"\n\n"
+
+
+def format_ndjson_line(data: Any) -> bytes:  # noqa: ANN401
+    """
+    Format one NDJSON (newline-delimited JSON) line.
+
+    Args:
+        data: Line payload (serialized like FastJSONResponse)
+
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+
+    """
+    return _dumps(data) + b"\n"
@@ -0,0 +1,193 @@
+"""
+Compiled multi-pattern content filter engine.
+
+REQ: REQ-B-B6-2, REQ-B-A2-4
+
+Design:
+    - AhoCorasick: one automaton for every word list (all categories), so a text
+      is scanned once regardless of how many words are configured
+    - ContentFilter: word lists + one combined precompiled regex per category,
+      built once (module import of the validators)
+    - scan_many: validates many texts in one pass; texts are joined with a NUL
+      separator and matches are mapped back to their text by offset
+
+Word lists:
+    Matching runs on NFC-normalized, lowercased text. Words made of ASCII letters
+    and digits honour word boundaries (like the regex word boundary); other words (e.g. Korean,
+    where particles attach to the word: "병신아") match as substrings.
+"""
+
+import bisect
+import re
+import unicodedata
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+TEXT_SEPARATOR = "\x00"  # Never part of question text; \s, \w and the filter patterns don't match it
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for matching (NFC + lowercase)."""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+@dataclass(frozen=True)
+class WordRule:
+    """Word list entry: category it belongs to and whether word boundaries apply."""
+
+    category: str
+    word_boundary: bool
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a fixed set of words (each word carries a payload)."""
+
+    def __init__(self, words: Iterable[tuple[str, WordRule]]) -> None:
+        """
+        Build automaton.
+
+        Args:
+            words: (word, payload) pairs; words are matched as given (normalize beforehand)
+
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[str, WordRule]]] = [[]]
+
+        for word, payload in words:
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((word, payload))
+
+        # Breadth-first failure links; outputs of the fallback state are inherited
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, str, WordRule]]:
+        """
+        Yield every (start, word, payload) occurrence in text, overlapping included.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            Start offset, matched word and its payload
+
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for word, payload in output[state]:
+                yield end - len(word), word, payload
+
+
+class ContentFilter:
+    """
+    Word lists and regex patterns per category, compiled once.
+
+    scan()/scan_many() return the set of categories that matched each text.
+    """
+
+    def __init__(
+        self,
+        word_lists: Mapping[str, Iterable[str]] | None = None,
+        patterns: Mapping[str, Iterable[str]] | None = None,
+        word_boundary_categories: Iterable[str] = (),
+    ) -> None:
+        """
+        Compile filter.
+
+        Args:
+            word_lists: Category → words (matched on normalized text)
+            patterns: Category → regex patterns (combined into one regex, IGNORECASE)
+            word_boundary_categories: Categories whose ASCII words require word boundaries
+
+        """
+        boundary = set(word_boundary_categories)
+        entries = []
+        for category, words in (word_lists or {}).items():
+            for word in words:
+                normalized = normalize_text(word)
+                word_boundary = category in boundary and normalized.isascii() and normalized.isalnum()
+                entries.append((normalized, WordRule(category, word_boundary)))
+        self._automaton = AhoCorasick(entries)
+        self._patterns = {
+            category: re.compile("|".join(f"(?:{pattern})" for pattern in category_patterns), re.IGNORECASE)
+            for category, category_patterns in (patterns or {}).items()
+        }
+
+    def scan(self, text: str) -> set[str]:
+        """
+        Return categories matched in one text.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            Matched category names
+
+        """
+        return self.scan_many([text])[0]
+
+    def scan_many(self, texts: list[str]) -> list[set[str]]:
+        """
+        Return categories matched in each text, scanning all texts in one pass.
+
+        Args:
+            texts: Texts to check
+
+        Returns:
+            Matched category names per text (same order as texts)
+
+        """
+        parts = [normalize_text(text).replace(TEXT_SEPARATOR, " ") for text in texts]
+        starts: list[int] = []
+        offset = 0
+        for part in parts:
+            starts.append(offset)
+            offset += len(part) + len(TEXT_SEPARATOR)
+        joined = TEXT_SEPARATOR.join(parts)
+        results: list[set[str]] = [set() for _ in texts]
+
+        def text_index(position: int) -> int:
+            return bisect.bisect_right(starts, position) - 1
+
+        for start, word, rule in self._automaton.finditer(joined):
+            end = start + len(word)
+            if rule.word_boundary and (
+                (start > 0 and _is_word_char(joined[start - 1])) or (end < len(joined) and _is_word_char(joined[end]))
+            ):
+                continue
+            results[text_index(start)].add(rule.category)
+
+        for category, regex in self._patterns.items():
+            for match in regex.finditer(joined):
+                results[text_index(match.start())].add(category)
+
+        return results
@@ -4,6 +4,8 @@ Nickname validation logic.
 REQ: REQ-B-A2-2, REQ-B-A2-4
 """
 
+from src.backend.validators.content_filter import AhoCorasick, WordRule, normalize_text
+
 
 class NicknameValidator:
     """
@@ -62,25 +64,21 @@ class NicknameValidator:
         # REQ-B-A2-Avail-2: Allow all Unicode characters, Korean, special chars, etc.
         # No character type restrictions beyond length + forbidden words
 
-        # Check forbidden words (case-insensitive)
-        nickname_lower = nickname.lower()
+        # Check forbidden words (case-insensitive, one automaton scan)
+        nickname_lower = normalize_text(nickname)
         if nickname_lower in cls.FORBIDDEN_WORDS:
             return (
                 False,
                 f"The nickname '{nickname}' is a prohibited word. Please choose another.",
             )
 
-        # Check if nickname contains forbidden words as substring
-        for forbidden in cls.FORBIDDEN_WORDS:
-            if forbidden in nickname_lower:
-                # Allow if it's a substring but not the exact match
-                # e.g., "admin123" should be rejected, but "admin_user" might be OK
-                # For strictness, reject if it starts with or is exactly a forbidden word
-                if nickname_lower.startswith(forbidden):
-                    return (
-                        False,
-                        "The nickname contains a prohibited word. Please choose another.",
-                    )
+        # Reject if the nickname starts with a forbidden word
+        # e.g., "admin123" is rejected, "my_admin" is allowed
+        if any(start == 0 for start, _, _ in _forbidden_words.finditer(nickname_lower)):
+            return (
+                False,
+                "The nickname contains a prohibited word. Please choose another.",
+            )
 
         return True, None
 
@@ -100,3 +98,9 @@ class NicknameValidator:
         """
         is_valid, error_msg = cls.validate(nickname)
         return error_msg if not is_valid else None
+
+
+# Compiled once at import (forbidden words → one automaton)
+_forbidden_words = AhoCorasick(
+    (word, WordRule("forbidden", word_boundary=False)) for word in NicknameValidator.FORBIDDEN_WORDS
+)
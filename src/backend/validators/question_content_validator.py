@@ -2,11 +2,17 @@
 Question content validation logic.
 
 REQ: REQ-B-B6-2
+
+Word lists and bias patterns are compiled once into a ContentFilter
+(one Aho-Corasick automaton + one combined regex per category), so a question
+or a whole generated set is scanned in a single pass.
 """
 
 import re
+from collections.abc import Sequence
 
 from src.backend.models import Question
+from src.backend.validators.content_filter import ContentFilter
 
 
 class QuestionContentValidator:
@@ -24,8 +30,7 @@ class QuestionContentValidator:
     """
 
     # Profanity keywords (비속어)
-    # For MVP 1.0: Basic English profanity list
-    # Future: Extend to Korean profanity with linguistic normalization
+    # English words match on word boundaries; Korean words match as substrings (조사 결합형 포함)
     PROFANITY_WORDS = {
         "damn",
         "hell",
@@ -44,6 +49,16 @@ class QuestionContentValidator:
         "wank",
     }
 
+    # Korean profanity keywords (한국어 비속어)
+    KOREAN_PROFANITY_WORDS = {
+        "씨발",
+        "씨빨",
+        "개새끼",
+        "병신",
+        "지랄",
+        "좆같",
+    }
+
     # Bias indicator keywords (편향 지시자)
     BIAS_PATTERNS = [
         r"\b(men|women|boys|girls)\s+(are|is)\s+(better|smarter|stronger|naturally)",
@@ -61,6 +76,55 @@ class QuestionContentValidator:
         r"(wikipedia|textbook|book|article)\s*[:;]?\s*['\"]?",  # Source mention
     ]
 
+    # Bias indicator phrases (substring match)
+    BIAS_INDICATORS = [
+        "which gender",
+        "which race",
+        "which culture",
+        "which religion",
+        "superior",
+        "inferior",
+        "naturally intelligent",
+        "naturally athletic",
+    ]
+
+    # Plagiarism/unattributed content indicators (substring match)
+    COPYRIGHT_INDICATORS = [
+        "copy-pasted",
+        "from wikipedia",
+        "from the internet",
+        "directly from",
+        "copied from",
+    ]
+
+    # Formal attribution markers accepted near a direct quote
+    FORMAL_SOURCE_MARKERS = (
+        "[source",
+        "source:",
+        "source =",
+        "citation:",
+        "cite:",
+        "doi:",
+        "url:",
+        "https://",
+        "http://",
+    )
+
+    PROFANITY_ERROR = "Question contains inappropriate language. Please revise."
+    BIAS_ERROR = (
+        "Question contains biased, stereotyped, or discriminatory language. "
+        "Please ensure the question is objective and fair."
+    )
+    BIAS_INDICATOR_ERROR = "Question may contain biased assumptions. Please revise for objectivity."
+    QUOTE_ERROR = (
+        "Question contains direct quotes without proper source attribution. "
+        "Please add source information or paraphrase."
+    )
+    COPYRIGHT_ERROR = (
+        "Question may contain plagiarized or unattributed content. "
+        "Please ensure original content or proper attribution."
+    )
+
     @classmethod
     def validate_question(cls, question: Question) -> tuple[bool, str | None]:
         """
@@ -77,6 +141,31 @@ class QuestionContentValidator:
         REQ: REQ-B-B6-2
 
         """
+        return cls.validate_questions([question])[0]
+
+    @classmethod
+    def validate_questions(cls, questions: Sequence[Question]) -> list[tuple[bool, str | None]]:
+        """
+        Validate all questions of a generated set in one filter pass.
+
+        Args:
+            questions: Questions to validate
+
+        Returns:
+            (is_valid, error_message) per question, in input order
+
+        REQ: REQ-B-B6-2
+
+        """
+        texts = [cls._question_text(question) for question in questions]
+        return [
+            cls._evaluate(text, categories)
+            for text, categories in zip(texts, _content_filter.scan_many(texts), strict=True)
+        ]
+
+    @staticmethod
+    def _question_text(question: Question) -> str:
+        """Concatenate stem, choices and explanation of a question."""
         # Collect all text to validate
         text_parts = [question.stem]
 
@@ -89,23 +178,59 @@ class QuestionContentValidator:
             if "explanation" in question.answer_schema:
                 text_parts.append(question.answer_schema["explanation"])
 
-        # Concatenate all text
-        full_text = " ".join(str(part) for part in text_parts if part)
+        return " ".join(str(part) for part in text_parts if part)
+
+    @classmethod
+    def _evaluate(cls, text: str, categories: set[str]) -> tuple[bool, str | None]:
+        """
+        Turn matched filter categories into the first failing check (profanity → bias → copyright).
+
+        Args:
+            text: Full question text
+            categories: Categories matched by the content filter
+
+        Returns:
+            (is_valid, error_message)
+
+        """
+        for check in (cls._profanity_result, cls._bias_result):
+            is_valid, error = check(categories)
+            if not is_valid:
+                return False, error
+        return cls._copyright_result(text, categories)
+
+    @classmethod
+    def _profanity_result(cls, categories: set[str]) -> tuple[bool, str | None]:
+        if PROFANITY in categories:
+            return False, cls.PROFANITY_ERROR
+        return True, None
 
-        # Check profanity
-        is_valid, error = cls._check_profanity(full_text)
-        if not is_valid:
-            return False, error
+    @classmethod
+    def _bias_result(cls, categories: set[str]) -> tuple[bool, str | None]:
+        if BIAS in categories:
+            return False, cls.BIAS_ERROR
+        if BIAS_INDICATOR in categories:
+            return False, cls.BIAS_INDICATOR_ERROR
+        return True, None
 
-        # Check bias
-        is_valid, error = cls._check_bias(full_text)
-        if not is_valid:
-            return False, error
+    @classmethod
+    def _copyright_result(cls, text: str, categories: set[str]) -> tuple[bool, str | None]:
+        # Check for direct quoted text without proper attribution
+        # Pattern: quoted text longer than 10 characters
+        if '"' in text:
+            text_lower = text.lower()
+            for quote in QUOTE_PATTERN.findall(text):
+                # Look for source attribution markers nearby
+                quote_pos = text_lower.find(f'"{quote.lower()}"')
+                if quote_pos != -1:
+                    # Check 100 characters before quote for formal attribution only
+                    context = text_lower[max(0, quote_pos - 100) : quote_pos + len(quote) + 100]
+                    if not any(marker in context for marker in cls.FORMAL_SOURCE_MARKERS):
+                        return False, cls.QUOTE_ERROR
 
-        # Check copyright concerns
-        is_valid, error = cls._check_copyright(full_text)
-        if not is_valid:
-            return False, error
+        # Check for explicit plagiarism/unattributed content indicators
+        if COPYRIGHT_INDICATOR in categories:
+            return False, cls.COPYRIGHT_ERROR
 
         return True, None
 
@@ -121,18 +246,7 @@ class QuestionContentValidator:
             (is_valid, error_message)
 
         """
-        text_lower = text.lower()
-
-        # Check for profanity keywords
-        for word in cls.PROFANITY_WORDS:
-            # Use word boundaries to avoid partial matches
-            if re.search(rf"\b{re.escape(word)}\b", text_lower):
-                return (
-                    False,
-                    "Question contains inappropriate language. Please revise.",
-                )
-
-        return True, None
+        return cls._profanity_result(_content_filter.scan(text))
 
     @classmethod
     def _check_bias(cls, text: str) -> tuple[bool, str | None]:
@@ -146,37 +260,7 @@ class QuestionContentValidator:
             (is_valid, error_message)
 
         """
-        text_lower = text.lower()
-
-        # Check bias patterns
-        for pattern in cls.BIAS_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return (
-                    False,
-                    "Question contains biased, stereotyped, or discriminatory language. "
-                    "Please ensure the question is objective and fair.",
-                )
-
-        # Additional checks for common bias indicators
-        bias_indicators = [
-            "which gender",
-            "which race",
-            "which culture",
-            "which religion",
-            "superior",
-            "inferior",
-            "naturally intelligent",
-            "naturally athletic",
-        ]
-
-        for indicator in bias_indicators:
-            if indicator in text_lower:
-                return (
-                    False,
-                    "Question may contain biased assumptions. Please revise for objectivity.",
-                )
-
-        return True, None
+        return cls._bias_result(_content_filter.scan(text))
 
     @classmethod
     def _check_copyright(cls, text: str) -> tuple[bool, str | None]:
@@ -190,56 +274,24 @@ class QuestionContentValidator:
             (is_valid, error_message)
 
         """
-        text_lower = text.lower()
-
-        # Check for direct quoted text without proper attribution
-        # Pattern: quoted text longer than 10 characters
-        quotes = re.findall(r'"([^"]{10,})"', text)
-        if quotes:
-            # Check if quote has formal source attribution nearby
-            for quote in quotes:
-                # Look for source attribution markers nearby
-                quote_pos = text.lower().find(f'"{quote.lower()}"')
-                if quote_pos != -1:
-                    # Check 100 characters before quote for formal attribution only
-                    context = text[max(0, quote_pos - 100) : quote_pos + len(quote) + 100]
-                    # Formal attribution patterns (from sources with proper format)
-                    has_formal_source = any(
-                        marker in context.lower()
-                        for marker in [
-                            "[source",
-                            "source:",
-                            "source =",
-                            "citation:",
-                            "cite:",
-                            "doi:",
-                            "url:",
-                            "https://",
-                            "http://",
-                        ]
-                    )
-                    if not has_formal_source:
-                        return (
-                            False,
-                            "Question contains direct quotes without proper source attribution. "
-                            "Please add source information or paraphrase.",
-                        )
-
-        # Check for explicit plagiarism/unattributed content indicators
-        copyright_indicators = [
-            "copy-pasted",
-            "from wikipedia",
-            "from the internet",
-            "directly from",
-            "copied from",
-        ]
-
-        for indicator in copyright_indicators:
-            if indicator in text_lower:
-                return (
-                    False,
-                    "Question may contain plagiarized or unattributed content. "
-                    "Please ensure original content or proper attribution.",
-                )
-
-        return True, None
+        return cls._copyright_result(text, _content_filter.scan(text))
+
+
+# Filter categories
+PROFANITY = "profanity"
+BIAS = "bias"
+BIAS_INDICATOR = "bias_indicator"
+COPYRIGHT_INDICATOR = "copyright_indicator"
+
+QUOTE_PATTERN = re.compile(r'"([^"]{10,})"')
+
+# Compiled once at import: all word lists in one automaton, bias patterns in one regex
+_content_filter = ContentFilter(
+    word_lists={
+        PROFANITY: QuestionContentValidator.PROFANITY_WORDS | QuestionContentValidator.KOREAN_PROFANITY_WORDS,
+        BIAS_INDICATOR: QuestionContentValidator.BIAS_INDICATORS,
+        COPYRIGHT_INDICATOR: QuestionContentValidator.COPYRIGHT_INDICATORS,
+    },
+    patterns={BIAS: QuestionContentValidator.BIAS_PATTERNS},
+    word_boundary_categories=[PROFANITY],
+)
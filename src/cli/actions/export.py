@@ -0,0 +1,72 @@
+"""Bulk export CLI actions."""
+
+from pathlib import Path
+
+from src.cli.context import CLIContext
+
+DATASETS = ("attempts", "answers", "results")
+FORMATS = ("ndjson", "csv")
+
+
+def export_help(context: CLIContext, *args: str) -> None:
+    """Export 명령어 사용법을 보여줍니다."""
+    context.console.print("[bold yellow]Export Commands:[/bold yellow]")
+    context.console.print("  export [dataset] [output_file] [--format ndjson|csv] [--user-id ID] [--since ISO8601]")
+    context.console.print()
+    context.console.print("[bold]Datasets:[/bold]")
+    context.console.print("  attempts   응시 이력 (라운드별 점수/소요 시간 포함, 라운드당 1행)")
+    context.console.print("  answers    문항별 답안/채점 결과")
+    context.console.print("  results    라운드별 채점 결과 (TestResult)")
+    context.console.print()
+    context.console.print("[bold]Examples:[/bold]")
+    context.console.print("  export attempts attempts.ndjson")
+    context.console.print("  export answers answers.csv --format csv --since 2025-01-01")
+
+
+def export_data(context: CLIContext, *args: str) -> None:
+    """응시 이력/답안/채점 결과를 NDJSON 또는 CSV 파일로 스트리밍 export 합니다."""
+    if len(args) < 2 or args[0] not in DATASETS:
+        export_help(context)
+        return
+
+    if not context.session.token:
+        context.console.print("[bold red]✗ Not authenticated[/bold red]")
+        context.console.print("[yellow]Please login first: auth login [username][/yellow]")
+        return
+
+    dataset, output_file = args[0], Path(args[1])
+    params: dict[str, str] = {"format": "ndjson"}
+    i = 2
+    while i < len(args):
+        if args[i] == "--format" and i + 1 < len(args) and args[i + 1] in FORMATS:
+            params["format"] = args[i + 1]
+            i += 2
+        elif args[i] == "--user-id" and i + 1 < len(args) and args[i + 1].isdigit():
+            params["user_id"] = args[i + 1]
+            i += 2
+        elif args[i] == "--since" and i + 1 < len(args):
+            params["since"] = args[i + 1]
+            i += 2
+        else:
+            context.console.print(f"[bold red]✗ Invalid option: {args[i]}[/bold red]")
+            export_help(context)
+            return
+
+    context.console.print(f"[dim]Exporting {dataset} ({params['format']}) to {output_file}...[/dim]")
+    context.client.set_token(context.session.token)
+
+    partial_file = output_file.with_name(output_file.name + ".part")
+    with partial_file.open("wb") as f:
+        status_code, bytes_written, error = context.client.stream_to_file(f"/export/{dataset}", f, params=params)
+
+    if error:
+        partial_file.unlink(missing_ok=True)
+        context.console.print(f"[bold red]✗ Export failed (HTTP {status_code})[/bold red]")
+        context.console.print(f"[red]  Error: {error}[/red]")
+        context.logger.error(f"Export failed: {error}")
+        return
+
+    partial_file.replace(output_file)
+    context.console.print(
+        f"[bold green]✓ Exported {dataset} to {output_file}[/bold green] [dim]({bytes_written:,} bytes)[/dim]"
+    )
@@ -2,7 +2,7 @@
 
 import json
 from types import TracebackType
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
 
@@ -111,6 +111,55 @@ class APIClient:
         except httpx.RequestError as e:
             return 0, None, f"Request failed: {str(e)}"
 
+    def stream_to_file(
+        self,
+        path: str,
+        destination: BinaryIO,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[int, int, str | None]:
+        """
+        Stream a GET response body into a file without buffering it in memory.
+
+        Used for bulk exports; no read timeout applies between chunks.
+
+        Args:
+            path: API path (e.g., '/export/attempts')
+            destination: Binary file object to write to
+            params: Query parameters
+
+        Returns:
+            Tuple of (status_code, bytes_written, error_message)
+
+        """
+        cookies = {"auth_token": self.token} if self.token else {}
+        try:
+            with self.client.stream(
+                "GET",
+                path,
+                headers=self._get_headers(),
+                params=params,
+                cookies=cookies,
+                timeout=httpx.Timeout(self.timeout, read=None),
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    try:
+                        error_msg = response.json().get("detail", response.text)
+                    except json.JSONDecodeError:
+                        error_msg = response.text
+                    return response.status_code, 0, error_msg
+
+                bytes_written = 0
+                for chunk in response.iter_bytes():
+                    destination.write(chunk)
+                    bytes_written += len(chunk)
+                return response.status_code, bytes_written, None
+
+        except httpx.ConnectError as e:
+            return 0, 0, f"Failed to connect to {self.base_url}: {str(e)}"
+        except httpx.RequestError as e:
+            return 0, 0, f"Request failed: {str(e)}"
+
     def close(self) -> None:
         """Close the HTTP client."""
         self.client.close()
@@ -259,6 +259,11 @@ COMMAND_LAYOUT = {
             },
         },
     },
+    "export": {
+        "description": "응시 이력/답안/채점 결과 대량 export (NDJSON/CSV 스트리밍)",
+        "usage": "export [dataset] [output_file] [--format ndjson|csv]",
+        "target": "src.cli.actions.export.export_data",
+    },
     "help": {
         "description": "사용 가능한 명령어 목록을 보여줍니다.",
         "usage": "help",
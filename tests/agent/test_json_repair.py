@@ -0,0 +1,97 @@
+"""
+Tests for shared tolerant JSON repair engine.
+
+REQ: REQ-A-OutputConverter
+"""
+
+import json
+
+import pytest
+
+from src.agent.json_repair import parse_json_tolerant, repair_json, strip_code_fences
+
+
+class TestParseJsonTolerant:
+    """Tests for parse_json_tolerant()."""
+
+    def test_valid_json_fast_path(self) -> None:
+        """Valid JSON is parsed without repairs."""
+        result = parse_json_tolerant('{"stem": "He said \\"hi\\"", "n": 1}')
+
+        assert result.value == {"stem": 'He said "hi"', "n": 1}
+        assert result.repairs == ()
+
+    def test_all_defects_repaired_in_one_pass(self) -> None:
+        """Python literals, trailing commas, invalid escapes and raw newlines together."""
+        text = '{"ok": True, "x": None, "k": [1, 2,], "p": "C:\\d", "q": "it\\\'s", "s": "a\nb",}'
+
+        result = parse_json_tolerant(text)
+
+        assert result.value == {"ok": True, "x": None, "k": [1, 2], "p": "C:\\d", "q": "it's", "s": "a\nb"}
+        assert set(result.repairs) == {"python_literals", "trailing_commas", "invalid_escapes", "control_chars"}
+
+    def test_literals_inside_strings_untouched(self) -> None:
+        """True/None inside strings and commas inside strings are not rewritten."""
+        result = parse_json_tolerant('{"stem": "True or None, ]", "ok": True}')
+
+        assert result.value == {"stem": "True or None, ]", "ok": True}
+        assert result.repairs == ("python_literals",)
+
+    def test_escaped_json(self) -> None:
+        r"""Fully escaped JSON with literal \n between tokens."""
+        result = parse_json_tolerant('[\\n  {\\"stem\\": \\"What is RAG?\\"}\\n]')
+
+        assert result.value == [{"stem": "What is RAG?"}]
+        assert result.repairs == ("escaped_json",)
+
+    def test_non_standard_numbers_fall_back_to_json(self) -> None:
+        """NaN (rejected by orjson) is still accepted like json.loads."""
+        result = parse_json_tolerant('{"score": NaN}')
+
+        assert result.value["score"] != result.value["score"]
+
+    def test_unrepairable_raises_decode_error(self) -> None:
+        """Structurally broken JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_tolerant('{"invalid": json without closing brace')
+
+    def test_valid_double_backslash_with_trailing_comma(self) -> None:
+        r"""A valid \\ pair is kept as-is while other defects are repaired."""
+        result = parse_json_tolerant('{"path": "C:\\\\Users\\\\x", "a": [1,2,],}')
+
+        assert result.value == {"path": "C:\\Users\\x", "a": [1, 2]}
+        assert result.repairs == ("trailing_commas",)
+
+    def test_unterminated_string_raises_decode_error(self) -> None:
+        """An unterminated string is not silently dropped."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_tolerant('{"a": [1,], "b": "open')
+
+    def test_empty_input(self) -> None:
+        """Empty input raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_json_tolerant("")
+
+
+class TestHelpers:
+    """Tests for repair_json() and strip_code_fences()."""
+
+    def test_repair_json_reports_repairs_in_order(self) -> None:
+        """Repairs are reported once each, in first-applied order."""
+        repaired, repairs = repair_json("[True, 1,]")
+
+        assert json.loads(repaired) == [True, 1]
+        assert repairs == ("python_literals", "trailing_commas")
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ('```json\n{"a": 1}\n```', '{"a": 1}'),
+            ("Result:\n```\n[1]\n```\nDone", "[1]"),
+            ('```json\n{"a": 1', '{"a": 1'),
+            ('  {"a": 1}  ', '{"a": 1}'),
+        ],
+    )
+    def test_strip_code_fences(self, text: str, expected: str) -> None:
+        """Code fences are removed (closed, unclosed or absent)."""
+        assert strip_code_fences(text) == expected
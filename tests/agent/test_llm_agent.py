@@ -233,6 +233,25 @@ class TestGenerateQuestionsHappyPath:
         assert "prev_answers" in agent_input_str.lower() or "previous" in agent_input_str.lower(), \
             f"prev_answers not found in agent input: {agent_input_str}"
 
+    @pytest.mark.asyncio
+    async def test_user_id_line_only_when_provided(self, agent_instance):
+        """
+        REQ: REQ-A-ItemGen
+        The agent input labels only a real user id as "User ID" (never the survey id)
+        """
+        agent_instance.executor.ainvoke.return_value = {"output": "Generated questions", "intermediate_steps": []}
+
+        def agent_input() -> str:
+            return agent_instance.executor.ainvoke.call_args[0][0]["messages"][0].content
+
+        anonymous = GenerateQuestionsRequest(session_id="session_1", survey_id="survey_1", round_idx=1)
+        await agent_instance.generate_questions(anonymous)
+        assert "User ID" not in agent_input()
+
+        known = GenerateQuestionsRequest(session_id="session_1", survey_id="survey_1", round_idx=1, user_id="user_1")
+        await agent_instance.generate_questions(known)
+        assert "User ID: user_1\nRound: 1" in agent_input()
+
 
 class TestGenerateQuestionsValidation:
     """Test input validation for question generation"""
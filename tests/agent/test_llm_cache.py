@@ -0,0 +1,121 @@
+"""
+Tests for exact-match LLM response cache.
+
+REQ: REQ-A-ItemGen
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agent.config import create_llm
+from src.agent.llm_cache import CachedChatModel, LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LLMResponseCache:
+    """Create cache backed by a temporary SQLite file."""
+    return LLMResponseCache(path=tmp_path / "llm.sqlite3")
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache storage."""
+
+    def test_put_get_roundtrip(self, cache: LLMResponseCache) -> None:
+        """Stored message is returned with content preserved and latency counted as saved."""
+        key = LLMResponseCache.make_key("fake", "m", {}, [HumanMessage(content="안녕")])
+        cache.put(key, AIMessage(content="응답"), latency_ms=120.0)
+
+        cached = cache.get(key)
+
+        assert cached.content == "응답"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["saved_latency_ms"] == 120.0
+
+    def test_key_depends_on_params(self) -> None:
+        """Different model params produce different keys."""
+        messages = [HumanMessage(content="prompt")]
+        key_a = LLMResponseCache.make_key("fake", "m", {"temperature": 0.3}, messages)
+        key_b = LLMResponseCache.make_key("fake", "m", {"temperature": 0.7}, messages)
+
+        assert key_a != key_b
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        """Expired entries are misses."""
+        cache = LLMResponseCache(path=tmp_path / "llm.sqlite3", ttl_seconds=-1)
+        cache.put("k", AIMessage(content="x"), latency_ms=1.0)
+
+        assert cache.get("k") is None
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Least recently accessed entry is evicted when full."""
+        cache = LLMResponseCache(path=tmp_path / "llm.sqlite3", max_entries=2)
+        cache.put("a", AIMessage(content="a"), latency_ms=1.0)
+        cache.put("b", AIMessage(content="b"), latency_ms=1.0)
+        cache.get("a")  # touch "a" so "b" becomes LRU
+        cache.put("c", AIMessage(content="c"), latency_ms=1.0)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Entries survive process restart (new instance on same file)."""
+        path = tmp_path / "llm.sqlite3"
+        LLMResponseCache(path=path).put("k", AIMessage(content="persisted"), latency_ms=5.0)
+
+        assert LLMResponseCache(path=path).get("k").content == "persisted"
+
+
+class TestCachedChatModel:
+    """Tests for CachedChatModel wrapper."""
+
+    def test_repeated_prompt_served_from_cache(self, cache: LLMResponseCache) -> None:
+        """Second identical prompt does not reach the inner model."""
+        llm = CachedChatModel(inner=FakeListChatModel(responses=["first", "second"]), response_cache=cache)
+
+        assert llm.invoke("same prompt").content == "first"
+        assert llm.invoke("same prompt").content == "first"
+        assert llm.invoke("other prompt").content == "second"
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_repeated_prompt_served_from_cache(self, cache: LLMResponseCache) -> None:
+        """Async path shares the same cache."""
+        llm = CachedChatModel(inner=FakeListChatModel(responses=["first", "second"]), response_cache=cache)
+
+        assert (await llm.ainvoke("same prompt")).content == "first"
+        assert llm.invoke("same prompt").content == "first"
+
+    def test_calls_with_tools_bypass_cache(self, cache: LLMResponseCache) -> None:
+        """Tool-calling requests (agent) are never cached."""
+        llm = CachedChatModel(inner=FakeListChatModel(responses=["first", "second"]), response_cache=cache)
+
+        assert llm.invoke("prompt", tools=[{"name": "t"}]).content == "first"
+        assert llm.invoke("prompt", tools=[{"name": "t"}]).content == "second"
+        assert cache.stats()["size"] == 0
+
+
+class TestCreateLLMCacheOption:
+    """Tests for LLM_CACHE_ENABLED wiring in create_llm()."""
+
+    def test_create_llm_wraps_when_enabled(self, tmp_path: Path) -> None:
+        """create_llm() returns CachedChatModel when LLM_CACHE_ENABLED=True."""
+        env = {
+            "USE_LITE_LLM": "False",
+            "GEMINI_API_KEY": "test-key",
+            "LLM_CACHE_ENABLED": "True",
+        }
+        with (
+            patch.dict(os.environ, env),
+            patch("src.agent.llm_cache.get_llm_cache", return_value=LLMResponseCache(path=tmp_path / "llm.sqlite3")),
+        ):
+            llm = create_llm()
+
+        assert isinstance(llm, CachedChatModel)
@@ -0,0 +1,195 @@
+"""
+Tests for deterministic fake LLM provider.
+
+REQ: REQ-A-ItemGen
+"""
+
+import asyncio
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.config import FakeLLMProvider, LLMFactory, create_llm
+from src.agent.llm_fake import FakeLLMError, FakeRateLimitError, ScriptedChatModel, scripted_questions
+from src.agent.llm_limiter import is_throttle_error
+
+AGENT_INPUT = """
+Survey ID: survey-1
+User ID: 7
+Round: 1
+Domain: AI
+Question Count: 3
+Question Types: multiple_choice, true_false, short_answer
+"""
+
+
+class TestProviderSelection:
+    """Tests for USE_FAKE_LLM provider selection."""
+
+    def test_use_fake_llm_takes_precedence(self) -> None:
+        """USE_FAKE_LLM=True selects FakeLLMProvider even if LiteLLM is configured."""
+        with patch.dict(os.environ, {"USE_FAKE_LLM": "True", "USE_LITE_LLM": "True"}):
+            assert isinstance(LLMFactory.get_provider(), FakeLLMProvider)
+            llm = create_llm()
+
+        assert isinstance(llm, ScriptedChatModel)
+
+    def test_env_configuration(self) -> None:
+        """LLM_FAKE_* variables configure latency and injection rates."""
+        env = {"USE_FAKE_LLM": "True", "LLM_FAKE_LATENCY_MS": "250", "LLM_FAKE_THROTTLE_RATE": "0.1"}
+        with patch.dict(os.environ, env):
+            llm = create_llm()
+
+        assert llm.latency_ms == 250.0
+        assert llm.throttle_rate == 0.1
+
+
+class TestScriptedResponses:
+    """Tests for call-site specific scripted responses."""
+
+    def test_validation_score_is_deterministic(self) -> None:
+        """Same validation prompt → same score in [0.8, 0.98]."""
+        llm = ScriptedChatModel()
+        prompt = "Evaluate the quality of this question on a scale of 0.0 to 1.0.\nQuestion Stem: What is RAG?"
+
+        first = llm.invoke(prompt).content
+        assert llm.invoke(prompt).content == first
+        assert 0.8 <= float(first) <= 0.98
+
+    def test_batch_validation_scores_every_question(self) -> None:
+        """Batch validation prompt → JSON array with one score per question."""
+        from src.agent.tools.validate_question_tool import _call_llm_batch_validation
+
+        questions = [("Q1?", "short_answer", None, "a"), ("Q2?", "short_answer", None, "b")]
+        with patch("src.agent.tools.validate_question_tool.create_llm", return_value=ScriptedChatModel()):
+            scores = _call_llm_batch_validation(questions)
+
+        assert len(scores) == 2
+        assert all(score is not None for score in scores)
+
+    def test_explanation_json_passes_explain_service_parser(self) -> None:
+        """ExplainService prompt → JSON accepted by _parse_llm_response."""
+        from src.backend.services.explain_service import ExplainService
+
+        prompt = "다음 문제에 대해 사용자 답변을 평가하고 맞춤형 해설을 작성해주세요.\n문제 주제: AI\n"
+        response = ScriptedChatModel().invoke(prompt).content
+
+        result = ExplainService.__new__(ExplainService)._parse_llm_response(response)
+        assert len(result["explanation"]) >= 200
+        assert len(result["reference_links"]) == 3
+
+    def test_batch_explanation_json_passes_explain_service_parser(self) -> None:
+        """Batch ExplainService prompt → one valid explanation per question."""
+        from types import SimpleNamespace
+
+        from src.backend.services.explain_service import ExplainService
+
+        service = ExplainService.__new__(ExplainService)
+        batch = [
+            (
+                SimpleNamespace(item_type="short_answer", category=category, stem="Q?", choices=None, answer_schema={}),
+                "a",
+                False,
+            )
+            for category in ("AI", "RAG")
+        ]
+        response = ScriptedChatModel().invoke(service._build_batch_explanation_prompt(batch)).content
+
+        results = service._parse_batch_llm_response(response, len(batch))
+        assert all(result is not None for result in results)
+        assert results[1]["reference_links"][0]["url"] == "https://example.com/concept-rag"
+
+    def test_short_answer_scoring_json(self) -> None:
+        """Short answer scoring prompt → {"score", "reasoning"} JSON."""
+        response = ScriptedChatModel().invoke("Evaluate the following short answer response on a scale of 0-100.")
+
+        data = json.loads(response.content)
+        assert 0 <= data["score"] <= 100
+        assert data["reasoning"]
+
+    def test_scripted_questions_follow_request(self) -> None:
+        """Question count, types and domain come from the agent input."""
+        questions = scripted_questions(AGENT_INPUT)
+
+        assert [q["type"] for q in questions] == ["multiple_choice", "true_false", "short_answer"]
+        assert all(q["category"] == "AI" for q in questions)
+        assert questions[0]["answer_schema"]["correct_answer"] in questions[0]["choices"]
+        assert questions == scripted_questions(AGENT_INPUT)
+
+
+class TestInjection:
+    """Tests for latency, error and 429 injection."""
+
+    def test_throttle_injection(self) -> None:
+        """throttle_rate=1 raises a 429 recognized by the limiter."""
+        llm = ScriptedChatModel(throttle_rate=1.0)
+
+        with pytest.raises(FakeRateLimitError) as exc_info:
+            llm.invoke("p")
+        assert is_throttle_error(exc_info.value)
+
+    def test_error_rate_is_reproducible(self) -> None:
+        """Same seed → same sequence of injected failures."""
+
+        def outcomes(seed: int) -> list[bool]:
+            llm = ScriptedChatModel(error_rate=0.3, seed=seed)
+            results = []
+            for _ in range(50):
+                try:
+                    llm.invoke("p")
+                    results.append(True)
+                except FakeLLMError:
+                    results.append(False)
+            return results
+
+        first = outcomes(7)
+        assert first == outcomes(7)
+        assert 5 <= first.count(False) <= 25
+
+    def test_async_latency(self) -> None:
+        """Async calls sleep for the configured latency without blocking each other."""
+        llm = ScriptedChatModel(latency_ms=50, latency_sigma=0)
+
+        async def run() -> None:
+            await asyncio.gather(*(llm.ainvoke("p") for _ in range(10)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        elapsed = time.monotonic() - start
+
+        assert 0.05 <= elapsed < 0.4
+
+
+class TestReactAgent:
+    """Tests for scripted ReAct tool calling."""
+
+    @pytest.mark.asyncio
+    async def test_generate_questions_end_to_end(self) -> None:
+        """ItemGenAgent completes Tool 1 → Tool 3 → Tool 4 → Final Answer with the fake LLM."""
+        from src.agent.llm_agent import GenerateQuestionsRequest, ItemGenAgent
+        from src.backend.services.user_context_cache import UserContext, bind_user_context
+
+        request = GenerateQuestionsRequest(
+            session_id="session-1",
+            survey_id="survey-1",
+            user_id="7",
+            round_idx=1,
+            domain="AI",
+            question_count=3,
+            question_types=["multiple_choice", "true_false", "short_answer"],
+        )
+
+        with (
+            patch.dict(os.environ, {"USE_FAKE_LLM": "True"}),
+            patch("src.agent.tools.difficulty_keywords_tool._get_keywords_from_db", return_value=None),
+            bind_user_context(UserContext(user_id="7", survey_id="survey-1")),
+        ):
+            agent = ItemGenAgent()
+            response = await agent.generate_questions(request)
+
+        assert response.error_message is None
+        assert [item.type for item in response.items] == ["multiple_choice", "true_false", "short_answer"]
+        assert all(item.validation_score >= 0.85 for item in response.items)
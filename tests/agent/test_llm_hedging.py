@@ -0,0 +1,165 @@
+"""
+Tests for hedged LLM requests.
+
+REQ: REQ-A-ItemGen
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.agent.llm_hedging import HedgedChatModel, HedgingPolicy
+
+
+class SleepyChatModel(BaseChatModel):
+    """Chat model that answers with `label` after `delay` seconds."""
+
+    label: str
+    delay: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "sleepy"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: list[str] | None = None, run_manager: object = None, **kwargs: object
+    ) -> ChatResult:
+        self.calls += 1
+        time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.label))])
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: list[str] | None = None, run_manager: object = None, **kwargs: object
+    ) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.label))])
+
+
+def warmed_policy(latency: float = 0.01, **kwargs: Any) -> HedgingPolicy:  # noqa: ANN401
+    """Create policy with enough observed latencies and hedge budget."""
+    policy = HedgingPolicy(min_samples=5, **kwargs)
+    for _ in range(20):
+        policy.record_primary(latency)
+        policy.record_request(latency, hedged=False)
+    return policy
+
+
+class TestHedgingPolicy:
+    """Tests for HedgingPolicy."""
+
+    def test_no_delay_before_min_samples(self) -> None:
+        """Hedging is disabled until enough latencies are observed."""
+        policy = HedgingPolicy(min_samples=3)
+        policy.record_primary(0.1)
+
+        assert policy.hedge_delay() is None
+
+    def test_delay_is_percentile(self) -> None:
+        """Hedge delay follows the configured percentile."""
+        policy = HedgingPolicy(percentile=0.9, min_samples=1)
+        for ms in range(1, 101):
+            policy.record_primary(ms / 1000)
+
+        assert policy.hedge_delay() == pytest.approx(0.09)
+
+    def test_budget_cap(self) -> None:
+        """Hedges beyond max_hedge_ratio of recent requests are refused."""
+        policy = warmed_policy(max_hedge_ratio=0.1)
+
+        assert policy.try_start_hedge()
+        policy.record_request(0.5, hedged=True)
+        assert policy.try_start_hedge()
+        policy.record_request(0.5, hedged=True)
+        assert not policy.try_start_hedge()
+
+    def test_concurrent_reservations_count_in_flight(self) -> None:
+        """A burst of concurrent reservations cannot exceed the budget before any completes."""
+        policy = warmed_policy(max_hedge_ratio=0.1)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            granted = sum(pool.map(lambda _: policy.try_start_hedge(), range(20)))
+
+        # (k + 1) <= 0.1 * (20 + k + 1) allows k = 0 and k = 1 only
+        assert granted == 2
+        assert policy.stats()["hedges_in_flight"] == 2
+
+        policy.record_request(0.5, hedged=True)
+        policy.abort_hedge()
+        assert policy.stats()["hedges_in_flight"] == 0
+
+
+class TestHedgedChatModel:
+    """Tests for HedgedChatModel."""
+
+    def test_fast_primary_is_not_hedged(self) -> None:
+        """Primary answering within the delay never triggers a duplicate."""
+        alternate = SleepyChatModel(label="alt")
+        llm = HedgedChatModel(inner=SleepyChatModel(label="primary"), policy=warmed_policy(0.5), alternate=alternate)
+
+        assert llm.invoke("p").content == "primary"
+        assert alternate.calls == 0
+
+    def test_slow_primary_hedged_to_alternate(self) -> None:
+        """Slow primary is raced against the alternate provider; first response wins."""
+        policy = warmed_policy(0.01)
+        llm = HedgedChatModel(
+            inner=SleepyChatModel(label="primary", delay=0.5),
+            policy=policy,
+            alternate=SleepyChatModel(label="alt"),
+        )
+
+        start = time.monotonic()
+        assert llm.invoke("p").content == "alt"
+        assert time.monotonic() - start < 0.4
+        assert policy.stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_slow_primary_hedged(self) -> None:
+        """Async hedge wins and the slow primary task is cancelled."""
+        policy = warmed_policy(0.01)
+        llm = HedgedChatModel(
+            inner=SleepyChatModel(label="primary", delay=1.0),
+            policy=policy,
+            alternate=SleepyChatModel(label="alt"),
+        )
+
+        start = time.monotonic()
+        assert (await llm.ainvoke("p")).content == "alt"
+        assert time.monotonic() - start < 0.5
+        stats = policy.stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_rate"] > 0
+        # Cancelled primary is not a latency sample (would drag the hedge delay down)
+        assert len(policy._primary_latencies) == 20
+
+    @pytest.mark.asyncio
+    async def test_async_burst_respects_budget(self) -> None:
+        """Simultaneous slow requests share one hedge budget; reservations are released afterwards."""
+        policy = warmed_policy(0.01, max_hedge_ratio=0.1)
+        alternate = SleepyChatModel(label="alt")
+        llm = HedgedChatModel(inner=SleepyChatModel(label="primary", delay=0.3), policy=policy, alternate=alternate)
+
+        results = await asyncio.gather(*(llm.ainvoke("p") for _ in range(10)))
+
+        assert sorted(r.content for r in results) == ["alt"] * 2 + ["primary"] * 8
+        stats = policy.stats()
+        assert stats["hedges"] == alternate.calls == 2
+        assert stats["hedges_in_flight"] == 0
+
+    def test_tool_calls_not_hedged(self) -> None:
+        """Calls with bound tools bypass hedging."""
+        alternate = SleepyChatModel(label="alt")
+        llm = HedgedChatModel(
+            inner=SleepyChatModel(label="primary", delay=0.05), policy=warmed_policy(0.001), alternate=alternate
+        )
+
+        assert llm.invoke("p", tools=[{"name": "t"}]).content == "primary"
+        assert alternate.calls == 0
@@ -0,0 +1,190 @@
+"""
+Tests for process-wide LLM limiter with AIMD throttling.
+
+REQ: REQ-A-ItemGen
+"""
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel, GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.agent.config import create_llm
+from src.agent.llm_cache import CachedChatModel, LLMResponseCache
+from src.agent.llm_limiter import AdaptiveLLMLimiter, ThrottledChatModel, is_throttle_error
+
+
+class RateLimitError(Exception):
+    """Stand-in for provider 429 errors."""
+
+    status_code = 429
+
+
+class TestIsThrottleError:
+    """Tests for throttle error classification."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [RateLimitError("slow down"), TimeoutError(), Exception("HTTP 429 Too Many Requests")],
+    )
+    def test_throttle_errors(self, error: Exception) -> None:
+        """429 and timeouts trigger backoff."""
+        assert is_throttle_error(error)
+
+    def test_other_errors(self) -> None:
+        """Regular errors do not trigger backoff."""
+        assert not is_throttle_error(ValueError("bad prompt"))
+
+
+class TestAdaptiveLLMLimiter:
+    """Tests for AdaptiveLLMLimiter."""
+
+    def test_multiplicative_decrease_on_throttle(self) -> None:
+        """Limit is halved on 429 and not again within cooldown."""
+        limiter = AdaptiveLLMLimiter(max_concurrency=8, cooldown_seconds=60)
+
+        for _ in range(2):
+            with pytest.raises(RateLimitError), limiter.slot():
+                raise RateLimitError("429")
+
+        assert limiter.limit == 4.0
+        assert limiter.stats()["throttled"] == 2
+
+    def test_additive_increase_on_success(self) -> None:
+        """Limit grows by about one per window of successes, capped at max."""
+        limiter = AdaptiveLLMLimiter(max_concurrency=8, initial_concurrency=2, rate_per_second=1000, burst=100)
+
+        for _ in range(2):
+            with limiter.slot():
+                pass
+
+        assert limiter.limit == pytest.approx(2.9)
+        for _ in range(100):
+            with limiter.slot():
+                pass
+        assert limiter.limit == 8.0
+
+    def test_concurrency_cap_across_threads(self) -> None:
+        """No more than `limit` calls run at once across threads."""
+        limiter = AdaptiveLLMLimiter(max_concurrency=2, rate_per_second=1000, burst=100)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, peak
+            with limiter.slot():
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.02)
+                with lock:
+                    running -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak <= 2
+        assert limiter.stats()["acquired"] == 6
+        assert limiter.stats()["peak_in_flight"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_asyncio(self) -> None:
+        """Async callers share the same cap without blocking the loop."""
+        limiter = AdaptiveLLMLimiter(max_concurrency=3, rate_per_second=1000, burst=100)
+
+        async def work() -> None:
+            async with limiter.aslot():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(9)))
+
+        stats = limiter.stats()
+        assert stats["peak_in_flight"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["max_wait_ms"] > 0
+
+    def test_token_bucket_limits_start_rate(self) -> None:
+        """Starts beyond burst wait for refill."""
+        limiter = AdaptiveLLMLimiter(max_concurrency=10, rate_per_second=50, burst=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            with limiter.slot():
+                pass
+
+        assert time.monotonic() - start >= 0.03
+
+
+class TestThrottledChatModel:
+    """Tests for ThrottledChatModel wrapper."""
+
+    def test_invoke_goes_through_limiter(self) -> None:
+        """Sync and async calls acquire limiter slots."""
+        limiter = AdaptiveLLMLimiter()
+        llm = ThrottledChatModel(inner=FakeListChatModel(responses=["a", "b"]), limiter=limiter)
+
+        assert llm.invoke("p").content == "a"
+        assert asyncio.run(llm.ainvoke("p")).content == "b"
+        assert limiter.stats()["acquired"] == 2
+
+    def test_create_llm_wraps_when_enabled(self) -> None:
+        """create_llm() returns ThrottledChatModel when LLM_LIMITER_ENABLED=True."""
+        env = {"USE_LITE_LLM": "False", "GEMINI_API_KEY": "test-key", "LLM_LIMITER_ENABLED": "True"}
+        with patch.dict(os.environ, env):
+            llm = create_llm()
+
+        assert isinstance(llm, ThrottledChatModel)
+
+    def test_stream_holds_slot_and_yields_inner_chunks(self) -> None:
+        """Streaming keeps token chunks and holds one slot until the stream ends."""
+        limiter = AdaptiveLLMLimiter()
+        inner = GenericFakeChatModel(messages=iter([AIMessage(content="hello world foo bar")]))
+        llm = ThrottledChatModel(inner=inner, limiter=limiter)
+
+        in_flight = []
+        chunks = []
+        for chunk in llm.stream("p"):
+            in_flight.append(limiter.stats()["in_flight"])
+            chunks.append(chunk.content)
+
+        assert chunks == ["hello", " ", "world", " ", "foo", " ", "bar"]
+        assert set(in_flight) == {1}
+        assert limiter.stats()["in_flight"] == 0
+        assert limiter.stats()["acquired"] == 1
+
+    def test_create_llm_streams_through_all_middleware(self, tmp_path: Path) -> None:
+        """Streaming through create_llm() (limiter + hedging + cache) yields tokens incrementally."""
+        env = {
+            "USE_FAKE_LLM": "True",
+            "LLM_LIMITER_ENABLED": "True",
+            "LLM_HEDGING_ENABLED": "True",
+            "LLM_CACHE_ENABLED": "True",
+        }
+        limiter = AdaptiveLLMLimiter()
+        with (
+            patch.dict(os.environ, env),
+            patch("src.agent.llm_limiter.get_llm_limiter", return_value=limiter),
+            patch("src.agent.llm_cache.get_llm_cache", return_value=LLMResponseCache(path=tmp_path / "llm.sqlite3")),
+        ):
+            llm = create_llm()
+
+        async def collect() -> list[str]:
+            return [chunk.content async for chunk in llm.astream("Generate a learning explanation for RAG")]
+
+        first = asyncio.run(collect())
+        replay = asyncio.run(collect())
+
+        assert isinstance(llm, CachedChatModel)
+        assert len([c for c in first if c]) > 1
+        assert [c for c in replay if c] == ["".join(first)]  # cache hit replays the stored response as one chunk
+        assert limiter.stats()["acquired"] == 1
@@ -0,0 +1,207 @@
+"""
+Tests for incremental JSON parsers for streamed LLM output.
+
+REQ: REQ-A-OutputConverter
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.streaming_json import FinalAnswerStreamParser, StringFieldStreamParser
+
+QUESTIONS = [
+    {
+        "question_id": "q1",
+        "type": "multiple_choice",
+        "stem": 'Which is "correct"? {not a brace} [nor a bracket]',
+        "choices": ["A", "B", "C", "D"],
+        "answer_schema": {"type": "exact_match", "correct_answer": "B"},
+        "difficulty": 5,
+        "category": "AI",
+    },
+    {
+        "question_id": "q2",
+        "type": "short_answer",
+        "stem": "설명하세요.",
+        "answer_schema": {"type": "keyword_match", "keywords": ["원리", "한계"]},
+        "difficulty": 4,
+        "category": "AI",
+    },
+]
+
+
+def feed_in_chunks(parser: FinalAnswerStreamParser, text: str, size: int) -> list[tuple[int, dict]]:
+    """Feed text in fixed-size chunks; return (chunk offset, value) per completed value."""
+    completed = []
+    for offset in range(0, len(text), size):
+        completed.extend((offset, value) for value in parser.feed(text[offset : offset + size]))
+    return completed
+
+
+class TestFinalAnswerStreamParser:
+    """Tests for FinalAnswerStreamParser."""
+
+    def test_yields_each_question_when_it_closes(self) -> None:
+        """First question is returned before the stream reaches the second one."""
+        text = "Thought: done\nFinal Answer: ```json\n" + json.dumps(QUESTIONS, ensure_ascii=False, indent=2) + "\n```"
+        parser = FinalAnswerStreamParser()
+
+        completed = feed_in_chunks(parser, text, size=7)
+
+        assert [value for _, value in completed] == QUESTIONS
+        assert completed[0][0] < text.index('"q2"')
+        assert parser.close() == QUESTIONS
+        assert parser.repairs == set()
+
+    def test_marker_split_across_chunks(self) -> None:
+        """Marker split between chunks is still detected."""
+        parser = FinalAnswerStreamParser()
+
+        parser.feed("Thought: ok\nFinal Ans")
+        parser.feed('wer: [{"a": 1}]')
+
+        assert parser.close() == [{"a": 1}]
+
+    def test_single_pass_repairs(self) -> None:
+        """Python literals, trailing commas, invalid escapes and raw newlines are repaired."""
+        text = 'Final Answer: [{"ok": True, "x": None, "k": [1, 2,], "p": "C:\\d", "s": "a\nb",},]'
+        parser = FinalAnswerStreamParser()
+
+        feed_in_chunks(parser, text, size=3)
+
+        assert parser.close() == [{"ok": True, "x": None, "k": [1, 2], "p": "C:\\d", "s": "a\nb"}]
+        assert parser.repairs == {"python_literals", "trailing_commas", "invalid_escapes", "control_chars"}
+
+    def test_escaped_json(self) -> None:
+        r"""Fully escaped JSON (\"key\": \"value\", literal \n) is unescaped."""
+        text = 'Final Answer: [\\n  {\\"stem\\": \\"What is RAG?\\", \\"difficulty\\": 5}\\n]'
+        parser = FinalAnswerStreamParser()
+
+        feed_in_chunks(parser, text, size=4)
+
+        assert parser.close() == [{"stem": "What is RAG?", "difficulty": 5}]
+        assert "escaped_json" in parser.repairs
+
+    def test_top_level_object(self) -> None:
+        """Top-level object is returned as a dict; trailing text is ignored."""
+        parser = FinalAnswerStreamParser()
+
+        parser.feed('Final Answer: {"questions": [{"a": 1}]} Done.')
+
+        assert parser.close() == {"questions": [{"a": 1}]}
+
+    def test_incomplete_stream(self) -> None:
+        """close() raises if the array never closes; completed elements are kept."""
+        parser = FinalAnswerStreamParser()
+
+        assert parser.feed('Final Answer: [{"a": 1}, {"b"') == [{"a": 1}]
+        with pytest.raises(ValueError, match="incomplete"):
+            parser.close()
+
+    def test_missing_marker(self) -> None:
+        """close() raises if the marker never appeared."""
+        parser = FinalAnswerStreamParser()
+        parser.feed('[{"a": 1}]')
+
+        with pytest.raises(ValueError, match="Final Answer"):
+            parser.close()
+
+
+class TestStringFieldStreamParser:
+    """Tests for StringFieldStreamParser."""
+
+    TEXT = '[정답의 원리]\n"셀프 어텐션"은 \\ 경로\t와 이모지 😀 를 포함합니다.'
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8])
+    def test_decodes_field_across_any_chunking(self, size: int) -> None:
+        """Escapes and surrogate pairs split across chunks decode to the original text."""
+        text = "```json\n" + json.dumps({"reference_links": [], "explanation": self.TEXT, "x": "y"}) + "\n```"
+        parser = StringFieldStreamParser("explanation")
+
+        decoded = "".join(parser.feed(text[offset : offset + size]) for offset in range(0, len(text), size))
+
+        assert decoded == self.TEXT
+        assert parser.finished
+
+    def test_streams_before_value_closes(self) -> None:
+        """Text is returned as it arrives; raw newlines are passed through."""
+        parser = StringFieldStreamParser("explanation")
+
+        assert parser.feed('{"explanation": "첫 줄\n둘') == "첫 줄\n둘"
+        assert not parser.finished
+        assert parser.feed('째 줄", "reference_links": ["\\u0041"]}') == "째 줄"
+        assert parser.finished
+        assert parser.feed("more") == ""
+
+    def test_field_not_present(self) -> None:
+        """Other fields are skipped; nothing is returned until the field starts."""
+        parser = StringFieldStreamParser("explanation")
+
+        assert parser.feed('{"title": "explanation", "url": "x"}') == ""
+        assert not parser.started
+
+
+class TestAgentStreaming:
+    """Tests for AGENT_STREAMING_ENABLED in ItemGenAgent.generate_questions."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_extracts_same_items(self) -> None:
+        """Streaming run (fake LLM) extracts the same items as the non-streaming run."""
+        from src.agent.llm_agent import GenerateQuestionsRequest, ItemGenAgent
+        from src.backend.services.user_context_cache import UserContext, bind_user_context
+
+        request = GenerateQuestionsRequest(
+            session_id="session-1",
+            survey_id="survey-1",
+            user_id="7",
+            round_idx=1,
+            domain="AI",
+            question_count=3,
+            question_types=["multiple_choice", "true_false", "short_answer"],
+        )
+
+        async def generate(streaming: str) -> list[dict]:
+            with (
+                patch.dict(os.environ, {"USE_FAKE_LLM": "True", "AGENT_STREAMING_ENABLED": streaming}),
+                patch("src.agent.tools.difficulty_keywords_tool._get_keywords_from_db", return_value=None),
+                bind_user_context(UserContext(user_id="7", survey_id="survey-1")),
+            ):
+                agent = ItemGenAgent()
+                with patch.object(agent, "_ainvoke_streaming", wraps=agent._ainvoke_streaming) as streaming_spy:
+                    response = await agent.generate_questions(request)
+            assert response.error_message is None
+            assert streaming_spy.called == (streaming == "True")
+            return [item.model_dump(exclude={"id", "saved_at"}) for item in response.items]
+
+        streamed = await generate("True")
+
+        assert len(streamed) == 3
+        assert streamed == await generate("False")
+
+    @pytest.mark.asyncio
+    async def test_items_from_earlier_turn_are_discarded(self) -> None:
+        """A partial Final Answer in an earlier AI turn does not leak items into the result."""
+        from langchain_core.messages import AIMessageChunk
+
+        from src.agent.llm_agent import ItemGenAgent
+
+        earlier = "Final Answer: [" + json.dumps(QUESTIONS[0], ensure_ascii=False) + ","
+        final = "Final Answer: " + json.dumps([QUESTIONS[1]], ensure_ascii=False)
+
+        class ScriptedExecutor:
+            async def astream(self, _input: dict, stream_mode: list[str]):  # noqa: ANN202
+                yield "messages", (AIMessageChunk(content=earlier, id="turn-1"), {})
+                yield "messages", (AIMessageChunk(content=final, id="turn-2"), {})
+                yield "values", {"messages": []}
+
+        with patch.dict(os.environ, {"USE_FAKE_LLM": "True"}):
+            agent = ItemGenAgent()
+        agent.executor = ScriptedExecutor()
+
+        _, items = await agent._ainvoke_streaming("prompt")
+
+        assert items is not None
+        assert [item.stem for item in items] == [QUESTIONS[1]["stem"]]
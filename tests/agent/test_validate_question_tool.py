@@ -408,3 +408,31 @@ class TestValidationResponseParser:
         }
 
         assert ValidationResponseParser.validate_response_structure(invalid_response) is False
+
+    def test_parse_batch_scores_indexed_objects(self) -> None:
+        """Test parsing indexed batch scores (fenced JSON, out of order)."""
+        content = '```json\n[{"index": 2, "score": 0.6}, {"index": 1, "score": 1.4}]\n```'
+
+        scores = ValidationResponseParser.parse_batch_scores(content, 2)
+
+        assert scores == [1.0, 0.6]
+
+    def test_parse_batch_scores_partial_failure(self) -> None:
+        """Test missing or malformed items are returned as None."""
+        content = '[{"index": 1, "score": "high"}, {"index": 3, "score": 0.9}, {"index": 9, "score": 0.5}]'
+
+        scores = ValidationResponseParser.parse_batch_scores(content, 3)
+
+        assert scores == [None, None, 0.9]
+
+    def test_parse_batch_scores_duplicate_index(self) -> None:
+        """Test a duplicated index is returned as None, not the first occurrence."""
+        content = '[{"index": 1, "score": 0.9}, {"index": 2, "score": 0.7}, {"index": 1, "score": 0.2}]'
+
+        scores = ValidationResponseParser.parse_batch_scores(content, 2)
+
+        assert scores == [None, 0.7]
+
+    def test_parse_batch_scores_not_json(self) -> None:
+        """Test unparseable response yields all None."""
+        assert ValidationResponseParser.parse_batch_scores("0.85", 2) == [None, None]
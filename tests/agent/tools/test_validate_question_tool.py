@@ -607,6 +607,212 @@ class TestBatchValidation:
             assert "feedback" in result
             assert "issues" in result
 
+    def test_batch_validation_single_llm_call(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that batch validation scores all questions in one LLM call.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Given: 5 questions and an LLM returning a JSON array of scores
+        When: validate_question_quality() is called with batch=True
+        Then: LLM is invoked once and each result uses its own score
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(
+            content='[{"index": 1, "score": 0.9}, {"index": 2, "score": 0.8}, {"index": 3, "score": 0.95}, '
+            '{"index": 4, "score": 0.6}, {"index": 5, "score": 0.88}]'
+        )
+
+        with (
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_single,
+        ):
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in batch_questions],
+                question_type=[q["question_type"] for q in batch_questions],
+                choices=[q.get("choices") for q in batch_questions],
+                correct_answer=[q["correct_answer"] for q in batch_questions],
+                batch=True,
+            )
+
+        assert mock_llm_instance.invoke.call_count == 1
+        mock_single.assert_not_called()
+        assert [r["score"] for r in results] == [0.9, 0.8, 0.95, 0.6, 0.88]
+        assert results[3]["recommendation"] == "reject"
+
+    def test_batch_validation_falls_back_per_item(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that unparsed batch items fall back to per-item LLM calls.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Given: Batch LLM response missing scores for items 2 and 5
+        When: validate_question_quality() is called with batch=True
+        Then: Only items 2 and 5 are re-validated individually
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(
+            content='[{"index": 1, "score": 0.9}, {"index": 3, "score": 0.9}, {"index": 4, "score": 0.9}]'
+        )
+
+        with (
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_single,
+        ):
+            mock_single.return_value = 0.75
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in batch_questions],
+                question_type=[q["question_type"] for q in batch_questions],
+                choices=[q.get("choices") for q in batch_questions],
+                correct_answer=[q["correct_answer"] for q in batch_questions],
+                batch=True,
+            )
+
+        assert mock_single.call_count == 2
+        assert [call.args[0] for call in mock_single.call_args_list] == [
+            batch_questions[1]["stem"],
+            batch_questions[4]["stem"],
+        ]
+        assert [r["score"] for r in results] == [0.9, 0.75, 0.9, 0.9, 0.75]
+
+
+# ============================================================================
+# Tiered (Rule-First) Validation Tests
+# ============================================================================
+
+
+class TestTieredValidation:
+    """Tests for rule-first short-circuit and LLM score memoization."""
+
+    def test_rule_decided_question_skips_llm(self) -> None:
+        """Test that a guaranteed discard does not call the LLM.
+
+        REQ: REQ-A-Mode1-Tool4
+
+        Given: Multiple choice with 2 choices and answer not in choices (rule_score 0.5)
+        When: validate_question_quality() is called
+        Then: LLM is not called and the question is rejected/discarded
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+            get_validation_stats,
+        )
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_llm:
+            result = _validate_question_quality_impl(
+                stem="What is RAG?",
+                question_type="multiple_choice",
+                choices=["A", "B"],
+                correct_answer="Z",
+            )
+
+        mock_llm.assert_not_called()
+        assert result["llm_skipped"] is True
+        assert result["recommendation"] == "reject"
+        assert result["should_discard"] is True
+        assert result["is_valid"] is False
+        assert get_validation_stats()["rule_decided"] == 1
+
+    def test_undecided_rule_failure_still_escalates(self, invalid_answer_not_in_choices: dict[str, Any]) -> None:
+        """Test that rule failures not guaranteeing discard still use the LLM.
+
+        REQ: REQ-A-Mode1-Tool4
+
+        Given: Answer not in choices only (rule_score 0.7 → revise or reject)
+        When: validate_question_quality() is called
+        Then: LLM is called and the semantics are unchanged
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_llm:
+            mock_llm.return_value = 0.9
+            result = _validate_question_quality_impl(
+                stem=invalid_answer_not_in_choices["stem"],
+                question_type=invalid_answer_not_in_choices["question_type"],
+                choices=invalid_answer_not_in_choices["choices"],
+                correct_answer=invalid_answer_not_in_choices["correct_answer"],
+            )
+
+        mock_llm.assert_called_once()
+        assert result["llm_skipped"] is False
+        assert result["recommendation"] == "revise"
+
+    def test_unchanged_question_reuses_llm_score(self, valid_multiple_choice_question: dict[str, Any]) -> None:
+        """Test that re-validating an unchanged question reuses the LLM score.
+
+        REQ: REQ-A-Mode1-Tool4
+
+        Given: The same question validated twice
+        When: validate_question_quality() is called again
+        Then: LLM is invoked once and short_circuit_rate is 0.5
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+            get_validation_stats,
+        )
+
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(content="0.9")
+
+        with patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance):
+            results = [
+                _validate_question_quality_impl(
+                    stem=valid_multiple_choice_question["stem"],
+                    question_type=valid_multiple_choice_question["question_type"],
+                    choices=valid_multiple_choice_question["choices"],
+                    correct_answer=valid_multiple_choice_question["correct_answer"],
+                )
+                for _ in range(2)
+            ]
+
+        assert mock_llm_instance.invoke.call_count == 1
+        assert results[0] == results[1]
+        stats = get_validation_stats()
+        assert stats["memo_hits"] == 1
+        assert stats["short_circuit_rate"] == 0.5
+
+    def test_batch_sends_only_ambiguous_items(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that rule-decided items are excluded from the batch prompt.
+
+        REQ: REQ-A-Mode1-Tool4
+
+        Given: 5 valid questions plus one rule-decided question
+        When: validate_question_quality() is called with batch=True
+        Then: Batch prompt contains only the 5 valid questions
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        questions = [
+            *batch_questions,
+            {"stem": "Broken?", "question_type": "multiple_choice", "choices": ["A", "B"], "correct_answer": "Z"},
+        ]
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_batch_validation") as mock_batch:
+            mock_batch.return_value = [0.9] * 5
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in questions],
+                question_type=[q["question_type"] for q in questions],
+                choices=[q.get("choices") for q in questions],
+                correct_answer=[q["correct_answer"] for q in questions],
+                batch=True,
+            )
+
+        sent = mock_batch.call_args.args[0]
+        assert [item[0] for item in sent] == [q["stem"] for q in batch_questions]
+        assert results[5]["llm_skipped"] is True
+        assert results[5]["should_discard"] is True
+        assert all(r["recommendation"] == "pass" for r in results[:5])
+
 
 # ============================================================================
 # Edge Cases & Error Handling Tests
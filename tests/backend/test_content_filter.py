@@ -0,0 +1,96 @@
+"""
+Tests for the compiled content filter engine and batch question validation.
+
+REQ: REQ-B-B6-2, REQ-B-A2-4
+"""
+
+import unicodedata
+
+from src.backend.validators.content_filter import AhoCorasick, ContentFilter, WordRule
+from src.backend.validators.nickname import NicknameValidator
+from src.backend.validators.question_content_validator import QuestionContentValidator
+
+RULE = WordRule("test", word_boundary=False)
+
+
+class TestAhoCorasick:
+    """Tests for AhoCorasick."""
+
+    def test_finds_overlapping_matches(self) -> None:
+        """All occurrences are reported, including overlaps and suffix words."""
+        automaton = AhoCorasick((word, RULE) for word in ["he", "she", "his", "hers"])
+
+        matches = sorted((start, word) for start, word, _ in automaton.finditer("ushers"))
+
+        assert matches == [(1, "she"), (2, "he"), (2, "hers")]
+
+    def test_matches_naive_search(self) -> None:
+        """Same hits as a naive str.find loop."""
+        words = ["ab", "abc", "bca", "c", "caa", "aab"]
+        text = "aabcaabcabccaab"
+        automaton = AhoCorasick((word, RULE) for word in words)
+
+        expected = sorted((i, word) for word in words for i in range(len(text)) if text.startswith(word, i))
+
+        assert sorted((start, word) for start, word, _ in automaton.finditer(text)) == expected
+
+
+class TestContentFilter:
+    """Tests for ContentFilter."""
+
+    FILTER = ContentFilter(
+        word_lists={"profanity": ["damn", "병신"], "indicator": ["copied from"]},
+        patterns={"bias": [r"\bwhich\s+gender\b", r"\binferior\s+race"]},
+        word_boundary_categories=["profanity"],
+    )
+
+    def test_word_boundaries_for_english_words(self) -> None:
+        """English words need word boundaries, like the previous regex check."""
+        assert self.FILTER.scan("Damn it") == {"profanity"}
+        assert self.FILTER.scan("Amsterdamned") == set()
+
+    def test_korean_words_match_with_particles(self) -> None:
+        """Korean words match inside eojeol and in decomposed (NFD) input."""
+        assert self.FILTER.scan("이 병신아") == {"profanity"}
+        assert self.FILTER.scan(unicodedata.normalize("NFD", "병신같은 질문")) == {"profanity"}
+
+    def test_scan_many_maps_matches_to_their_text(self) -> None:
+        """Batch scan attributes each hit to its own text and never matches across texts."""
+        results = self.FILTER.scan_many(["clean text", "WHICH GENDER wins", "copied", "from the book", "damn"])
+
+        assert results == [set(), {"bias"}, set(), set(), {"profanity"}]
+
+
+class TestBatchQuestionValidation:
+    """Tests for QuestionContentValidator.validate_questions."""
+
+    def test_batch_matches_single_validation(self, question_factory) -> None:  # noqa: ANN001
+        """Batch results equal per-question results, in order."""
+        questions = [
+            question_factory(stem="What is a transformer?"),
+            question_factory(stem="What the hell is AI?"),
+            question_factory(stem="Which gender is better at math?"),
+            question_factory(stem="This was copied from a blog. What is RAG?"),
+            question_factory(stem='He said "attention is all you need" once', choices=["A", "B"]),
+            question_factory(stem="이 병신 같은 문제는 무엇인가?"),
+        ]
+
+        batch = QuestionContentValidator.validate_questions(questions)
+
+        assert batch == [QuestionContentValidator.validate_question(question) for question in questions]
+        assert [is_valid for is_valid, _ in batch] == [True, False, False, False, False, False]
+        assert batch[1][1] == QuestionContentValidator.PROFANITY_ERROR
+        assert batch[4][1] == QuestionContentValidator.QUOTE_ERROR
+
+    def test_empty_batch(self) -> None:
+        """No questions → no results."""
+        assert QuestionContentValidator.validate_questions([]) == []
+
+
+class TestNicknameForbiddenWords:
+    """NicknameValidator keeps its prefix semantics on the automaton."""
+
+    def test_prefix_rejected_infix_allowed(self) -> None:
+        """Forbidden word at the start is rejected; elsewhere it is allowed."""
+        assert NicknameValidator.validate("Admin_kim")[0] is False
+        assert NicknameValidator.validate("kim_admin")[0] is True
@@ -4,6 +4,7 @@ Tests for explanation generation service.
 REQ: REQ-B-B3-Explain
 """
 
+import json
 import time
 from typing import Any, NoReturn
 from unittest.mock import patch
@@ -673,3 +674,313 @@ class TestLLMIntegration:
             {"correct_answer": "Expected answer"}, "short_answer"
         )
         assert result == "Expected answer"
+
+
+class TestContentAddressedCache:
+    """REQ-B-B3-Explain-1: Explanations shared by question content (LRU → DB → LLM)."""
+
+    MOCK_LLM_RESPONSE = {
+        "explanation": "콘텐츠 해시 캐시 테스트 해설. " * 30,
+        "reference_links": [
+            {"title": "Link 1", "url": "https://example.com/1"},
+            {"title": "Link 2", "url": "https://example.com/2"},
+            {"title": "Link 3", "url": "https://example.com/3"},
+        ],
+    }
+
+    def test_identical_question_reuses_explanation(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Same content and same wrong answer under another question id → no LLM call, no attempt leak."""
+        from src.backend.services.explain_service import ExplainService
+
+        attempt_answer = attempt_answers_for_session[0]
+        first = create_test_question(db_session, test_session_round1_fixture)
+        second = create_test_question(db_session, test_session_round1_fixture)
+
+        with patch.object(
+            ExplainService, "_generate_with_llm", return_value=(self.MOCK_LLM_RESPONSE, False, None)
+        ) as mock_llm:
+            service = ExplainService(db_session)
+            result1 = service.generate_explanation(
+                question_id=first.id, user_answer="B", is_correct=False, attempt_answer_id=attempt_answer.id
+            )
+            result2 = service.generate_explanation(question_id=second.id, user_answer=" B ", is_correct=False)
+
+        assert mock_llm.call_count == 1
+        assert result2["id"] == result1["id"]
+        assert result2["question_id"] == second.id
+        assert result2["attempt_answer_id"] is None
+        assert result2["user_answer_summary"]["user_answer_text"] == " B "
+
+    def test_wrong_answer_is_part_of_key(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Incorrect explanations are per wrong answer; correct explanations ignore the answer."""
+        from src.backend.services.explain_service import ExplainService
+
+        first = create_test_question(db_session, test_session_round1_fixture)
+        second = create_test_question(db_session, test_session_round1_fixture)
+
+        with patch.object(
+            ExplainService, "_generate_with_llm", return_value=(self.MOCK_LLM_RESPONSE, False, None)
+        ) as mock_llm:
+            service = ExplainService(db_session)
+            wrong_b = service.generate_explanation(question_id=first.id, user_answer="B", is_correct=False)
+            wrong_c = service.generate_explanation(question_id=first.id, user_answer="C", is_correct=False)
+            assert mock_llm.call_count == 2
+
+            service.generate_explanation(question_id=first.id, user_answer="A", is_correct=True)
+            service.generate_explanation(question_id=second.id, user_answer="a", is_correct=True)
+            assert mock_llm.call_count == 3
+
+        assert wrong_b["id"] != wrong_c["id"]
+
+    def test_correctness_is_part_of_key(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Correct and incorrect explanations for the same content are separate."""
+        from src.backend.services.explain_service import ExplainService
+
+        question = create_test_question(db_session, test_session_round1_fixture)
+
+        with patch.object(
+            ExplainService, "_generate_with_llm", return_value=(self.MOCK_LLM_RESPONSE, False, None)
+        ) as mock_llm:
+            service = ExplainService(db_session)
+            service.generate_explanation(question_id=question.id, user_answer="A", is_correct=True)
+            service.generate_explanation(question_id=question.id, user_answer="B", is_correct=False)
+
+        assert mock_llm.call_count == 2
+
+    def test_hot_lookup_skips_db_tier(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """After generation, lookups are served from the in-process LRU."""
+        from src.backend.services.explain_service import ExplainService
+        from src.backend.services.explanation_cache import explanation_cache
+
+        question = create_test_question(db_session, test_session_round1_fixture)
+
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(self.MOCK_LLM_RESPONSE, False, None)):
+            service = ExplainService(db_session)
+            service.generate_explanation(question_id=question.id, user_answer="A", is_correct=True)
+
+        with patch.object(ExplainService, "_load_cached_explanation") as mock_db_tier:
+            result = service.generate_explanation(question_id=question.id, user_answer="A", is_correct=True)
+
+        mock_db_tier.assert_not_called()
+        assert result["explanation_text"] == self.MOCK_LLM_RESPONSE["explanation"]
+        assert explanation_cache.stats()["hits"] == 1
+
+    def test_legacy_row_is_backfilled(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Rows without content_hash are found by question_id and get their hash set."""
+        from src.backend.models.answer_explanation import AnswerExplanation
+        from src.backend.services.explain_service import ExplainService
+
+        question = create_test_question(db_session, test_session_round1_fixture)
+        legacy = AnswerExplanation(
+            question_id=question.id,
+            explanation_text=self.MOCK_LLM_RESPONSE["explanation"],
+            reference_links=self.MOCK_LLM_RESPONSE["reference_links"],
+            is_correct=True,
+        )
+        db_session.add(legacy)
+        db_session.commit()
+
+        with patch.object(ExplainService, "_generate_with_llm") as mock_llm:
+            result = ExplainService(db_session).generate_explanation(
+                question_id=question.id, user_answer="A", is_correct=True
+            )
+
+        mock_llm.assert_not_called()
+        assert result["id"] == legacy.id
+        db_session.refresh(legacy)
+        assert legacy.content_hash is not None
+
+    def test_fallback_is_not_shared(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Fallback (mock) explanations stay per question."""
+        from src.backend.services.explain_service import ExplainService
+
+        first = create_test_question(db_session, test_session_round1_fixture)
+        second = create_test_question(db_session, test_session_round1_fixture)
+
+        with patch.object(
+            ExplainService, "_generate_with_llm", return_value=(self.MOCK_LLM_RESPONSE, True, "LLM down")
+        ) as mock_llm:
+            service = ExplainService(db_session)
+            service.generate_explanation(question_id=first.id, user_answer="A", is_correct=True)
+            result = service.generate_explanation(question_id=second.id, user_answer="A", is_correct=True)
+
+        assert mock_llm.call_count == 2
+        assert result["question_id"] == second.id
+
+    def test_content_key_normalization(self) -> None:
+        """Whitespace/Unicode width differences share a key; content differences don't."""
+        from src.backend.services.explanation_cache import explanation_content_key
+
+        base = explanation_content_key("RAG란  무엇인가?", ["A", "B"], "A", "AI", True)
+
+        assert explanation_content_key(" RAG란 무엇인가?\n", ["A ", "B"], "A", "AI", True) == base
+        assert explanation_content_key("ＲＡＧ란 무엇인가?", ["A", "B"], "A", "AI", True) == base
+        assert explanation_content_key("RAG란 무엇인가?", ["B", "A"], "A", "AI", True) != base
+        assert explanation_content_key("RAG란 무엇인가?", ["A", "B"], "B", "AI", True) != base
+        assert explanation_content_key("RAG란 무엇인가?", ["A", "B"], "A", "AI", False) != base
+        assert explanation_content_key("RAG란 무엇인가?", ["A", "B"], "A", "AI", True, "B") == base
+
+        wrong = explanation_content_key("RAG란 무엇인가?", ["A", "B"], "A", "AI", False, {"selected_key": "B"})
+        assert explanation_content_key("RAG란 무엇인가?", ["A", "B"], "A", "AI", False, {"selected_key": " B"}) == wrong
+        assert explanation_content_key("RAG란 무엇인가?", ["A", "B"], "A", "AI", False, {"selected_key": "C"}) != wrong
+
+
+class TestBatchedSessionExplanations:
+    """REQ-B-B3-Explain-2: Explain a session's questions with batched LLM prompts."""
+
+    MOCK_LLM_RESPONSE = {
+        "explanation": "문항별로 생성된 배치 해설입니다. " * 30,
+        "reference_links": [
+            {"title": "Link 1", "url": "https://example.com/1"},
+            {"title": "Link 2", "url": "https://example.com/2"},
+            {"title": "Link 3", "url": "https://example.com/3"},
+        ],
+    }
+
+    @staticmethod
+    def _items(answers: list) -> list[tuple]:
+        return [(answer.question_id, answer.user_answer, answer.is_correct, answer.id) for answer in answers]
+
+    @staticmethod
+    def _batch_llm(entries: list[dict[str, Any]]) -> Any:  # noqa: ANN401
+        from unittest.mock import AsyncMock, MagicMock
+
+        from langchain_core.messages import AIMessage
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=AIMessage(content=json.dumps(entries, ensure_ascii=False)))
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_one_llm_call_per_chunk(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """5 uncached questions with batch_size=3 → 2 LLM calls, results in item order."""
+        from unittest.mock import AsyncMock
+
+        from src.backend.services.explain_service import ExplainService
+
+        llm = self._batch_llm([{"index": i, **self.MOCK_LLM_RESPONSE} for i in range(1, 4)])
+
+        with (
+            patch("src.backend.services.explain_service.create_llm", return_value=llm),
+            patch.object(ExplainService, "_agenerate_with_gemini", new=AsyncMock()) as mock_single,
+        ):
+            results = await ExplainService(db_session).agenerate_session_explanations(
+                self._items(attempt_answers_for_session), batch_size=3
+            )
+
+        assert llm.ainvoke.await_count == 2
+        mock_single.assert_not_awaited()
+        assert [result["question_id"] for result in results] == [a.question_id for a in attempt_answers_for_session]
+        assert not any(result["is_fallback"] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_missing_or_invalid_items_fall_back_individually(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Only items the batch response doesn't cover are regenerated one by one."""
+        from unittest.mock import AsyncMock
+
+        from src.backend.services.explain_service import ExplainService
+
+        llm = self._batch_llm(
+            [
+                {"index": 1, **self.MOCK_LLM_RESPONSE},
+                {"index": 2, "explanation": "너무 짧음", "reference_links": []},
+                {"index": 4, **self.MOCK_LLM_RESPONSE},
+                {"index": 5, **self.MOCK_LLM_RESPONSE},
+            ]
+        )
+
+        with (
+            patch("src.backend.services.explain_service.create_llm", return_value=llm),
+            patch.object(
+                ExplainService, "_agenerate_with_gemini", new=AsyncMock(return_value=self.MOCK_LLM_RESPONSE)
+            ) as mock_single,
+        ):
+            results = await ExplainService(db_session).agenerate_session_explanations(
+                self._items(attempt_answers_for_session), batch_size=5
+            )
+
+        assert llm.ainvoke.await_count == 1
+        assert mock_single.await_count == 2
+        assert all(result is not None for result in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_disabled_by_default(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Without EXPLANATION_BATCH_ENABLED every question gets its own LLM call."""
+        import os
+        from unittest.mock import AsyncMock
+
+        from src.backend.services.explain_service import ExplainService
+
+        with (
+            patch.dict(os.environ, {"EXPLANATION_BATCH_ENABLED": "False"}),
+            patch.object(
+                ExplainService, "_agenerate_with_gemini", new=AsyncMock(return_value=self.MOCK_LLM_RESPONSE)
+            ) as mock_single,
+        ):
+            await ExplainService(db_session).agenerate_session_explanations(self._items(attempt_answers_for_session))
+
+        assert mock_single.await_count == 5
+
+    def test_parse_batch_response(self) -> None:
+        """Wrapped, duplicated and out-of-range entries are handled per item."""
+        from src.backend.services.explain_service import ExplainService
+
+        service = ExplainService.__new__(ExplainService)
+        response = json.dumps(
+            {
+                "explanations": [
+                    {"index": 2, **self.MOCK_LLM_RESPONSE},
+                    {"index": 2, "explanation": "중복", "reference_links": []},
+                    {"index": 9, **self.MOCK_LLM_RESPONSE},
+                    "not an object",
+                ]
+            },
+            ensure_ascii=False,
+        )
+
+        results = service._parse_batch_llm_response(f"```json\n{response}\n```", 3)
+
+        assert results[0] is None
+        assert results[1] == self.MOCK_LLM_RESPONSE
+        assert results[2] is None
+        assert service._parse_batch_llm_response("not json at all", 2) == [None, None]
@@ -0,0 +1,179 @@
+"""
+Tests for shared explanation execution resources and async explanation generation.
+
+REQ: REQ-B-B3-Explain-2
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.test_session import TestSession
+from src.backend.services.explain_service import ExplainService
+from src.backend.services.explanation_executor import ExplanationExecutor
+
+MOCK_LLM_RESPONSE = {
+    "explanation": "비동기로 생성된 해설입니다. " * 30,
+    "reference_links": [
+        {"title": "Link 1", "url": "https://example.com/1"},
+        {"title": "Link 2", "url": "https://example.com/2"},
+        {"title": "Link 3", "url": "https://example.com/3"},
+    ],
+}
+
+request_tag: contextvars.ContextVar[str] = contextvars.ContextVar("request_tag", default="")
+
+
+class TestExplanationExecutor:
+    """Tests for ExplanationExecutor."""
+
+    def test_llm_slot_limits_threads(self) -> None:
+        """Blocking callers never exceed max_concurrency."""
+        executor = ExplanationExecutor(max_concurrency=2)
+
+        def call() -> None:
+            with executor.llm_slot():
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        stats = executor.stats()
+        assert (stats["max_concurrency"], stats["in_flight"], stats["peak_in_flight"]) == (2, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_allm_slot_limits_tasks(self) -> None:
+        """Async callers share the same limit without blocking the event loop."""
+        executor = ExplanationExecutor(max_concurrency=2)
+
+        async def call() -> None:
+            async with executor.allm_slot():
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert executor.stats()["peak_in_flight"] == 2
+        assert executor.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_throttled_call_shrinks_limit(self) -> None:
+        """429 / timeout inside a slot backs the shared limit off (AIMD)."""
+        executor = ExplanationExecutor(max_concurrency=4)
+
+        with pytest.raises(TimeoutError):
+            async with executor.allm_slot():
+                raise TimeoutError("LLM timeout")
+
+        assert executor.stats()["limit"] == 2
+        assert executor.stats()["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_db_propagates_context(self) -> None:
+        """Context variables (e.g. query counters) are visible in the DB thread."""
+        executor = ExplanationExecutor(max_concurrency=1)
+        request_tag.set("req-1")
+
+        assert await executor.run_db(request_tag.get) == "req-1"
+
+
+class TestAsyncExplanationGeneration:
+    """Tests for ExplainService.agenerate_explanation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generation_keeps_order_and_caches(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Concurrent calls on one service return in order; repeats are served from cache."""
+        service = ExplainService(db_session)
+        answers = attempt_answers_for_session
+
+        async def explain_all() -> list[dict]:
+            return await asyncio.gather(
+                *(
+                    service.agenerate_explanation(
+                        question_id=answer.question_id,
+                        user_answer=answer.user_answer,
+                        is_correct=answer.is_correct,
+                        attempt_answer_id=answer.id,
+                    )
+                    for answer in answers
+                )
+            )
+
+        with patch.object(
+            ExplainService, "_agenerate_with_gemini", new=AsyncMock(return_value=MOCK_LLM_RESPONSE)
+        ) as mock_llm:
+            results = await explain_all()
+            assert mock_llm.await_count == 5
+
+            repeated = await explain_all()
+            assert mock_llm.await_count == 5
+
+        assert [result["question_id"] for result in results] == [answer.question_id for answer in answers]
+        assert [result["id"] for result in repeated] == [result["id"] for result in results]
+        assert not any(result["is_fallback"] for result in results)
+        assert db_session.query(AnswerExplanation).count() == 5
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """LLM errors produce a fallback explanation, like the sync path."""
+        answer = attempt_answers_for_session[0]
+
+        with patch.object(
+            ExplainService, "_agenerate_with_gemini", new=AsyncMock(side_effect=TimeoutError("LLM timeout"))
+        ):
+            result = await ExplainService(db_session).agenerate_explanation(
+                question_id=answer.question_id, user_answer=answer.user_answer, is_correct=answer.is_correct
+            )
+
+        assert result["is_fallback"] is True
+        assert result["error_message"] == "LLM timeout"
+        assert len(result["reference_links"]) >= 3
+
+
+class TestSessionExplanationsEndpoint:
+    """Tests for GET /questions/explanations/session/{session_id}."""
+
+    def test_returns_explanation_per_answered_question(
+        self,
+        client: TestClient,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Every answered question gets one explanation (LLM calls run concurrently)."""
+        with patch.object(
+            ExplainService, "_agenerate_with_gemini", new=AsyncMock(return_value=MOCK_LLM_RESPONSE)
+        ) as mock_llm:
+            response = client.get(f"/questions/explanations/session/{test_session_round1_fixture.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["answered_count"] == 5
+        assert sorted(item["question_id"] for item in data["explanations"]) == sorted(
+            answer.question_id for answer in attempt_answers_for_session
+        )
+        assert mock_llm.await_count == 5
+
+    def test_unknown_session_returns_404(self, client: TestClient) -> None:
+        """Unknown session id is rejected before any explanation work."""
+        response = client.get("/questions/explanations/session/does-not-exist")
+
+        assert response.status_code == 404
@@ -0,0 +1,129 @@
+"""
+Tests for explanation pre-generation after round scoring.
+
+REQ: REQ-B-B3-Explain-2
+"""
+
+import os
+import threading
+from concurrent.futures import wait
+from typing import Any
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.test_session import TestSession
+from src.backend.services.explain_service import ExplainService
+from src.backend.services.explanation_pregen import ExplanationPregenerator, schedule_explanation_pregeneration
+from src.backend.services.scoring_service import ScoringService
+
+MOCK_LLM_RESPONSE = {
+    "explanation": "사전 생성된 해설입니다. " * 30,
+    "reference_links": [
+        {"title": "Link 1", "url": "https://example.com/1"},
+        {"title": "Link 2", "url": "https://example.com/2"},
+        {"title": "Link 3", "url": "https://example.com/3"},
+    ],
+}
+
+
+class TestExplanationPregenerator:
+    """Tests for ExplanationPregenerator."""
+
+    def test_pregenerated_explanations_are_served_from_cache(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Every answer gets an explanation; later lookups don't call the LLM."""
+        pregenerator = ExplanationPregenerator(max_workers=2)
+
+        with patch.object(
+            ExplainService, "_generate_with_llm", return_value=(MOCK_LLM_RESPONSE, False, None)
+        ) as mock_llm:
+            futures = pregenerator.schedule_session(test_session_round1_fixture.id, db_session)
+            wait(futures, timeout=10)
+            assert mock_llm.call_count == 5
+
+            answer = attempt_answers_for_session[1]
+            ExplainService(db_session).generate_explanation(
+                question_id=answer.question_id, user_answer=answer.user_answer, is_correct=answer.is_correct
+            )
+            assert mock_llm.call_count == 5
+
+        assert db_session.query(AnswerExplanation).count() == 5
+        assert pregenerator.stats() == {"in_flight_sessions": 0, "generated": 5, "failed": 0}
+
+    def test_session_scheduled_once_while_in_flight(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Re-scoring while tasks run returns the same futures; wait_for_session is bounded."""
+        pregenerator = ExplanationPregenerator(max_workers=2)
+        release = threading.Event()
+
+        def slow_generate(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            release.wait(timeout=10)
+
+        with patch.object(pregenerator, "_generate", side_effect=slow_generate):
+            futures = pregenerator.schedule_session(test_session_round1_fixture.id, db_session)
+            assert pregenerator.schedule_session(test_session_round1_fixture.id, db_session) == futures
+            assert pregenerator.wait_for_session(test_session_round1_fixture.id, timeout=0.05) is False
+
+            release.set()
+            assert pregenerator.wait_for_session(test_session_round1_fixture.id, timeout=10) is True
+
+        wait(futures, timeout=10)
+        assert pregenerator.stats()["in_flight_sessions"] == 0
+
+    def test_generation_failure_is_contained(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Errors are counted and logged, never raised to the scheduler."""
+        pregenerator = ExplanationPregenerator(max_workers=2)
+
+        with patch.object(ExplainService, "generate_explanation", side_effect=ValueError("boom")):
+            futures = pregenerator.schedule_session(test_session_round1_fixture.id, db_session)
+            wait(futures, timeout=10)
+
+        assert all(future.exception() is None for future in futures)
+        assert pregenerator.stats()["failed"] == 5
+
+
+class TestScoringTrigger:
+    """Tests for scheduling from ScoringService.save_round_result."""
+
+    def test_disabled_by_default(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Without EXPLANATION_PREGEN_ENABLED nothing is scheduled."""
+        with patch.dict(os.environ, {"EXPLANATION_PREGEN_ENABLED": "False"}):
+            assert schedule_explanation_pregeneration(test_session_round1_fixture.id, db_session) == []
+
+    def test_save_round_result_schedules_session(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Scoring a round schedules pre-generation for its session."""
+        pregenerator = ExplanationPregenerator(max_workers=2)
+
+        with (
+            patch.dict(os.environ, {"EXPLANATION_PREGEN_ENABLED": "True"}),
+            patch("src.backend.services.explanation_pregen.explanation_pregenerator", pregenerator),
+            patch.object(pregenerator, "schedule_session", return_value=[]) as mock_schedule,
+        ):
+            ScoringService(db_session).save_round_result(test_session_round1_fixture.id, 1)
+
+        mock_schedule.assert_called_once_with(test_session_round1_fixture.id, db_session)
@@ -0,0 +1,101 @@
+"""
+Tests for the streaming explanation endpoint (Server-Sent Events).
+
+REQ: REQ-B-B3-Explain-1
+"""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.agent.llm_fake import ScriptedChatModel
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.test_session import TestSession
+
+
+def parse_sse(body: str) -> list[tuple[str, Any]]:
+    """Split SSE body into (event, data) pairs."""
+    events = []
+    for message in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in message.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def stream_request(client: TestClient, answer: Any) -> Any:  # noqa: ANN401
+    """POST the stream endpoint for an attempt answer."""
+    return client.post(
+        "/questions/explanations/stream",
+        json={"question_id": answer.question_id, "user_answer": answer.user_answer, "is_correct": answer.is_correct},
+    )
+
+
+class TestStreamExplanation:
+    """Tests for POST /questions/explanations/stream."""
+
+    def test_streams_deltas_then_saved_explanation(
+        self,
+        client: TestClient,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Explanation text arrives in several deltas; done carries the saved explanation."""
+        with patch("src.backend.services.explain_service.create_llm", return_value=ScriptedChatModel()):
+            response = stream_request(client, attempt_answers_for_session[0])
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        deltas = [data["text"] for event, data in events if event == "delta"]
+        event, done = events[-1]
+
+        assert event == "done"
+        assert len(deltas) > 1
+        assert "".join(deltas) == done["explanation_text"]
+        assert done["is_fallback"] is False
+        assert len(done["reference_links"]) == 3
+        assert db_session.query(AnswerExplanation).count() == 1
+
+    def test_cached_explanation_streams_without_llm(
+        self,
+        client: TestClient,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """Second request is served from cache: one delta, then done."""
+        answer = attempt_answers_for_session[0]
+        with patch("src.backend.services.explain_service.create_llm", return_value=ScriptedChatModel()):
+            first = parse_sse(stream_request(client, answer).text)
+
+        with patch("src.backend.services.explain_service.create_llm") as mock_llm:
+            events = parse_sse(stream_request(client, answer).text)
+
+        mock_llm.assert_not_called()
+        assert [event for event, _ in events] == ["delta", "done"]
+        assert events[1][1]["id"] == first[-1][1]["id"]
+
+    def test_llm_failure_streams_fallback(
+        self,
+        client: TestClient,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list,
+    ) -> None:
+        """LLM errors produce the fallback explanation through the same stream."""
+        with patch("src.backend.services.explain_service.create_llm", side_effect=TimeoutError("LLM timeout")):
+            events = parse_sse(stream_request(client, attempt_answers_for_session[0]).text)
+
+        assert [event for event, _ in events] == ["delta", "done"]
+        assert events[1][1]["is_fallback"] is True
+
+    def test_unknown_question_returns_404(self, client: TestClient) -> None:
+        """Lookup errors are returned as HTTP errors before the stream starts."""
+        response = client.post(
+            "/questions/explanations/stream",
+            json={"question_id": "missing", "user_answer": "A", "is_correct": True},
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,134 @@
+"""
+Tests for streaming bulk export (ExportService and GET /export/{dataset}).
+
+REQ: REQ-B-B5-1, REQ-B-B5-3
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.backend.models import Attempt, AttemptRound, TestResult, User, UserProfileSurvey
+from src.backend.services.export_service import ExportService
+
+
+def parse_ndjson(data: bytes) -> list[dict]:
+    """Parse NDJSON payload into row dicts."""
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+@pytest.fixture
+def attempts_for_two_users(
+    db_session: Session,
+    authenticated_user: User,
+    user_fixture: User,
+    user_profile_survey_fixture: UserProfileSurvey,
+    create_attempt: Callable[..., Attempt],
+    create_attempt_round: Callable[..., AttemptRound],
+) -> None:
+    """Create 2 attempts for the authenticated user (2 rounds, no rounds) and 1 for another user (1 round)."""
+    first = create_attempt(authenticated_user.id, user_profile_survey_fixture.id, days_ago=3)
+    create_attempt_round(first.id, round_idx=1, score=60.0)
+    create_attempt_round(first.id, round_idx=2, score=80.0)
+    create_attempt(authenticated_user.id, user_profile_survey_fixture.id, days_ago=1)
+    other = create_attempt(user_fixture.id, user_profile_survey_fixture.id)
+    create_attempt_round(other.id, round_idx=1, score=90.0)
+
+
+class TestExportService:
+    """Tests for ExportService."""
+
+    def test_attempts_ndjson_one_row_per_round(
+        self, db_session: Session, authenticated_user: User, attempts_for_two_users: None
+    ) -> None:
+        """Attempts are joined with rounds; attempts without rounds keep one row."""
+        rows = parse_ndjson(b"".join(ExportService(db_session).stream("attempts", user_id=authenticated_user.id)))
+
+        assert len(rows) == 3
+        assert {row["user_id"] for row in rows} == {authenticated_user.id}
+        assert sorted(row["round_idx"] for row in rows if row["round_idx"] is not None) == [1, 2]
+        assert sum(row["round_idx"] is None for row in rows) == 1
+
+    def test_chunks_follow_batch_size(self, db_session: Session, attempts_for_two_users: None) -> None:
+        """Rows are streamed in batch_size chunks, not as one buffered body."""
+        chunks = list(ExportService(db_session, batch_size=2).stream("attempts"))
+
+        assert [len(parse_ndjson(chunk)) for chunk in chunks] == [2, 2]
+
+    def test_csv_header_and_json_columns(
+        self, db_session: Session, attempt_answers_for_session: list, authenticated_user: User
+    ) -> None:
+        """CSV starts with the column header; JSON columns are written as JSON text."""
+        service = ExportService(db_session)
+        reader = csv.DictReader(io.StringIO(b"".join(service.stream("answers", "csv")).decode()))
+        rows = list(reader)
+
+        assert reader.fieldnames == service.columns("answers")
+        assert len(rows) == 5
+        assert {row["user_id"] for row in rows} == {str(authenticated_user.id)}
+        assert all(json.loads(row["user_answer"]).keys() == {"selected_key"} for row in rows)
+
+    def test_results_and_empty_csv(
+        self, db_session: Session, test_result_low_score: TestResult, user_fixture: User
+    ) -> None:
+        """Results rows carry the session's user; an empty export still has a CSV header."""
+        service = ExportService(db_session)
+
+        rows = parse_ndjson(b"".join(service.stream("results")))
+        empty = b"".join(service.stream("results", "csv", user_id=user_fixture.id)).decode()
+
+        assert len(rows) == 1
+        assert rows[0]["score"] == test_result_low_score.score
+        assert empty.splitlines() == [",".join(service.columns("results"))]
+
+    def test_unknown_dataset_or_format(self, db_session: Session) -> None:
+        """Invalid parameters fail before streaming starts."""
+        service = ExportService(db_session)
+
+        with pytest.raises(ValueError, match="Unknown export dataset"):
+            service.stream("users")
+        with pytest.raises(ValueError, match="Unknown export format"):
+            service.stream("attempts", "xlsx")
+
+
+class TestExportEndpoint:
+    """Tests for GET /export/{dataset}."""
+
+    def test_streams_own_rows_by_default(
+        self, client: TestClient, authenticated_user: User, attempts_for_two_users: None
+    ) -> None:
+        """Users not on the allowlist get only their own rows."""
+        response = client.get("/export/attempts")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="attempts.ndjson"' in response.headers["content-disposition"]
+        assert {row["user_id"] for row in parse_ndjson(response.content)} == {authenticated_user.id}
+
+    def test_other_user_requires_allowlist(
+        self,
+        client: TestClient,
+        authenticated_user: User,
+        user_fixture: User,
+        attempts_for_two_users: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Exporting another user's rows is 403 unless the caller is on EXPORT_ALLOWED_KNOX_IDS."""
+        assert client.get(f"/export/attempts?user_id={user_fixture.id}").status_code == 403
+
+        monkeypatch.setenv("EXPORT_ALLOWED_KNOX_IDS", f"someone_else, {authenticated_user.knox_id}")
+        all_rows = parse_ndjson(client.get("/export/attempts").content)
+        other = client.get(f"/export/attempts?user_id={user_fixture.id}&format=csv")
+
+        assert {row["user_id"] for row in all_rows} == {authenticated_user.id, user_fixture.id}
+        assert other.headers["content-type"].startswith("text/csv")
+        assert len(other.text.splitlines()) == 2  # header + 1 round
+
+    def test_unknown_dataset(self, client: TestClient) -> None:
+        """Unknown dataset is rejected by validation."""
+        assert client.get("/export/users").status_code == 422
@@ -252,6 +252,103 @@ class TestRetryAPI:
         assert total == 3
 
 
+class TestHistoryPagination:
+    """Test REQ-B-B5-3: keyset pagination and single-round-trip history queries."""
+
+    def test_keyset_pages_cover_all_attempts_once(
+        self, db_session: Session, user_fixture, user_profile_survey_fixture, create_attempt
+    ):
+        """
+        Keyset pages return every attempt once, newest first.
+
+        Given: 5 completed attempts, two of them finished at the same instant
+        When: Pages of 2 are fetched by following next_cursor
+        Then: Every attempt appears exactly once, newest first; last page has no cursor
+        """
+        attempts = [create_attempt(user_fixture.id, user_profile_survey_fixture.id, days_ago=i) for i in range(5)]
+        attempts[2].finished_at = attempts[1].finished_at
+        db_session.commit()
+
+        history_service = HistoryService(db_session)
+        seen: list[str] = []
+        cursor = None
+        for _ in range(3):
+            page = history_service.list_user_attempts_page(user_fixture.id, limit=2, cursor=cursor)
+            seen.extend(a.id for a in page.attempts)
+            cursor = page.next_cursor
+
+        assert cursor is None
+        assert sorted(seen) == sorted(a.id for a in attempts)
+        assert seen[0] == attempts[0].id
+        assert seen[-1] == attempts[4].id
+
+    def test_total_count_in_same_query(
+        self, db_session: Session, user_fixture, user_profile_survey_fixture, create_attempt, sql_statements
+    ):
+        """
+        Total count comes with the page query.
+
+        Given: 3 completed attempts and 1 in progress
+        When: Pages are fetched with include_total / via list_user_attempts
+        Then: Total counts completed attempts only, with one query per page
+        """
+        for i in range(3):
+            create_attempt(user_fixture.id, user_profile_survey_fixture.id, days_ago=i)
+        create_attempt(user_fixture.id, user_profile_survey_fixture.id, status="in_progress")
+        user_id = user_fixture.id
+        history_service = HistoryService(db_session)
+        sql_statements.clear()
+
+        first = history_service.list_user_attempts_page(user_id, limit=2, include_total=True)
+        second = history_service.list_user_attempts_page(user_id, limit=2, cursor=first.next_cursor, include_total=True)
+        attempts, total = history_service.list_user_attempts(user_id, limit=2, offset=2)
+
+        assert (first.total_count, second.total_count, total) == (3, 3, 3)
+        assert len(second.attempts) == len(attempts) == 1
+        assert len(sql_statements) == 3
+        assert history_service.list_user_attempts_page(user_id).total_count is None
+        assert history_service.list_user_attempts(user_id, limit=2, offset=10) == ([], 3)
+
+    def test_invalid_cursor(self, db_session: Session, user_fixture):
+        """Malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            HistoryService(db_session).list_user_attempts_page(user_fixture.id, cursor="not-a-cursor")
+
+    def test_attempt_details_single_query(
+        self,
+        db_session: Session,
+        user_fixture,
+        user_profile_survey_fixture,
+        create_attempt,
+        create_attempt_round,
+        sql_statements,
+    ):
+        """
+        Attempt details load with rounds in one query.
+
+        Given: Attempt with 2 rounds and attempt without rounds
+        When: get_attempt_details() called
+        Then: Rounds are ordered by round_idx and each call is one query
+        """
+        attempt = create_attempt(user_fixture.id, user_profile_survey_fixture.id)
+        create_attempt_round(attempt.id, round_idx=2, score=80.0)
+        create_attempt_round(attempt.id, round_idx=1, score=60.0)
+        empty = create_attempt(user_fixture.id, user_profile_survey_fixture.id, days_ago=1)
+        attempt_id, empty_id = attempt.id, empty.id
+        history_service = HistoryService(db_session)
+        sql_statements.clear()
+
+        details = history_service.get_attempt_details(attempt_id)
+        empty_details = history_service.get_attempt_details(empty_id)
+
+        assert [r["round_idx"] for r in details["rounds"]] == [1, 2]
+        assert details["attempt_id"] == attempt_id
+        assert empty_details["rounds"] == []
+        assert len(sql_statements) == 2
+        with pytest.raises(ValueError, match="not found"):
+            history_service.get_attempt_details("missing")
+
+
 class TestPreviousSurvey:
     """Test REQ-B-B5-4: Load previous survey."""
 
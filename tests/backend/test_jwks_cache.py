@@ -0,0 +1,164 @@
+"""
+Tests for the JWKS signing key cache and ID token signature verification.
+
+REQ: REQ-B-A1-3
+"""
+
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from src.backend.services.auth_service import OIDCAuthService
+from src.backend.services.jwks_cache import JWKSCache
+
+TENANT_ID = "test_tenant_id"
+CLIENT_ID = "test_client_id"
+
+
+def make_key(kid: str) -> tuple[rsa.RSAPrivateKey, dict[str, Any]]:
+    """Generate RSA private key and its public JWK."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+def write_jwks(path: Path, *jwks: dict[str, Any]) -> str:
+    """Write local stand-in JWKS file."""
+    path.write_text(json.dumps({"keys": list(jwks)}), encoding="utf-8")
+    return str(path)
+
+
+def sign_id_token(private_key: rsa.RSAPrivateKey, kid: str | None) -> str:
+    """Sign Azure AD-like ID token with RS256 (no kid header if kid is None)."""
+    now = datetime.now(UTC)
+    claims = {
+        "iss": f"https://login.microsoftonline.com/{TENANT_ID}/v2.0",
+        "aud": CLIENT_ID,
+        "sub": "user-oid-1",
+        "email": "user@samsung.com",
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(hours=1)).timestamp()),
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid} if kid else None)
+
+
+@pytest.fixture
+def key_a() -> tuple[rsa.RSAPrivateKey, dict[str, Any]]:
+    """Signing key currently published by the IdP."""
+    return make_key("kid-a")
+
+
+class TestJWKSCache:
+    """Tests for JWKSCache."""
+
+    def test_keys_loaded_once(self, tmp_path: Path, key_a: tuple) -> None:
+        """Key set is read on first use; later lookups are served from memory."""
+        cache = JWKSCache(jwks_file=write_jwks(tmp_path / "jwks.json", key_a[1]))
+
+        first = cache.get_signing_key("kid-a")
+        second = cache.get_signing_key("kid-a")
+
+        assert first is second
+        assert cache.stats()["fetches"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_unknown_kid_refetches_rotated_keys(self, tmp_path: Path, key_a: tuple) -> None:
+        """A kid published after the last fetch is picked up by one refetch."""
+        path = tmp_path / "jwks.json"
+        cache = JWKSCache(min_refetch_seconds=0, jwks_file=write_jwks(path, key_a[1]))
+        cache.get_signing_key("kid-a")
+
+        _, jwk_b = make_key("kid-b")
+        write_jwks(path, key_a[1], jwk_b)
+
+        assert cache.get_signing_key("kid-b").key_id == "kid-b"
+        assert cache.stats()["fetches"] == 2
+
+    def test_unknown_kid_refetch_is_rate_limited(self, tmp_path: Path, key_a: tuple) -> None:
+        """Repeated unknown kids do not refetch within min_refetch_seconds."""
+        cache = JWKSCache(min_refetch_seconds=60, jwks_file=write_jwks(tmp_path / "jwks.json", key_a[1]))
+        cache.get_signing_key("kid-a")
+
+        for _ in range(3):
+            with pytest.raises(jwt.InvalidTokenError, match="Unknown signing key"):
+                cache.get_signing_key("forged")
+
+        assert cache.stats()["fetches"] == 1
+
+    def test_stale_keys_refresh_in_background(self, tmp_path: Path, key_a: tuple) -> None:
+        """Stale keys are still served while a background refresh runs; failures keep them."""
+        path = tmp_path / "jwks.json"
+        cache = JWKSCache(ttl_seconds=0.01, jwks_file=write_jwks(path, key_a[1]))
+        cache.get_signing_key("kid-a")
+        time.sleep(0.02)
+        path.unlink()
+
+        assert cache.get_signing_key("kid-a").key_id == "kid-a"
+        for _ in range(100):
+            if cache.stats()["fetch_errors"]:
+                break
+            time.sleep(0.01)
+
+        assert cache.stats()["fetch_errors"] == 1
+        assert cache.get_signing_key("kid-a").key_id == "kid-a"
+
+    def test_missing_file_raises_value_error(self, tmp_path: Path) -> None:
+        """Initial load failure is reported as ValueError."""
+        cache = JWKSCache(jwks_file=str(tmp_path / "missing.json"))
+
+        with pytest.raises(ValueError, match="Failed to read JWKS file"):
+            cache.get_jwks()
+
+
+class TestValidateIdTokenSignature:
+    """Tests for OIDCAuthService.validate_id_token with cached JWKS."""
+
+    @pytest.fixture
+    def oidc_settings(self) -> Any:  # noqa: ANN401
+        """Patch settings to a non-mock Azure AD app."""
+        with patch("src.backend.services.auth_service.settings") as mock_settings:
+            mock_settings.OIDC_CLIENT_ID = CLIENT_ID
+            mock_settings.OIDC_TENANT_ID = TENANT_ID
+            yield mock_settings
+
+    def test_valid_signature_without_network(self, oidc_settings: Any, tmp_path: Path, key_a: tuple) -> None:  # noqa: ANN401
+        """RS256 token signed by a published key validates against the cached key."""
+        cache = JWKSCache(jwks_file=write_jwks(tmp_path / "jwks.json", key_a[1]))
+
+        with (
+            patch("src.backend.services.auth_service.jwks_cache", cache),
+            patch("src.backend.services.jwks_cache.httpx.get") as mock_get,
+        ):
+            for _ in range(3):
+                claims = OIDCAuthService().validate_id_token(sign_id_token(key_a[0], "kid-a"))
+
+        assert claims["sub"] == "user-oid-1"
+        assert cache.stats()["fetches"] == 1
+        mock_get.assert_not_called()
+
+    def test_signature_by_other_key_is_rejected(self, oidc_settings: Any, tmp_path: Path, key_a: tuple) -> None:  # noqa: ANN401
+        """Token claiming a published kid but signed by another key is rejected."""
+        cache = JWKSCache(jwks_file=write_jwks(tmp_path / "jwks.json", key_a[1]))
+        forged_key, _ = make_key("kid-a")
+
+        with patch("src.backend.services.auth_service.jwks_cache", cache):
+            with pytest.raises(jwt.InvalidTokenError, match="Invalid ID token"):
+                OIDCAuthService().validate_id_token(sign_id_token(forged_key, "kid-a"))
+
+    def test_token_without_kid_is_rejected(self, oidc_settings: Any, tmp_path: Path, key_a: tuple) -> None:  # noqa: ANN401
+        """Outside mock mode, a token with no kid header cannot skip signature verification."""
+        cache = JWKSCache(jwks_file=write_jwks(tmp_path / "jwks.json", key_a[1]))
+        forged_key, _ = make_key("unused")
+
+        with patch("src.backend.services.auth_service.jwks_cache", cache):
+            with pytest.raises(jwt.InvalidTokenError, match="no kid"):
+                OIDCAuthService().validate_id_token(sign_id_token(forged_key, None))
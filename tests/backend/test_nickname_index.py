@@ -0,0 +1,137 @@
+"""
+Tests for the in-process nickname availability index.
+
+REQ: REQ-B-A2-1, REQ-B-A2-3
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.backend.models.user import User
+from src.backend.services.nickname_index import BloomFilter, NicknameIndex, nickname_index
+from src.backend.services.profile_service import ProfileService
+
+
+@pytest.fixture
+def index_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable the process-wide nickname index."""
+    monkeypatch.setenv("NICKNAME_INDEX_ENABLED", "true")
+
+
+def make_user(db_session: Session, knox_id: str, nickname: str | None = None) -> User:
+    """Create user with optional nickname."""
+    user = User(
+        knox_id=knox_id,
+        name=knox_id,
+        dept="Test",
+        business_unit="Test",
+        email=f"{knox_id}@example.com",
+        nickname=nickname,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_no_false_negatives_and_low_false_positive_rate(self) -> None:
+        """Added items are always found; unseen items rarely are."""
+        bloom = BloomFilter(capacity=1000)
+        for i in range(1000):
+            bloom.add(f"nick_{i}")
+
+        assert all(f"nick_{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+        assert false_positives < 300  # target 1%, allow slack
+
+
+class TestNicknameIndex:
+    """Tests for NicknameIndex."""
+
+    def test_unloaded_index_defers_to_db(self) -> None:
+        """contains() is None until loaded."""
+        index = NicknameIndex()
+
+        assert index.contains("alice") is None
+        assert index.taken_among(["alice"]) is None
+
+    def test_load_add_discard(self, db_session: Session) -> None:
+        """Loaded snapshot tracks committed changes."""
+        make_user(db_session, "u1", "alice")
+        index = NicknameIndex()
+        index.load(db_session)
+
+        assert index.contains("alice") is True
+        assert index.contains("bob") is False
+
+        index.add("bob")
+        index.discard("alice")
+
+        assert index.contains("bob") is True
+        assert index.contains("alice") is False
+        assert index.taken_among(["alice", "bob", "carol"]) == {"bob"}
+
+    def test_reload_after_refresh_interval(self, db_session: Session) -> None:
+        """Writes from other processes are picked up on the next refresh."""
+        index = NicknameIndex(refresh_seconds=0)
+        index.ensure_loaded(db_session)
+        make_user(db_session, "u1", "written_elsewhere")
+
+        index.ensure_loaded(db_session)
+
+        assert index.contains("written_elsewhere") is True
+
+
+class TestProfileServiceWithIndex:
+    """ProfileService answers nickname checks from the index when enabled."""
+
+    def test_free_nickname_checks_need_no_query(
+        self, index_enabled: None, db_session: Session, sql_statements: list[str]
+    ) -> None:
+        """After the index is loaded, checks while typing do not touch the users table."""
+        make_user(db_session, "u1", "alice")
+        service = ProfileService(db_session)
+        service.check_nickname_availability("a")
+        sql_statements.clear()
+
+        for typed in ("al", "ali", "alic", "alice2"):
+            assert service.check_nickname_availability(typed)["available"] is True
+
+        assert sql_statements == []
+        assert nickname_index.stats()["bloom_negatives"] >= 4
+
+    def test_taken_nickname_is_confirmed_by_db(self, index_enabled: None, db_session: Session) -> None:
+        """Index positives are confirmed in the DB; suggestions come from the index."""
+        make_user(db_session, "u1", "alice")
+        make_user(db_session, "u2", "alice_1")
+
+        result = ProfileService(db_session).check_nickname_availability("alice")
+
+        assert result == {"available": False, "suggestions": ["alice_2", "alice_3", "alice_4"]}
+
+    def test_register_and_edit_keep_index_consistent(self, index_enabled: None, db_session: Session) -> None:
+        """Registered nicknames become taken; edited-away nicknames become free."""
+        user = make_user(db_session, "u1")
+        service = ProfileService(db_session)
+
+        service.register_nickname(user.id, "first")
+        assert service.check_nickname_availability("first")["available"] is False
+
+        service.edit_nickname(user.id, "second")
+        assert service.check_nickname_availability("first")["available"] is True
+        assert nickname_index.contains("second") is True
+
+    def test_stale_index_still_rejects_duplicate(self, index_enabled: None, db_session: Session) -> None:
+        """Nickname taken after the snapshot is rejected by the UNIQUE constraint."""
+        user = make_user(db_session, "u1")
+        service = ProfileService(db_session)
+        service.check_nickname_availability("warmup")
+        make_user(db_session, "u2", "raced")  # not seen by the index
+
+        with pytest.raises(ValueError, match="already taken"):
+            service.register_nickname(user.id, "raced")
+
+        db_session.refresh(user)
+        assert user.nickname is None
@@ -0,0 +1,195 @@
+"""
+Tests for async OIDC token exchange on the shared pooled client and the async callback route.
+
+The IdP is stood in by pytest-httpx (token endpoint) and a local JWKS file (signing keys).
+
+REQ: REQ-B-A1-1, REQ-B-A1-2, REQ-B-A1-3
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi.testclient import TestClient
+from jwt.algorithms import RSAAlgorithm
+from pytest_httpx import HTTPXMock
+
+from src.backend.config import settings
+from src.backend.services.auth_service import OIDCAuthService
+from src.backend.services.jwks_cache import JWKSCache
+from src.backend.services.oidc_http_client import close_oidc_http_client, get_oidc_http_client
+
+TENANT_ID = "test_tenant_id"
+CLIENT_ID = "test_client_id"
+TOKEN_ENDPOINT = f"https://login.microsoftonline.com/{TENANT_ID}/oauth2/v2.0/token"
+
+
+@pytest.fixture
+def idp_settings() -> Any:  # noqa: ANN401
+    """Patch settings to a real (non-mock) Azure AD app."""
+    with patch("src.backend.services.auth_service.settings") as mock_settings:
+        mock_settings.JWT_ALGORITHM = settings.JWT_ALGORITHM
+        mock_settings.JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+        mock_settings.JWT_EXPIRATION_HOURS = settings.JWT_EXPIRATION_HOURS
+        mock_settings.OIDC_CLIENT_ID = CLIENT_ID
+        mock_settings.OIDC_CLIENT_SECRET = "test_client_secret"
+        mock_settings.OIDC_TENANT_ID = TENANT_ID
+        mock_settings.OIDC_REDIRECT_URI = "http://localhost:3000/auth/callback"
+        mock_settings.OIDC_TOKEN_ENDPOINT = TOKEN_ENDPOINT
+        yield mock_settings
+
+
+@pytest.fixture
+def idp_signing_key(tmp_path: Path) -> Any:  # noqa: ANN401
+    """RSA key published through a local JWKS file; yields the private key."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": "idp-key", "use": "sig", "alg": "RS256"})
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps({"keys": [jwk]}), encoding="utf-8")
+
+    with patch("src.backend.services.auth_service.jwks_cache", JWKSCache(jwks_file=str(jwks_file))):
+        yield private_key
+
+
+def issue_id_token(private_key: rsa.RSAPrivateKey, sub: str) -> str:
+    """Sign ID token the way Azure AD does (RS256 with kid)."""
+    now = datetime.now(UTC)
+    claims = {
+        "iss": f"https://login.microsoftonline.com/{TENANT_ID}/v2.0",
+        "aud": CLIENT_ID,
+        "sub": sub,
+        "name": "OIDC User",
+        "email": f"{sub}@samsung.com",
+        "dept": "AI Lab",
+        "business_unit": "Research",
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(hours=1)).timestamp()),
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": "idp-key"})
+
+
+class TestAsyncTokenExchange:
+    """Tests for OIDCAuthService.aexchange_code_for_tokens."""
+
+    @pytest.mark.asyncio
+    async def test_exchange_posts_pkce_form_on_shared_client(self, idp_settings: Any, httpx_mock: HTTPXMock) -> None:  # noqa: ANN401
+        """Token request carries the PKCE form; consecutive logins reuse one pooled client."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                method="POST", url=TOKEN_ENDPOINT, json={"access_token": "at", "id_token": "it", "token_type": "Bearer"}
+            )
+        service = OIDCAuthService()
+
+        client = get_oidc_http_client()
+        tokens = await service.aexchange_code_for_tokens("code-1", "verifier-1")
+        await service.aexchange_code_for_tokens("code-2", "verifier-2")
+
+        assert tokens["id_token"] == "it"
+        assert get_oidc_http_client() is client
+        form = parse_qs(httpx_mock.get_requests()[0].content.decode())
+        assert form["code"] == ["code-1"]
+        assert form["code_verifier"] == ["verifier-1"]
+        assert form["grant_type"] == ["authorization_code"]
+        await close_oidc_http_client()
+
+    @pytest.mark.asyncio
+    async def test_idp_error_raises_value_error(self, idp_settings: Any, httpx_mock: HTTPXMock) -> None:  # noqa: ANN401
+        """IdP rejections and network failures surface as ValueError, like the sync path."""
+        httpx_mock.add_response(method="POST", url=TOKEN_ENDPOINT, status_code=400, json={"error": "invalid_grant"})
+        httpx_mock.add_exception(httpx.ConnectError("connection refused"), method="POST", url=TOKEN_ENDPOINT)
+        service = OIDCAuthService()
+
+        with pytest.raises(ValueError, match="Token exchange failed"):
+            await service.aexchange_code_for_tokens("bad-code", "verifier")
+        with pytest.raises(ValueError, match="Token exchange request failed"):
+            await service.aexchange_code_for_tokens("code", "verifier")
+        await close_oidc_http_client()
+
+    def test_client_is_not_shared_across_event_loops(self) -> None:
+        """A client bound to a finished loop is replaced, not reused."""
+
+        async def get_client() -> httpx.AsyncClient:
+            return get_oidc_http_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+
+class TestAsyncOIDCCallback:
+    """End-to-end POST /auth/oidc/callback against the IdP stand-in."""
+
+    def test_login_then_relogin(
+        self,
+        client: TestClient,
+        idp_settings: Any,  # noqa: ANN401
+        idp_signing_key: rsa.RSAPrivateKey,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """First login creates the user (201), second login finds it (200); JWT cookie is set."""
+        id_token = issue_id_token(idp_signing_key, "oidc-user-1")
+        for _ in range(2):
+            httpx_mock.add_response(
+                method="POST", url=TOKEN_ENDPOINT, json={"access_token": "at", "id_token": id_token}
+            )
+
+        first = client.post("/auth/oidc/callback", json={"code": "c1", "code_verifier": "v1"})
+        second = client.post("/auth/oidc/callback", json={"code": "c2", "code_verifier": "v2"})
+
+        assert first.status_code == 201
+        assert second.status_code == 200
+        assert first.json()["user_id"] == second.json()["user_id"]
+        assert "auth_token=" in first.headers["set-cookie"]
+        assert "HttpOnly" in first.headers["set-cookie"]
+
+    def test_forged_id_token_is_rejected(
+        self,
+        client: TestClient,
+        idp_settings: Any,  # noqa: ANN401
+        idp_signing_key: rsa.RSAPrivateKey,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """ID token not signed by the published key → 401."""
+        forged = issue_id_token(rsa.generate_private_key(public_exponent=65537, key_size=2048), "attacker")
+        httpx_mock.add_response(method="POST", url=TOKEN_ENDPOINT, json={"access_token": "at", "id_token": forged})
+
+        response = client.post("/auth/oidc/callback", json={"code": "c", "code_verifier": "v"})
+
+        assert response.status_code == 401
+
+    def test_id_token_validation_runs_off_event_loop(
+        self,
+        client: TestClient,
+        idp_settings: Any,  # noqa: ANN401
+        idp_signing_key: rsa.RSAPrivateKey,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Validation (which may fetch JWKS synchronously) runs in the threadpool, not on the loop."""
+        id_token = issue_id_token(idp_signing_key, "oidc-user-2")
+        httpx_mock.add_response(method="POST", url=TOKEN_ENDPOINT, json={"access_token": "at", "id_token": id_token})
+        validate = OIDCAuthService.validate_id_token
+        on_event_loop: list[bool] = []
+
+        def recording_validate(self: OIDCAuthService, token: str) -> dict[str, Any]:
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return validate(self, token)
+
+        with patch.object(OIDCAuthService, "validate_id_token", recording_validate):
+            response = client.post("/auth/oidc/callback", json={"code": "c", "code_verifier": "v"})
+
+        assert response.status_code == 201
+        assert on_event_loop == [False]
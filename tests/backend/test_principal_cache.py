@@ -0,0 +1,110 @@
+"""
+Tests for the authenticated principal cache.
+
+REQ: REQ-B-A1-5
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from src.backend.models.user import User
+from src.backend.services.auth_service import AuthService
+from src.backend.services.principal_cache import Principal, PrincipalCache, principal_cache
+from src.backend.services.profile_service import ProfileService
+from src.backend.utils.auth import get_current_principal, get_current_user
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    """Build Bearer credentials for a token."""
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestPrincipalCache:
+    """Tests for PrincipalCache."""
+
+    PRINCIPAL = Principal(id=1, knox_id="knox1", nickname="nick")
+
+    def test_put_and_get(self) -> None:
+        """Cached principal is returned for the same token only."""
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.put("token-a", self.PRINCIPAL)
+
+        assert cache.get("token-a") == self.PRINCIPAL
+        assert cache.get("token-b") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_entry_never_outlives_token(self) -> None:
+        """Entries expire with the TTL or the token's exp claim, whichever is first."""
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.put("expiring", self.PRINCIPAL, token_exp=time.time() + 0.05)
+        cache.put("expired", self.PRINCIPAL, token_exp=time.time() - 1)
+
+        assert cache.get("expiring") == self.PRINCIPAL
+        time.sleep(0.06)
+        assert cache.get("expiring") is None
+        assert cache.get("expired") is None
+
+    def test_ttl_zero_disables_cache(self) -> None:
+        """ttl_seconds=0 stores nothing."""
+        cache = PrincipalCache(ttl_seconds=0)
+        cache.put("token-a", self.PRINCIPAL)
+
+        assert cache.get("token-a") is None
+
+    def test_size_bound_and_invalidate_user(self) -> None:
+        """Least recently used tokens are evicted; invalidate_user drops all tokens of a user."""
+        cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+        other = Principal(id=2, knox_id="knox2")
+        cache.put("a", self.PRINCIPAL)
+        cache.put("b", other)
+        cache.get("a")
+        cache.put("c", self.PRINCIPAL)
+
+        assert cache.get("b") is None
+        cache.invalidate_user(1)
+        assert cache.stats()["size"] == 0
+
+
+class TestCurrentPrincipal:
+    """Tests for get_current_principal / get_current_user with the shared cache."""
+
+    def test_cache_hit_skips_decode_and_query(self, db_session: Session, authenticated_user: User) -> None:
+        """Second request with the same token does no DB work."""
+        token = AuthService(db_session)._generate_jwt(authenticated_user.knox_id)
+
+        first = get_current_principal(bearer(token), db_session)
+        unused_db = MagicMock()
+        second = get_current_principal(bearer(token), unused_db)
+
+        assert first == second == Principal.from_user(authenticated_user)
+        assert unused_db.method_calls == []
+
+    def test_get_current_user_uses_cached_principal(self, db_session: Session, authenticated_user: User) -> None:
+        """get_current_user loads the cached principal's row by primary key."""
+        token = AuthService(db_session)._generate_jwt(authenticated_user.knox_id)
+        get_current_principal(bearer(token), db_session)
+
+        assert get_current_user(bearer(token), db_session) is authenticated_user
+
+    def test_nickname_change_invalidates(self, db_session: Session, authenticated_user: User) -> None:
+        """Nickname edits are visible on the next request."""
+        token = AuthService(db_session)._generate_jwt(authenticated_user.knox_id)
+        get_current_principal(bearer(token), db_session)
+
+        ProfileService(db_session).edit_nickname(authenticated_user.id, "new_nick")
+
+        assert principal_cache.stats()["size"] == 0
+        assert get_current_principal(bearer(token), db_session).nickname == "new_nick"
+
+    def test_invalid_token_is_not_cached(self, db_session: Session) -> None:
+        """Invalid tokens raise 401 every time."""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_principal(bearer("not-a-jwt"), db_session)
+
+        assert exc_info.value.status_code == 401
+        assert principal_cache.stats()["size"] == 0
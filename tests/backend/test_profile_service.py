@@ -102,6 +102,56 @@ class TestNicknameAlternativeGeneration:
         assert "john_2" not in alts
         assert "john_3" in alts
 
+    def test_popular_nickname_costs_one_query(self, db_session: Session, sql_statements: list[str]) -> None:
+        """Performance: Taken candidates are fetched in one query, not one per candidate."""
+        db_session.add_all(
+            User(
+                knox_id=f"popular_{i}",
+                name="Popular",
+                dept="Test",
+                business_unit="Test",
+                email=f"popular{i}@example.com",
+                nickname=f"star_{i}",
+            )
+            for i in range(1, 31)
+        )
+        db_session.commit()
+        sql_statements.clear()
+
+        alts = ProfileService(db_session).generate_nickname_alternatives("star")
+
+        assert alts == ["star_31", "star_32", "star_33"]
+        assert len(sql_statements) == 1
+
+    def test_long_nickname_is_truncated_to_fit(self, db_session: Session) -> None:
+        """Edge case: 30-char nickname still gets suggestions within the max length."""
+        base = "a" * 30
+        alts = ProfileService(db_session).generate_nickname_alternatives(base)
+
+        assert alts == ["a" * 28 + "_1", "a" * 28 + "_2", "a" * 28 + "_3"]
+
+    def test_random_suffix_when_numeric_suffixes_exhausted(self, db_session: Session) -> None:
+        """Edge case: All base_1..base_100 taken → random 4-digit suffixes."""
+        db_session.add_all(
+            User(
+                knox_id=f"crowd_{i}",
+                name="Crowd",
+                dept="Test",
+                business_unit="Test",
+                email=f"crowd{i}@example.com",
+                nickname=f"crowd_{i}",
+            )
+            for i in range(1, 101)
+        )
+        db_session.commit()
+
+        alts = ProfileService(db_session).generate_nickname_alternatives("crowd")
+
+        assert len(set(alts)) == 3
+        for alt in alts:
+            assert alt.startswith("crowd_")
+            assert 1000 <= int(alt.removeprefix("crowd_")) <= 9999
+
 
 class TestProfileServiceRegistration:
     """REQ-B-A2-5: Save user record with nickname."""
@@ -0,0 +1,52 @@
+"""
+Tests for FastJSONResponse.
+
+REQ: REQ-B-B3-Explain-2
+"""
+
+import json
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.backend.api.questions import QuestionResponse
+from src.backend.main import app
+from src.backend.utils import responses
+from src.backend.utils.responses import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """Tests for orjson-backed response rendering."""
+
+    def test_matches_stdlib_output(self) -> None:
+        """Same bytes as JSONResponse for jsonable content (UTF-8, compact)."""
+        content = {"stem": "셀프 어텐션이란?", "choices": ["A", "B"], "score": 87.5, "ok": True, "none": None}
+
+        assert FastJSONResponse(content).body == JSONResponse(content).body
+
+    def test_orjson_path_in_use(self) -> None:
+        """The declared orjson dependency is used, not the stdlib fallback (NaN renders as null)."""
+        assert responses.orjson is not None
+        assert FastJSONResponse({"score": float("nan")}).body == b'{"score":null}'
+
+    def test_serializes_models_and_datetimes(self) -> None:
+        """Pydantic models nested in dicts, datetimes and int keys are serialized."""
+        question = QuestionResponse(
+            id="q1", item_type="short_answer", stem="Q?", answer_schema={}, difficulty=5, category="AI"
+        )
+        content = {"questions": [question], "at": datetime(2025, 1, 1), 1: "one"}
+
+        data = json.loads(FastJSONResponse(content).body)
+
+        assert data["questions"][0]["id"] == "q1"
+        assert data["at"] == "2025-01-01T00:00:00"
+        assert data["1"] == "one"
+
+    def test_app_default_response_class(self) -> None:
+        """App uses FastJSONResponse by default."""
+        response = TestClient(app).get("/health")
+
+        assert app.router.default_response_class is FastJSONResponse
+        assert response.json() == {"status": "healthy"}
+        assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,187 @@
+"""
+Tests for user context cache shared by Tool 1 and backend services.
+
+REQ: REQ-A-Mode1-Tool1, REQ-B-B2-Gen-1
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.agent.llm_agent import GenerateQuestionsResponse
+from src.agent.tools.user_profile_tool import _get_user_profile_impl
+from src.backend.models.test_result import TestResult
+from src.backend.models.test_session import TestSession
+from src.backend.models.user import User
+from src.backend.models.user_profile import UserProfileSurvey
+from src.backend.services.profile_service import ProfileService
+from src.backend.services.question_gen_service import QuestionGenerationService
+from src.backend.services.scoring_service import ScoringService
+from src.backend.services.survey_service import SurveyService
+from src.backend.services.user_context_cache import (
+    UserContext,
+    UserContextCache,
+    bind_user_context,
+    lookup_user_context,
+    user_context_cache,
+)
+
+
+class TestUserContextCache:
+    """Unit tests for UserContextCache."""
+
+    def test_put_and_get(self) -> None:
+        """Stored context is returned and counted as hit."""
+        cache = UserContextCache()
+        cache.put(UserContext(user_id="1", self_level="Beginner"))
+
+        assert cache.get(1).self_level == "Beginner"
+        assert cache.get("2") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_dropped(self) -> None:
+        """Entries older than TTL are treated as misses."""
+        cache = UserContextCache(ttl_seconds=0)
+        cache.put(UserContext(user_id="1"))
+
+        assert cache.get("1") is None
+        assert cache.stats()["size"] == 0
+
+    def test_max_entries_evicts_oldest(self) -> None:
+        """Oldest user is evicted when cache is full."""
+        cache = UserContextCache(max_entries=2)
+        for user_id in ("1", "2", "3"):
+            cache.put(UserContext(user_id=user_id))
+
+        assert cache.get("1") is None
+        assert cache.get("3") is not None
+
+    def test_bound_context_matches_user_or_survey_id(self) -> None:
+        """Run-bound context is found by user id or survey id, only inside the binding."""
+        context = UserContext(user_id="7", survey_id="survey_abc")
+
+        with bind_user_context(context):
+            assert lookup_user_context("7") is context
+            assert lookup_user_context("survey_abc") is context
+
+        assert lookup_user_context("survey_abc") is None
+
+
+class TestUserContextIntegration:
+    """Integration with Tool 1, ProfileService and QuestionGenerationService."""
+
+    def test_tool1_uses_bound_context_without_db(self) -> None:
+        """Tool 1 answers from preloaded context and never opens a DB session."""
+        context = UserContext(
+            user_id="42",
+            survey_id="survey_42",
+            self_level="Advanced",
+            years_experience=7,
+            job_role="Engineer",
+            duty="MLOps",
+            interests=["LLM"],
+            prior_round={"round": 1, "score": 80.0, "correct_count": 4, "total_count": 5, "wrong_categories": {}},
+        )
+
+        with bind_user_context(context), patch("src.agent.tools.user_profile_tool.get_db") as mock_get_db:
+            result = _get_user_profile_impl("42")
+
+        mock_get_db.assert_not_called()
+        assert result["self_level"] == "Advanced"
+        assert result["interests"] == ["LLM"]
+        assert result["previous_score"] == 80.0
+
+    def test_update_survey_invalidates_cache(self, db_session: Session, authenticated_user: User) -> None:
+        """New survey submission drops the cached context."""
+        user_context_cache.put(UserContext(user_id=str(authenticated_user.id), self_level="Beginner"))
+
+        SurveyService(db_session).submit_survey(authenticated_user.id, {"self_level": "advanced"})
+
+        assert user_context_cache.get(authenticated_user.id) is None
+
+    def test_profile_service_update_survey_invalidates_cache(
+        self, db_session: Session, authenticated_user: User
+    ) -> None:
+        """ProfileService.update_survey invalidates directly as well."""
+        user_context_cache.put(UserContext(user_id=str(authenticated_user.id)))
+
+        ProfileService(db_session).update_survey(authenticated_user.id, {"interests": ["RAG"]})
+
+        assert user_context_cache.get(authenticated_user.id) is None
+
+    def test_stale_prior_result_is_not_reused(
+        self,
+        db_session: Session,
+        authenticated_user: User,
+        user_profile_survey_fixture: UserProfileSurvey,
+        test_result_low_score: TestResult,
+    ) -> None:
+        """A cached context built from an older round-1 result is rebuilt for the new one."""
+        service = QuestionGenerationService(db_session)
+        stale = service._load_user_context(
+            authenticated_user.id, user_profile_survey_fixture, 2, prior_result=test_result_low_score
+        )
+        newer = TestResult(
+            session_id=test_result_low_score.session_id,
+            round=1,
+            score=90.0,
+            total_points=90,
+            correct_count=4,
+            total_count=5,
+            wrong_categories={},
+        )
+        db_session.add(newer)
+        db_session.commit()
+
+        context = service._load_user_context(authenticated_user.id, user_profile_survey_fixture, 2, prior_result=newer)
+
+        assert stale.prior_result_id == test_result_low_score.id
+        assert context.prior_result_id == newer.id
+        assert context.prior_round["score"] == 90.0
+
+    def test_save_round_result_invalidates_cache(
+        self, db_session: Session, authenticated_user: User, test_session_round1_fixture: TestSession
+    ) -> None:
+        """Saving a round result drops the cached context of the session's user."""
+        user_context_cache.put(UserContext(user_id=str(authenticated_user.id)))
+
+        score_data = {"score": 80.0, "total_points": 80, "correct_count": 4, "total_count": 5, "wrong_categories": {}}
+        with (
+            patch.object(ScoringService, "calculate_round_score", return_value=score_data),
+            patch("src.backend.services.scoring_service.schedule_explanation_pregeneration"),
+        ):
+            ScoringService(db_session).save_round_result(test_session_round1_fixture.id, 1)
+
+        assert user_context_cache.get(authenticated_user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_generate_questions_binds_context_for_agent_run(
+        self, db_session: Session, authenticated_user: User, user_profile_survey_fixture: UserProfileSurvey
+    ) -> None:
+        """Context loaded by the service is visible to Tool 1 during the agent run."""
+        seen: dict = {}
+
+        async def fake_generate(request):  # noqa: ANN001, ANN202
+            seen["profile"] = _get_user_profile_impl(request.user_id)
+            return GenerateQuestionsResponse(round_id="round_test", items=[])
+
+        mock_agent = AsyncMock()
+        mock_agent.generate_questions = AsyncMock(side_effect=fake_generate)
+
+        service = QuestionGenerationService(db_session)
+        with (
+            patch("src.backend.services.question_gen_service.create_agent", return_value=mock_agent),
+            patch("src.backend.services.question_gen_service.asyncio.sleep", new=AsyncMock()),
+            patch("src.agent.tools.user_profile_tool.get_db") as mock_get_db,
+        ):
+            await service.generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+            )
+
+        mock_get_db.assert_not_called()
+        assert seen["profile"]["job_role"] == "Senior Engineer"
+        assert seen["profile"]["interests"] == ["LLM", "RAG"]
+        assert user_context_cache.get(authenticated_user.id).survey_id == user_profile_survey_fixture.id
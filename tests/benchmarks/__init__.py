@@ -0,0 +1 @@
+"""Micro-benchmarks for CPU-bound hot paths (pytest-benchmark)."""
@@ -0,0 +1,162 @@
+"""
+Shared fixtures for hot-path micro-benchmarks.
+
+Realistic worst-case inputs: large agent outputs, long Korean answers, many keywords.
+
+실행 방법:
+    # Run benchmarks (the regular suite includes them; --benchmark-disable runs each once)
+    pytest tests/benchmarks
+
+    # Compare against committed baseline (fails on >50% median regression; shared runners are noisy)
+    pytest tests/benchmarks --benchmark-storage=file://tests/benchmarks/baselines
+        --benchmark-compare=0001 --benchmark-compare-fail=median:50%
+
+    # Refresh baseline (baselines are stored per interpreter/platform)
+    pytest tests/benchmarks --benchmark-storage=file://tests/benchmarks/baselines --benchmark-save=baseline
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+QUESTION_COUNT = 20
+KEYWORD_COUNT = 40
+
+KOREAN_KEYWORDS = [
+    "트랜스포머",
+    "어텐션 메커니즘",
+    "셀프 어텐션",
+    "임베딩 벡터",
+    "토큰화",
+    "파인튜닝",
+    "전이 학습",
+    "프롬프트 엔지니어링",
+    "검색 증강 생성",
+    "벡터 데이터베이스",
+]
+ENGLISH_KEYWORDS = [
+    "large language model",
+    "retrieval augmented generation",
+    "attention",
+    "positional encoding",
+    "gradient descent",
+    "overfitting",
+    "regularization",
+    "context window",
+    "hallucination",
+    "reinforcement learning from human feedback",
+]
+
+
+def _agent_question(index: int) -> dict[str, Any]:
+    """Build one question in Final Answer format."""
+    return {
+        "question_id": f"q-{index:04d}",
+        "type": ["multiple_choice", "true_false", "short_answer"][index % 3],
+        "stem": f"[AI] {index}번: 트랜스포머 모델에서 셀프 어텐션이 문맥 정보를 반영하는 방식으로 올바른 것은 무엇입니까? "
+        * 2,
+        "choices": [f"선택지 {index}-{key}: 각 토큰이 다른 모든 토큰과의 관련도를 계산한다" for key in "ABCD"],
+        "answer_schema": {
+            "type": "keyword_match",
+            "keywords": KOREAN_KEYWORDS[:5],
+            "explanation": "셀프 어텐션은 쿼리·키·값 벡터를 이용해 토큰 간 가중치를 계산합니다. " * 5,
+        },
+        "difficulty": 5,
+        "category": "AI",
+        "validation_score": 0.92,
+        "saved": True,
+    }
+
+
+@pytest.fixture(scope="session")
+def large_agent_output() -> str:
+    """Large, well-formed Final Answer JSON (20 questions)."""
+    return json.dumps([_agent_question(i) for i in range(QUESTION_COUNT)], ensure_ascii=False, indent=2)
+
+
+@pytest.fixture(scope="session")
+def dirty_agent_output(large_agent_output: str) -> str:
+    """Return the same output with trailing commas (parses only after two failed cleanup strategies)."""
+    return large_agent_output.replace("\n  }", ",\n  }")
+
+
+@pytest.fixture(scope="session")
+def many_keywords() -> list[str]:
+    """40 mixed Korean/English (multi-word) keywords."""
+    keywords = KOREAN_KEYWORDS + ENGLISH_KEYWORDS
+    return [
+        f"{keyword} {i // len(keywords)}" if i >= len(keywords) else keyword for i, keyword in enumerate(keywords * 2)
+    ][:KEYWORD_COUNT]
+
+
+@pytest.fixture(scope="session")
+def long_korean_answer() -> str:
+    """~3,000 character Korean short answer mentioning about half the keywords."""
+    sentences = [
+        f"{KOREAN_KEYWORDS[i % len(KOREAN_KEYWORDS)]}은 대규모 언어 모델에서 중요한 역할을 하며 "
+        f"{ENGLISH_KEYWORDS[i % len(ENGLISH_KEYWORDS)].split()[0]} 개념과 함께 설명할 수 있습니다."
+        for i in range(40)
+    ]
+    return " ".join(sentences)
+
+
+@pytest.fixture(scope="session")
+def explanation_llm_response() -> str:
+    """ExplainService LLM response (fenced JSON, long Korean explanation, raw newlines)."""
+    explanation = "\n".join(
+        f"[{section}] 셀프 어텐션은 각 토큰이 다른 토큰과의 관련도를 계산해 문맥을 반영합니다. " * 6
+        for section in ("틀린 이유", "정답의 원리", "개념 구분", "복습 팁")
+    )
+    links = ",\n".join(
+        f'    {{"title": "참고 자료 {i}: 트랜스포머 구조 이해", "url": "https://example.com/docs/{i}"}}'
+        for i in range(3)
+    )
+    return f'```json\n{{\n  "explanation": "{explanation}",\n  "reference_links": [\n{links}\n  ]\n}}\n```'
+
+
+def _session_explanation(index: int) -> dict[str, Any]:
+    """Build one SessionExplanationItem with a full (fallback-free) explanation."""
+    return {
+        "question_id": f"q-{index:04d}",
+        "user_answer": {"selected": "A"} if index % 3 else {"text": "셀프 어텐션은 토큰 간 관련도를 계산합니다."},
+        "is_correct": index % 2 == 0,
+        "score": 100.0 if index % 2 == 0 else 0.0,
+        "explanation": {
+            "id": f"e-{index:04d}",
+            "question_id": f"q-{index:04d}",
+            "attempt_answer_id": f"a-{index:04d}",
+            "explanation_text": "셀프 어텐션은 쿼리·키·값 벡터를 이용해 토큰 간 가중치를 계산합니다. " * 12,
+            "explanation_sections": [
+                {"title": title, "content": "각 토큰이 다른 모든 토큰과의 관련도를 계산해 문맥을 반영합니다. " * 4}
+                for title in ("틀린 이유", "정답의 원리", "개념 구분", "복습 팁")
+            ],
+            "reference_links": [
+                {"title": f"참고 자료 {i}: 트랜스포머 구조 이해", "url": f"https://example.com/docs/{i}"}
+                for i in range(3)
+            ],
+            "user_answer_summary": {
+                "user_answer_text": "A",
+                "correct_answer_text": "B",
+                "question_type": "multiple_choice",
+            },
+            "problem_statement": "[오답 해설] 트랜스포머 모델에서 셀프 어텐션이 문맥 정보를 반영하는 방식은?",
+            "is_correct": index % 2 == 0,
+            "created_at": "2025-01-01T00:00:00",
+            "is_fallback": False,
+            "error_message": None,
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def session_explanations_payload() -> dict[str, Any]:
+    """GET /questions/explanations/session/{id} payload: 20 questions with full explanations."""
+    return {
+        "session_id": "session-0001",
+        "status": "completed",
+        "round": 1,
+        "answered_count": QUESTION_COUNT,
+        "total_questions": QUESTION_COUNT,
+        "explanations": [_session_explanation(i) for i in range(QUESTION_COUNT)],
+    }
@@ -0,0 +1,109 @@
+"""
+Micro-benchmarks for CPU-bound hot paths.
+
+REQ: REQ-A-ItemGen, REQ-B-B3-Score-2, REQ-B-B3-Explain-2, REQ-B-A2-2, REQ-B-B6-2
+
+Each benchmark also asserts the result, so a fast-but-wrong change fails here too.
+See conftest.py for baseline compare/save commands.
+"""
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.agent.llm_agent import parse_json_robust  # noqa: E402
+from src.agent.output_converter import AgentOutputConverter  # noqa: E402
+from src.backend.models import Question  # noqa: E402
+from src.backend.models.answer_schema import AnswerSchema, TransformerFactory  # noqa: E402
+from src.backend.services.explain_service import ExplainService  # noqa: E402
+from src.backend.services.scoring_service import ScoringService  # noqa: E402
+from src.backend.validators.nickname import NicknameValidator  # noqa: E402
+from src.backend.validators.question_content_validator import QuestionContentValidator  # noqa: E402
+
+NICKNAMES = [f"닉네임_{i}" for i in range(80)] + [f"admin{i}" for i in range(10)] + ["x" * 31] * 10
+
+
+@pytest.mark.benchmark(group="scoring")
+def test_score_short_answer_long_korean(benchmark: Any, long_korean_answer: str, many_keywords: list[str]) -> None:  # noqa: ANN401
+    """Short answer keyword scoring: 3,000-char answer × 40 keywords."""
+    scorer = ScoringService(session=None)
+
+    is_correct, score = benchmark(scorer._score_short_answer, {"text": long_korean_answer}, {"keywords": many_keywords})
+
+    assert not is_correct
+    assert 0 < score < 100
+
+
+@pytest.mark.benchmark(group="json")
+def test_parse_json_robust_clean(benchmark: Any, large_agent_output: str) -> None:  # noqa: ANN401
+    """parse_json_robust on a well-formed 20-question Final Answer."""
+    result = benchmark(parse_json_robust, large_agent_output)
+
+    assert len(result) == 20
+
+
+@pytest.mark.benchmark(group="json")
+def test_parse_json_robust_dirty(benchmark: Any, dirty_agent_output: str) -> None:  # noqa: ANN401
+    """parse_json_robust when cleanup strategies are needed."""
+    result = benchmark(parse_json_robust, dirty_agent_output)
+
+    assert len(result) == 20
+    assert result[-1]["saved"] is True
+
+
+@pytest.mark.benchmark(group="json")
+def test_output_converter_parse_json_robust_dirty(benchmark: Any, dirty_agent_output: str) -> None:  # noqa: ANN401
+    """AgentOutputConverter._parse_json_robust when cleanup strategies are needed."""
+    result = benchmark(AgentOutputConverter._parse_json_robust, dirty_agent_output)
+
+    assert len(result) == 20
+
+
+@pytest.mark.benchmark(group="answer_schema")
+def test_answer_schema_transform_agent_response(benchmark: Any, many_keywords: list[str]) -> None:  # noqa: ANN401
+    """TransformerFactory → AgentResponseTransformer → AnswerSchema → DB dict."""
+    factory = TransformerFactory()
+    raw = {"correct_keywords": many_keywords, "explanation": "셀프 어텐션은 토큰 간 관련도를 계산합니다. " * 20}
+
+    def transform() -> dict[str, Any]:
+        factory.get_transformer("agent_response").transform(raw)
+        return AnswerSchema.from_agent_response(raw).to_db_dict()
+
+    result = benchmark(transform)
+
+    assert len(result["keywords"]) == len(many_keywords)
+
+
+@pytest.mark.benchmark(group="validators")
+def test_nickname_validate_batch(benchmark: Any) -> None:  # noqa: ANN401
+    """NicknameValidator.validate over 100 mixed valid/invalid nicknames."""
+
+    def validate_all() -> int:
+        return sum(1 for nickname in NICKNAMES if NicknameValidator.validate(nickname)[0])
+
+    assert benchmark(validate_all) == 80
+
+
+@pytest.mark.benchmark(group="validators")
+def test_question_content_validate(benchmark: Any) -> None:  # noqa: ANN401
+    """QuestionContentValidator.validate_question on a long clean question."""
+    question = Question(
+        stem="트랜스포머 모델에서 셀프 어텐션이 문맥 정보를 반영하는 방식으로 올바른 것은 무엇입니까? " * 10,
+        choices=[f"선택지 {key}: 각 토큰이 다른 모든 토큰과의 관련도를 계산한다" * 3 for key in "ABCD"],
+        answer_schema={"explanation": "셀프 어텐션은 쿼리·키·값 벡터를 이용해 가중치를 계산합니다. " * 30},
+    )
+
+    assert benchmark(QuestionContentValidator.validate_question, question) == (True, None)
+
+
+@pytest.mark.benchmark(group="explain")
+def test_explain_parse_llm_response(benchmark: Any, explanation_llm_response: str) -> None:  # noqa: ANN401
+    """ExplainService._parse_llm_response with raw newlines (control character recovery)."""
+    service = ExplainService(session=None)
+
+    result = benchmark(service._parse_llm_response, explanation_llm_response)
+
+    assert len(result["reference_links"]) == 3
+    assert "[복습 팁]" in result["explanation"]
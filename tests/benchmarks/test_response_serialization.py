@@ -0,0 +1,73 @@
+"""
+Benchmarks for API response serialization (20-question session with full explanations).
+
+REQ: REQ-B-B3-Explain-2
+
+Each case replays what FastAPI does after the endpoint returns:
+response_model validation → dump to jsonable Python → response class render.
+"wall" cases measure elapsed time, "cpu" cases measure process CPU time per request.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.backend.api.questions import SessionExplanationResponse  # noqa: E402
+from src.backend.utils.responses import FastJSONResponse  # noqa: E402
+
+CLOCKS = [
+    pytest.param(time.perf_counter, id="wall", marks=pytest.mark.benchmark(group="response-serialization-wall")),
+    pytest.param(
+        time.process_time,
+        id="cpu",
+        marks=pytest.mark.benchmark(group="response-serialization-cpu", timer=time.process_time),
+    ),
+]
+
+_adapter = TypeAdapter(SessionExplanationResponse)
+
+
+def _serialize(content: Any, response_class: type[JSONResponse]) -> bytes:  # noqa: ANN401
+    """Replay FastAPI response handling for response_model=SessionExplanationResponse."""
+    value = _adapter.validate_python(content)
+    return response_class(_adapter.dump_python(value, mode="json")).body
+
+
+def _run(benchmark: Any, func: Callable[[], bytes]) -> dict[str, Any]:  # noqa: ANN401
+    """Benchmark func and return the decoded response body."""
+    body = benchmark(func)
+    return json.loads(body)
+
+
+@pytest.mark.parametrize("clock", CLOCKS)
+def test_stdlib_response_from_dict(benchmark: Any, clock: Any, session_explanations_payload: dict) -> None:  # noqa: ANN401
+    """Before: endpoint returns a dict, rendered by stdlib JSONResponse."""
+    data = _run(benchmark, lambda: _serialize(session_explanations_payload, JSONResponse))
+
+    assert len(data["explanations"]) == 20
+
+
+@pytest.mark.parametrize("clock", CLOCKS)
+def test_fast_response_from_dict(benchmark: Any, clock: Any, session_explanations_payload: dict) -> None:  # noqa: ANN401
+    """Endpoint returns a dict, rendered by FastJSONResponse."""
+    data = _run(benchmark, lambda: _serialize(session_explanations_payload, FastJSONResponse))
+
+    assert data == json.loads(_serialize(session_explanations_payload, JSONResponse))
+
+
+@pytest.mark.parametrize("clock", CLOCKS)
+def test_fast_response_from_model(benchmark: Any, clock: Any, session_explanations_payload: dict) -> None:  # noqa: ANN401
+    """After: endpoint returns a model instance (no re-validation), rendered by FastJSONResponse."""
+    model = SessionExplanationResponse.model_validate(session_explanations_payload)
+
+    data = _run(benchmark, lambda: _serialize(model, FastJSONResponse))
+
+    assert data == json.loads(_serialize(session_explanations_payload, JSONResponse))
@@ -0,0 +1,74 @@
+"""Tests for the export CLI command (streams /export/{dataset} into a file)."""
+
+import re
+from io import StringIO
+from pathlib import Path
+from typing import Any, BinaryIO
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from src.cli.actions import export
+from src.cli.context import CLIContext
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape codes from text."""
+    return re.compile(r"\x1b\[[0-9;]*m").sub("", text)
+
+
+@pytest.fixture
+def mock_context() -> CLIContext:
+    """Create CLIContext with buffered console and authenticated user."""
+    buffer = StringIO()
+    context = CLIContext(console=Console(file=buffer, force_terminal=True, width=120), logger=MagicMock())
+    context._buffer = buffer
+    context.session.token = "test-token"
+    context.client = MagicMock()
+    return context
+
+
+class TestExportCommand:
+    """Test export command."""
+
+    def test_streams_into_output_file(self, mock_context: CLIContext, tmp_path: Path) -> None:
+        """Chunks are written to the output file; options become query parameters."""
+
+        def stream_to_file(path: str, destination: BinaryIO, params: dict[str, Any]) -> tuple[int, int, None]:
+            destination.write(b"a,b\n")
+            destination.write(b"1,2\n")
+            return 200, 8, None
+
+        mock_context.client.stream_to_file.side_effect = stream_to_file
+        output = tmp_path / "answers.csv"
+
+        export.export_data(mock_context, "answers", str(output), "--format", "csv", "--user-id", "7")
+
+        assert output.read_bytes() == b"a,b\n1,2\n"
+        assert not (tmp_path / "answers.csv.part").exists()
+        call = mock_context.client.stream_to_file.call_args
+        assert call.args[0] == "/export/answers"
+        assert call.kwargs["params"] == {"format": "csv", "user_id": "7"}
+        assert "Exported answers" in strip_ansi(mock_context._buffer.getvalue())
+
+    def test_failed_export_leaves_no_file(self, mock_context: CLIContext, tmp_path: Path) -> None:
+        """Server error → message shown, no output or partial file left behind."""
+        mock_context.client.stream_to_file.return_value = (403, 0, "Not allowed to export other users' data")
+        output = tmp_path / "attempts.ndjson"
+
+        export.export_data(mock_context, "attempts", str(output), "--user-id", "2")
+
+        assert not output.exists()
+        assert list(tmp_path.iterdir()) == []
+        assert "Not allowed" in strip_ansi(mock_context._buffer.getvalue())
+
+    def test_requires_login_and_valid_dataset(self, mock_context: CLIContext, tmp_path: Path) -> None:
+        """Unknown dataset shows usage; unauthenticated users are asked to log in."""
+        export.export_data(mock_context, "users", str(tmp_path / "x"))
+        assert "Datasets:" in strip_ansi(mock_context._buffer.getvalue())
+
+        mock_context.session.token = None
+        export.export_data(mock_context, "attempts", str(tmp_path / "x"))
+        assert "Not authenticated" in strip_ansi(mock_context._buffer.getvalue())
+        mock_context.client.stream_to_file.assert_not_called()
@@ -5,6 +5,7 @@ import sys
 from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 import pytest
@@ -31,7 +32,7 @@ def pytest_configure(config):
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import Engine, create_engine, inspect, text
+from sqlalchemy import Engine, create_engine, event, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 from unittest.mock import patch
 
@@ -72,6 +73,32 @@ def patch_database_for_tools(db_engine: Engine) -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_process_wide_state() -> Generator[None, None, None]:
+    """
+    Reset process-wide caches and memoized state between tests (each test has its own DB).
+
+    Covers the user context cache, authenticated principal cache, nickname index,
+    explanation LRU and Tool 4 memoized LLM scores/counters.
+    """
+    from src.agent.tools.validate_question_tool import reset_validation_state
+    from src.backend.services.explanation_cache import explanation_cache
+    from src.backend.services.nickname_index import nickname_index
+    from src.backend.services.principal_cache import principal_cache
+    from src.backend.services.user_context_cache import user_context_cache
+
+    def reset() -> None:
+        user_context_cache.clear()
+        principal_cache.clear()
+        nickname_index.clear()
+        explanation_cache.clear()
+        reset_validation_state()
+
+    reset()
+    yield
+    reset()
+
+
 @pytest.fixture(scope="function")
 def db_engine() -> Generator[Engine, None, None]:
     """
@@ -104,6 +131,30 @@ def db_engine() -> Generator[Engine, None, None]:
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def sql_statements(db_engine: Engine) -> Generator[list[str], None, None]:
+    """
+    Record SQL statements executed on the test engine (for query-count assertions).
+
+    Clear the list after setting up test data to count only the code under test.
+
+    Args:
+        db_engine: Test database engine fixture
+
+    Yields:
+        List of executed SQL statements
+
+    """
+    recorded: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:  # noqa: ANN401
+        recorded.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture(scope="function")
 def db_session(db_engine: Engine) -> Generator[Session, None, None]:
     """
@@ -182,16 +233,20 @@ def client(db_session: Session, authenticated_user: User) -> Generator[TestClien
     """
     # Lazy import routers to avoid import errors during conftest loading
     from src.backend.api.auth import router as auth_router
+    from src.backend.api.export import router as export_router
     from src.backend.api.profile import router as profile_router
     from src.backend.api.questions import router as questions_router
     from src.backend.api.survey import router as survey_router
-    from src.backend.utils.auth import get_current_user
+    from src.backend.services.principal_cache import Principal
+    from src.backend.utils.auth import get_current_principal, get_current_user
+    from src.backend.utils.responses import FastJSONResponse
 
-    app = FastAPI()
+    app = FastAPI(default_response_class=FastJSONResponse)
     app.include_router(auth_router, prefix="/auth", tags=["auth"])
     app.include_router(profile_router, prefix="/profile", tags=["profile"])
     app.include_router(survey_router, prefix="/survey", tags=["survey"])
     app.include_router(questions_router, prefix="/questions", tags=["questions"])
+    app.include_router(export_router, prefix="/export", tags=["export"])
 
     # Override database dependency to use the test session
     def override_get_db() -> Generator[Session, None, None]:
@@ -203,8 +258,12 @@ def client(db_session: Session, authenticated_user: User) -> Generator[TestClien
     def override_get_current_user() -> User:
         return authenticated_user
 
+    def override_get_current_principal() -> Principal:
+        return Principal.from_user(authenticated_user)
+
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_current_user] = override_get_current_user
+    app.dependency_overrides[get_current_principal] = override_get_current_principal
 
     yield TestClient(app)
 
@@ -0,0 +1 @@
+"""Load tests (exam flow harness and baselines)."""
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Exam Flow Load Test - Concurrent exam takers through the real API routes.
+
+REQ: REQ-B-B2-Gen, REQ-B-B3-Score, REQ-B-B3-Explain, REQ-B-B4
+
+Each simulated user runs the full exam flow:
+    login → survey submit → generate → autosave × N → score → explanations → ranking
+
+The report contains per-endpoint throughput, p50/p95/p99 latency, error rate
+and DB queries per request, plus peak thread count and peak checked-out DB
+connections (in-process target only), and can be saved as a baseline and
+compared against one for regression checks.
+
+실행 방법:
+    # In-process app (SQLite, fake LLM) - no server or network required
+    DATABASE_URL=sqlite:////tmp/loadtest.db python -m tests.load.exam_flow --users 20 --concurrency 10
+
+    # Running local server (server must run with USE_FAKE_LLM=True)
+    python -m tests.load.exam_flow --base-url http://localhost:8000 --users 50
+
+    # Save / compare baseline
+    python -m tests.load.exam_flow --save-baseline tests/load/baselines/exam_flow.json
+    python -m tests.load.exam_flow --baseline tests/load/baselines/exam_flow.json
+
+환경변수:
+    DATABASE_URL: Database for the in-process app (tables are created if missing)
+    USE_FAKE_LLM: Forced to "True" for the in-process target
+    LLM_FAKE_LATENCY_MS: Fake LLM median latency (default: 50 for in-process runs)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "exam_flow.json"
+
+# Regression thresholds for compare_with_baseline()
+LATENCY_TOLERANCE = 0.5  # p95 may grow by 50% (small runs are noisy; use more users for tighter checks)
+LATENCY_FLOOR_MS = 5.0  # ignore p95 growth below 5ms (timer noise)
+ERROR_RATE_TOLERANCE = 0.01  # error rate may grow by 1 percentage point
+DB_QUERY_TOLERANCE = 0.10  # queries per request may grow by 10%
+RESOURCE_TOLERANCE = 0.5  # peak threads / DB connections may grow by 50%
+RESOURCE_FLOOR = 2  # ignore peak growth of up to 2 threads / connections
+
+# Mutable per-request counter; set by the harness, incremented by the SQLAlchemy listener
+_db_query_counter: ContextVar[list[int] | None] = ContextVar("db_query_counter", default=None)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Return q-quantile (0..1) of values using nearest-rank (same as llm_hedging; kept local, no src import)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class EndpointStats:
+    """Latency, error and DB query samples for one endpoint."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    db_queries: list[int] = field(default_factory=list)
+
+    def summary(self, wall_seconds: float) -> dict[str, Any]:
+        """Summarize samples (throughput relative to the whole run)."""
+        count = len(self.latencies_ms)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "p50_ms": round(_percentile(self.latencies_ms, 0.50), 1),
+            "p95_ms": round(_percentile(self.latencies_ms, 0.95), 1),
+            "p99_ms": round(_percentile(self.latencies_ms, 0.99), 1),
+            "db_queries_per_request": (
+                round(sum(self.db_queries) / len(self.db_queries), 1) if self.db_queries else None
+            ),
+        }
+
+
+class FlowError(Exception):
+    """Raised when a flow step fails and the user cannot continue."""
+
+
+class LoadRecorder:
+    """Collects per-endpoint samples across concurrent simulated users."""
+
+    def __init__(self, count_db_queries: bool = False) -> None:
+        """
+        Initialize recorder.
+
+        Args:
+            count_db_queries: True to record DB queries per request (in-process only)
+
+        """
+        self.count_db_queries = count_db_queries
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.completed_flows = 0
+        self.failed_flows = 0
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        name: str,
+        method: str,
+        url: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        """
+        Send request and record latency, errors and DB queries under `name`.
+
+        Raises:
+            FlowError: If the request fails or returns status >= 400
+
+        """
+        stats = self.endpoints.setdefault(name, EndpointStats())
+        counter = [0]
+        token = _db_query_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+            stats.errors += 1
+            raise FlowError(f"{name}: {e}") from e
+        finally:
+            _db_query_counter.reset(token)
+
+        stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+        if self.count_db_queries:
+            stats.db_queries.append(counter[0])
+        if response.status_code >= 400:
+            stats.errors += 1
+            raise FlowError(f"{name}: HTTP {response.status_code} {response.text[:200]}")
+        return response.json()
+
+    def report(self, wall_seconds: float, config: dict[str, Any]) -> dict[str, Any]:
+        """Build report dict (config, totals, per-endpoint summaries)."""
+        return {
+            "config": config,
+            "wall_seconds": round(wall_seconds, 2),
+            "completed_flows": self.completed_flows,
+            "failed_flows": self.failed_flows,
+            "flows_per_second": round(self.completed_flows / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "endpoints": {name: stats.summary(wall_seconds) for name, stats in self.endpoints.items()},
+        }
+
+
+class ResourceMonitor:
+    """Tracks peak thread count and peak checked-out DB connections during a run."""
+
+    def __init__(self) -> None:
+        """Initialize monitor with the current thread count."""
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self.peak_threads = threading.active_count()
+        self.peak_db_connections = 0
+
+    @contextmanager
+    def watch_pool(self, engine: Any) -> Iterator[None]:  # noqa: ANN401
+        """Count connection checkouts/checkins on engine's pool."""
+        from sqlalchemy import event
+
+        def on_checkout(*_args: Any) -> None:  # noqa: ANN401
+            with self._lock:
+                self._checked_out += 1
+                self.peak_db_connections = max(self.peak_db_connections, self._checked_out)
+
+        def on_checkin(*_args: Any) -> None:  # noqa: ANN401
+            with self._lock:
+                self._checked_out -= 1
+
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        try:
+            yield
+        finally:
+            event.remove(engine, "checkout", on_checkout)
+            event.remove(engine, "checkin", on_checkin)
+
+    async def sample_threads(self, interval: float = 0.005) -> None:
+        """Sample thread count until cancelled."""
+        while True:
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            await asyncio.sleep(interval)
+
+    def summary(self) -> dict[str, int]:
+        """Return peak values."""
+        return {"peak_threads": self.peak_threads, "peak_db_connections": self.peak_db_connections}
+
+
+def _pick_answer(question: dict[str, Any], rng: random.Random) -> dict[str, Any]:
+    """Build a plausible user answer for a generated question."""
+    item_type = question.get("item_type")
+    if item_type == "multiple_choice" and question.get("choices"):
+        return {"selected_key": rng.choice(question["choices"])}
+    if item_type == "true_false":
+        return {"answer": rng.random() < 0.5}
+    keywords = (question.get("answer_schema") or {}).get("keywords") or ["개념"]
+    return {"text": f"{' '.join(keywords[:2])}에 대한 설명입니다. " * rng.randint(1, 5)}
+
+
+async def simulate_user(
+    client: httpx.AsyncClient,
+    recorder: LoadRecorder,
+    user_index: int,
+    run_id: str,
+    question_count: int,
+    rng: random.Random,
+) -> None:
+    """
+    Run one exam flow for a new user.
+
+    Args:
+        client: HTTP client (in-process transport or base URL)
+        recorder: Shared LoadRecorder
+        user_index: Index used for the user's knox_id
+        run_id: Unique run id (knox_ids must not collide across runs)
+        question_count: Questions per generated round
+        rng: Seeded RNG for answers
+
+    """
+    knox_id = f"load-{run_id}-{user_index}"
+    try:
+        login = await recorder.request(
+            client,
+            "POST /auth/login",
+            "POST",
+            "/auth/login",
+            json={
+                "knox_id": knox_id,
+                "name": f"Load User {user_index}",
+                "dept": "Load Test",
+                "business_unit": "QA",
+                "email": f"{knox_id}@example.com",
+            },
+        )
+        headers = {"Authorization": f"Bearer {login['access_token']}"}
+
+        survey = await recorder.request(
+            client,
+            "POST /survey/submit",
+            "POST",
+            "/survey/submit",
+            headers=headers,
+            json={
+                "self_level": rng.choice(["beginner", "intermediate", "advanced"]),
+                "years_experience": rng.randint(0, 15),
+                "job_role": "Engineer",
+                "duty": "Load testing",
+                "interests": ["AI"],
+            },
+        )
+
+        generated = await recorder.request(
+            client,
+            "POST /questions/generate",
+            "POST",
+            "/questions/generate",
+            headers=headers,
+            json={"survey_id": survey["survey_id"], "round": 1, "domain": "AI", "question_count": question_count},
+        )
+        session_id = generated["session_id"]
+        if not generated["questions"]:
+            raise FlowError("POST /questions/generate: no questions generated")
+
+        for question in generated["questions"]:
+            await recorder.request(
+                client,
+                "POST /questions/autosave",
+                "POST",
+                "/questions/autosave",
+                headers=headers,
+                json={
+                    "session_id": session_id,
+                    "question_id": question["id"],
+                    "user_answer": _pick_answer(question, rng),
+                    "response_time_ms": rng.randint(5_000, 60_000),
+                },
+            )
+
+        await recorder.request(
+            client,
+            "POST /questions/score",
+            "POST",
+            "/questions/score",
+            headers=headers,
+            params={"session_id": session_id},
+        )
+        await recorder.request(
+            client,
+            "GET /questions/explanations/session/{id}",
+            "GET",
+            f"/questions/explanations/session/{session_id}",
+            headers=headers,
+        )
+        await recorder.request(client, "GET /profile/ranking", "GET", "/profile/ranking", headers=headers)
+        recorder.completed_flows += 1
+    except FlowError:
+        recorder.failed_flows += 1
+
+
+@contextmanager
+def _count_queries(engine: Any) -> Iterator[None]:  # noqa: ANN401
+    """Count executed statements into the current request's counter."""
+    from sqlalchemy import event
+
+    def before_cursor_execute(*_args: Any) -> None:  # noqa: ANN401
+        counter = _db_query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def run_load_test(
+    users: int = 20,
+    concurrency: int = 10,
+    question_count: int = 5,
+    base_url: str | None = None,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """
+    Run the exam flow for `users` users with at most `concurrency` in flight.
+
+    Args:
+        users: Total simulated users
+        concurrency: Concurrent users
+        question_count: Questions per generated round
+        base_url: Local server URL; None runs against the in-process app
+        seed: RNG seed for answers
+
+    Returns:
+        Report dict (see LoadRecorder.report)
+
+    """
+    config = {
+        "target": base_url or "in-process",
+        "users": users,
+        "concurrency": concurrency,
+        "question_count": question_count,
+        "fake_llm_latency_ms": float(os.getenv("LLM_FAKE_LATENCY_MS", "0")),
+    }
+    run_id = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_all(client: httpx.AsyncClient, recorder: LoadRecorder) -> float:
+        async def one(index: int) -> None:
+            async with semaphore:
+                await simulate_user(client, recorder, index, run_id, question_count, random.Random(seed + index))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(users)))
+        return time.perf_counter() - start
+
+    if base_url:
+        recorder = LoadRecorder(count_db_queries=False)
+        async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+            wall = await run_all(client, recorder)
+        return recorder.report(wall, config)
+
+    # In-process: real app and DB, fake LLM
+    os.environ["USE_FAKE_LLM"] = "True"
+    from src.backend import database
+    from src.backend.main import app
+
+    database.init_db()
+    recorder = LoadRecorder(count_db_queries=True)
+    monitor = ResourceMonitor()
+    transport = httpx.ASGITransport(app=app)
+    # Count on the engine sessions are actually bound to (tests rebind SessionLocal)
+    engine = database.SessionLocal.kw.get("bind") or database.engine
+    with _count_queries(engine), monitor.watch_pool(engine):
+        sampler = asyncio.create_task(monitor.sample_threads())
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120) as client:
+                wall = await run_all(client, recorder)
+        finally:
+            sampler.cancel()
+    report = recorder.report(wall, config)
+    report["resources"] = monitor.summary()
+    return report
+
+
+def compare_with_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    latency_tolerance: float = LATENCY_TOLERANCE,
+) -> list[str]:
+    """
+    Compare report against a saved baseline.
+
+    Regressions:
+        - p95 latency above baseline by more than latency_tolerance (and LATENCY_FLOOR_MS)
+        - error rate above baseline by more than ERROR_RATE_TOLERANCE
+        - DB queries per request above baseline by more than DB_QUERY_TOLERANCE
+        - Peak threads / DB connections above baseline by more than RESOURCE_TOLERANCE
+          (and RESOURCE_FLOOR)
+
+    Args:
+        report: Current report
+        baseline: Baseline report
+        latency_tolerance: Allowed relative p95 growth
+
+    Returns:
+        List of human-readable regressions (empty if none)
+
+    """
+    regressions = []
+    for name, base in baseline.get("endpoints", {}).items():
+        current = report["endpoints"].get(name)
+        if current is None:
+            regressions.append(f"{name}: missing from current run")
+            continue
+
+        p95_limit = max(base["p95_ms"] * (1 + latency_tolerance), base["p95_ms"] + LATENCY_FLOOR_MS)
+        if current["p95_ms"] > p95_limit:
+            regressions.append(f"{name}: p95 {current['p95_ms']}ms > baseline {base['p95_ms']}ms")
+
+        if current["error_rate"] > base["error_rate"] + ERROR_RATE_TOLERANCE:
+            regressions.append(f"{name}: error rate {current['error_rate']:.2%} > baseline {base['error_rate']:.2%}")
+
+        base_queries, queries = base.get("db_queries_per_request"), current.get("db_queries_per_request")
+        if base_queries is not None and queries is not None and queries > base_queries * (1 + DB_QUERY_TOLERANCE):
+            regressions.append(f"{name}: {queries} DB queries/request > baseline {base_queries}")
+
+    current_resources = report.get("resources") or {}
+    for name, base_value in (baseline.get("resources") or {}).items():
+        value = current_resources.get(name)
+        if value is not None and value > max(base_value * (1 + RESOURCE_TOLERANCE), base_value + RESOURCE_FLOOR):
+            regressions.append(f"{name}: {value} > baseline {base_value}")
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format report as a plain-text table."""
+    lines = [
+        f"Target: {report['config']['target']}  users={report['config']['users']}  "
+        f"concurrency={report['config']['concurrency']}  wall={report['wall_seconds']}s",
+        f"Flows: {report['completed_flows']} completed, {report['failed_flows']} failed "
+        f"({report['flows_per_second']} flows/s)",
+        "",
+        f"{'endpoint':<42}{'req':>6}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'err%':>7}{'db/req':>8}",
+    ]
+    for name, s in report["endpoints"].items():
+        db = "-" if s["db_queries_per_request"] is None else f"{s['db_queries_per_request']:.1f}"
+        lines.append(
+            f"{name:<42}{s['requests']:>6}{s['throughput_rps']:>8.2f}{s['p50_ms']:>9.1f}"
+            f"{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['error_rate'] * 100:>7.1f}{db:>8}"
+        )
+    if "resources" in report:
+        resources = report["resources"]
+        lines += [
+            "",
+            f"Peak threads: {resources['peak_threads']}  Peak DB connections: {resources['peak_db_connections']}",
+        ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """CLI entry point; returns exit code (1 on baseline regression)."""
+    parser = argparse.ArgumentParser(description="Exam flow load test")
+    parser.add_argument("--users", type=int, default=20, help="Total simulated users")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent users")
+    parser.add_argument("--question-count", type=int, default=5, help="Questions per round")
+    parser.add_argument("--base-url", default=None, help="Local server URL (default: in-process app)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for answers")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against baseline JSON")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="Save report as baseline JSON")
+    parser.add_argument(
+        "--latency-tolerance", type=float, default=LATENCY_TOLERANCE, help="Allowed relative p95 growth"
+    )
+    parser.add_argument("--json", action="store_true", help="Print report as JSON")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LLM_FAKE_LATENCY_MS", "50")
+    report = asyncio.run(
+        run_load_test(
+            users=args.users,
+            concurrency=args.concurrency,
+            question_count=args.question_count,
+            base_url=args.base_url,
+            seed=args.seed,
+        )
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False) if args.json else format_report(report))
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        print(f"\nBaseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(
+            report, json.loads(args.baseline.read_text()), latency_tolerance=args.latency_tolerance
+        )
+        if regressions:
+            print("\nRegressions vs baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nNo regressions vs baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
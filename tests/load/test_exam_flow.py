@@ -0,0 +1,66 @@
+"""
+Tests for exam flow load test harness.
+
+REQ: REQ-B-B2-Gen, REQ-B-B3-Score
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tests.load.exam_flow import DEFAULT_BASELINE, compare_with_baseline, run_load_test
+
+EXPECTED_ENDPOINTS = {
+    "POST /auth/login",
+    "POST /survey/submit",
+    "POST /questions/generate",
+    "POST /questions/autosave",
+    "POST /questions/score",
+    "GET /questions/explanations/session/{id}",
+    "GET /profile/ranking",
+}
+
+
+@pytest.fixture
+def fake_llm_env() -> None:
+    """Run the in-process app with a zero-latency fake LLM."""
+    with patch.dict(os.environ, {"USE_FAKE_LLM": "True", "LLM_FAKE_LATENCY_MS": "0"}):
+        yield
+
+
+class TestExamFlowHarness:
+    """Tests for run_load_test() and compare_with_baseline()."""
+
+    @pytest.mark.asyncio
+    async def test_small_run_completes_every_step(self, fake_llm_env: None) -> None:
+        """Two users complete the full flow; every endpoint is measured."""
+        report = await run_load_test(users=2, concurrency=2, question_count=3)
+
+        assert report["completed_flows"] == 2
+        assert report["failed_flows"] == 0
+        assert set(report["endpoints"]) == EXPECTED_ENDPOINTS
+        assert report["endpoints"]["POST /questions/autosave"]["requests"] == 6
+        for stats in report["endpoints"].values():
+            assert stats["error_rate"] == 0.0
+            assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+            assert stats["db_queries_per_request"] > 0
+
+    def test_committed_baseline_covers_every_endpoint(self) -> None:
+        """Committed baseline includes all flow endpoints."""
+        baseline = json.loads(DEFAULT_BASELINE.read_text())
+
+        assert set(baseline["endpoints"]) == EXPECTED_ENDPOINTS
+
+    def test_regressions_detected(self) -> None:
+        """p95, error rate and DB query growth beyond tolerance are reported."""
+        base = {"p95_ms": 100.0, "error_rate": 0.0, "db_queries_per_request": 4.0}
+        current = {"p95_ms": 300.0, "error_rate": 0.05, "db_queries_per_request": 8.0}
+
+        regressions = compare_with_baseline(
+            {"endpoints": {"POST /auth/login": current}}, {"endpoints": {"POST /auth/login": base, "GET /x": base}}
+        )
+
+        assert len(regressions) == 4
+        assert compare_with_baseline({"endpoints": {"GET /x": base}}, {"endpoints": {"GET /x": base}}) == []